@@ -0,0 +1,95 @@
+"""
+Batch Request Helpers for Athena API
+
+Provides parsing for bulk ingestion request bodies, which may be either a
+JSON array or newline-delimited JSON (one object per line).
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Tuple
+
+from fastapi import HTTPException, Request
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+async def read_batch_body(request: Request) -> Tuple[List[Tuple[int, Any]], List[Dict[str, Any]]]:
+    """
+    Parse a batch request body.
+
+    A malformed NDJSON line is reported as an error for that line only;
+    a malformed JSON array rejects the request.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Tuple of (index, item) pairs and a list of per-item parse errors
+    """
+    body = (await request.body()).decode("utf-8")
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+
+    if content_type not in NDJSON_CONTENT_TYPES and body.lstrip().startswith("["):
+        try:
+            items = json.loads(body)
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON array: {e}")
+        return list(enumerate(items)), []
+
+    items = []
+    errors = []
+    for index, line in enumerate(line for line in body.splitlines() if line.strip()):
+        try:
+            items.append((index, json.loads(line)))
+        except json.JSONDecodeError as e:
+            errors.append({"index": index, "error": f"Invalid JSON: {e}"})
+    return items, errors
+
+def convert_batch_items(items: List[Tuple[int, Any]], convert: Callable[[Any], Any],
+                        errors: List[Dict[str, Any]]) -> Tuple[List[int], List[Any]]:
+    """
+    Convert parsed items into domain objects, recording conversion failures.
+
+    Args:
+        items: (index, item) pairs from read_batch_body
+        convert: Function building a domain object from one item
+        errors: List that per-item conversion errors are appended to
+
+    Returns:
+        Tuple of the original indices and the converted objects
+    """
+    indices = []
+    objects = []
+    for index, item in items:
+        try:
+            if not isinstance(item, dict):
+                raise ValueError("Expected a JSON object")
+            objects.append(convert(item))
+            indices.append(index)
+        except Exception as e:
+            errors.append({"index": index, "error": str(e)})
+    return indices, objects
+
+def batch_response(indices: List[int], result: Dict[str, Any], errors: List[Dict[str, Any]],
+                   total: int) -> Dict[str, Any]:
+    """
+    Build the response of a batch endpoint.
+
+    Args:
+        indices: Original request indices of the objects sent to the engine
+        result: Result of KnowledgeEngine.add_entities or add_relationships
+        errors: Parse and conversion errors collected so far
+        total: Number of items in the request
+
+    Returns:
+        Summary with created IDs and per-item errors ordered by request index
+    """
+    for error in result["errors"]:
+        errors.append({**error, "index": indices[error["index"]]})
+    errors.sort(key=lambda error: error["index"])
+    return {
+        "total": total,
+        "created": len(result["created"]),
+        "failed": len(errors),
+        "ids": result["created"],
+        "errors": errors
+    }
@@ -5,7 +5,7 @@ Provides REST API endpoints for entity management and operations.
 """
 
 from typing import Dict, List, Any, Optional, Union
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Request
 
 from tekton.core.query.modes import QueryMode, QueryParameters
 
@@ -16,6 +16,7 @@ from athena.api.models.entity import (
     EntityMergeResponse,
     EntitySearchResult
 )
+from athena.api.batch import read_batch_body, convert_batch_items, batch_response
 from athena.core.engine import get_knowledge_engine
 from athena.core.entity_manager import EntityManager
 
@@ -41,6 +42,26 @@ async def create_entity(entity: EntityCreate):
     
     return EntityResponse.from_domain_entity(created_entity)
 
+@router.post("/batch", response_model=Dict[str, Any])
+async def create_entities(request: Request):
+    """
+    Create many entities from a JSON array or an NDJSON body of EntityCreate objects.
+    
+    Invalid items are reported by their position in the request without
+    failing the rest of the batch.
+    """
+    engine = await get_knowledge_engine()
+    
+    items, errors = await read_batch_body(request)
+    total = len(items) + len(errors)
+    indices, entities = convert_batch_items(
+        items,
+        lambda item: EntityCreate(**item).to_domain_entity(),
+        errors
+    )
+    result = await engine.add_entities(entities)
+    return batch_response(indices, result, errors, total)
+
 @router.get("/{entity_id}", response_model=EntityResponse)
 async def get_entity(entity_id: str):
     """
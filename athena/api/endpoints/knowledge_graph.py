@@ -6,15 +6,26 @@ Provides endpoints for Athena's knowledge graph functionality including:
 - Relationship management
 - Graph querying
 - Path finding
+- Property indexes
 """
 
+import os
+import json
+import asyncio
 from typing import Dict, Any, List, Optional, Union
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 
+from ..batch import read_batch_body, convert_batch_items, batch_response
 from ...core.engine import get_knowledge_engine, KnowledgeEngine
 from ...core.entity import Entity
 from ...core.relationship import Relationship
 
+# Server-side limits on raw queries: rows returned, and seconds a
+# non-streaming query may run
+QUERY_MAX_ROWS = int(os.environ.get("ATHENA_QUERY_MAX_ROWS", "10000"))
+QUERY_TIMEOUT = float(os.environ.get("ATHENA_QUERY_TIMEOUT", "30"))
+
 # Create router
 router = APIRouter(
     prefix="/knowledge",
@@ -46,6 +57,23 @@ async def create_entity(
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error creating entity: {str(e)}")
 
+@router.post("/entities/batch")
+async def create_entities(
+    request: Request,
+    engine: KnowledgeEngine = Depends(get_engine)
+) -> Dict[str, Any]:
+    """
+    Create many entities from a JSON array or an NDJSON body.
+    
+    Invalid items are reported by their position in the request without
+    failing the rest of the batch.
+    """
+    items, errors = await read_batch_body(request)
+    total = len(items) + len(errors)
+    indices, entities = convert_batch_items(items, Entity.from_dict, errors)
+    result = await engine.add_entities(entities)
+    return batch_response(indices, result, errors, total)
+
 @router.get("/entities/{entity_id}")
 async def get_entity(
     entity_id: str,
@@ -99,6 +127,44 @@ async def search_entities(
     entities = await engine.search_entities(query, entity_type, limit)
     return [entity.to_dict() for entity in entities]
 
+def _parse_value(raw: Optional[str]) -> Any:
+    """Interpret a query-string value as JSON (numbers, booleans), falling back to the raw string."""
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw
+
+@router.get("/properties/{name}/entities")
+async def find_entities_by_property(
+    name: str,
+    value: Optional[str] = None,
+    min_value: Optional[str] = None,
+    max_value: Optional[str] = None,
+    entity_type: Optional[str] = None,
+    limit: int = 100,
+    engine: KnowledgeEngine = Depends(get_engine)
+) -> List[Dict[str, Any]]:
+    """
+    Find entities whose property equals a value or lies in an inclusive range.
+    
+    Values are parsed as JSON when possible, so min_value=1990 is a number
+    and value="1990" (quoted) is a string.
+    """
+    try:
+        entities = await engine.find_entities_by_property(
+            name,
+            value=_parse_value(value),
+            min_value=_parse_value(min_value),
+            max_value=_parse_value(max_value),
+            entity_type=entity_type,
+            limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return [entity.to_dict() for entity in entities]
+
 # Relationship endpoints
 
 @router.post("/relationships", response_model=Dict[str, str])
@@ -114,6 +180,23 @@ async def create_relationship(
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error creating relationship: {str(e)}")
 
+@router.post("/relationships/batch")
+async def create_relationships(
+    request: Request,
+    engine: KnowledgeEngine = Depends(get_engine)
+) -> Dict[str, Any]:
+    """
+    Create many relationships from a JSON array or an NDJSON body.
+    
+    Invalid items are reported by their position in the request without
+    failing the rest of the batch.
+    """
+    items, errors = await read_batch_body(request)
+    total = len(items) + len(errors)
+    indices, relationships = convert_batch_items(items, Relationship.from_dict, errors)
+    result = await engine.add_relationships(relationships)
+    return batch_response(indices, result, errors, total)
+
 @router.get("/relationships/{relationship_id}")
 async def get_relationship(
     relationship_id: str,
@@ -184,31 +267,86 @@ async def get_entity_relationships(
 @router.post("/query")
 async def execute_query(
     query_data: Dict[str, Any],
+    response: Response,
+    stream: bool = False,
     engine: KnowledgeEngine = Depends(get_engine)
 ) -> List[Dict[str, Any]]:
-    """Execute a raw Cypher query."""
-    try:
-        query = query_data.get("query", "")
-        params = query_data.get("params", {})
+    """
+    Execute a raw Cypher query.
+    
+    At most QUERY_MAX_ROWS rows are returned, fewer if the body sets
+    max_rows. With stream=true the rows are sent as newline-delimited JSON
+    as the database produces them; if the row cap cut the result short,
+    the last line is {"truncated": true, "max_rows": ...}, and an error
+    part way through ends the stream with an {"error": ...} line.
+    Otherwise the query must finish within QUERY_TIMEOUT seconds, and the
+    X-Result-Truncated header tells whether rows were left out.
+    """
+    query = query_data.get("query", "")
+    params = query_data.get("params", {})
+    if not query:
+        raise HTTPException(status_code=400, detail="Query is required")
         
-        if not query:
-            raise HTTPException(status_code=400, detail="Query is required")
-            
-        results = await engine.execute_query(query, params)
-        return results
+    max_rows = query_data.get("max_rows") or QUERY_MAX_ROWS
+    if not isinstance(max_rows, int) or max_rows < 1:
+        raise HTTPException(status_code=400, detail="max_rows must be a positive integer")
+    max_rows = min(max_rows, QUERY_MAX_ROWS)
+        
+    if stream:
+        async def generate_stream():
+            # Ask for one row past the cap to tell whether it cut the result
+            records = engine.stream_query(query, params, max_rows + 1)
+            count = 0
+            try:
+                async for record in records:
+                    if count == max_rows:
+                        yield json.dumps({"truncated": True, "max_rows": max_rows}) + "\n"
+                    else:
+                        yield json.dumps(record, default=str) + "\n"
+                    count += 1
+            except Exception as e:
+                yield json.dumps({"error": f"Error executing query: {str(e)}"}) + "\n"
+            finally:
+                # Release the database stream even if the client went away
+                await records.aclose()
+                
+        return StreamingResponse(generate_stream(), media_type="application/x-ndjson")
+        
+    async def collect() -> List[Dict[str, Any]]:
+        records = engine.stream_query(query, params, max_rows + 1)
+        try:
+            return [record async for record in records]
+        finally:
+            # Release the database stream when the timeout cancels the read
+            await records.aclose()
+        
+    try:
+        results = await asyncio.wait_for(collect(), timeout=QUERY_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=f"Query did not finish within {QUERY_TIMEOUT:g} seconds")
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error executing query: {str(e)}")
+        
+    response.headers["X-Result-Truncated"] = "true" if len(results) > max_rows else "false"
+    return results[:max_rows]
 
 @router.get("/path")
 async def find_path(
     source_id: str,
     target_id: str,
     max_depth: int = 3,
+    max_paths: int = 10,
+    weighted: bool = False,
     engine: KnowledgeEngine = Depends(get_engine)
 ) -> List[List[Dict[str, Any]]]:
-    """Find paths between two entities."""
+    """
+    Find up to max_paths paths of at most max_depth relationships between two entities.
+    
+    Paths come shortest first, or with weighted, most confident first by
+    the product of their relationships' confidences.
+    """
     try:
-        paths = await engine.find_path(source_id, target_id, max_depth)
+        paths = await engine.find_path(source_id, target_id, max_depth, max_paths, weighted)
         
         # Convert to serializable format
         result = []
@@ -225,6 +363,52 @@ async def find_path(
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error finding path: {str(e)}")
 
+# Admin endpoints
+
+@router.get("/admin/property-indexes")
+async def list_property_indexes(
+    engine: KnowledgeEngine = Depends(get_engine)
+) -> List[Dict[str, Any]]:
+    """List the property indexes."""
+    return await engine.list_property_indexes()
+
+@router.post("/admin/property-indexes")
+async def create_property_index(
+    index_data: Dict[str, Any],
+    engine: KnowledgeEngine = Depends(get_engine)
+) -> Dict[str, Any]:
+    """
+    Create a property index.
+    
+    The body is {"name": property, "kind": "hash" | "sorted"}; hash indexes
+    answer equality lookups and sorted indexes answer range lookups.
+    """
+    name = index_data.get("name")
+    if not name:
+        raise HTTPException(status_code=400, detail="Property name is required")
+    kind = index_data.get("kind", "hash")
+    try:
+        created = await engine.create_property_index(name, kind)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating index on property {name}: {str(e)}")
+    return {"name": name, "kind": kind, "status": "created" if created else "exists"}
+
+@router.delete("/admin/property-indexes/{name}")
+async def drop_property_index(
+    name: str,
+    engine: KnowledgeEngine = Depends(get_engine)
+) -> Dict[str, str]:
+    """Drop a property index."""
+    try:
+        dropped = await engine.drop_property_index(name)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error dropping index on property {name}: {str(e)}")
+    if not dropped:
+        raise HTTPException(status_code=404, detail=f"No index on property {name}")
+    return {"name": name, "status": "dropped"}
+
 # Statistics endpoints
 
 @router.get("/stats")
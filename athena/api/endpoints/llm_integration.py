@@ -224,12 +224,11 @@ async def get_knowledge_context(request: KnowledgeContextRequest):
         relationships = []
         entity_ids = [e.entity_id for e in entities]
         
-        # For each entity, get its relationships
+        # Get the relationships of all entities in one batch
+        relationships_by_entity = await engine.get_relationships_for_entities(entity_ids, direction="both")
+        
         for entity_id in entity_ids:
-            entity_relationships = await engine.get_entity_relationships(
-                entity_id=entity_id,
-                direction="both"
-            )
+            entity_relationships = relationships_by_entity.get(entity_id, [])
             
             # Only include relationships between our relevant entities
             for rel, connected_entity in entity_relationships:
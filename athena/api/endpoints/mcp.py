@@ -5,6 +5,7 @@ This module provides FastAPI endpoints for Athena's MCP implementation,
 allowing other components to interact with Athena's knowledge graph capabilities.
 """
 
+import math
 import logging
 import time
 from typing import Dict, List, Any, Optional
@@ -342,18 +343,24 @@ async def find_paths_handler(engine, entity_manager, query_engine, request):
     target_id = params.get("target_id", "")
     max_depth = params.get("max_depth", 3)
     relationship_types = params.get("relationship_types")
+    max_paths = params.get("max_paths", 10)
+    weighted = params.get("weighted", False)
     
     # Find paths
-    paths = await engine.find_paths(
+    paths = await engine.find_path(
         source_id, 
         target_id,
         max_depth=max_depth,
+        max_paths=max_paths,
+        weighted=weighted,
         relationship_types=relationship_types
     )
     
     # Format results
     formatted_paths = []
+    confidences = []
     for path in paths:
+        confidences.append(math.prod(rel.confidence for rel in path[1::2]))
         formatted_path = []
         
         for i, item in enumerate(path):
@@ -382,8 +389,10 @@ async def find_paths_handler(engine, entity_manager, query_engine, request):
         "target_id": target_id,
         "max_depth": max_depth,
         "relationship_types": relationship_types,
+        "weighted": weighted,
         "count": len(formatted_paths),
-        "paths": formatted_paths
+        "paths": formatted_paths,
+        "confidences": confidences
     }
 
 async def merge_entities_handler(engine, entity_manager, query_engine, request):
@@ -45,7 +45,8 @@ async def get_visualization_data(
                 center_node=center_node,
                 depth=depth,
                 relationship_type=relationship_type,
-                min_confidence=min_confidence
+                min_confidence=min_confidence,
+                max_nodes=limit
             )
         else:
             # Get general graph data with specified filters
@@ -71,19 +72,19 @@ async def get_visualization_data(
             # Get relationships between these entities
             entity_ids = [e.entity_id for e in entities]
             
-            # For each entity, get relationships within our entity set
-            for entity_id in entity_ids:
-                entity_relationships = await engine.get_entity_relationships(
-                    entity_id=entity_id,
-                    relationship_type=relationship_type,
-                    direction="both"
-                )
-                
-                # Only include relationships between our entities
+            # Get the relationships of all entities in one batch, keeping
+            # those within our entity set, each once
+            relationships_by_entity = await engine.get_relationships_for_entities(
+                entity_ids,
+                relationship_type=relationship_type,
+                direction="both"
+            )
+            included = {}
+            for entity_relationships in relationships_by_entity.values():
                 for rel, connected_entity in entity_relationships:
                     if connected_entity.entity_id in entity_ids and rel.confidence >= min_confidence:
-                        if rel not in relationships:
-                            relationships.append(rel)
+                        included.setdefault(rel.relationship_id, rel)
+            relationships = list(included.values())
             
             graph_data = {
                 "entities": entities,
@@ -154,7 +155,8 @@ async def create_custom_visualization(request: GraphVisualizationRequest):
                 center_node=request.center_node_id,
                 depth=request.depth or 1,
                 relationship_type=request.relationship_type,
-                min_confidence=request.min_confidence or 0.0
+                min_confidence=request.min_confidence or 0.0,
+                max_nodes=request.limit or 100
             )
         else:
             # Get entities with filters
@@ -171,21 +173,20 @@ async def create_custom_visualization(request: GraphVisualizationRequest):
             
             # Get relationships between these entities
             entity_ids = [e.entity_id for e in entities]
-            relationships = []
             
-            # For each entity, get relationships within our entity set
-            for entity_id in entity_ids:
-                entity_relationships = await engine.get_entity_relationships(
-                    entity_id=entity_id,
-                    relationship_type=request.relationship_type,
-                    direction="both"
-                )
-                
-                # Only include relationships between our entities
+            # Get the relationships of all entities in one batch, keeping
+            # those within our entity set, each once
+            relationships_by_entity = await engine.get_relationships_for_entities(
+                entity_ids,
+                relationship_type=request.relationship_type,
+                direction="both"
+            )
+            included = {}
+            for entity_relationships in relationships_by_entity.values():
                 for rel, connected_entity in entity_relationships:
                     if connected_entity.entity_id in entity_ids and rel.confidence >= (request.min_confidence or 0.0):
-                        if rel not in relationships:
-                            relationships.append(rel)
+                        included.setdefault(rel.relationship_id, rel)
+            relationships = list(included.values())
             
             graph_data = {
                 "entities": entities,
@@ -215,7 +216,8 @@ async def get_node_subgraph(
     center_node: str,
     depth: int = 1,
     relationship_type: Optional[str] = None,
-    min_confidence: float = 0.0
+    min_confidence: float = 0.0,
+    max_nodes: Optional[int] = 1000
 ):
     """
     Helper function to get a subgraph around a center node.
@@ -225,61 +227,27 @@ async def get_node_subgraph(
         depth: How many relationship hops to include
         relationship_type: Filter relationships by type
         min_confidence: Minimum confidence threshold for relationships
+        max_nodes: Maximum number of entities to include, nearest first
         
     Returns:
         Dictionary with entities and relationships lists
     """
     engine = await get_knowledge_engine()
     
-    # Get the center entity
-    center_entity = await engine.get_entity(center_node)
-    if not center_entity:
-        raise HTTPException(status_code=404, detail=f"Entity with ID {center_node} not found")
-    
-    # Collect entities and relationships
-    entities = [center_entity]
-    relationships = []
-    entity_ids = {center_entity.entity_id}
+    # The adapter walks the neighborhood natively and lists each relationship once
+    subgraph = await engine.get_subgraph(
+        [center_node],
+        depth=depth,
+        relationship_types=[relationship_type] if relationship_type else None,
+        min_confidence=min_confidence,
+        max_nodes=max_nodes
+    )
     
-    # Queue of nodes to process with their current depth
-    queue = [(center_entity.entity_id, 0)]
-    processed = set()
-    
-    while queue:
-        current_id, current_depth = queue.pop(0)
-        
-        if current_id in processed:
-            continue
-            
-        processed.add(current_id)
-        
-        if current_depth >= depth:
-            continue
-        
-        # Get relationships for this entity
-        entity_relationships = await engine.get_entity_relationships(
-            entity_id=current_id,
-            relationship_type=relationship_type,
-            direction="both"
-        )
-        
-        for rel, connected_entity in entity_relationships:
-            if rel.confidence < min_confidence:
-                continue
-                
-            # Add relationship if it meets criteria
-            if rel not in relationships:
-                relationships.append(rel)
-            
-            # Add connected entity if not already included
-            if connected_entity.entity_id not in entity_ids:
-                entities.append(connected_entity)
-                entity_ids.add(connected_entity.entity_id)
-                
-                # Add to queue for next level processing
-                queue.append((connected_entity.entity_id, current_depth + 1))
+    # The center always comes first when it exists
+    if not subgraph["entities"] or subgraph["entities"][0].entity_id != center_node:
+        raise HTTPException(status_code=404, detail=f"Entity with ID {center_node} not found")
     
     return {
-        "entities": entities,
-        "relationships": relationships
-    }
\ No newline at end of file
+        "entities": subgraph["entities"],
+        "relationships": subgraph["relationships"]
+    }
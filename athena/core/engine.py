@@ -6,9 +6,11 @@ Core knowledge graph engine and management capabilities.
 
 import os
 import json
+import math
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Set, Tuple, Union
+from collections import deque
+from typing import Dict, Any, AsyncIterator, List, Optional, Set, Tuple, Union
 from pathlib import Path
 
 # Import FastMCP integration if available
@@ -49,12 +51,18 @@ class KnowledgeEngine:
     Manages entity and relationship creation, querying, and inference.
     """
     
-    def __init__(self, data_path: Optional[str] = None):
+    def __init__(self, data_path: Optional[str] = None, adapter_type: Optional[str] = None,
+                 adapter_options: Optional[Dict[str, Any]] = None):
         """
         Initialize the knowledge engine.
         
         Args:
             data_path: Path to store graph data (if using file-based adapter)
+            adapter_type: Graph storage engine, "neo4j", "memory", "csr",
+                "sharded" or "shared".
+                Defaults to $ATHENA_GRAPH_ADAPTER, then to Neo4j when it is
+                available and the in-memory adapter otherwise.
+            adapter_options: Extra keyword arguments passed to the adapter
         """
         if data_path:
             self.data_path = data_path
@@ -65,6 +73,8 @@ class KnowledgeEngine:
                               os.path.join(os.environ.get('TEKTON_ROOT', os.path.expanduser('~')), '.tekton', 'data')),
                 'athena'
             )
+        self.adapter_type = adapter_type or os.environ.get('ATHENA_GRAPH_ADAPTER')
+        self.adapter_options = adapter_options or {}
         self.is_initialized = False
         self.adapter = None
         self.entity_manager = None
@@ -89,7 +99,27 @@ class KnowledgeEngine:
             "namespace": "athena_knowledge"
         }
         
-        if USING_NEO4J:
+        adapter_config.update(self.adapter_options)
+        
+        if self.adapter_type == "csr":
+            from .graph.csr import CSRAdapter as GraphAdapter
+            logger.info("Using CSR array graph adapter with file persistence")
+        elif self.adapter_type == "sharded":
+            from .graph.sharded import ShardedAdapter as GraphAdapter
+            logger.info("Using sharded multi-process graph adapter with file persistence")
+        elif self.adapter_type == "shared":
+            from .graph.shared import SharedGraphAdapter as GraphAdapter
+            logger.info("Using shared single-writer graph adapter with file persistence")
+        elif self.adapter_type == "memory":
+            from .graph.memory_adapter import MemoryAdapter as GraphAdapter
+            logger.info("Using in-memory graph adapter with file persistence")
+        elif self.adapter_type == "neo4j":
+            from .graph.neo4j_adapter import Neo4jAdapter as GraphAdapter
+            logger.info("Using Neo4j graph database adapter")
+        elif self.adapter_type:
+            logger.error(f"Unknown graph adapter type: {self.adapter_type}")
+            return False
+        elif USING_NEO4J:
             # Import within function to handle both direct import and Hermes integration
             try:
                 from .graph.neo4j_adapter import Neo4jAdapter as GraphAdapter
@@ -102,6 +132,9 @@ class KnowledgeEngine:
             from .graph.memory_adapter import MemoryAdapter as GraphAdapter
             logger.info("Using in-memory graph adapter with file persistence")
             
+        if not self.adapter_type:
+            self.adapter_type = "neo4j" if GraphAdapter.__name__ == "Neo4jAdapter" else "memory"
+            
         try:
             self.adapter = GraphAdapter(**adapter_config)
             await self.adapter.connect()
@@ -179,6 +212,29 @@ class KnowledgeEngine:
             logger.error(f"Error adding entity: {e}")
             raise
             
+    async def add_entities(self, entities: List[Entity], batch_size: int = 10000) -> Dict[str, Any]:
+        """
+        Add many entities to the knowledge graph.
+        
+        Entities are handed to the adapter in batches. A failing entity is
+        reported in the result instead of failing the whole call.
+        
+        Args:
+            entities: Entity objects to add
+            batch_size: Number of entities per adapter call
+            
+        Returns:
+            Dictionary with the IDs of the created entities and a list of
+            errors, each with the index of the failed entity in the input
+        """
+        if not self.is_initialized:
+            await self.initialize()
+            
+        return await self._add_in_batches(
+            entities, batch_size, "create_entities", "create_entity",
+            lambda entity: entity.entity_id, "entities"
+        )
+        
     async def get_entity(self, entity_id: str) -> Optional[Entity]:
         """
         Retrieve an entity by ID.
@@ -264,6 +320,62 @@ class KnowledgeEngine:
             logger.error(f"Error adding relationship: {e}")
             raise
             
+    async def add_relationships(self, relationships: List[Relationship], batch_size: int = 10000) -> Dict[str, Any]:
+        """
+        Add many relationships to the knowledge graph.
+        
+        Relationships are handed to the adapter in batches. A failing
+        relationship is reported in the result instead of failing the whole call.
+        
+        Args:
+            relationships: Relationship objects to add
+            batch_size: Number of relationships per adapter call
+            
+        Returns:
+            Dictionary with the IDs of the created relationships and a list of
+            errors, each with the index of the failed relationship in the input
+        """
+        if not self.is_initialized:
+            await self.initialize()
+            
+        return await self._add_in_batches(
+            relationships, batch_size, "create_relationships", "create_relationship",
+            lambda relationship: relationship.relationship_id, "relationships"
+        )
+        
+    async def _add_in_batches(self, items: List[Any], batch_size: int, batch_method: str,
+                              single_method: str, get_id, label: str) -> Dict[str, Any]:
+        """Feed items to the adapter's batch method, falling back to one call per item."""
+        created: List[str] = []
+        errors: List[Dict[str, Any]] = []
+        create_batch = getattr(self.adapter, batch_method, None)
+        create_one = getattr(self.adapter, single_method)
+        
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            if create_batch:
+                try:
+                    failed = await create_batch(batch)
+                except Exception as e:
+                    logger.error(f"Error adding batch of {label}: {e}")
+                    failed = {index: str(e) for index in range(len(batch))}
+            else:
+                failed = {}
+                for index, item in enumerate(batch):
+                    try:
+                        await create_one(item)
+                    except Exception as e:
+                        failed[index] = str(e)
+                        
+            for index, item in enumerate(batch):
+                if index in failed:
+                    errors.append({"index": start + index, "id": get_id(item), "error": failed[index]})
+                else:
+                    created.append(get_id(item))
+                    
+        logger.info(f"Added {len(created)} {label} in bulk ({len(errors)} failed)")
+        return {"created": created, "errors": errors}
+        
     async def get_relationship(self, relationship_id: str) -> Optional[Relationship]:
         """
         Retrieve a relationship by ID.
@@ -350,6 +462,113 @@ class KnowledgeEngine:
             logger.error(f"Error searching entities: {e}")
             return []
             
+    async def find_entities_by_property(self,
+                                        name: str,
+                                        value: Any = None,
+                                        min_value: Any = None,
+                                        max_value: Any = None,
+                                        entity_type: Optional[str] = None,
+                                        limit: int = 100) -> List[Entity]:
+        """
+        Find entities by property value.
+        
+        Either an exact value or an inclusive range (one or both bounds) is
+        given. Adapters answer from a property index when one exists on the
+        property and scan otherwise.
+        
+        Args:
+            name: Property name
+            value: Required value (omit for a range query)
+            min_value: Inclusive lower bound
+            max_value: Inclusive upper bound
+            entity_type: Optional entity type to filter by
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of matching entities
+            
+        Raises:
+            ValueError: If neither a value nor a range bound is given
+        """
+        if value is None and min_value is None and max_value is None:
+            raise ValueError("A value or at least one range bound is required")
+            
+        if not self.is_initialized:
+            await self.initialize()
+            
+        try:
+            return await self.adapter.find_entities_by_property(
+                name, value, min_value, max_value, entity_type, limit
+            )
+        except Exception as e:
+            logger.error(f"Error finding entities by property {name}: {e}")
+            return []
+            
+    async def create_property_index(self, name: str, kind: str = "hash") -> bool:
+        """
+        Create an index over an entity property.
+        
+        Args:
+            name: Property name
+            kind: "hash" for equality lookups or "sorted" for range lookups
+            
+        Returns:
+            True if the index was created, False if it already existed
+            
+        Raises:
+            ValueError: If the kind is unknown
+            Exception: If the adapter fails to create the index
+        """
+        if kind not in ("hash", "sorted"):
+            raise ValueError(f"Unsupported property index kind: {kind}")
+            
+        if not self.is_initialized:
+            await self.initialize()
+            
+        try:
+            return await self.adapter.create_property_index(name, kind)
+        except Exception as e:
+            logger.error(f"Error creating index on property {name}: {e}")
+            raise
+            
+    async def drop_property_index(self, name: str) -> bool:
+        """
+        Drop the index over an entity property.
+        
+        Args:
+            name: Property name
+            
+        Returns:
+            True if an index was dropped, False if there was none
+            
+        Raises:
+            Exception: If the adapter fails to drop the index
+        """
+        if not self.is_initialized:
+            await self.initialize()
+            
+        try:
+            return await self.adapter.drop_property_index(name)
+        except Exception as e:
+            logger.error(f"Error dropping index on property {name}: {e}")
+            raise
+            
+    async def list_property_indexes(self) -> List[Dict[str, Any]]:
+        """
+        List the property indexes.
+        
+        Returns:
+            List of index descriptions with at least "name" and "kind"
+        """
+        if not self.is_initialized:
+            await self.initialize()
+            
+        try:
+            return await self.adapter.list_property_indexes()
+        except Exception as e:
+            logger.error(f"Error listing property indexes: {e}")
+            return []
+            
     async def get_entity_relationships(self, 
                                     entity_id: str, 
                                     relationship_type: Optional[str] = None,
@@ -375,6 +594,42 @@ class KnowledgeEngine:
             logger.error(f"Error getting entity relationships for {entity_id}: {e}")
             return []
             
+    async def get_relationships_for_entities(self,
+                                             entity_ids: List[str],
+                                             relationship_type: Optional[str] = None,
+                                             direction: str = "both",
+                                             per_entity_limit: Optional[int] = None) -> Dict[str, List[Tuple[Relationship, Entity]]]:
+        """
+        Get the relationships of many entities at once.
+        
+        Adapters that support it answer with a single query instead of one
+        round trip per entity.
+        
+        Args:
+            entity_ids: Entity IDs to query
+            relationship_type: Optional relationship type to filter by
+            direction: Direction of relationships ('outgoing', 'incoming', or 'both')
+            per_entity_limit: Maximum number of relationships per entity, or None for all
+            
+        Returns:
+            Mapping from each requested entity ID to its (relationship, connected entity) tuples
+        """
+        if not self.is_initialized:
+            await self.initialize()
+            
+        try:
+            fetch = getattr(self.adapter, "get_relationships_for_entities", None)
+            if fetch:
+                return await fetch(entity_ids, relationship_type, direction, per_entity_limit)
+            results = {}
+            for entity_id in entity_ids:
+                relationships = await self.adapter.get_entity_relationships(entity_id, relationship_type, direction)
+                results[entity_id] = relationships[:per_entity_limit]
+            return results
+        except Exception as e:
+            logger.error(f"Error getting relationships for {len(entity_ids)} entities: {e}")
+            return {entity_id: [] for entity_id in entity_ids}
+            
     async def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
         Execute a raw graph query.
@@ -396,17 +651,68 @@ class KnowledgeEngine:
             logger.error(f"Error executing query: {e}")
             return []
             
+    async def stream_query(self, query: str, params: Dict[str, Any] = None,
+                           max_rows: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a raw graph query, yielding results one at a time.
+        
+        Adapters that can stream hold only a batch of results in memory;
+        others run execute_query and yield from its result. Unlike
+        execute_query, errors are raised to the consumer.
+        
+        Args:
+            query: Query string in the graph database language (e.g., Cypher for Neo4j)
+            params: Query parameters
+            max_rows: Maximum number of results to yield, or None for all
+            
+        Yields:
+            Query results
+        """
+        if not self.is_initialized:
+            await self.initialize()
+            
+        if max_rows is not None and max_rows < 1:
+            return
+        stream = getattr(self.adapter, "stream_query", None)
+        if stream:
+            records = stream(query, params or {})
+        else:
+            records = _iterate(await self.adapter.execute_query(query, params or {}))
+            
+        count = 0
+        try:
+            async for record in records:
+                yield record
+                count += 1
+                if count == max_rows:
+                    break
+        finally:
+            await records.aclose()
+            
     async def find_path(self, 
                       source_id: str, 
                       target_id: str, 
-                      max_depth: int = 3) -> List[List[Union[Entity, Relationship]]]:
+                      max_depth: int = 3,
+                      max_paths: Optional[int] = 10,
+                      weighted: bool = False,
+                      relationship_types: Optional[List[str]] = None) -> List[List[Union[Entity, Relationship]]]:
         """
-        Find paths between two entities.
+        Find paths between two entities, shortest first.
+        
+        With weighted, paths are ranked by the product of their
+        relationships' confidences instead, so the first path is the most
+        trustworthy chain and max_paths gives the top k.
+        
+        With relationship_types, the search follows only relationships of
+        those types, so max_paths counts matching paths only.
         
         Args:
             source_id: Source entity ID
             target_id: Target entity ID
-            max_depth: Maximum path length
+            max_depth: Maximum number of relationships in a path
+            max_paths: Maximum number of paths to return, or None for all
+            weighted: Rank paths by confidence instead of by length
+            relationship_types: Relationship types a path may use, or None for all
             
         Returns:
             List of paths, where each path is a list of alternating Entity and Relationship objects
@@ -415,12 +721,148 @@ class KnowledgeEngine:
             await self.initialize()
             
         try:
-            paths = await self.adapter.find_paths(source_id, target_id, max_depth)
+            paths = await self.adapter.find_paths(source_id, target_id, max_depth, max_paths, weighted,
+                                                  relationship_types)
             return paths
         except Exception as e:
             logger.error(f"Error finding paths: {e}")
             return []
     
+    async def are_connected(self, source_id: str, target_id: str, max_hops: Optional[int] = None) -> bool:
+        """
+        Check whether a directed path leads from one entity to another.
+        
+        Adapters with a reachability index answer without enumerating
+        paths; others fall back to looking for a single path, of at most
+        3 relationships when max_hops is None.
+        
+        Args:
+            source_id: Source entity ID
+            target_id: Target entity ID
+            max_hops: Maximum number of relationships on the path, or None for any
+        
+        Returns:
+            True if the target is reachable within max_hops
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        
+        try:
+            check = getattr(self.adapter, "are_connected", None)
+            if check:
+                return await check(source_id, target_id, max_hops)
+            if max_hops is None:
+                max_hops = 3
+            return bool(await self.adapter.find_paths(source_id, target_id, max_hops, 1))
+        except Exception as e:
+            logger.error(f"Error checking connectivity: {e}")
+            return False
+    
+    async def distance_bounds(self, source_id: str, target_id: str) -> Tuple[float, float]:
+        """
+        Bound the number of relationships on a shortest path between two entities.
+        
+        Args:
+            source_id: Source entity ID
+            target_id: Target entity ID
+        
+        Returns:
+            (lower, upper) pair, where math.inf means unreachable or unknown;
+            (inf, inf) means no path exists
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        
+        try:
+            bounds = getattr(self.adapter, "distance_bounds", None)
+            if bounds:
+                return await bounds(source_id, target_id)
+        except Exception as e:
+            logger.error(f"Error bounding distance: {e}")
+        return (0.0, 0.0) if source_id == target_id else (1.0, math.inf)
+    
+    async def get_subgraph(self,
+                           center_ids: List[str],
+                           depth: int = 1,
+                           relationship_types: Optional[List[str]] = None,
+                           min_confidence: float = 0.0,
+                           max_nodes: Optional[int] = 1000) -> Dict[str, Any]:
+        """
+        Get the entities within depth hops of some centers and the relationships between them.
+        
+        Relationships are followed in both directions. When max_nodes cuts
+        the neighborhood short, the entities nearest the centers are kept.
+        
+        Args:
+            center_ids: IDs of the entities to start from
+            depth: Maximum number of relationships between a center and an entity
+            relationship_types: Relationship types to follow, or None for all
+            min_confidence: Minimum confidence of a followed relationship
+            max_nodes: Maximum number of entities to return, or None for no limit
+            
+        Returns:
+            Dictionary with "entities" (centers first, then nearest first),
+            "relationships" among them, each listed once, and "truncated"
+        """
+        if not self.is_initialized:
+            await self.initialize()
+            
+        try:
+            extract = getattr(self.adapter, "get_subgraph", None)
+            if extract:
+                return await extract(center_ids, depth, relationship_types, min_confidence, max_nodes)
+            return await self._subgraph_by_relationships(center_ids, depth, relationship_types, min_confidence, max_nodes)
+        except Exception as e:
+            logger.error(f"Error extracting subgraph: {e}")
+            return {"entities": [], "relationships": [], "truncated": False}
+            
+    async def _subgraph_by_relationships(self, center_ids: List[str], depth: int,
+                                         relationship_types: Optional[List[str]], min_confidence: float,
+                                         max_nodes: Optional[int]) -> Dict[str, Any]:
+        """Breadth-first subgraph extraction for adapters without a native get_subgraph."""
+        types = set(relationship_types) if relationship_types else None
+        entities: Dict[str, Entity] = {}
+        relationships: Dict[str, Relationship] = {}
+        truncated = False
+        queue = deque()
+        for center_id in dict.fromkeys(center_ids):
+            entity = await self.adapter.get_entity(center_id)
+            if entity is None:
+                continue
+            if max_nodes is not None and len(entities) >= max_nodes:
+                truncated = True
+                break
+            entities[center_id] = entity
+            queue.append((center_id, 0))
+            
+        # Entities at depth are visited too, for the relationships among them
+        expanded = set()
+        while queue:
+            entity_id, hops = queue.popleft()
+            if entity_id in expanded:
+                continue
+            expanded.add(entity_id)
+            for relationship, other in await self.adapter.get_entity_relationships(entity_id, direction="both"):
+                if relationship.confidence < min_confidence:
+                    continue
+                if types is not None and relationship.relationship_type not in types:
+                    continue
+                if other.entity_id not in entities:
+                    if hops >= depth or truncated:
+                        continue
+                    if max_nodes is not None and len(entities) >= max_nodes:
+                        truncated = True
+                        continue
+                    entities[other.entity_id] = other
+                    queue.append((other.entity_id, hops + 1))
+                relationships[relationship.relationship_id] = relationship
+                
+        return {
+            "entities": list(entities.values()),
+            "relationships": list(relationships.values()),
+            "truncated": truncated
+        }
+        
     async def get_status(self) -> Dict[str, Any]:
         """
         Get the status of the knowledge engine.
@@ -435,25 +877,35 @@ class KnowledgeEngine:
             }
             
         try:
-            adapter_type = "neo4j" if USING_NEO4J else "memory"
             entity_count = await self.adapter.count_entities()
             relationship_count = await self.adapter.count_relationships()
             
-            return {
+            status = {
                 "status": "initialized",
-                "adapter_type": adapter_type,
+                "adapter_type": self.adapter_type,
                 "entity_count": entity_count,
                 "relationship_count": relationship_count,
                 "data_path": self.data_path
             }
+            
+            # Include adapter-specific details such as snapshot load progress
+            if hasattr(self.adapter, "get_status"):
+                status["adapter_status"] = await self.adapter.get_status()
+                
+            return status
         except Exception as e:
             logger.error(f"Error getting engine status: {e}")
             return {
                 "status": "error",
-                "adapter_type": "neo4j" if USING_NEO4J else "memory",
+                "adapter_type": self.adapter_type,
                 "error": str(e)
             }
 
+async def _iterate(items: List[Any]) -> AsyncIterator[Any]:
+    """Yield the items of a list from an async generator."""
+    for item in items:
+        yield item
+
 # Global singleton instance
 _engine = KnowledgeEngine()
 
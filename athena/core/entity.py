@@ -4,9 +4,11 @@ Athena Entity Module
 Provides entity management capabilities for the knowledge graph.
 """
 
+import sys
 import uuid
-from typing import Dict, Any, List, Optional, Set, Tuple
-from datetime import datetime
+from typing import Dict, Any, FrozenSet, Iterable, List, Optional, Tuple
+
+from . import timestamps
 
 class Entity:
     """
@@ -14,8 +16,30 @@ class Entity:
     
     Entities are the primary unit of knowledge in Athena, representing
     people, concepts, objects, etc.
+    
+    Instances are slotted to keep large graphs small: type and source
+    strings are interned, timestamps are held as integer microseconds and
+    formatted on access, and aliases are stored as a tuple.
+    
+    A graph adapter may also leave the properties in a stored payload, any
+    object with a load() method returning the properties dictionary. The
+    payload is decoded the first time the properties are accessed, and
+    read_properties() reads it without keeping the result.
     """
     
+    __slots__ = (
+        "entity_id",
+        "entity_type",
+        "name",
+        "_properties",
+        "_payload",
+        "confidence",
+        "source",
+        "_created_at",
+        "_updated_at",
+        "_aliases"
+    )
+    
     def __init__(self, 
                 entity_id: Optional[str] = None, 
                 entity_type: str = "generic", 
@@ -35,16 +59,79 @@ class Entity:
             source: Source of the entity information
         """
         self.entity_id = entity_id or str(uuid.uuid4())
-        self.entity_type = entity_type
+        self.entity_type = sys.intern(entity_type) if isinstance(entity_type, str) else entity_type
         self.name = name
-        self.properties = properties or {}
+        self._properties = properties or {}
+        self._payload = None
         self.confidence = max(0.0, min(1.0, confidence))  # Clamp between 0 and 1
-        self.source = source
-        self.created_at = datetime.utcnow().isoformat()
-        self.updated_at = self.created_at
-        self.aliases: Set[str] = set()
-        if name:
-            self.aliases.add(name.lower())
+        self.source = sys.intern(source) if isinstance(source, str) else source
+        self._created_at = timestamps.now()
+        self._updated_at = self._created_at
+        self._aliases: Tuple[str, ...] = (name.lower(),) if name else ()
+        
+    @property
+    def properties(self) -> Dict[str, Any]:
+        """Property dictionary, decoded from the stored payload on first access."""
+        if self._payload is not None:
+            self._properties = self._payload.load()
+            self._payload = None
+        return self._properties
+        
+    @properties.setter
+    def properties(self, properties: Dict[str, Any]) -> None:
+        self._properties = properties
+        self._payload = None
+        
+    @property
+    def properties_loaded(self) -> bool:
+        """Whether the properties are held in memory rather than in a stored payload."""
+        return self._payload is None
+        
+    def read_properties(self) -> Dict[str, Any]:
+        """
+        Get the properties for reading only.
+        
+        Unlike accessing properties, this does not keep a decoded payload,
+        so scanning many entities does not make their payloads resident.
+        The returned dictionary must not be modified.
+        
+        Returns:
+            Property dictionary
+        """
+        if self._payload is not None:
+            return self._payload.load()
+        return self._properties
+        
+    @property
+    def created_at(self) -> str:
+        """Creation time as an ISO 8601 string."""
+        return timestamps.to_iso(self._created_at)
+        
+    @created_at.setter
+    def created_at(self, value) -> None:
+        self._created_at = timestamps.to_compact(value)
+        
+    @property
+    def updated_at(self) -> str:
+        """Last update time as an ISO 8601 string."""
+        return timestamps.to_iso(self._updated_at)
+        
+    @updated_at.setter
+    def updated_at(self, value) -> None:
+        self._updated_at = timestamps.to_compact(value)
+        
+    @property
+    def aliases(self) -> FrozenSet[str]:
+        """Lower-cased alternative names, including the primary name."""
+        return frozenset(self._aliases)
+        
+    @aliases.setter
+    def aliases(self, aliases: Iterable[str]) -> None:
+        self._aliases = tuple(dict.fromkeys(aliases))
+        
+    def _add_alias(self, alias: str) -> None:
+        if alias not in self._aliases:
+            self._aliases += (alias,)
             
     def add_alias(self, alias: str) -> None:
         """
@@ -54,7 +141,7 @@ class Entity:
             alias: Alternative name
         """
         if alias and alias.strip():
-            self.aliases.add(alias.lower().strip())
+            self._add_alias(alias.lower().strip())
             
     def add_property(self, key: str, value: Any, confidence: float = 1.0) -> None:
         """
@@ -65,12 +152,13 @@ class Entity:
             value: Property value
             confidence: Confidence in this property (0.0 to 1.0)
         """
+        now = timestamps.now()
         self.properties[key] = {
             "value": value,
             "confidence": max(0.0, min(1.0, confidence)),
-            "updated_at": datetime.utcnow().isoformat()
+            "updated_at": timestamps.to_iso(now)
         }
-        self.updated_at = datetime.utcnow().isoformat()
+        self._updated_at = now
         
     def get_property(self, key: str) -> Optional[Any]:
         """
@@ -108,10 +196,10 @@ class Entity:
         if name and name.strip():
             old_name = self.name
             self.name = name.strip()
-            self.aliases.add(name.lower().strip())
+            self._add_alias(name.lower().strip())
             if old_name:
-                self.aliases.add(old_name.lower())
-            self.updated_at = datetime.utcnow().isoformat()
+                self._add_alias(old_name.lower())
+            self._updated_at = timestamps.now()
             
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -124,12 +212,12 @@ class Entity:
             "entity_id": self.entity_id,
             "entity_type": self.entity_type,
             "name": self.name,
-            "properties": self.properties,
+            "properties": self.read_properties(),
             "confidence": self.confidence,
             "source": self.source,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
-            "aliases": list(self.aliases)
+            "aliases": list(self._aliases)
         }
         
     @classmethod
@@ -152,11 +240,13 @@ class Entity:
             source=data.get("source", "system")
         )
         
-        entity.created_at = data.get("created_at", entity.created_at)
-        entity.updated_at = data.get("updated_at", entity.updated_at)
+        if "created_at" in data:
+            entity.created_at = data["created_at"]
+        if "updated_at" in data:
+            entity.updated_at = data["updated_at"]
         
         # Add aliases
-        for alias in data.get("aliases", []):
+        for alias in data.get("aliases") or ():
             entity.add_alias(alias)
             
         return entity
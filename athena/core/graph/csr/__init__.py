@@ -0,0 +1,11 @@
+"""
+CSR-based Graph Module for Athena
+
+Provides an array-backed implementation of the graph database interface.
+Adjacency is kept in NumPy CSR/CSC arrays with a delta buffer for recent
+writes, sharing the memory adapter's persistence formats.
+"""
+
+from .adapter import CSRAdapter
+
+__all__ = ['CSRAdapter']
\ No newline at end of file
@@ -0,0 +1,645 @@
+"""
+CSR Graph Adapter for Athena
+
+Provides an array-backed implementation of the graph database interface.
+Adjacency is stored in NumPy CSR/CSC arrays instead of NetworkX dicts, so
+large graphs take far less memory and neighbor and path queries run on
+the arrays directly.
+"""
+
+import io
+import os
+import json
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ...entity import Entity
+from ...relationship import Relationship
+from ..memory.search_index import TokenIndex, TrigramIndex, tokenize, entity_text_fields
+from ..memory.property_index import PropertyIndexes, find_entities
+from ..memory.snapshot_format import (
+    SnapshotWriter,
+    is_binary_snapshot,
+    iter_blocks,
+    entity_from_record,
+    relationship_from_record,
+    PAYLOAD_BLOCK,
+    ENTITY_BLOCK,
+    RELATIONSHIP_BLOCK
+)
+from ..memory.payload_store import PayloadStore
+from ..memory.path_search import iter_simple_paths, iter_weighted_paths, confidence_cost
+from ..memory.wal import WriteAheadLog, log_mutation, log_mutations
+from .storage import CSRGraphStore
+
+logger = logging.getLogger("athena.graph.csr.adapter")
+
+class CSRAdapter:
+    """
+    Array-backed graph adapter for Athena.
+
+    Entities and relationships are kept in a CSRGraphStore. The adapter
+    shares the memory adapter's on-disk formats (binary snapshot, JSON
+    files and write-ahead log), so a data directory can be opened with
+    either adapter.
+    """
+
+    def __init__(self, data_path: str, **kwargs):
+        """
+        Initialize the CSR adapter.
+
+        Args:
+            data_path: Path to store persistence files
+            **kwargs: Additional configuration options
+                merge_threshold: Delta edges plus tombstones that trigger a
+                    merge into the CSR arrays (default 50000)
+                snapshot_compression: zlib-compress binary snapshots (default True)
+                search_mode: Default entity search semantics, either
+                    "substring" (default) or "token"
+                wal_enabled: Log every mutation to a write-ahead log (default True)
+                wal_commit_delay: Seconds a commit waits to batch more records (default 0)
+                wal_fsync: Whether commits fsync the log (default True)
+                checkpoint_interval: Log records between checkpoints (default 10000)
+        """
+        self.data_path = data_path
+        self.entity_file = os.path.join(data_path, "entities.json")
+        self.relationship_file = os.path.join(data_path, "relationships.json")
+        self.snapshot_file = os.path.join(data_path, "graph.snapshot")
+        self.snapshot_compression = kwargs.get("snapshot_compression", True)
+        self.merge_threshold = kwargs.get("merge_threshold", 50000)
+        self.store = CSRGraphStore()
+        self.is_connected = False
+
+        self.token_index = TokenIndex()
+        self.trigram_index = TrigramIndex()
+        self.search_mode = kwargs.get("search_mode", "substring")
+
+        self.property_index_file = os.path.join(data_path, "property_indexes.json")
+        self.property_indexes = PropertyIndexes()
+
+        self.wal_file = os.path.join(data_path, "graph.wal")
+        self.checkpoint_interval = kwargs.get("checkpoint_interval", 10000)
+        if kwargs.get("wal_enabled", True):
+            self.wal = WriteAheadLog(
+                self.wal_file,
+                commit_delay=kwargs.get("wal_commit_delay", 0.0),
+                fsync=kwargs.get("wal_fsync", True)
+            )
+        else:
+            self.wal = None
+        self._checkpointing = False
+        self._checkpoint_task: Optional[asyncio.Task] = None
+
+    async def connect(self) -> bool:
+        """
+        Connect to the graph database.
+
+        Returns:
+            True if successful
+        """
+        logger.info("Connecting to CSR graph database")
+        os.makedirs(self.data_path, exist_ok=True)
+
+        self.property_indexes.load_definitions(self.property_index_file)
+        # Nothing else touches the store before connect returns, so it can load on a thread
+        await asyncio.get_running_loop().run_in_executor(None, self._load)
+        self.store.merge()
+        self.property_indexes.flush()
+
+        if self.wal:
+            replayed = await self._replay_log()
+            self.wal.open()
+            if replayed:
+                await self.checkpoint()
+
+        self.is_connected = True
+        logger.info(f"Connected to CSR graph database ({self.store.live_nodes} nodes, "
+                    f"{self.store.live_edges} edges)")
+        return True
+
+    async def disconnect(self) -> bool:
+        """
+        Disconnect from the graph database.
+
+        Returns:
+            True if successful
+        """
+        logger.info("Disconnecting from CSR graph database")
+        if self._checkpoint_task is not None:
+            await self._checkpoint_task
+        await self.checkpoint()
+        if self.wal:
+            self.wal.close()
+        self.is_connected = False
+        return True
+
+    async def initialize_schema(self) -> bool:
+        """
+        Initialize the graph schema.
+
+        Returns:
+            True if successful
+        """
+        return True
+
+    async def checkpoint(self) -> bool:
+        """
+        Write a full snapshot and compact the write-ahead log into it.
+
+        Returns:
+            True if the snapshot was written
+        """
+        if self.wal is None:
+            return await self._save()
+
+        if self._checkpointing:
+            return False
+
+        self._checkpointing = True
+        try:
+            await self.wal.rotate()
+            saved = await self._save()
+            if saved:
+                self.wal.discard_rotated()
+            return saved
+        finally:
+            self._checkpointing = False
+
+    def schedule_checkpoint(self) -> None:
+        """Start a checkpoint in the background unless one is already running."""
+        if self._checkpointing:
+            return
+        if self._checkpoint_task is None or self._checkpoint_task.done():
+            self._checkpoint_task = asyncio.create_task(self._background_checkpoint())
+
+    async def _background_checkpoint(self) -> None:
+        try:
+            await self.checkpoint()
+        except Exception as e:
+            logger.error(f"Error checkpointing graph: {e}")
+
+    # Entity operations
+    async def create_entity(self, entity: Entity) -> str:
+        self.store.put_node(entity.entity_id, entity)
+        self._index_entity(entity)
+        await log_mutation(self, "create_entity", entity.to_dict())
+        logger.debug(f"Created entity: {entity.name} ({entity.entity_id})")
+        return entity.entity_id
+
+    async def create_entities(self, entities: List[Entity]) -> Dict[int, str]:
+        """
+        Create many entities with a single write-ahead log commit.
+
+        Args:
+            entities: Entities to create
+
+        Returns:
+            Mapping from batch index to error message for entities that could not be created
+        """
+        errors: Dict[int, str] = {}
+        valid = []
+        for index, entity in enumerate(entities):
+            if not entity.entity_id:
+                errors[index] = "Entity has no ID"
+                continue
+            self.store.put_node(entity.entity_id, entity)
+            self._index_entity(entity)
+            valid.append(entity)
+        await log_mutations(self, "create_entity", [entity.to_dict() for entity in valid])
+        return errors
+
+    async def get_entity(self, entity_id: str) -> Optional[Entity]:
+        return self._lookup_entity(entity_id)
+
+    async def update_entity(self, entity: Entity) -> bool:
+        if self.store.get_node(entity.entity_id) is None:
+            logger.warning(f"Cannot update entity: {entity.entity_id} - not found")
+            return False
+        self.store.put_node(entity.entity_id, entity)
+        self._index_entity(entity)
+        await log_mutation(self, "update_entity", entity.to_dict())
+        return True
+
+    async def delete_entity(self, entity_id: str) -> bool:
+        if self.store.get_node(entity_id) is None:
+            logger.warning(f"Cannot delete entity: {entity_id} - not found")
+            return False
+        self.store.remove_node(entity_id)
+        self.token_index.remove(entity_id)
+        self.trigram_index.remove(entity_id)
+        self.property_indexes.remove(entity_id)
+        await log_mutation(self, "delete_entity", {"entity_id": entity_id})
+        await self._maybe_merge()
+        return True
+
+    def _lookup_entity(self, entity_id: str) -> Optional[Entity]:
+        index = self.store.get_node(entity_id)
+        return self.store.entities[index] if index is not None else None
+
+    def _index_entity(self, entity: Entity) -> None:
+        """Register an entity (or a new version of it) in the search and property indexes."""
+        self.token_index.add(entity)
+        self.trigram_index.add(entity)
+        self.property_indexes.add(entity)
+
+    # Relationship operations
+    async def create_relationship(self, relationship: Relationship) -> str:
+        self.store.put_edge(relationship)
+        await log_mutation(self, "create_relationship", relationship.to_dict())
+        await self._maybe_merge()
+        logger.debug(f"Created relationship: {relationship.relationship_type} ({relationship.relationship_id})")
+        return relationship.relationship_id
+
+    async def create_relationships(self, relationships: List[Relationship]) -> Dict[int, str]:
+        """
+        Create many relationships with a single write-ahead log commit.
+
+        Args:
+            relationships: Relationships to create
+
+        Returns:
+            Mapping from batch index to error message for relationships that could not be created
+        """
+        errors: Dict[int, str] = {}
+        valid = []
+        for index, relationship in enumerate(relationships):
+            if not relationship.source_id or not relationship.target_id:
+                errors[index] = "Relationship needs a source_id and a target_id"
+                continue
+            self.store.put_edge(relationship)
+            valid.append(relationship)
+        await log_mutations(self, "create_relationship", [rel.to_dict() for rel in valid])
+        await self._maybe_merge()
+        return errors
+
+    async def get_relationship(self, relationship_id: str) -> Optional[Relationship]:
+        index = self.store.get_edge(relationship_id)
+        return self.store.relationships[index] if index is not None else None
+
+    async def update_relationship(self, relationship: Relationship) -> bool:
+        index = self.store.get_edge(relationship.relationship_id)
+        if index is None:
+            logger.warning(f"Cannot update relationship: {relationship.relationship_id} - not found")
+            return False
+        self.store.set_edge(index, relationship)
+        await log_mutation(self, "update_relationship", relationship.to_dict())
+        return True
+
+    async def delete_relationship(self, relationship_id: str) -> bool:
+        if not self.store.remove_edge(relationship_id):
+            logger.warning(f"Cannot delete relationship: {relationship_id} - not found")
+            return False
+        await log_mutation(self, "delete_relationship", {"relationship_id": relationship_id})
+        await self._maybe_merge()
+        return True
+
+    async def _maybe_merge(self) -> None:
+        """Merge the delta buffer into the arrays once it reaches the threshold."""
+        if self.store.needs_merge(self.merge_threshold):
+            self.store.merge()
+
+    # Query operations
+    async def search_entities(self, query: str, entity_type: Optional[str] = None, limit: int = 10,
+                              match_mode: Optional[str] = None) -> List[Entity]:
+        """
+        Search for entities matching a query.
+
+        Args:
+            query: Search query
+            entity_type: Optional entity type filter
+            limit: Maximum number of results
+            match_mode: "substring" or "token" (defaults to the adapter's search_mode)
+
+        Returns:
+            List of matching entities
+        """
+        query = (query or "").lower()
+        match_mode = match_mode or self.search_mode
+        store = self.store
+
+        def lookup(entity_id: str) -> Optional[Entity]:
+            index = store.node_index.get(entity_id)
+            entity = store.entities[index] if index is not None else None
+            if entity is None or (entity_type and entity.entity_type != entity_type):
+                return None
+            return entity
+
+        if match_mode == "token" and tokenize(query):
+            entity_ids = self.token_index.search(tokenize(query), limit, lambda i: lookup(i) is not None)
+            return [lookup(entity_id) for entity_id in entity_ids]
+        if match_mode not in ("token", "substring"):
+            raise ValueError(f"Unsupported match mode: {match_mode}")
+
+        if len(query) >= 3:
+            candidates = (lookup(entity_id) for entity_id in self.trigram_index.candidates(query))
+        else:
+            candidates = (entity for entity in store.iter_entities()
+                          if not entity_type or entity.entity_type == entity_type)
+
+        results = []
+        for entity in candidates:
+            if len(results) >= limit:
+                break
+            if entity and any(query in text.lower() for text in entity_text_fields(entity)):
+                results.append(entity)
+        return results
+
+    async def get_entity_relationships(self, entity_id: str, relationship_type: Optional[str] = None,
+                                       direction: str = "both") -> List[Tuple[Relationship, Entity]]:
+        """
+        Get relationships for an entity.
+
+        Args:
+            entity_id: Entity ID
+            relationship_type: Optional relationship type filter
+            direction: Relationship direction ('outgoing', 'incoming', or 'both')
+
+        Returns:
+            List of (relationship, connected entity) tuples
+        """
+        store = self.store
+        node = store.get_node(entity_id)
+        if node is None:
+            return []
+
+        type_code = store.type_codes.get(relationship_type) if relationship_type else None
+        if relationship_type and type_code is None:
+            return []
+
+        results = []
+        sides = []
+        if direction in ["outgoing", "both"]:
+            sides.append((store.out_edge_indices(node), store.edge_target))
+        if direction in ["incoming", "both"]:
+            sides.append((store.in_edge_indices(node), store.edge_source))
+
+        for edges, other_end in sides:
+            if type_code is not None:
+                edges = edges[store.edge_type.data[edges] == type_code]
+            for edge, other in zip(edges.tolist(), other_end.data[edges].tolist()):
+                relationship = store.relationships[edge]
+                entity = store.entities[other]
+                if relationship and entity:
+                    results.append((relationship, entity))
+        return results
+
+    async def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        logger.warning(f"Raw query execution not supported in CSR adapter. Query: {query}")
+        return []
+
+    # Path operations
+    async def find_paths(self, source_id: str, target_id: str, max_depth: int = 3, max_paths: Optional[int] = 10,
+                         weighted: bool = False,
+                         relationship_types: Optional[List[str]] = None) -> List[List[Union[Entity, Relationship]]]:
+        """
+        Find simple directed paths between two entities, shortest first.
+
+        The shortest path length comes from a bidirectional breadth-first
+        search over the CSR and CSC arrays, and longer paths are enumerated
+        only as far as needed to fill max_paths.
+
+        Args:
+            source_id: Source entity ID
+            target_id: Target entity ID
+            max_depth: Maximum number of relationships in a path
+            max_paths: Maximum number of paths to return, or None for all
+            weighted: Return the most confident paths first, by the product
+                of their relationships' confidences, instead of the shortest
+            relationship_types: Relationship types a path may use, or None for all
+
+        Returns:
+            List of paths, where each path is a list of alternating Entity and Relationship objects
+        """
+        store = self.store
+        source = store.get_node(source_id)
+        target = store.get_node(target_id)
+        if source is None or target is None or (max_paths is not None and max_paths < 1):
+            return []
+
+        type_codes = None
+        if relationship_types:
+            type_codes = [store.type_codes[name] for name in relationship_types if name in store.type_codes]
+            if not type_codes:
+                return []
+
+        def successors(node: int):
+            outgoing = store.out_edge_indices(node)
+            if type_codes is not None:
+                outgoing = outgoing[np.isin(store.edge_type.data[outgoing], type_codes)]
+            return list(zip(outgoing.tolist(), store.edge_target.data[outgoing].tolist()))
+
+        def predecessors(node: int):
+            incoming = store.in_edge_indices(node)
+            if type_codes is not None:
+                incoming = incoming[np.isin(store.edge_type.data[incoming], type_codes)]
+            return list(zip(incoming.tolist(), store.edge_source.data[incoming].tolist()))
+
+        if weighted:
+            found = iter_weighted_paths(successors, predecessors, source, target, max_depth,
+                                        lambda edge: confidence_cost(store.relationships[edge].confidence))
+        else:
+            found = iter_simple_paths(successors, predecessors, source, target, max_depth)
+        paths = []
+        try:
+            async for nodes, edges in found:
+                paths.append(self._path_objects(nodes, edges))
+                if len(paths) == max_paths:
+                    break
+        finally:
+            await found.aclose()
+        logger.debug(f"Found {len(paths)} paths between {source_id} and {target_id}")
+        return paths
+
+    def _path_objects(self, nodes: List[int], edges: List[int]) -> List[Union[Entity, Relationship]]:
+        """Convert node and edge indices into an alternating entity/relationship list."""
+        path = [self.store.entities[nodes[0]]]
+        for edge, node in zip(edges, nodes[1:]):
+            path.append(self.store.relationships[edge])
+            path.append(self.store.entities[node])
+        return path
+
+    # Count operations
+    # Property index operations
+    async def create_property_index(self, name: str, kind: str = "hash") -> bool:
+        """
+        Create an index over one property and populate it from the graph.
+
+        Args:
+            name: Property name
+            kind: "hash" for equality lookups or "sorted" for range lookups
+
+        Returns:
+            True if the index was created, False if it already existed with that kind
+        """
+        existing = self.property_indexes.indexes.get(name)
+        if existing is not None and existing.kind == kind:
+            return False
+        self.property_indexes.create(name, kind)
+        self.property_indexes.add_to(name, self.store.iter_entities())
+        self.property_indexes.save_definitions(self.property_index_file)
+        logger.info(f"Created {kind} index on property {name}")
+        return True
+
+    async def drop_property_index(self, name: str) -> bool:
+        if not self.property_indexes.drop(name):
+            return False
+        self.property_indexes.save_definitions(self.property_index_file)
+        logger.info(f"Dropped index on property {name}")
+        return True
+
+    async def list_property_indexes(self) -> List[Dict[str, Any]]:
+        return self.property_indexes.describe()
+
+    async def find_entities_by_property(self, name: str, value: Any = None, min_value: Any = None,
+                                        max_value: Any = None, entity_type: Optional[str] = None,
+                                        limit: int = 100) -> List[Entity]:
+        """
+        Find entities whose property equals a value or lies in an inclusive range.
+
+        Args:
+            name: Property name
+            value: Required value (omit for a range query)
+            min_value: Inclusive lower bound
+            max_value: Inclusive upper bound
+            entity_type: Optional entity type filter
+            limit: Maximum number of results
+
+        Returns:
+            List of matching entities
+        """
+        return find_entities(self.property_indexes, name, self._lookup_entity, self.store.iter_entities,
+                             value, min_value, max_value, entity_type, limit)
+
+    async def count_entities(self) -> int:
+        return self.store.live_nodes
+
+    async def count_relationships(self) -> int:
+        return self.store.live_edges
+
+    async def get_status(self) -> Dict[str, Any]:
+        """
+        Get adapter status, including the size of the delta buffer.
+
+        Returns:
+            Status information dictionary
+        """
+        store = self.store
+        return {
+            "adapter": "csr",
+            "connected": self.is_connected,
+            "nodes": store.live_nodes,
+            "edges": store.live_edges,
+            "merged_nodes": store.base_nodes,
+            "delta_edges": store.delta_edges,
+            "tombstoned_edges": store.dead_edges,
+            "merge_threshold": self.merge_threshold,
+            "property_indexes": self.property_indexes.describe(),
+            "wal_enabled": self.wal is not None,
+            "wal_records_since_checkpoint": self.wal.records_since_checkpoint if self.wal else 0
+        }
+
+    # Persistence
+    def _load(self) -> None:
+        """Load the binary snapshot, or the JSON files if there is none."""
+        try:
+            if os.path.exists(self.snapshot_file) and is_binary_snapshot(self.snapshot_file):
+                entity_ids: List[str] = []
+                payloads: Optional[PayloadStore] = None
+                with open(self.snapshot_file, 'rb') as f:
+                    for kind, records in iter_blocks(f):
+                        if kind == PAYLOAD_BLOCK:
+                            # Properties stay in the payload file until first accessed
+                            payloads = PayloadStore(os.path.join(self.data_path, records[0]))
+                        elif kind == ENTITY_BLOCK:
+                            for record in records:
+                                entity = entity_from_record(record, payloads)
+                                entity_ids.append(entity.entity_id)
+                                self._add_loaded_entity(entity)
+                        elif kind == RELATIONSHIP_BLOCK:
+                            for record in records:
+                                self.store.put_edge(relationship_from_record(record, entity_ids))
+                        else:
+                            logger.warning(f"Skipping unknown snapshot block type: {kind!r}")
+                logger.info(f"Loaded {self.store.live_nodes} entities and "
+                            f"{self.store.live_edges} relationships from {self.snapshot_file}")
+                return
+
+            if os.path.exists(self.entity_file):
+                with open(self.entity_file, 'r') as f:
+                    for entity_data in json.load(f):
+                        self._add_loaded_entity(Entity.from_dict(entity_data))
+            if os.path.exists(self.relationship_file):
+                with open(self.relationship_file, 'r') as f:
+                    for rel_data in json.load(f):
+                        self.store.put_edge(Relationship.from_dict(rel_data))
+        except Exception as e:
+            logger.error(f"Error loading graph data: {e}")
+
+    def _add_loaded_entity(self, entity: Entity) -> None:
+        self.store.put_node(entity.entity_id, entity)
+        self._index_entity(entity)
+
+    async def _save(self) -> bool:
+        """
+        Write the graph as a binary snapshot.
+
+        The snapshot is encoded before the first await, so it holds exactly
+        the mutations made before the call, and is then written and fsynced
+        on an executor thread.
+        """
+        try:
+            buffer = io.BytesIO()
+            writer = SnapshotWriter(buffer, compress=self.snapshot_compression)
+            for entity in self.store.iter_entities():
+                writer.write_entity(entity)
+            for relationship in self.store.iter_relationships():
+                writer.write_relationship(relationship)
+            writer.close()
+            await asyncio.get_running_loop().run_in_executor(None, _write_atomic, self.snapshot_file,
+                                                             buffer.getvalue())
+            logger.info(f"Saved {self.store.live_nodes} entities and {self.store.live_edges} "
+                        f"relationships to {self.snapshot_file}")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving snapshot: {e}")
+            return False
+
+    async def _replay_log(self) -> int:
+        """Re-apply the mutations recorded in the write-ahead log."""
+        handlers = {
+            "create_entity": lambda data: self.create_entity(Entity.from_dict(data)),
+            "update_entity": lambda data: self.update_entity(Entity.from_dict(data)),
+            "delete_entity": lambda data: self.delete_entity(data["entity_id"]),
+            "create_relationship": lambda data: self.create_relationship(Relationship.from_dict(data)),
+            "update_relationship": lambda data: self.update_relationship(Relationship.from_dict(data)),
+            "delete_relationship": lambda data: self.delete_relationship(data["relationship_id"]),
+        }
+
+        count = 0
+        self.wal.replaying = True
+        try:
+            for op, data in self.wal.replay():
+                handler = handlers.get(op)
+                if handler is None:
+                    logger.warning(f"Skipping unknown write-ahead log operation: {op}")
+                    continue
+                await handler(data)
+                count += 1
+        finally:
+            self.wal.replaying = False
+
+        if count:
+            logger.info(f"Replayed {count} mutations from {self.wal.path}")
+        return count
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write data to a temporary file, fsync it and move it into place."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
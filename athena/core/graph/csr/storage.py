@@ -0,0 +1,397 @@
+"""
+Array Storage for CSR Graph
+
+Provides a graph store that maps entity UUIDs to dense integer IDs and keeps
+adjacency in NumPy compressed sparse row (outgoing) and column (incoming)
+arrays. Recent writes go to a delta buffer that is merged into the arrays
+once it grows past a threshold.
+"""
+
+import logging
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from ...entity import Entity
+from ...relationship import Relationship
+
+logger = logging.getLogger("athena.graph.csr.storage")
+
+class Column:
+    """Growable NumPy array with amortized constant-time appends."""
+
+    def __init__(self, dtype, capacity: int = 1024):
+        self.data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def append(self, value) -> None:
+        """Append a value, doubling the capacity when full."""
+        if self.size == len(self.data):
+            grown = np.empty(max(1024, 2 * len(self.data)), dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size] = value
+        self.size += 1
+
+    def view(self) -> np.ndarray:
+        """Get the filled part of the array."""
+        return self.data[:self.size]
+
+    def replace(self, values: np.ndarray) -> None:
+        """Replace the contents with a new array."""
+        self.data = np.array(values, dtype=self.data.dtype)
+        self.size = len(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __setitem__(self, index, value) -> None:
+        self.data[index] = value
+
+class CSRGraphStore:
+    """
+    Directed multigraph stored in parallel arrays.
+
+    Nodes and edges are addressed by dense integer indices. Per-node and
+    per-edge attributes live in parallel columns indexed by those integers;
+    the Entity and Relationship objects are kept in parallel lists.
+
+    Edges present at the last merge are reachable through the CSR/CSC
+    offset arrays. Edges added since then are listed per node in the delta
+    buffer. Deletions only clear an alive flag; merge() drops tombstones,
+    renumbers the survivors and rebuilds the offset arrays.
+    """
+
+    def __init__(self):
+        # Node columns
+        self.node_ids: List[str] = []
+        self.node_index: Dict[str, int] = {}
+        self.entities: List[Optional[Entity]] = []
+        self.node_type = Column(np.int32)
+        self.node_alive = Column(np.bool_)
+
+        # Edge columns
+        self.edge_ids: List[str] = []
+        self.edge_index: Dict[str, int] = {}
+        self.relationships: List[Optional[Relationship]] = []
+        self.edge_source = Column(np.int32)
+        self.edge_target = Column(np.int32)
+        self.edge_type = Column(np.int32)
+        self.edge_confidence = Column(np.float32)
+        self.edge_alive = Column(np.bool_)
+
+        # Interned type names shared by node and edge type columns
+        self.type_codes: Dict[str, int] = {}
+        self.type_names: List[str] = []
+
+        # Merged adjacency: out_edges[out_offsets[v]:out_offsets[v + 1]] are
+        # the outgoing edge indices of node v, in_edges likewise incoming
+        self.base_nodes = 0
+        self.out_offsets = np.zeros(1, dtype=np.int64)
+        self.out_edges = np.zeros(0, dtype=np.int32)
+        self.in_offsets = np.zeros(1, dtype=np.int64)
+        self.in_edges = np.zeros(0, dtype=np.int32)
+
+        # Delta buffer: node index -> edge indices added since the last merge
+        self.delta_out: Dict[int, List[int]] = {}
+        self.delta_in: Dict[int, List[int]] = {}
+        self.delta_edges = 0
+
+        self.live_nodes = 0
+        self.live_edges = 0
+        self.dead_edges = 0
+
+    # Type codes
+
+    def type_code(self, type_name: str) -> int:
+        """Get the integer code of a type name, assigning one if needed."""
+        code = self.type_codes.get(type_name)
+        if code is None:
+            code = len(self.type_names)
+            self.type_codes[type_name] = code
+            self.type_names.append(type_name)
+        return code
+
+    # Nodes
+
+    def put_node(self, entity_id: str, entity: Optional[Entity]) -> int:
+        """
+        Insert or replace a node.
+
+        Args:
+            entity_id: Entity UUID
+            entity: Entity stored on the node (None for an endpoint placeholder)
+
+        Returns:
+            Dense node index
+        """
+        type_code = self.type_code(entity.entity_type) if entity else -1
+        index = self.node_index.get(entity_id)
+        if index is not None:
+            self.entities[index] = entity
+            self.node_type[index] = type_code
+            return index
+
+        index = len(self.node_ids)
+        self.node_ids.append(entity_id)
+        self.node_index[entity_id] = index
+        self.entities.append(entity)
+        self.node_type.append(type_code)
+        self.node_alive.append(True)
+        self.live_nodes += 1
+        return index
+
+    def get_node(self, entity_id: str) -> Optional[int]:
+        """Get the dense index of a node, or None if it does not exist."""
+        return self.node_index.get(entity_id)
+
+    def remove_node(self, entity_id: str) -> List[str]:
+        """
+        Remove a node and its incident edges.
+
+        Args:
+            entity_id: Entity UUID
+
+        Returns:
+            IDs of the relationships removed with the node
+        """
+        index = self.node_index.pop(entity_id, None)
+        if index is None:
+            return []
+
+        removed = []
+        for edge in np.concatenate((self.out_edge_indices(index), self.in_edge_indices(index))):
+            relationship_id = self.edge_ids[edge]
+            if self.remove_edge(relationship_id):
+                removed.append(relationship_id)
+
+        self.entities[index] = None
+        self.node_alive[index] = False
+        self.live_nodes -= 1
+        return removed
+
+    def iter_entities(self) -> Iterator[Entity]:
+        """Iterate over the entities of live nodes."""
+        for index, entity in enumerate(self.entities):
+            if entity is not None and self.node_alive[index]:
+                yield entity
+
+    # Edges
+
+    def put_edge(self, relationship: Relationship) -> int:
+        """
+        Insert or replace an edge, creating placeholder endpoints if needed.
+
+        Re-inserting an existing relationship ID with different endpoints
+        moves the edge.
+
+        Args:
+            relationship: Relationship stored on the edge
+
+        Returns:
+            Dense edge index
+        """
+        source = self.node_index.get(relationship.source_id)
+        if source is None:
+            source = self.put_node(relationship.source_id, None)
+        target = self.node_index.get(relationship.target_id)
+        if target is None:
+            target = self.put_node(relationship.target_id, None)
+
+        index = self.edge_index.get(relationship.relationship_id)
+        if index is not None:
+            if self.edge_source[index] == source and self.edge_target[index] == target:
+                self.set_edge(index, relationship)
+                return index
+            self.remove_edge(relationship.relationship_id)
+
+        index = len(self.edge_ids)
+        self.edge_ids.append(relationship.relationship_id)
+        self.edge_index[relationship.relationship_id] = index
+        self.relationships.append(relationship)
+        self.edge_source.append(source)
+        self.edge_target.append(target)
+        self.edge_type.append(self.type_code(relationship.relationship_type))
+        self.edge_confidence.append(relationship.confidence)
+        self.edge_alive.append(True)
+
+        self.delta_out.setdefault(source, []).append(index)
+        self.delta_in.setdefault(target, []).append(index)
+        self.delta_edges += 1
+        self.live_edges += 1
+        return index
+
+    def set_edge(self, index: int, relationship: Relationship) -> None:
+        """Replace the relationship and attributes of an edge, keeping its endpoints."""
+        self.relationships[index] = relationship
+        self.edge_type[index] = self.type_code(relationship.relationship_type)
+        self.edge_confidence[index] = relationship.confidence
+
+    def get_edge(self, relationship_id: str) -> Optional[int]:
+        """Get the dense index of an edge, or None if it does not exist."""
+        return self.edge_index.get(relationship_id)
+
+    def remove_edge(self, relationship_id: str) -> bool:
+        """
+        Remove an edge by relationship ID.
+
+        Args:
+            relationship_id: Relationship UUID
+
+        Returns:
+            True if the edge existed
+        """
+        index = self.edge_index.pop(relationship_id, None)
+        if index is None:
+            return False
+        self.relationships[index] = None
+        self.edge_alive[index] = False
+        self.live_edges -= 1
+        self.dead_edges += 1
+        return True
+
+    def iter_relationships(self) -> Iterator[Relationship]:
+        """Iterate over the relationships of live edges."""
+        for index, relationship in enumerate(self.relationships):
+            if relationship is not None and self.edge_alive[index]:
+                yield relationship
+
+    # Adjacency
+
+    def out_edge_indices(self, node: int) -> np.ndarray:
+        """Get the indices of the live outgoing edges of a node."""
+        return self._incident(node, self.out_offsets, self.out_edges, self.delta_out)
+
+    def in_edge_indices(self, node: int) -> np.ndarray:
+        """Get the indices of the live incoming edges of a node."""
+        return self._incident(node, self.in_offsets, self.in_edges, self.delta_in)
+
+    def _incident(self, node: int, offsets: np.ndarray, edges: np.ndarray,
+                  delta: Dict[int, List[int]]) -> np.ndarray:
+        if node < self.base_nodes:
+            base = edges[offsets[node]:offsets[node + 1]]
+        else:
+            base = edges[:0]
+        recent = delta.get(node)
+        if recent:
+            base = np.concatenate((base, np.asarray(recent, dtype=np.int32)))
+        if self.dead_edges:
+            base = base[self.edge_alive.data[base]]
+        return base
+
+    def expand(self, frontier: np.ndarray, reverse: bool = False) -> np.ndarray:
+        """
+        Get the neighbors of a set of nodes in one vectorized step.
+
+        Args:
+            frontier: Node indices
+            reverse: Follow incoming instead of outgoing edges
+
+        Returns:
+            Node indices adjacent to the frontier (may contain duplicates)
+        """
+        if reverse:
+            offsets, edges, delta, other_end = self.in_offsets, self.in_edges, self.delta_in, self.edge_source
+        else:
+            offsets, edges, delta, other_end = self.out_offsets, self.out_edges, self.delta_out, self.edge_target
+
+        # Gather the merged adjacency slices of every frontier node at once
+        merged = frontier[frontier < self.base_nodes]
+        starts = offsets[merged]
+        counts = offsets[merged + 1] - starts
+        total = int(counts.sum())
+        if total:
+            run_starts = np.repeat(starts - np.concatenate(([0], np.cumsum(counts)[:-1])), counts)
+            incident = edges[run_starts + np.arange(total)]
+        else:
+            incident = edges[:0]
+
+        # Add the edges still sitting in the delta buffer
+        if delta:
+            recent = [edge for node in frontier.tolist() for edge in delta.get(node, ())]
+            if recent:
+                incident = np.concatenate((incident, np.asarray(recent, dtype=np.int32)))
+
+        if self.dead_edges:
+            incident = incident[self.edge_alive.data[incident]]
+        return other_end.data[incident]
+
+    def distances(self, origin: int, max_depth: int, reverse: bool = False) -> np.ndarray:
+        """
+        Breadth-first hop distances from a node, computed frontier by frontier.
+
+        Args:
+            origin: Start node index
+            max_depth: Maximum number of hops to explore
+            reverse: Follow incoming edges, giving distances *to* the origin
+
+        Returns:
+            Array of hop counts per node index, -1 where unreachable
+        """
+        dist = np.full(len(self.node_ids), -1, dtype=np.int32)
+        dist[origin] = 0
+        frontier = np.array([origin], dtype=np.int32)
+        for depth in range(1, max_depth + 1):
+            neighbors = self.expand(frontier, reverse)
+            neighbors = np.unique(neighbors[dist[neighbors] < 0])
+            if not len(neighbors):
+                break
+            dist[neighbors] = depth
+            frontier = neighbors
+        return dist
+
+    # Maintenance
+
+    def needs_merge(self, threshold: int) -> bool:
+        """Check whether the delta buffer and tombstones have outgrown the threshold."""
+        return self.delta_edges + self.dead_edges >= threshold
+
+    def merge(self) -> None:
+        """
+        Fold the delta buffer into the CSR/CSC arrays and drop tombstones.
+
+        Node and edge indices are renumbered densely, so indices obtained
+        before a merge must not be used after it.
+        """
+        live_nodes = np.flatnonzero(self.node_alive.view())
+        remap = np.full(len(self.node_ids), -1, dtype=np.int32)
+        remap[live_nodes] = np.arange(len(live_nodes), dtype=np.int32)
+
+        self.node_ids = [self.node_ids[i] for i in live_nodes.tolist()]
+        self.entities = [self.entities[i] for i in live_nodes.tolist()]
+        self.node_index = {entity_id: i for i, entity_id in enumerate(self.node_ids)}
+        self.node_type.replace(self.node_type.view()[live_nodes])
+        self.node_alive.replace(np.ones(len(live_nodes), dtype=np.bool_))
+
+        live_edges = np.flatnonzero(self.edge_alive.view())
+        source = remap[self.edge_source.view()[live_edges]]
+        target = remap[self.edge_target.view()[live_edges]]
+
+        self.edge_ids = [self.edge_ids[i] for i in live_edges.tolist()]
+        self.relationships = [self.relationships[i] for i in live_edges.tolist()]
+        self.edge_index = {relationship_id: i for i, relationship_id in enumerate(self.edge_ids)}
+        self.edge_source.replace(source)
+        self.edge_target.replace(target)
+        self.edge_type.replace(self.edge_type.view()[live_edges])
+        self.edge_confidence.replace(self.edge_confidence.view()[live_edges])
+        self.edge_alive.replace(np.ones(len(live_edges), dtype=np.bool_))
+
+        node_count = len(self.node_ids)
+        self.out_offsets, self.out_edges = _compress(source, node_count)
+        self.in_offsets, self.in_edges = _compress(target, node_count)
+        self.base_nodes = node_count
+
+        self.delta_out.clear()
+        self.delta_in.clear()
+        self.delta_edges = 0
+        self.dead_edges = 0
+        self.live_nodes = node_count
+        self.live_edges = len(self.edge_ids)
+        logger.debug(f"Merged CSR graph: {node_count} nodes, {self.live_edges} edges")
+
+def _compress(keys: np.ndarray, node_count: int):
+    """Build offset and edge-index arrays grouping edges by the given endpoint."""
+    order = np.argsort(keys, kind="stable").astype(np.int32)
+    offsets = np.zeros(node_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=node_count), out=offsets[1:])
+    return offsets, order
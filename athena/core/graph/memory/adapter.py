@@ -6,22 +6,32 @@ Provides the main adapter class with common operations.
 
 import os
 import json
+import time
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import networkx as nx
 
 from ...entity import Entity
 from ...relationship import Relationship
-from .persistence import load_data, save_data
+from .search_index import TokenIndex, TrigramIndex
+from .type_index import TypeIndex, AdjacencyIndex
+from .property_index import PropertyIndexes
+from .mvcc import SnapshotRegistry
+from .reachability import ReachabilityIndex
+from .wal import WriteAheadLog
+from .persistence import load_data, save_data, replay_log, export_json, import_json, quarantine_snapshot
 from .entity_ops import (
     create_entity, 
+    create_entities, 
     get_entity, 
     update_entity, 
     delete_entity
 )
 from .relationship_ops import (
     create_relationship, 
+    create_relationships, 
     get_relationship, 
     update_relationship, 
     delete_relationship
@@ -29,9 +39,17 @@ from .relationship_ops import (
 from .query_ops import (
     search_entities, 
     get_entity_relationships, 
+    get_relationships_for_entities,
     execute_query
 )
-from .path_ops import find_paths
+from .path_ops import find_paths, iter_paths, are_connected, distance_bounds
+from .subgraph_ops import get_subgraph
+from .property_ops import (
+    create_property_index,
+    drop_property_index,
+    list_property_indexes,
+    find_entities_by_property
+)
 
 logger = logging.getLogger("athena.graph.memory.adapter")
 
@@ -50,13 +68,87 @@ class MemoryAdapter:
         Args:
             data_path: Path to store persistence files
             **kwargs: Additional configuration options
+                snapshot_format: Format written by checkpoints, "binary" (default)
+                    or "json"; loading detects the format from the file header
+                snapshot_compression: zlib-compress binary snapshots (default True)
+                search_mode: Default entity search semantics, either
+                    "substring" (default) or "token"
+                wal_enabled: Log every mutation to a write-ahead log (default True)
+                wal_commit_delay: Seconds a commit waits to batch more records (default 0)
+                wal_fsync: Whether commits fsync the log (default True)
+                checkpoint_interval: Log records between checkpoints (default 10000)
+                load_batch_size: Records inserted per batch while loading (default 10000)
+                background_load: Return from connect() immediately and load the
+                    snapshot in the background; operations wait for it (default False)
+                load_workers: Processes used to decode binary snapshot blocks;
+                    0 decodes in-process (default 0)
+                lazy_properties: Keep entity properties of binary snapshots in
+                    a memory-mapped payload file and decode each entity's
+                    properties only when they are first accessed (default False)
+                reachability_landmarks: Landmarks kept by the reachability
+                    index behind are_connected and distance_bounds; 0
+                    disables the index (default 8)
         """
         self.data_path = data_path
         self.entity_file = os.path.join(data_path, "entities.json")
         self.relationship_file = os.path.join(data_path, "relationships.json")
+        self.snapshot_file = os.path.join(data_path, "graph.snapshot")
+        self.snapshot_format = kwargs.get("snapshot_format", "binary")
+        self.snapshot_compression = kwargs.get("snapshot_compression", True)
+        self.lazy_properties = kwargs.get("lazy_properties", False)
         self.graph = nx.MultiDiGraph()
         self.is_connected = False
         
+        # Graph version and the snapshots pinned by long reads (paths, saves, exports)
+        self.snapshots = SnapshotRegistry()
+        
+        # relationship_id -> (source_id, target_id), kept current by the ops modules
+        self.relationship_index: Dict[str, Tuple[str, str]] = {}
+        
+        # Inverted index over name, alias and string-property tokens
+        self.token_index = TokenIndex()
+        
+        # Trigram posting lists backing substring search
+        self.trigram_index = TrigramIndex()
+        
+        # entity_type -> entity IDs, and node -> (direction, relationship_type) -> edge keys
+        self.type_index = TypeIndex()
+        self.adjacency_index = AdjacencyIndex()
+        
+        # Components and landmark distances, rebuilt lazily after removals
+        self.reachability = ReachabilityIndex(kwargs.get("reachability_landmarks", 8))
+        
+        # Declarative property value indexes; definitions survive restarts
+        self.property_index_file = os.path.join(data_path, "property_indexes.json")
+        self.property_indexes = PropertyIndexes()
+        self.search_mode = kwargs.get("search_mode", "substring")
+        
+        # Append-only mutation log, compacted into the snapshot at checkpoints
+        self.wal_file = os.path.join(data_path, "graph.wal")
+        self.checkpoint_interval = kwargs.get("checkpoint_interval", 10000)
+        if kwargs.get("wal_enabled", True):
+            self.wal = WriteAheadLog(
+                self.wal_file,
+                commit_delay=kwargs.get("wal_commit_delay", 0.0),
+                fsync=kwargs.get("wal_fsync", True)
+            )
+        else:
+            self.wal = None
+        self._checkpointing = False
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        
+        # Set when the snapshot could not be loaded; the log then holds the
+        # only copy of recent writes and is never compacted
+        self._snapshot_unreadable = False
+        
+        # Streaming load state, reported through get_status()
+        self.load_batch_size = kwargs.get("load_batch_size", 10000)
+        self.background_load = kwargs.get("background_load", False)
+        self.load_workers = kwargs.get("load_workers", 0)
+        self.load_progress: Dict[str, Any] = {"state": "not_loaded"}
+        self._loaded = asyncio.Event()
+        self._load_task: Optional[asyncio.Task] = None
+        
     async def connect(self) -> bool:
         """
         Connect to the graph database.
@@ -69,13 +161,46 @@ class MemoryAdapter:
         # Ensure data directory exists
         os.makedirs(self.data_path, exist_ok=True)
         
+        # Define property indexes first so loading populates them
+        self.property_indexes.load_definitions(self.property_index_file)
+        
         # Load data from files if they exist
-        await load_data(self)
+        if self.background_load:
+            self._load_task = asyncio.create_task(self._load())
+        else:
+            await self._load()
         
         self.is_connected = True
         logger.info("Connected to in-memory graph database")
         return True
         
+    async def _load(self) -> None:
+        """Load the snapshot and replay the write-ahead log."""
+        try:
+            await load_data(self)
+            self.property_indexes.flush()
+            if self.load_progress["state"] == "failed":
+                quarantine_snapshot(self)
+                if self.wal:
+                    self._snapshot_unreadable = True
+                    logger.warning("Snapshot could not be loaded; checkpoints are disabled and "
+                                   "the write-ahead log is kept until restart")
+            
+            # Recover mutations made since the last checkpoint
+            if self.wal:
+                replayed = await replay_log(self)
+                self.wal.open()
+                if replayed:
+                    await self.checkpoint()
+            self.reachability.schedule(self)
+        finally:
+            self._loaded.set()
+            
+    async def _wait_until_loaded(self) -> None:
+        """Block an operation until a background load has finished."""
+        if not self._loaded.is_set():
+            await self._loaded.wait()
+        
     async def disconnect(self) -> bool:
         """
         Disconnect from the graph database.
@@ -84,14 +209,98 @@ class MemoryAdapter:
             True if successful
         """
         logger.info("Disconnecting from in-memory graph database")
+        await self._wait_until_loaded()
+        self.reachability.cancel()
         
-        # Save data to files
-        await save_data(self)
+        # Save data to files and compact the log, after any checkpoint in flight
+        if self._checkpoint_task is not None:
+            await self._checkpoint_task
+        await self.checkpoint()
+        if self.wal:
+            self.wal.close()
         
         self.is_connected = False
         logger.info("Disconnected from in-memory graph database")
         return True
         
+    async def checkpoint(self) -> bool:
+        """
+        Write a full snapshot and compact the write-ahead log into it.
+        
+        Returns:
+            True if the snapshot was written
+        """
+        if self.wal is None:
+            return await save_data(self)
+            
+        if self._checkpointing or self._snapshot_unreadable:
+            return False
+            
+        self._checkpointing = True
+        try:
+            # Mutations made while the snapshot is written go to a fresh segment.
+            # save_data pins its snapshot before its first await, so the
+            # snapshot holds exactly the mutations of the rotated segment.
+            await self.wal.rotate()
+            saved = await save_data(self)
+            if saved:
+                self.wal.discard_rotated()
+            return saved
+        finally:
+            self._checkpointing = False
+            
+    def schedule_checkpoint(self) -> None:
+        """Start a checkpoint in the background unless one is already running."""
+        if self._checkpointing or self._snapshot_unreadable:
+            return
+        if self._checkpoint_task is None or self._checkpoint_task.done():
+            self._checkpoint_task = asyncio.create_task(self._background_checkpoint())
+            
+    async def _background_checkpoint(self) -> None:
+        try:
+            await self.checkpoint()
+        except Exception as e:
+            logger.error(f"Error checkpointing graph: {e}")
+        
+    async def export_json(self, entity_file: Optional[str] = None, relationship_file: Optional[str] = None) -> bool:
+        """
+        Export the graph as JSON entity and relationship files.
+        
+        Args:
+            entity_file: Destination for entities (defaults to entities.json)
+            relationship_file: Destination for relationships (defaults to relationships.json)
+            
+        Returns:
+            True if successful
+        """
+        await self._wait_until_loaded()
+        return await export_json(
+            self,
+            entity_file or self.entity_file,
+            relationship_file or self.relationship_file
+        )
+        
+    async def import_json(self, entity_file: Optional[str] = None, relationship_file: Optional[str] = None) -> bool:
+        """
+        Import JSON entity and relationship files into the graph.
+        
+        The imported data is made durable with a checkpoint.
+        
+        Args:
+            entity_file: Source of entities (defaults to entities.json)
+            relationship_file: Source of relationships (defaults to relationships.json)
+            
+        Returns:
+            True if the imported graph was saved
+        """
+        await self._wait_until_loaded()
+        await import_json(
+            self,
+            entity_file or self.entity_file,
+            relationship_file or self.relationship_file
+        )
+        return await self.checkpoint()
+        
     async def initialize_schema(self) -> bool:
         """
         Initialize the graph schema.
@@ -104,47 +313,145 @@ class MemoryAdapter:
 
     # Entity operations
     async def create_entity(self, entity: Entity) -> str:
+        await self._wait_until_loaded()
         return await create_entity(self, entity)
         
+    async def create_entities(self, entities: List[Entity]) -> Dict[int, str]:
+        await self._wait_until_loaded()
+        return await create_entities(self, entities)
+        
     async def get_entity(self, entity_id: str) -> Optional[Entity]:
+        await self._wait_until_loaded()
         return await get_entity(self, entity_id)
         
     async def update_entity(self, entity: Entity) -> bool:
+        await self._wait_until_loaded()
         return await update_entity(self, entity)
         
     async def delete_entity(self, entity_id: str) -> bool:
+        await self._wait_until_loaded()
         return await delete_entity(self, entity_id)
         
     # Relationship operations
     async def create_relationship(self, relationship: Relationship) -> str:
+        await self._wait_until_loaded()
         return await create_relationship(self, relationship)
         
+    async def create_relationships(self, relationships: List[Relationship]) -> Dict[int, str]:
+        await self._wait_until_loaded()
+        return await create_relationships(self, relationships)
+        
     async def get_relationship(self, relationship_id: str) -> Optional[Relationship]:
+        await self._wait_until_loaded()
         return await get_relationship(self, relationship_id)
         
     async def update_relationship(self, relationship: Relationship) -> bool:
+        await self._wait_until_loaded()
         return await update_relationship(self, relationship)
         
     async def delete_relationship(self, relationship_id: str) -> bool:
+        await self._wait_until_loaded()
         return await delete_relationship(self, relationship_id)
         
     # Query operations
-    async def search_entities(self, query: str, entity_type: Optional[str] = None, limit: int = 10) -> List[Entity]:
-        return await search_entities(self, query, entity_type, limit)
+    async def search_entities(self, query: str, entity_type: Optional[str] = None, limit: int = 10,
+                              match_mode: Optional[str] = None) -> List[Entity]:
+        await self._wait_until_loaded()
+        return await search_entities(self, query, entity_type, limit, match_mode)
         
     async def get_entity_relationships(self, entity_id: str, relationship_type: Optional[str] = None, direction: str = "both"):
+        await self._wait_until_loaded()
         return await get_entity_relationships(self, entity_id, relationship_type, direction)
         
+    async def get_relationships_for_entities(self, entity_ids: List[str], relationship_type: Optional[str] = None,
+                                             direction: str = "both", per_entity_limit: Optional[int] = None):
+        await self._wait_until_loaded()
+        return await get_relationships_for_entities(self, entity_ids, relationship_type, direction, per_entity_limit)
+        
     async def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         return await execute_query(query, params)
         
     # Path operations
-    async def find_paths(self, source_id: str, target_id: str, max_depth: int = 3):
-        return await find_paths(self, source_id, target_id, max_depth)
+    async def find_paths(self, source_id: str, target_id: str, max_depth: int = 3, max_paths: Optional[int] = 10,
+                         weighted: bool = False, relationship_types: Optional[List[str]] = None):
+        await self._wait_until_loaded()
+        return await find_paths(self, source_id, target_id, max_depth, max_paths, weighted, relationship_types)
+        
+    async def iter_paths(self, source_id: str, target_id: str, max_depth: int = 3, weighted: bool = False,
+                         relationship_types: Optional[List[str]] = None):
+        await self._wait_until_loaded()
+        paths = iter_paths(self, source_id, target_id, max_depth, weighted, relationship_types)
+        try:
+            async for path in paths:
+                yield path
+        finally:
+            await paths.aclose()
+        
+    async def are_connected(self, source_id: str, target_id: str, max_hops: Optional[int] = None) -> bool:
+        await self._wait_until_loaded()
+        return await are_connected(self, source_id, target_id, max_hops)
+        
+    async def distance_bounds(self, source_id: str, target_id: str) -> Tuple[float, float]:
+        await self._wait_until_loaded()
+        return await distance_bounds(self, source_id, target_id)
+        
+    # Subgraph operations
+    async def get_subgraph(self, center_ids: List[str], depth: int = 1, relationship_types: Optional[List[str]] = None,
+                           min_confidence: float = 0.0, max_nodes: Optional[int] = 1000) -> Dict[str, Any]:
+        await self._wait_until_loaded()
+        return await get_subgraph(self, center_ids, depth, relationship_types, min_confidence, max_nodes)
+        
+    # Property index operations
+    async def create_property_index(self, name: str, kind: str = "hash") -> bool:
+        await self._wait_until_loaded()
+        return await create_property_index(self, name, kind)
+        
+    async def drop_property_index(self, name: str) -> bool:
+        await self._wait_until_loaded()
+        return await drop_property_index(self, name)
+        
+    async def list_property_indexes(self) -> List[Dict[str, Any]]:
+        await self._wait_until_loaded()
+        return await list_property_indexes(self)
+        
+    async def find_entities_by_property(self, name: str, value: Any = None, min_value: Any = None,
+                                        max_value: Any = None, entity_type: Optional[str] = None,
+                                        limit: int = 100) -> List[Entity]:
+        await self._wait_until_loaded()
+        return await find_entities_by_property(self, name, value, min_value, max_value, entity_type, limit)
         
     # Count operations
     async def count_entities(self) -> int:
         return len(self.graph.nodes)
         
     async def count_relationships(self) -> int:
-        return len(self.graph.edges)
\ No newline at end of file
+        return len(self.graph.edges)
+        
+    async def get_status(self) -> Dict[str, Any]:
+        """
+        Get adapter status, including snapshot load progress.
+        
+        Returns:
+            Status information dictionary
+        """
+        progress = dict(self.load_progress)
+        if progress.get("bytes_total"):
+            progress["percent"] = round(100.0 * progress["bytes_read"] / progress["bytes_total"], 1)
+        if progress.get("started_at"):
+            progress["elapsed"] = round((progress.get("finished_at") or time.time()) - progress["started_at"], 3)
+            
+        return {
+            "adapter": "memory",
+            "connected": self.is_connected,
+            "loaded": self._loaded.is_set(),
+            "load_progress": progress,
+            "snapshot_format": self.snapshot_format,
+            "lazy_properties": self.lazy_properties,
+            "property_indexes": self.property_indexes.describe(),
+            "reachability": self.reachability.describe(),
+            "wal_enabled": self.wal is not None,
+            "wal_records_since_checkpoint": self.wal.records_since_checkpoint if self.wal else 0,
+            "checkpoints_disabled": self._snapshot_unreadable,
+            "graph_version": self.snapshots.version,
+            "pinned_snapshots": len(self.snapshots.pinned)
+        }
\ No newline at end of file
@@ -5,9 +5,13 @@ Provides functions for entity CRUD operations in the memory graph.
 """
 
 import logging
-from typing import Optional
+from itertools import chain
+from typing import Dict, List, Optional
 
 from ...entity import Entity
+from .index_ops import index_entity, unindex_entity, unindex_entity_relationships
+from .mvcc import before_write
+from .wal import log_mutation, log_mutations
 
 logger = logging.getLogger("athena.graph.memory.entity_ops")
 
@@ -22,10 +26,43 @@ async def create_entity(adapter, entity: Entity) -> str:
     Returns:
         Entity ID
     """
+    before_write(adapter, (entity.entity_id,))
     adapter.graph.add_node(entity.entity_id, entity=entity)
+    index_entity(adapter, entity)
+    await log_mutation(adapter, "create_entity", entity.to_dict())
     logger.debug(f"Created entity: {entity.name} ({entity.entity_id})")
     return entity.entity_id
 
+async def create_entities(adapter, entities: List[Entity]) -> Dict[int, str]:
+    """
+    Create many entities at once.
+    
+    Nodes are inserted with a single add_nodes_from call and the whole
+    batch is written to the write-ahead log with one commit.
+    
+    Args:
+        adapter: The memory adapter instance
+        entities: Entities to create
+        
+    Returns:
+        Mapping from batch index to error message for entities that could not be created
+    """
+    errors: Dict[int, str] = {}
+    valid = []
+    for index, entity in enumerate(entities):
+        if not entity.entity_id:
+            errors[index] = "Entity has no ID"
+            continue
+        valid.append(entity)
+        
+    before_write(adapter, (entity.entity_id for entity in valid))
+    adapter.graph.add_nodes_from((entity.entity_id, {"entity": entity}) for entity in valid)
+    for entity in valid:
+        index_entity(adapter, entity)
+    await log_mutations(adapter, "create_entity", [entity.to_dict() for entity in valid])
+    logger.debug(f"Created {len(valid)} entities in batch")
+    return errors
+
 async def get_entity(adapter, entity_id: str) -> Optional[Entity]:
     """
     Get an entity by ID.
@@ -59,7 +96,10 @@ async def update_entity(adapter, entity: Entity) -> bool:
         True if successful
     """
     if entity.entity_id in adapter.graph.nodes:
+        before_write(adapter, (entity.entity_id,))
         adapter.graph.nodes[entity.entity_id]['entity'] = entity
+        index_entity(adapter, entity)
+        await log_mutation(adapter, "update_entity", entity.to_dict())
         logger.debug(f"Updated entity: {entity.name} ({entity.entity_id})")
         return True
     logger.warning(f"Cannot update entity: {entity.entity_id} - not found")
@@ -77,7 +117,18 @@ async def delete_entity(adapter, entity_id: str) -> bool:
         True if successful
     """
     if entity_id in adapter.graph.nodes:
+        # Incident edges disappear with the node, which changes its neighbors too
+        before_write(adapter, chain(
+            (entity_id,),
+            adapter.graph.successors(entity_id),
+            adapter.graph.predecessors(entity_id)
+        ))
+        
+        # Drop the incident edges from the indexes while they can still be enumerated
+        unindex_entity_relationships(adapter, entity_id)
+        unindex_entity(adapter, entity_id)
         adapter.graph.remove_node(entity_id)
+        await log_mutation(adapter, "delete_entity", {"entity_id": entity_id})
         logger.debug(f"Deleted entity: {entity_id}")
         return True
     logger.warning(f"Cannot delete entity: {entity_id} - not found")
@@ -0,0 +1,145 @@
+"""
+Index Operations for Memory Graph
+
+Provides functions for maintaining the secondary indexes of the memory graph.
+Every mutation of the graph goes through these functions so the indexes
+never drift from the underlying NetworkX storage.
+"""
+
+import logging
+from typing import Optional, Tuple
+
+from ...entity import Entity
+from ...relationship import Relationship
+
+logger = logging.getLogger("athena.graph.memory.index_ops")
+
+def index_entity(adapter, entity: Entity) -> None:
+    """
+    Register an entity (or a new version of it) in the entity indexes.
+
+    Args:
+        adapter: The memory adapter instance
+        entity: Entity that was stored in the graph
+    """
+    adapter.token_index.add(entity)
+    adapter.trigram_index.add(entity)
+    adapter.type_index.add(entity.entity_id, entity.entity_type)
+    adapter.property_indexes.add(entity)
+
+def unindex_entity(adapter, entity_id: str) -> None:
+    """
+    Remove an entity from the entity indexes.
+
+    Args:
+        adapter: The memory adapter instance
+        entity_id: ID of the entity that was removed
+    """
+    adapter.token_index.remove(entity_id)
+    adapter.trigram_index.remove(entity_id)
+    adapter.type_index.remove(entity_id)
+    adapter.property_indexes.remove(entity_id)
+
+def index_relationship(adapter, relationship: Relationship,
+                       endpoints: Optional[Tuple[str, str]] = None) -> None:
+    """
+    Register a relationship (or a new version of it) in the relationship indexes.
+
+    Args:
+        adapter: The memory adapter instance
+        relationship: Relationship that was stored in the graph
+        endpoints: (source_id, target_id) of the graph edge, when it differs
+            from the relationship's own endpoints
+    """
+    relationship_id = relationship.relationship_id
+    source_id, target_id = endpoints or (relationship.source_id, relationship.target_id)
+
+    previous = adapter.relationship_index.get(relationship_id)
+    if previous is not None:
+        adapter.adjacency_index.remove(relationship_id, *previous)
+        if previous != (source_id, target_id):
+            adapter.reachability.invalidate()
+    else:
+        adapter.reachability.add_edge(adapter.graph, source_id, target_id)
+
+    adapter.relationship_index[relationship_id] = (source_id, target_id)
+    adapter.adjacency_index.add(relationship_id, source_id, target_id, relationship.relationship_type)
+
+def unindex_relationship(adapter, relationship_id: str) -> Optional[Tuple[str, str]]:
+    """
+    Remove a relationship from the relationship ID index.
+
+    Args:
+        adapter: The memory adapter instance
+        relationship_id: ID of the relationship that was removed
+
+    Returns:
+        The (source_id, target_id) pair the relationship pointed to, or None
+    """
+    endpoints = adapter.relationship_index.pop(relationship_id, None)
+    if endpoints is not None:
+        adapter.adjacency_index.remove(relationship_id, *endpoints)
+        adapter.reachability.invalidate()
+    return endpoints
+
+def unindex_entity_relationships(adapter, entity_id: str) -> None:
+    """
+    Remove every relationship incident to an entity from the indexes.
+
+    Must be called before the node is removed from the graph, while its
+    incident edges can still be enumerated.
+
+    Args:
+        adapter: The memory adapter instance
+        entity_id: ID of the entity about to be removed
+    """
+    for _, _, rel_id in adapter.graph.out_edges(entity_id, keys=True):
+        unindex_relationship(adapter, rel_id)
+    for _, _, rel_id in adapter.graph.in_edges(entity_id, keys=True):
+        unindex_relationship(adapter, rel_id)
+
+def lookup_relationship(adapter, relationship_id: str) -> Optional[Tuple[str, str]]:
+    """
+    Resolve a relationship ID to its endpoints.
+
+    Args:
+        adapter: The memory adapter instance
+        relationship_id: Relationship ID
+
+    Returns:
+        (source_id, target_id) pair or None if the ID is unknown
+    """
+    endpoints = adapter.relationship_index.get(relationship_id)
+    if endpoints is None:
+        return None
+    source_id, target_id = endpoints
+    if not adapter.graph.has_edge(source_id, target_id, key=relationship_id):
+        # Should never happen, but keep the index self-healing
+        logger.warning(f"Stale relationship index entry: {relationship_id}")
+        unindex_relationship(adapter, relationship_id)
+        return None
+    return endpoints
+
+def rebuild_indexes(adapter) -> None:
+    """
+    Rebuild all indexes from the current graph contents.
+
+    Args:
+        adapter: The memory adapter instance
+    """
+    adapter.token_index.clear()
+    adapter.trigram_index.clear()
+    adapter.type_index.clear()
+    adapter.property_indexes.clear()
+    for _, entity in adapter.graph.nodes(data='entity'):
+        if entity:
+            index_entity(adapter, entity)
+            
+    adapter.relationship_index = {}
+    adapter.adjacency_index.clear()
+    adapter.reachability.invalidate()
+    for source_id, target_id, relationship in adapter.graph.edges(data='relationship'):
+        if relationship:
+            index_relationship(adapter, relationship, (source_id, target_id))
+    logger.debug(f"Rebuilt indexes: {len(adapter.token_index.entity_tokens)} entities, "
+                 f"{len(adapter.relationship_index)} relationships")
@@ -0,0 +1,191 @@
+"""
+Versioned Snapshots for Memory Graph
+
+Provides multi-version reads of the memory graph. A long read pins a
+GraphSnapshot, which presents the graph exactly as it was at one version
+even while writes keep being applied to the live graph.
+
+Snapshots are copy-on-write at node granularity. Before a write changes a
+node's entity or incident edges, before_write() records the node's current
+state in every pinned snapshot that has not recorded it yet. A snapshot
+answers from those records and reads every untouched node straight from the
+live graph, so pinning is O(1) and a write pays only for the nodes it
+touches, and only while a snapshot is pinned.
+
+Operations run on the event loop, so each write applies atomically between
+two awaits. Long reads periodically yield to the loop (see YIELD_EVERY) so
+writes flow while they run; that is safe because a snapshot never changes.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ...entity import Entity
+from ...relationship import Relationship
+
+logger = logging.getLogger("athena.graph.memory.mvcc")
+
+# Work items a long read processes between yields to the event loop
+YIELD_EVERY = 250
+
+# (neighbor_id, relationship_id, relationship) in edge insertion order
+Edge = Tuple[str, str, Optional[Relationship]]
+
+class NodeVersion:
+    """The recorded state of one node: its entity and its incident edges."""
+
+    __slots__ = ("entity", "out_edges", "in_edges")
+
+    def __init__(self, entity: Optional[Entity], out_edges: Tuple[Edge, ...], in_edges: Tuple[Edge, ...]):
+        self.entity = entity
+        self.out_edges = out_edges
+        self.in_edges = in_edges
+
+def capture(graph, node_id: str) -> Optional[NodeVersion]:
+    """
+    Record the current state of a node.
+
+    Args:
+        graph: Live NetworkX graph
+        node_id: Node to record
+
+    Returns:
+        NodeVersion, or None if the node does not exist
+    """
+    if node_id not in graph:
+        return None
+    return NodeVersion(
+        graph.nodes[node_id].get('entity'),
+        tuple((target, key, rel) for _, target, key, rel in graph.out_edges(node_id, keys=True, data='relationship')),
+        tuple((source, key, rel) for source, _, key, rel in graph.in_edges(node_id, keys=True, data='relationship'))
+    )
+
+class GraphSnapshot:
+    """
+    Read-only view of the memory graph as of one version.
+
+    Obtain one with pinned_snapshot(); the view stays valid only while pinned.
+    """
+
+    def __init__(self, graph, version: int):
+        self.graph = graph
+        self.version = version
+        self.before: Dict[str, Optional[NodeVersion]] = {}
+        self.pins = 0
+
+    def has_node(self, node_id: str) -> bool:
+        """Check whether a node existed at the snapshot version."""
+        if node_id in self.before:
+            return self.before[node_id] is not None
+        return node_id in self.graph
+
+    def entity(self, node_id: str) -> Optional[Entity]:
+        """Get the entity stored on a node, or None."""
+        if node_id in self.before:
+            recorded = self.before[node_id]
+            return recorded.entity if recorded is not None else None
+        data = self.graph.nodes.get(node_id)
+        return data.get('entity') if data is not None else None
+
+    def out_edges(self, node_id: str) -> Tuple[Edge, ...]:
+        """Get a node's outgoing edges as (target_id, relationship_id, relationship) tuples."""
+        if node_id in self.before:
+            recorded = self.before[node_id]
+            return recorded.out_edges if recorded is not None else ()
+        if node_id not in self.graph:
+            return ()
+        return tuple((target, key, rel) for _, target, key, rel
+                     in self.graph.out_edges(node_id, keys=True, data='relationship'))
+
+    def in_edges(self, node_id: str) -> Tuple[Edge, ...]:
+        """Get a node's incoming edges as (source_id, relationship_id, relationship) tuples."""
+        if node_id in self.before:
+            recorded = self.before[node_id]
+            return recorded.in_edges if recorded is not None else ()
+        if node_id not in self.graph:
+            return ()
+        return tuple((source, key, rel) for source, _, key, rel
+                     in self.graph.in_edges(node_id, keys=True, data='relationship'))
+
+    def successors(self, node_id: str) -> List[str]:
+        """Get the distinct successors of a node in edge insertion order."""
+        return list(dict.fromkeys(target for target, _, _ in self.out_edges(node_id)))
+
+    def node_ids(self) -> List[str]:
+        """
+        List the nodes that existed at the snapshot version.
+
+        The list is materialized, so callers may yield to the event loop
+        while walking it.
+        """
+        live = list(self.graph)
+        before = self.before
+        if not before:
+            return live
+        ids = [node_id for node_id in live if node_id not in before]
+        ids.extend(node_id for node_id, recorded in before.items() if recorded is not None)
+        return ids
+
+class SnapshotRegistry:
+    """The pinned snapshots of one graph and the version counter they are taken at."""
+
+    def __init__(self):
+        self.version = 0
+        self.pinned: List[GraphSnapshot] = []
+
+def before_write(adapter, node_ids: Iterable[str]) -> None:
+    """
+    Prepare the pinned snapshots for a write that will touch some nodes.
+
+    Must be called before the graph is changed. A node is touched when its
+    entity, or any edge entering or leaving it, is added, replaced or removed.
+
+    Args:
+        adapter: The memory adapter instance
+        node_ids: IDs of the nodes about to change; only iterated while a
+            snapshot is pinned, so it may be a lazy iterator
+    """
+    snapshots = adapter.snapshots
+    snapshots.version += 1
+    if not snapshots.pinned:
+        return
+
+    graph = adapter.graph
+    for node_id in node_ids:
+        recorded = snapshots
+        for snapshot in snapshots.pinned:
+            if node_id not in snapshot.before:
+                if recorded is snapshots:
+                    recorded = capture(graph, node_id)
+                snapshot.before[node_id] = recorded
+
+@contextmanager
+def pinned_snapshot(adapter) -> Iterator[GraphSnapshot]:
+    """
+    Pin a snapshot of the graph at its current version.
+
+    Readers that pin while no write has happened share the same snapshot.
+
+    Args:
+        adapter: The memory adapter instance
+
+    Returns:
+        Context manager yielding the GraphSnapshot
+    """
+    snapshots = adapter.snapshots
+    pinned = snapshots.pinned
+    if pinned and pinned[-1].version == snapshots.version:
+        snapshot = pinned[-1]
+    else:
+        snapshot = GraphSnapshot(adapter.graph, snapshots.version)
+        pinned.append(snapshot)
+    snapshot.pins += 1
+    try:
+        yield snapshot
+    finally:
+        snapshot.pins -= 1
+        if not snapshot.pins:
+            pinned.remove(snapshot)
+            logger.debug(f"Released snapshot at version {snapshot.version} "
+                         f"({len(snapshot.before)} nodes copied on write)")
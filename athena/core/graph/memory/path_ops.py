@@ -4,66 +4,179 @@ Path Operations for Memory Graph
 Provides functions for finding paths in the memory graph.
 """
 
+import math
 import logging
-import networkx as nx
-from typing import List, Union
+from typing import AsyncIterator, List, Optional, Tuple, Union
 
 from ...entity import Entity
 from ...relationship import Relationship
+from .mvcc import pinned_snapshot
+from .path_search import iter_simple_paths, iter_weighted_paths, confidence_cost, shortest_path_length
 
 logger = logging.getLogger("athena.graph.memory.path_ops")
 
-async def find_paths(adapter, source_id: str, target_id: str, max_depth: int = 3) -> List[List[Union[Entity, Relationship]]]:
+async def iter_paths(adapter, source_id: str, target_id: str, max_depth: int = 3, weighted: bool = False,
+                     relationship_types: Optional[List[str]] = None) -> AsyncIterator[List[Union[Entity, Relationship]]]:
+    """
+    Enumerate paths between two entities, shortest or most confident first.
+    
+    Paths are produced lazily from a pinned snapshot, so a caller that
+    stops early does no further work. Close the iterator (aclose) when
+    stopping early to release the snapshot promptly.
+    
+    Args:
+        adapter: The memory adapter instance
+        source_id: Source entity ID
+        target_id: Target entity ID
+        max_depth: Maximum number of relationships in a path
+        weighted: Order paths by the product of their relationships'
+            confidences, highest first, instead of by length
+        relationship_types: Relationship types a path may use, or None for all
+        
+    Returns:
+        Async iterator over paths, where each path is a list of alternating Entity and Relationship objects
+    """
+    with pinned_snapshot(adapter) as snapshot:
+        if not snapshot.has_node(source_id) or not snapshot.has_node(target_id):
+            logger.debug(f"Cannot find path: source {source_id} or target {target_id} not found")
+            return
+            
+        # Skip the search when the reachability index already rules the pair out
+        bounds = adapter.reachability.bounds(source_id, target_id)
+        if bounds is not None and bounds[0] > max_depth:
+            logger.debug(f"No path within {max_depth} hops between {source_id} and {target_id}")
+            return
+            
+        types = set(relationship_types) if relationship_types else None
+        
+        def successors(node_id: str):
+            return [(relationship, target) for target, _, relationship in snapshot.out_edges(node_id)
+                    if types is None or relationship.relationship_type in types]
+            
+        def predecessors(node_id: str):
+            return [(relationship, source) for source, _, relationship in snapshot.in_edges(node_id)
+                    if types is None or relationship.relationship_type in types]
+            
+        if weighted:
+            search = iter_weighted_paths(successors, predecessors, source_id, target_id, max_depth,
+                                         lambda relationship: confidence_cost(relationship.confidence))
+        else:
+            search = iter_simple_paths(successors, predecessors, source_id, target_id, max_depth)
+            
+        async for nodes, relationships in search:
+            path = [snapshot.entity(source_id)]
+            for relationship, node_id in zip(relationships, nodes[1:]):
+                path.append(relationship)
+                path.append(snapshot.entity(node_id))
+            yield path
+
+async def find_paths(adapter, source_id: str, target_id: str, max_depth: int = 3, max_paths: Optional[int] = 10,
+                     weighted: bool = False,
+                     relationship_types: Optional[List[str]] = None) -> List[List[Union[Entity, Relationship]]]:
     """
     Find paths between two entities.
     
+    The search runs on a pinned snapshot and yields to the event loop as it
+    goes, so concurrent writes neither block on it nor disturb it. Shortest
+    paths come first, or with weighted the most confident ones, found by an
+    A* search with -log(confidence) as the cost of a relationship. The
+    search stops once max_paths are found. Parallel relationships between
+    the same entities give distinct paths.
+    
     Args:
         adapter: The memory adapter instance
         source_id: Source entity ID
         target_id: Target entity ID
-        max_depth: Maximum path length
+        max_depth: Maximum number of relationships in a path
+        max_paths: Maximum number of paths to return, or None for all
+        weighted: Order paths by confidence instead of by length
+        relationship_types: Relationship types a path may use, or None for all
         
     Returns:
         List of paths, where each path is a list of alternating Entity and Relationship objects
     """
-    if source_id not in adapter.graph.nodes or target_id not in adapter.graph.nodes:
-        logger.debug(f"Cannot find path: source {source_id} or target {target_id} not found")
-        return []
+    result_paths = []
+    if max_paths is not None and max_paths < 1:
+        return result_paths
         
-    # Use NetworkX to find simple paths
+    paths = iter_paths(adapter, source_id, target_id, max_depth, weighted, relationship_types)
     try:
-        # Find all simple paths up to length 2*max_depth (edges + nodes)
-        # This accounts for the fact that we're counting relationship hops, not graph hops
-        simple_paths = list(nx.all_simple_paths(
-            adapter.graph, source_id, target_id, cutoff=max_depth*2-1
-        ))
-    except nx.NetworkXNoPath:
-        logger.debug(f"No path found between {source_id} and {target_id}")
-        return []
+        async for path in paths:
+            result_paths.append(path)
+            if len(result_paths) == max_paths:
+                break
+    finally:
+        await paths.aclose()
         
-    # Convert simple paths to entity/relationship sequences
-    result_paths = []
-    for path in simple_paths:
-        entity_rel_path = []
+    logger.debug(f"Found {len(result_paths)} paths between {source_id} and {target_id}")
+    return result_paths
+
+async def are_connected(adapter, source_id: str, target_id: str, max_hops: Optional[int] = None) -> bool:
+    """
+    Check whether a directed path leads from one entity to another.
+    
+    Answered from the reachability index when its bounds decide the
+    question, which they do for every pair in different components and for
+    most pairs near a landmark. Otherwise a bidirectional breadth-first
+    search settles it. A stale or outgrown index schedules its rebuild.
+    
+    Args:
+        adapter: The memory adapter instance
+        source_id: Source entity ID
+        target_id: Target entity ID
+        max_hops: Maximum number of relationships on the path, or None for any
         
-        # Add the source entity
-        entity_rel_path.append(adapter.graph.nodes[path[0]].get('entity'))
+    Returns:
+        True if the target is reachable from the source within max_hops
+    """
+    limit = math.inf if max_hops is None else max_hops
+    if not adapter.graph.has_node(source_id) or not adapter.graph.has_node(target_id):
+        return False
         
-        # Add relationships and entities along the path
-        for i in range(len(path) - 1):
-            source = path[i]
-            target = path[i + 1]
+    adapter.reachability.schedule(adapter)
+    bounds = adapter.reachability.bounds(source_id, target_id)
+    if bounds is not None:
+        lower, upper = bounds
+        if lower > limit or lower == math.inf:
+            return False
+        if upper <= limit and upper != math.inf:
+            return True
             
-            # Find the relationship between these nodes
-            # (there could be multiple, take the first one)
-            rel_id = list(adapter.graph[source][target].keys())[0]
-            relationship = adapter.graph[source][target][rel_id].get('relationship')
-            entity_rel_path.append(relationship)
+    with pinned_snapshot(adapter) as snapshot:
+        def successors(node_id: str):
+            return [(key, target) for target, key, _ in snapshot.out_edges(node_id)]
             
-            # Add the target entity
-            entity_rel_path.append(adapter.graph.nodes[target].get('entity'))
+        def predecessors(node_id: str):
+            return [(key, source) for source, key, _ in snapshot.in_edges(node_id)]
             
-        result_paths.append(entity_rel_path)
+        depth = len(adapter.graph) if max_hops is None else max_hops
+        length = await shortest_path_length(successors, predecessors, source_id, target_id, depth)
+    return length is not None
+
+async def distance_bounds(adapter, source_id: str, target_id: str) -> Tuple[float, float]:
+    """
+    Bound the number of relationships on a shortest path between two entities.
     
-    logger.debug(f"Found {len(result_paths)} paths between {source_id} and {target_id}")
-    return result_paths
\ No newline at end of file
+    Read from the reachability index without searching the graph. While the
+    index is stale, after relationships were removed, the bounds are the
+    trivial (1, inf) until the rebuild it schedules has finished.
+    
+    Args:
+        adapter: The memory adapter instance
+        source_id: Source entity ID
+        target_id: Target entity ID
+        
+    Returns:
+        (lower, upper) pair; (inf, inf) when no path exists, with upper
+        inf when no path is known
+    """
+    if not adapter.graph.has_node(source_id) or not adapter.graph.has_node(target_id):
+        return math.inf, math.inf
+    if source_id == target_id:
+        return 0.0, 0.0
+        
+    adapter.reachability.schedule(adapter)
+    bounds = adapter.reachability.bounds(source_id, target_id)
+    if bounds is None:
+        return 1.0, math.inf
+    return bounds
@@ -0,0 +1,257 @@
+"""
+Path Search for Graph Adapters
+
+Provides bounded path search over any directed multigraph that can list a
+node's outgoing and incoming edges. Depths count relationships (hops).
+
+The shortest path length is found with a bidirectional breadth-first
+search that always grows the smaller frontier, so a query between two
+hubs explores two small balls instead of one large one. Simple paths are
+then enumerated lazily in order of length: for each length, a depth-first
+walk only enters nodes whose hop distance to the target still fits the
+remaining length. Callers pull paths one at a time and stop as soon as
+they have enough, so the work done follows the number of paths wanted
+rather than the number of paths that exist.
+
+Weighted search ranks paths by the product of their relationships'
+confidences, using -log(confidence) as the cost of an edge so that the
+most trustworthy chain is the cheapest. Exact cost-to-target bounds from a
+reverse Dijkstra search over the nodes near the target guide an A* search
+over partial paths, which emits complete paths in order of cost.
+"""
+
+import math
+import heapq
+import asyncio
+from itertools import count
+from typing import AsyncIterator, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .mvcc import YIELD_EVERY
+
+# node -> (edge, neighbor) pairs in edge order
+Neighbors = Callable[[Hashable], Sequence[Tuple[Hashable, Hashable]]]
+
+# edge -> non-negative cost, or None for an edge that cannot be used
+Cost = Callable[[Hashable], Optional[float]]
+
+def confidence_cost(confidence: float) -> Optional[float]:
+    """Get the cost of an edge with a confidence, or None for zero confidence."""
+    if confidence <= 0:
+        return None
+    return max(0.0, -math.log(confidence))
+
+class _Levels:
+    """Breadth-first search from one end, advanced one level at a time."""
+
+    def __init__(self, origin: Hashable, neighbors: Neighbors):
+        self.origin = origin
+        self.neighbors = neighbors
+        self.dist: Dict[Hashable, int] = {origin: 0}
+        self.frontier: List[Hashable] = [origin]
+        self.depth = 0
+
+    async def expand(self) -> List[Hashable]:
+        """Advance one level and return the newly reached nodes."""
+        self.depth += 1
+        reached = []
+        steps = 0
+        for node in self.frontier:
+            edges = self.neighbors(node)
+            steps += len(edges) + 1
+            for _, other in edges:
+                if other not in self.dist:
+                    self.dist[other] = self.depth
+                    reached.append(other)
+            if steps >= YIELD_EVERY:
+                steps = 0
+                await asyncio.sleep(0)
+        self.frontier = reached
+        return reached
+
+async def _meet(forward: _Levels, backward: _Levels, max_depth: int) -> Optional[int]:
+    """Advance both searches until they meet, returning the shortest length or None."""
+    if forward.origin == backward.origin:
+        return 0
+    while forward.frontier and backward.frontier and forward.depth + backward.depth < max_depth:
+        side, other = (forward, backward) if len(forward.frontier) <= len(backward.frontier) else (backward, forward)
+        for node in await side.expand():
+            if node in other.dist:
+                # The levels met for the first time, so no shorter path exists
+                return forward.depth + backward.depth
+    return None
+
+async def shortest_path_length(successors: Neighbors, predecessors: Neighbors,
+                               source: Hashable, target: Hashable, max_depth: int) -> Optional[int]:
+    """
+    Get the number of relationships on a shortest directed path.
+
+    Args:
+        successors: Function listing a node's outgoing (edge, target) pairs
+        predecessors: Function listing a node's incoming (edge, source) pairs
+        source: Start node
+        target: End node
+        max_depth: Maximum number of relationships to consider
+
+    Returns:
+        Hop count, or None if the target is not reachable within max_depth
+    """
+    return await _meet(_Levels(source, successors), _Levels(target, predecessors), max_depth)
+
+async def iter_simple_paths(successors: Neighbors, predecessors: Neighbors, source: Hashable,
+                            target: Hashable, max_depth: int) -> AsyncIterator[Tuple[List[Hashable], List[Hashable]]]:
+    """
+    Enumerate simple directed paths from source to target, shortest first.
+
+    Paths of equal length come in edge order. Parallel edges between the
+    same nodes give distinct paths.
+
+    Args:
+        successors: Function listing a node's outgoing (edge, target) pairs
+        predecessors: Function listing a node's incoming (edge, source) pairs
+        source: Start node
+        target: End node, distinct from source
+        max_depth: Maximum number of relationships in a path
+
+    Returns:
+        Async iterator over (nodes, edges) pairs, with one more node than edges
+    """
+    if source == target or max_depth < 1:
+        return
+    forward = _Levels(source, successors)
+    backward = _Levels(target, predecessors)
+    shortest = await _meet(forward, backward, max_depth)
+    if shortest is None:
+        return
+
+    to_target = backward.dist
+    for length in range(shortest, max_depth + 1):
+        # Distances up to length-1 decide which nodes can still reach the target
+        while backward.depth < length - 1 and backward.frontier:
+            await backward.expand()
+
+        nodes = [source]
+        edges: List[Hashable] = []
+        on_path = {source}
+        stack = [iter(successors(source))]
+        steps = 0
+        while stack:
+            step = next(stack[-1], None)
+            if step is None:
+                stack.pop()
+                on_path.discard(nodes.pop())
+                if edges:
+                    edges.pop()
+                continue
+
+            steps += 1
+            if steps >= YIELD_EVERY:
+                steps = 0
+                await asyncio.sleep(0)
+
+            edge, node = step
+            if node in on_path:
+                continue
+            remaining = length - len(edges) - 1
+            if node == target:
+                if remaining == 0:
+                    yield nodes + [node], edges + [edge]
+                continue
+            distance = to_target.get(node)
+            if distance is None or distance > remaining:
+                continue
+            out_edges = successors(node)
+            # Listing a hub's edges is work too; count it toward the next yield
+            steps += len(out_edges)
+            nodes.append(node)
+            edges.append(edge)
+            on_path.add(node)
+            stack.append(iter(out_edges))
+
+async def iter_weighted_paths(successors: Neighbors, predecessors: Neighbors, source: Hashable, target: Hashable,
+                              max_depth: int, cost: Cost) -> AsyncIterator[Tuple[List[Hashable], List[Hashable]]]:
+    """
+    Enumerate simple directed paths from source to target, cheapest first.
+
+    Paths of equal cost come shortest first. Edges without a cost are
+    never used.
+
+    Args:
+        successors: Function listing a node's outgoing (edge, target) pairs
+        predecessors: Function listing a node's incoming (edge, source) pairs
+        source: Start node
+        target: End node, distinct from source
+        max_depth: Maximum number of relationships in a path
+        cost: Function giving the cost of an edge, see confidence_cost
+
+    Returns:
+        Async iterator over (nodes, edges) pairs, with one more node than edges
+    """
+    if source == target or max_depth < 1:
+        return
+    forward = _Levels(source, successors)
+    backward = _Levels(target, predecessors)
+    if await _meet(forward, backward, max_depth) is None:
+        return
+    while backward.depth < max_depth - 1 and backward.frontier:
+        await backward.expand()
+    hops = backward.dist
+
+    # Cheapest cost to the target from each node that is close enough to
+    # matter. Nodes max_depth-1 hops out can only follow the source, so
+    # their predecessors are not searched; the source is bounded directly.
+    bound: Dict[Hashable, float] = {target: 0.0}
+    tie = count()
+    queue = [(0.0, next(tie), target)]
+    steps = 0
+    while queue:
+        distance, _, node = heapq.heappop(queue)
+        if distance > bound[node] or hops[node] > max_depth - 2:
+            continue
+        edges = predecessors(node)
+        steps += len(edges) + 1
+        for edge, other in edges:
+            if other not in hops or other == source:
+                continue
+            edge_cost = cost(edge)
+            if edge_cost is None:
+                continue
+            candidate = distance + edge_cost
+            if candidate < bound.get(other, math.inf):
+                bound[other] = candidate
+                heapq.heappush(queue, (candidate, next(tie), other))
+        if steps >= YIELD_EVERY:
+            steps = 0
+            await asyncio.sleep(0)
+    for edge, other in successors(source):
+        edge_cost = cost(edge) if other in bound else None
+        if edge_cost is not None and edge_cost + bound[other] < bound.get(source, math.inf):
+            bound[source] = edge_cost + bound[other]
+    if source not in bound:
+        return
+
+    # A* over partial paths, keyed by (cost bound, length bound, deepest first)
+    partial = [(bound[source], hops.get(source, max_depth), 0, next(tie), 0.0, (source,), ())]
+    while partial:
+        _, _, _, _, spent, nodes, edges = heapq.heappop(partial)
+        node = nodes[-1]
+        if node == target:
+            yield list(nodes), list(edges)
+            continue
+        remaining = max_depth - len(edges) - 1
+        out_edges = successors(node)
+        steps += len(out_edges) + 1
+        for edge, other in out_edges:
+            if other in nodes:
+                continue
+            distance = hops.get(other)
+            if distance is None or distance > remaining or other not in bound:
+                continue
+            edge_cost = cost(edge)
+            if edge_cost is None:
+                continue
+            total = spent + edge_cost
+            heapq.heappush(partial, (total + bound[other], len(edges) + 1 + distance, -len(edges) - 1,
+                                     next(tie), total, nodes + (other,), edges + (edge,)))
+        if steps >= YIELD_EVERY:
+            steps = 0
+            await asyncio.sleep(0)
@@ -0,0 +1,149 @@
+"""
+Property Payload Store for Memory Graph
+
+Provides the companion file of a binary snapshot that keeps entity
+property payloads out of the heap. Each payload is a marshal-encoded
+properties dictionary. The file is mapped read-only and a payload is only
+decoded when an entity's properties are read, so resident memory follows
+the graph's topology and small fields rather than its property data.
+
+Payload files are immutable: every checkpoint writes a new one under a
+unique name, which the snapshot records, so a crash between writing the
+two files never pairs a snapshot with the wrong payloads.
+"""
+
+import os
+import mmap
+import uuid
+import marshal
+import logging
+from typing import Any, BinaryIO, Dict, List, Tuple
+
+from ...entity import Entity
+
+logger = logging.getLogger("athena.graph.memory.payload_store")
+
+PAYLOAD_PREFIX = "graph.payloads."
+
+def new_payload_name() -> str:
+    """Get a fresh payload file name."""
+    return f"{PAYLOAD_PREFIX}{uuid.uuid4().hex[:16]}"
+
+class PayloadStore:
+    """A payload file, mapped read-only."""
+
+    def __init__(self, path: str):
+        """
+        Map a payload file.
+
+        Args:
+            path: Payload file
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # An empty file cannot be mapped, and holds no payloads to read
+                self._map = b""
+
+    def raw(self, offset: int, length: int) -> bytes:
+        """Get the encoded bytes of a payload."""
+        return self._map[offset:offset + length]
+
+    def read(self, offset: int, length: int) -> Dict[str, Any]:
+        """Decode a payload."""
+        return marshal.loads(self._map[offset:offset + length])
+
+class PayloadRef:
+    """Location of one entity's properties in a payload store."""
+
+    __slots__ = ("store", "offset", "length")
+
+    def __init__(self, store: PayloadStore, offset: int, length: int):
+        self.store = store
+        self.offset = offset
+        self.length = length
+
+    def load(self) -> Dict[str, Any]:
+        return self.store.read(self.offset, self.length)
+
+class PayloadWriter:
+    """
+    Appends entity payloads to a new payload file.
+
+    Payloads that are still in a store are copied without being decoded.
+    Those entities are remembered so they can be pointed at the new file
+    once it is in place.
+    """
+
+    def __init__(self, f: BinaryIO, name: str):
+        """
+        Initialize the writer.
+
+        Args:
+            f: Binary file object opened for writing
+            name: File name the payload file will have once in place
+        """
+        self.f = f
+        self.name = name
+        self.offset = 0
+        self.copied: List[Tuple[Entity, int, int]] = []
+
+    def add(self, entity: Entity) -> Tuple[int, int]:
+        """
+        Write an entity's properties.
+
+        Returns:
+            (offset, length) of the payload
+        """
+        payload = entity._payload
+        if payload is not None:
+            data = payload.store.raw(payload.offset, payload.length)
+        else:
+            data = marshal.dumps(entity.properties)
+        location = (self.offset, len(data))
+        self.f.write(data)
+        self.offset += len(data)
+        if payload is not None:
+            self.copied.append((entity, *location))
+        return location
+
+    def adopt(self, store: PayloadStore) -> int:
+        """
+        Point the copied entities at the written store.
+
+        Entities whose properties were decoded since they were copied keep
+        their decoded, possibly modified, properties.
+
+        Args:
+            store: The payload file this writer wrote, now in place
+
+        Returns:
+            Number of entities moved to the new store
+        """
+        moved = 0
+        for entity, offset, length in self.copied:
+            if entity._payload is not None:
+                entity._payload = PayloadRef(store, offset, length)
+                moved += 1
+        self.copied = []
+        return moved
+
+def remove_stale_payloads(directory: str, keep: str) -> None:
+    """
+    Delete the payload files of a directory other than the current one.
+
+    Readers that still map a deleted file keep reading it until they
+    release it.
+
+    Args:
+        directory: Data directory
+        keep: Name of the payload file the current snapshot uses
+    """
+    for name in os.listdir(directory):
+        if name.startswith(PAYLOAD_PREFIX) and name != keep:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError as e:
+                logger.warning(f"Could not remove stale payload file {name}: {e}")
@@ -6,11 +6,35 @@ Provides functions for loading and saving graph data to disk.
 
 import os
 import json
+import time
+import codecs
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from itertools import chain
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, AsyncIterator, BinaryIO, Iterator, List, Optional, Tuple
 
 from ...entity import Entity
 from ...relationship import Relationship
+from .index_ops import index_entity, index_relationship
+from .mvcc import before_write, pinned_snapshot, YIELD_EVERY
+from .snapshot_format import (
+    SnapshotWriter,
+    is_binary_snapshot,
+    read_header,
+    iter_raw_blocks,
+    decode_block,
+    decode_blocks,
+    entity_from_record,
+    relationship_from_record,
+    PAYLOAD_BLOCK,
+    ENTITY_BLOCK,
+    RELATIONSHIP_BLOCK
+)
+from .payload_store import PayloadStore, PayloadWriter, PAYLOAD_PREFIX, new_payload_name, remove_stale_payloads
+from .entity_ops import create_entity, update_entity, delete_entity
+from .relationship_ops import create_relationship, update_relationship, delete_relationship
 
 logger = logging.getLogger("athena.graph.memory.persistence")
 
@@ -18,75 +42,528 @@ async def load_data(adapter) -> None:
     """
     Load graph data from persistence files.
     
+    A binary snapshot is preferred when present; otherwise the JSON entity
+    and relationship files are imported. The format is detected from the
+    file header rather than the configured snapshot format, so switching
+    formats never strands existing data.
+    
+    Records are streamed from disk and inserted in batches of
+    adapter.load_batch_size, yielding to the event loop between batches.
+    Progress is published in adapter.load_progress.
+    
+    Args:
+        adapter: The memory adapter instance
+    """
+    progress = adapter.load_progress
+    progress.update(
+        state="loading",
+        phase="entities",
+        entities_loaded=0,
+        relationships_loaded=0,
+        bytes_read=0,
+        bytes_total=0,
+        started_at=time.time(),
+        finished_at=None
+    )
+    
+    if os.path.exists(adapter.snapshot_file) and is_binary_snapshot(adapter.snapshot_file):
+        progress["bytes_total"] = os.path.getsize(adapter.snapshot_file)
+        loaded = await _load_binary(adapter, adapter.snapshot_file)
+    else:
+        progress["bytes_total"] = sum(
+            os.path.getsize(path)
+            for path in (adapter.entity_file, adapter.relationship_file)
+            if os.path.exists(path)
+        )
+        loaded = await _load_json(adapter, adapter.entity_file, adapter.relationship_file)
+        
+    progress["state"] = "loaded" if loaded else "failed"
+    progress["phase"] = None
+    progress["finished_at"] = time.time()
+
+def quarantine_snapshot(adapter) -> Optional[str]:
+    """
+    Move the files of a snapshot that failed to load into a directory of their own.
+    
+    The next save then starts a new snapshot instead of replacing the
+    unreadable one, which stays available for recovery. Payload files move
+    with it, so cleaning up stale payloads never deletes the ones it uses.
+    
+    Args:
+        adapter: The memory adapter instance
+        
+    Returns:
+        The directory the files were moved to, or None if there were none
+    """
+    paths = [path for path in (adapter.snapshot_file, adapter.entity_file, adapter.relationship_file)
+             if os.path.exists(path)]
+    paths.extend(os.path.join(adapter.data_path, name) for name in os.listdir(adapter.data_path)
+                 if name.startswith(PAYLOAD_PREFIX))
+    if not paths:
+        return None
+        
+    directory = os.path.join(adapter.data_path, time.strftime("corrupt-%Y%m%d-%H%M%S"))
+    os.makedirs(directory, exist_ok=True)
+    for path in paths:
+        os.replace(path, os.path.join(directory, os.path.basename(path)))
+    logger.warning(f"Moved the unreadable snapshot to {directory}")
+    return directory
+
+async def _load_binary(adapter, path: str) -> bool:
+    """
+    Stream entities and relationships from a binary snapshot into the graph.
+    
+    Entity properties kept in a payload file stay there, undecoded, when the
+    adapter has lazy_properties set, and are decoded as they load otherwise.
+    """
+    progress = adapter.load_progress
+    entity_ids: List[str] = []
+    entities: List[Entity] = []
+    relationships: List[Relationship] = []
+    payloads: Optional[PayloadStore] = None
+    
+    try:
+        with open(path, 'rb') as f:
+            async for kind, records in _iter_decoded_blocks(adapter, f):
+                if kind == PAYLOAD_BLOCK:
+                    payloads = PayloadStore(os.path.join(os.path.dirname(path), records[0]))
+                elif kind == ENTITY_BLOCK:
+                    for record in records:
+                        entity = entity_from_record(record, payloads)
+                        if not adapter.lazy_properties and not entity.properties_loaded:
+                            entity.properties = entity.read_properties()
+                        entity_ids.append(entity.entity_id)
+                        entities.append(entity)
+                elif kind == RELATIONSHIP_BLOCK:
+                    if entities:
+                        await _insert_entities(adapter, entities)
+                        entities = []
+                    progress["phase"] = "relationships"
+                    for record in records:
+                        relationships.append(relationship_from_record(record, entity_ids))
+                else:
+                    logger.warning(f"Skipping unknown snapshot block type: {kind!r}")
+                    
+                progress["bytes_read"] = f.tell()
+                if len(entities) >= adapter.load_batch_size:
+                    await _insert_entities(adapter, entities)
+                    entities = []
+                if len(relationships) >= adapter.load_batch_size:
+                    await _insert_relationships(adapter, relationships)
+                    relationships = []
+                    
+        await _insert_entities(adapter, entities)
+        await _insert_relationships(adapter, relationships)
+        
+        logger.info(f"Loaded {progress['entities_loaded']} entities and "
+                    f"{progress['relationships_loaded']} relationships from {path}")
+        return True
+    except Exception as e:
+        logger.error(f"Error loading snapshot: {e}")
+        return False
+
+async def _iter_decoded_blocks(adapter, f: BinaryIO) -> AsyncIterator[Tuple[bytes, List[Tuple]]]:
+    """
+    Yield the decoded blocks of a binary snapshot in file order.
+    
+    With adapter.load_workers set, raw blocks are read here and grouped
+    into chunks that are decompressed and unmarshalled by a process pool.
+    Up to two chunks per worker are kept in flight, so decoding overlaps
+    with graph construction while memory use stays bounded.
+    
     Args:
         adapter: The memory adapter instance
+        f: Binary snapshot file positioned at the start
+        
+    Returns:
+        Async iterator over (kind, records) pairs
     """
+    flags = read_header(f)
+    workers = adapter.load_workers
+    if not workers or workers < 1:
+        for kind, payload in iter_raw_blocks(f):
+            yield kind, decode_block(payload, flags)
+        return
+        
+    loop = asyncio.get_running_loop()
+    blocks_per_chunk = 4
+    in_flight = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunk = []
+        for block in iter_raw_blocks(f):
+            chunk.append(block)
+            if len(chunk) < blocks_per_chunk:
+                continue
+            in_flight.append(loop.run_in_executor(pool, decode_blocks, chunk, flags))
+            chunk = []
+            if len(in_flight) >= 2 * workers:
+                for decoded in await in_flight.pop(0):
+                    yield decoded
+        if chunk:
+            in_flight.append(loop.run_in_executor(pool, decode_blocks, chunk, flags))
+        for future in in_flight:
+            for decoded in await future:
+                yield decoded
+
+async def _load_json(adapter, entity_file: str, relationship_file: str) -> bool:
+    """Stream entities and relationships from JSON files into the graph."""
+    progress = adapter.load_progress
+    loaded = True
+    
     # Load entities
-    if os.path.exists(adapter.entity_file):
+    if os.path.exists(entity_file):
         try:
-            with open(adapter.entity_file, 'r') as f:
-                entities_data = json.load(f)
-                
-            for entity_data in entities_data:
-                entity = Entity.from_dict(entity_data)
-                adapter.graph.add_node(entity.entity_id, entity=entity)
+            batch = []
+            with open(entity_file, 'rb') as f:
+                for entity_data in _iter_json_array(f, progress):
+                    batch.append(Entity.from_dict(entity_data))
+                    if len(batch) >= adapter.load_batch_size:
+                        await _insert_entities(adapter, batch)
+                        batch = []
+            await _insert_entities(adapter, batch)
                 
-            logger.info(f"Loaded {len(entities_data)} entities from {adapter.entity_file}")
+            logger.info(f"Loaded {progress['entities_loaded']} entities from {entity_file}")
         except Exception as e:
             logger.error(f"Error loading entities: {e}")
+            loaded = False
             
     # Load relationships
-    if os.path.exists(adapter.relationship_file):
+    progress["phase"] = "relationships"
+    if os.path.exists(relationship_file):
         try:
-            with open(adapter.relationship_file, 'r') as f:
-                relationships_data = json.load(f)
+            batch = []
+            with open(relationship_file, 'rb') as f:
+                for rel_data in _iter_json_array(f, progress):
+                    batch.append(Relationship.from_dict(rel_data))
+                    if len(batch) >= adapter.load_batch_size:
+                        await _insert_relationships(adapter, batch)
+                        batch = []
+            await _insert_relationships(adapter, batch)
                 
-            for rel_data in relationships_data:
-                relationship = Relationship.from_dict(rel_data)
-                adapter.graph.add_edge(
-                    relationship.source_id,
-                    relationship.target_id,
-                    key=relationship.relationship_id,
-                    relationship=relationship
-                )
-                
-            logger.info(f"Loaded {len(relationships_data)} relationships from {adapter.relationship_file}")
+            logger.info(f"Loaded {progress['relationships_loaded']} relationships from {relationship_file}")
         except Exception as e:
             logger.error(f"Error loading relationships: {e}")
+            loaded = False
+            
+    return loaded
 
-async def save_data(adapter) -> None:
+def _iter_json_array(f: BinaryIO, progress: Dict[str, Any], chunk_size: int = 1 << 20) -> Iterator[Any]:
     """
-    Save graph data to persistence files.
+    Incrementally decode the elements of a top-level JSON array.
+    
+    Only one chunk of the file plus the element being decoded is held in
+    memory at a time.
+    
+    Args:
+        f: Binary file object containing a JSON array
+        progress: Load progress dictionary; its bytes_read counter is advanced
+        chunk_size: Number of bytes to read at a time
+        
+    Returns:
+        Iterator over the decoded array elements
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ""
+    index = 0
+    started = False
+    eof = False
+    
+    def read_more() -> None:
+        nonlocal buffer, index, eof
+        raw = f.read(chunk_size)
+        progress["bytes_read"] += len(raw)
+        eof = not raw
+        buffer = buffer[index:] + text_decoder.decode(raw, final=eof)
+        index = 0
+        
+    while True:
+        # Skip whitespace and element separators
+        while index < len(buffer) and buffer[index] in " \t\r\n,":
+            index += 1
+            
+        if index >= len(buffer):
+            if eof:
+                if started:
+                    raise ValueError("Unterminated JSON array")
+                return
+            read_more()
+            continue
+            
+        if not started:
+            if buffer[index] != "[":
+                raise ValueError("Expected a JSON array")
+            started = True
+            index += 1
+            continue
+            
+        if buffer[index] == "]":
+            return
+            
+        try:
+            element, end = decoder.raw_decode(buffer, index)
+        except json.JSONDecodeError:
+            # The element continues past the end of the buffer
+            if eof:
+                raise
+            read_more()
+            continue
+            
+        yield element
+        index = end
+
+async def _insert_entities(adapter, entities: List[Entity]) -> None:
+    """Insert a batch of loaded entities, index them and yield to the event loop."""
+    if not entities:
+        return
+        
+    before_write(adapter, (entity.entity_id for entity in entities))
+    adapter.graph.add_nodes_from((entity.entity_id, {"entity": entity}) for entity in entities)
+    for entity in entities:
+        index_entity(adapter, entity)
+        
+    adapter.load_progress["entities_loaded"] += len(entities)
+    await asyncio.sleep(0)
+
+async def _insert_relationships(adapter, relationships: List[Relationship]) -> None:
+    """Insert a batch of loaded relationships, index them and yield to the event loop."""
+    if not relationships:
+        return
+        
+    before_write(adapter, chain.from_iterable((rel.source_id, rel.target_id) for rel in relationships))
+    adapter.graph.add_edges_from(
+        (rel.source_id, rel.target_id, rel.relationship_id, {"relationship": rel})
+        for rel in relationships
+    )
+    for relationship in relationships:
+        index_relationship(adapter, relationship)
+        
+    adapter.load_progress["relationships_loaded"] += len(relationships)
+    await asyncio.sleep(0)
+
+async def save_data(adapter) -> bool:
+    """
+    Save graph data to persistence files in the adapter's snapshot format.
+    
+    The graph is written from a pinned snapshot taken when this function is
+    called, so writes made while the files are being written do not end up
+    in them and are not blocked by the save.
+    
+    Files are written to a temporary path, fsynced and then renamed over
+    the previous version, so a crash never leaves a half-written snapshot.
     
     Args:
         adapter: The memory adapter instance
+        
+    Returns:
+        True if the snapshot was saved
+    """
+    with pinned_snapshot(adapter) as snapshot:
+        if adapter.snapshot_format == "binary":
+            return await _save_binary(snapshot, adapter.snapshot_file, adapter.snapshot_compression,
+                                      adapter.lazy_properties)
+            
+        saved = await _save_json(snapshot, adapter.entity_file, adapter.relationship_file)
+    if saved and os.path.exists(adapter.snapshot_file):
+        # The binary snapshot would otherwise shadow the JSON files on load
+        os.remove(adapter.snapshot_file)
+        remove_stale_payloads(adapter.data_path, keep="")
+    return saved
+
+async def _save_binary(snapshot, path: str, compress: bool, lazy_properties: bool = False) -> bool:
+    """
+    Write a graph snapshot as a binary snapshot file.
+    
+    With lazy_properties, entity properties go to a new payload file that is
+    put in place before the snapshot naming it. Payloads still undecoded are
+    copied as they are, and their entities then read from the new file.
+    """
+    try:
+        tmp_path = path + ".tmp"
+        entity_count = 0
+        relationship_count = 0
+        node_ids = snapshot.node_ids()
+        directory = os.path.dirname(path)
+        payload_name = new_payload_name() if lazy_properties else ""
+        payload_path = os.path.join(directory, payload_name)
+        loop = asyncio.get_running_loop()
+        
+        with open(tmp_path, 'wb') as f, open(payload_path + ".tmp", 'wb') if lazy_properties else nullcontext() as pf:
+            payloads = PayloadWriter(pf, payload_name) if lazy_properties else None
+            writer = SnapshotWriter(f, compress=compress, payloads=payloads)
+            for count, node_id in enumerate(node_ids, 1):
+                entity = snapshot.entity(node_id)
+                if entity:
+                    writer.write_entity(entity)
+                    entity_count += 1
+                if count % YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+            since_yield = 0
+            for node_id in node_ids:
+                out_edges = snapshot.out_edges(node_id)
+                for _, _, relationship in out_edges:
+                    if relationship:
+                        writer.write_relationship(relationship)
+                        relationship_count += 1
+                since_yield += len(out_edges) + 1
+                if since_yield >= YIELD_EVERY:
+                    since_yield = 0
+                    await asyncio.sleep(0)
+            writer.close()
+            if payloads is not None:
+                pf.flush()
+                await loop.run_in_executor(None, os.fsync, pf.fileno())
+                os.replace(payload_path + ".tmp", payload_path)
+            f.flush()
+            await loop.run_in_executor(None, os.fsync, f.fileno())
+        os.replace(tmp_path, path)
+        
+        if payloads is not None:
+            moved = payloads.adopt(PayloadStore(payload_path))
+            logger.debug(f"Moved {moved} undecoded property payloads to {payload_name}")
+        remove_stale_payloads(directory, keep=payload_name)
+        
+        logger.info(f"Saved {entity_count} entities and {relationship_count} relationships to {path}")
+        return True
+    except Exception as e:
+        logger.error(f"Error saving snapshot: {e}")
+        return False
+
+async def _save_json(snapshot, entity_file: str, relationship_file: str) -> bool:
     """
+    Write a graph snapshot as JSON entity and relationship files.
+    
+    Records are encoded as they are read so the event loop is never held for
+    a whole file, and the encoded text is written out on an executor thread.
+    """
+    saved = True
+    node_ids = snapshot.node_ids()
+    loop = asyncio.get_running_loop()
+    
     # Save entities
     try:
-        entities_data = []
-        for node_id in adapter.graph.nodes():
-            entity = adapter.graph.nodes[node_id].get('entity')
+        entities_json = []
+        for count, node_id in enumerate(node_ids, 1):
+            entity = snapshot.entity(node_id)
             if entity:
-                entities_data.append(entity.to_dict())
+                entities_json.append(_encode_json_item(entity.to_dict()))
+            if count % YIELD_EVERY == 0:
+                await asyncio.sleep(0)
                 
-        with open(adapter.entity_file, 'w') as f:
-            json.dump(entities_data, f, indent=2)
+        await loop.run_in_executor(None, _write_json_atomic, entity_file, entities_json)
             
-        logger.info(f"Saved {len(entities_data)} entities to {adapter.entity_file}")
+        logger.info(f"Saved {len(entities_json)} entities to {entity_file}")
     except Exception as e:
         logger.error(f"Error saving entities: {e}")
+        saved = False
         
     # Save relationships
     try:
-        relationships_data = []
-        for source_id, target_id, rel_id in adapter.graph.edges(keys=True):
-            relationship = adapter.graph[source_id][target_id][rel_id].get('relationship')
-            if relationship:
-                relationships_data.append(relationship.to_dict())
+        relationships_json = []
+        since_yield = 0
+        for node_id in node_ids:
+            out_edges = snapshot.out_edges(node_id)
+            for _, _, relationship in out_edges:
+                if relationship:
+                    relationships_json.append(_encode_json_item(relationship.to_dict()))
+            since_yield += len(out_edges) + 1
+            if since_yield >= YIELD_EVERY:
+                since_yield = 0
+                await asyncio.sleep(0)
                 
-        with open(adapter.relationship_file, 'w') as f:
-            json.dump(relationships_data, f, indent=2)
+        await loop.run_in_executor(None, _write_json_atomic, relationship_file, relationships_json)
             
-        logger.info(f"Saved {len(relationships_data)} relationships to {adapter.relationship_file}")
+        logger.info(f"Saved {len(relationships_json)} relationships to {relationship_file}")
     except Exception as e:
-        logger.error(f"Error saving relationships: {e}")
\ No newline at end of file
+        logger.error(f"Error saving relationships: {e}")
+        saved = False
+        
+    return saved
+
+async def export_json(adapter, entity_file: str, relationship_file: str) -> bool:
+    """
+    Export the graph to JSON entity and relationship files.
+    
+    The export reflects the graph at the time of the call; concurrent
+    writes proceed while it is written.
+    
+    Args:
+        adapter: The memory adapter instance
+        entity_file: Destination for the entities
+        relationship_file: Destination for the relationships
+        
+    Returns:
+        True if both files were written
+    """
+    with pinned_snapshot(adapter) as snapshot:
+        return await _save_json(snapshot, entity_file, relationship_file)
+
+async def import_json(adapter, entity_file: str, relationship_file: str) -> None:
+    """
+    Import entities and relationships from JSON files into the graph.
+    
+    Existing entities and relationships with the same IDs are replaced.
+    
+    Args:
+        adapter: The memory adapter instance
+        entity_file: JSON file with a list of entity dictionaries
+        relationship_file: JSON file with a list of relationship dictionaries
+    """
+    progress = adapter.load_progress
+    progress.update(state="importing", phase="entities", entities_loaded=0,
+                    relationships_loaded=0, bytes_read=0, finished_at=None)
+    loaded = await _load_json(adapter, entity_file, relationship_file)
+    progress.update(state="loaded" if loaded else "failed", phase=None, finished_at=time.time())
+
+def _encode_json_item(data: Any) -> str:
+    """Encode one list item the way json.dump(..., indent=2) lays it out."""
+    return "  " + json.dumps(data, indent=2).replace("\n", "\n  ")
+
+def _write_json_atomic(path: str, items: List[str]) -> None:
+    """Write encoded items as a JSON list to a temporary file and atomically move it into place."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        f.write("[\n" + ",\n".join(items) + "\n]" if items else "[]")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+async def replay_log(adapter) -> int:
+    """
+    Re-apply the mutations recorded in the adapter's write-ahead log.
+    
+    Args:
+        adapter: The memory adapter instance
+        
+    Returns:
+        Number of records replayed
+    """
+    wal = adapter.wal
+    if wal is None:
+        return 0
+        
+    handlers = {
+        "create_entity": lambda data: create_entity(adapter, Entity.from_dict(data)),
+        "update_entity": lambda data: update_entity(adapter, Entity.from_dict(data)),
+        "delete_entity": lambda data: delete_entity(adapter, data["entity_id"]),
+        "create_relationship": lambda data: create_relationship(adapter, Relationship.from_dict(data)),
+        "update_relationship": lambda data: update_relationship(adapter, Relationship.from_dict(data)),
+        "delete_relationship": lambda data: delete_relationship(adapter, data["relationship_id"]),
+    }
+    
+    count = 0
+    wal.replaying = True
+    try:
+        for op, data in wal.replay():
+            handler = handlers.get(op)
+            if handler is None:
+                logger.warning(f"Skipping unknown write-ahead log operation: {op}")
+                continue
+            await handler(data)
+            count += 1
+    finally:
+        wal.replaying = False
+        
+    if count:
+        logger.info(f"Replayed {count} mutations from {wal.path}")
+    return count
@@ -0,0 +1,440 @@
+"""
+Property Indexes for Memory Graph
+
+Provides declarative secondary indexes over entity property values: hash
+indexes answer equality lookups and sorted indexes answer range lookups.
+Index definitions are persisted next to the graph data; their contents are
+rebuilt from the entities whenever the graph is loaded.
+"""
+
+import os
+import json
+import math
+import logging
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ...entity import Entity
+
+logger = logging.getLogger("athena.graph.memory.property_index")
+
+# Index kinds
+HASH = "hash"
+SORTED = "sorted"
+INDEX_KINDS = (HASH, SORTED)
+
+# Marks a property that an entity does not have
+MISSING = object()
+
+# Sorted index keys group values by rank so numbers, strings and booleans
+# never compare. bool is a subclass of int, but like Neo4j the indexes treat
+# True and False as distinct from 1 and 0.
+_NUMBER_RANK = 0
+_STRING_RANK = 1
+_BOOLEAN_RANK = 2
+
+# Tags boolean hash index keys so they do not collide with 1 and 0
+_BOOLEAN = object()
+
+# Pending sorted-index entries merged one by one rather than by a full sort
+_INSERT_LIMIT = 64
+
+def property_value(entity: Entity, name: str) -> Any:
+    """
+    Get the raw value of an entity property.
+
+    Properties are normally stored as {"value", "confidence", "updated_at"}
+    dictionaries, but plain values are accepted as well.
+
+    Args:
+        entity: Entity to inspect
+        name: Property name
+
+    Returns:
+        Property value, or MISSING if the entity has no such property
+    """
+    prop = entity.read_properties().get(name, MISSING)
+    if isinstance(prop, dict) and "value" in prop:
+        return prop["value"]
+    return prop
+
+def sort_key(value: Any) -> Optional[Tuple[int, Any]]:
+    """
+    Get the ordering key of a value, or None if the value cannot be ordered.
+
+    Args:
+        value: Property value
+
+    Returns:
+        (rank, value) tuple for numbers, strings and booleans, otherwise None
+    """
+    if isinstance(value, bool):
+        return (_BOOLEAN_RANK, value)
+    if isinstance(value, str):
+        return (_STRING_RANK, value)
+    if isinstance(value, (int, float)) and not (isinstance(value, float) and math.isnan(value)):
+        return (_NUMBER_RANK, value)
+    return None
+
+def hash_key(value: Any) -> Any:
+    """
+    Get the key a value is stored under in a hash index.
+
+    Args:
+        value: Property value
+
+    Returns:
+        The value itself, or a tagged key for booleans
+    """
+    if isinstance(value, bool):
+        return (_BOOLEAN, value)
+    return value
+
+def value_matches(value: Any, equals: Any = None, min_value: Any = None, max_value: Any = None) -> bool:
+    """
+    Check a property value against an equality or inclusive range condition.
+
+    Ranges only match values of the same kind as their bounds, so a numeric
+    range never matches string values and vice versa.
+
+    Args:
+        value: Property value
+        equals: Required value, or None for a range condition
+        min_value: Inclusive lower bound, or None
+        max_value: Inclusive upper bound, or None
+
+    Returns:
+        True if the value satisfies the condition
+    """
+    if value is MISSING:
+        return False
+    if equals is not None:
+        return isinstance(value, bool) == isinstance(equals, bool) and value == equals
+    key = sort_key(value)
+    if key is None:
+        return False
+    for bound, below in ((min_value, True), (max_value, False)):
+        if bound is None:
+            continue
+        bound_key = sort_key(bound)
+        if bound_key is None or bound_key[0] != key[0]:
+            return False
+        if (key < bound_key) if below else (key > bound_key):
+            return False
+    return True
+
+class HashPropertyIndex:
+    """
+    Equality index from property value to the IDs of the entities holding it.
+
+    The value each entity was indexed under is remembered so that an entity
+    mutated in place can still be removed from its old posting set.
+    """
+
+    kind = HASH
+
+    def __init__(self):
+        self.postings: Dict[Any, Set[str]] = {}
+        self.entity_values: Dict[str, Any] = {}
+
+    def add(self, entity_id: str, value: Any) -> None:
+        """Index an entity under a value; unhashable values are skipped."""
+        key = hash_key(value)
+        try:
+            ids = self.postings.setdefault(key, set())
+        except TypeError:
+            return
+        ids.add(entity_id)
+        self.entity_values[entity_id] = key
+
+    def remove(self, entity_id: str) -> None:
+        """Remove an entity from the index."""
+        value = self.entity_values.pop(entity_id, MISSING)
+        if value is MISSING:
+            return
+        ids = self.postings.get(value)
+        if ids is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del self.postings[value]
+
+    def find(self, equals: Any = None, min_value: Any = None, max_value: Any = None) -> Optional[Iterable[str]]:
+        """
+        Find the IDs of the entities whose value equals the given one.
+
+        Returns:
+            Matching entity IDs, or None for a range condition or an
+            unhashable value, which this index cannot answer
+        """
+        if equals is None:
+            return None
+        try:
+            return list(self.postings.get(hash_key(equals), ()))
+        except TypeError:
+            return None
+
+    def flush(self) -> None:
+        """Nothing is buffered in a hash index."""
+
+    def __len__(self) -> int:
+        return len(self.entity_values)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.postings.clear()
+        self.entity_values.clear()
+
+class SortedPropertyIndex:
+    """
+    Range index keeping (rank, value, entity_id) keys in a sorted list.
+
+    Lookups bisect the list. Inserts are buffered and merged before the next
+    lookup or removal, so bulk loads sort once instead of inserting one by one.
+    Values that are not numbers, strings or booleans are not indexed.
+    """
+
+    kind = SORTED
+
+    def __init__(self):
+        self.keys: List[Tuple[int, Any, str]] = []
+        self.entity_keys: Dict[str, Tuple[int, Any, str]] = {}
+        self._pending: List[Tuple[int, Any, str]] = []
+
+    def add(self, entity_id: str, value: Any) -> None:
+        """Index an entity under a value."""
+        key = sort_key(value)
+        if key is None:
+            return
+        entry = (key[0], key[1], entity_id)
+        self.entity_keys[entity_id] = entry
+        self._pending.append(entry)
+
+    def remove(self, entity_id: str) -> None:
+        """Remove an entity from the index."""
+        entry = self.entity_keys.pop(entity_id, None)
+        if entry is None:
+            return
+        self.flush()
+        position = bisect_left(self.keys, entry)
+        if position < len(self.keys) and self.keys[position] == entry:
+            del self.keys[position]
+
+    def flush(self) -> None:
+        """Merge buffered inserts into the sorted key list."""
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = []
+        if len(pending) <= _INSERT_LIMIT:
+            for entry in pending:
+                insort(self.keys, entry)
+        else:
+            self.keys.extend(pending)
+            self.keys.sort()
+
+    def find(self, equals: Any = None, min_value: Any = None, max_value: Any = None) -> Optional[Iterable[str]]:
+        """
+        Find the IDs of the entities whose value equals the given one or lies
+        in an inclusive range, in ascending value order.
+
+        Returns:
+            Matching entity IDs, or None if the condition cannot be answered
+            from this index
+        """
+        if equals is not None:
+            if sort_key(equals) is None:
+                # Values that cannot be ordered are not in the index
+                return None
+            min_value = max_value = equals
+        bounds = [(bound, sort_key(bound)) for bound in (min_value, max_value) if bound is not None]
+        if any(key is None for _, key in bounds):
+            return []
+        ranks = {key[0] for _, key in bounds}
+        if len(ranks) != 1:
+            return [] if ranks else None
+        rank = ranks.pop()
+
+        self.flush()
+        keys = self.keys
+        start = bisect_left(keys, (rank,)) if min_value is None else bisect_left(keys, (rank, min_value))
+        end = bisect_left(keys, (rank + 1,)) if max_value is None else self._upper(rank, max_value)
+        return [entry[2] for entry in keys[start:end]]
+
+    def _upper(self, rank: int, value: Any) -> int:
+        """Position just past the last key with the given rank and value."""
+        position = bisect_right(self.keys, (rank, value))
+        keys = self.keys
+        while position < len(keys) and keys[position][0] == rank and keys[position][1] == value:
+            position += 1
+        return position
+
+    def __len__(self) -> int:
+        return len(self.entity_keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.keys.clear()
+        self.entity_keys.clear()
+        self._pending.clear()
+
+class PropertyIndexes:
+    """
+    The set of property indexes defined on a graph.
+
+    Each index covers one property name across all entities. Entities are
+    registered with add() whenever they are stored and removed with
+    remove() when they are deleted.
+    """
+
+    def __init__(self):
+        self.indexes: Dict[str, Any] = {}
+
+    def create(self, name: str, kind: str = HASH) -> Any:
+        """
+        Define an empty index; the caller populates it with add_to().
+
+        Args:
+            name: Property name
+            kind: "hash" for equality lookups or "sorted" for range lookups
+
+        Returns:
+            The new index
+
+        Raises:
+            ValueError: If the kind is unknown
+        """
+        if kind == HASH:
+            index = HashPropertyIndex()
+        elif kind == SORTED:
+            index = SortedPropertyIndex()
+        else:
+            raise ValueError(f"Unsupported property index kind: {kind}")
+        self.indexes[name] = index
+        return index
+
+    def drop(self, name: str) -> bool:
+        """Remove an index definition; returns False if there was none."""
+        return self.indexes.pop(name, None) is not None
+
+    def add(self, entity: Entity) -> None:
+        """Index an entity (or a new version of it) in every index."""
+        for name, index in self.indexes.items():
+            self._reindex(index, entity, name)
+
+    def add_to(self, name: str, entities: Iterable[Entity]) -> None:
+        """Populate one index from a collection of entities."""
+        index = self.indexes[name]
+        for entity in entities:
+            self._reindex(index, entity, name)
+        index.flush()
+
+    def _reindex(self, index: Any, entity: Entity, name: str) -> None:
+        index.remove(entity.entity_id)
+        value = property_value(entity, name)
+        if value is not MISSING:
+            index.add(entity.entity_id, value)
+
+    def remove(self, entity_id: str) -> None:
+        """Remove an entity from every index."""
+        for index in self.indexes.values():
+            index.remove(entity_id)
+
+    def find(self, name: str, equals: Any = None, min_value: Any = None,
+             max_value: Any = None) -> Optional[Iterable[str]]:
+        """
+        Look up entity IDs through the index on a property.
+
+        Returns:
+            Matching entity IDs, or None if no index can answer the condition
+        """
+        index = self.indexes.get(name)
+        if index is None:
+            return None
+        return index.find(equals, min_value, max_value)
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """List the defined indexes with their kind and number of entries."""
+        return [
+            {"name": name, "kind": index.kind, "entries": len(index)}
+            for name, index in sorted(self.indexes.items())
+        ]
+
+    def flush(self) -> None:
+        """Apply buffered inserts so the next lookup does not pay for them."""
+        for index in self.indexes.values():
+            index.flush()
+
+    def clear(self) -> None:
+        """Remove the contents of every index, keeping the definitions."""
+        for index in self.indexes.values():
+            index.clear()
+
+    def load_definitions(self, path: str) -> None:
+        """
+        Define the indexes listed in a definitions file, if it exists.
+
+        Args:
+            path: JSON file written by save_definitions()
+        """
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r') as f:
+                definitions = json.load(f)
+            for definition in definitions:
+                self.create(definition["name"], definition.get("kind", HASH))
+            logger.info(f"Loaded {len(definitions)} property index definitions from {path}")
+        except Exception as e:
+            logger.error(f"Error loading property index definitions: {e}")
+
+    def save_definitions(self, path: str) -> None:
+        """
+        Write the index definitions to a file.
+
+        Args:
+            path: Destination JSON file
+        """
+        definitions = [{"name": name, "kind": index.kind} for name, index in sorted(self.indexes.items())]
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(definitions, f, indent=2)
+        os.replace(tmp_path, path)
+
+def find_entities(indexes: PropertyIndexes, name: str, lookup: Callable[[str], Optional[Entity]],
+                  scan: Callable[[], Iterable[Entity]], equals: Any = None, min_value: Any = None,
+                  max_value: Any = None, entity_type: Optional[str] = None, limit: int = 100) -> List[Entity]:
+    """
+    Find entities by property value, through an index when one applies.
+
+    Args:
+        indexes: Property indexes of the graph
+        name: Property name
+        lookup: Resolves an entity ID to the stored entity
+        scan: Iterates the candidate entities when no index applies
+        equals: Required value, or None for a range condition
+        min_value: Inclusive lower bound, or None
+        max_value: Inclusive upper bound, or None
+        entity_type: Optional entity type filter
+        limit: Maximum number of results
+
+    Returns:
+        Matching entities; results from a sorted index are in ascending value order
+    """
+    if equals is None and min_value is None and max_value is None:
+        raise ValueError("A value or at least one range bound is required")
+
+    entity_ids = indexes.find(name, equals, min_value, max_value)
+    if entity_ids is not None:
+        candidates = (lookup(entity_id) for entity_id in entity_ids)
+    else:
+        logger.debug(f"No index answers the condition on property {name}, scanning")
+        candidates = (entity for entity in scan()
+                      if value_matches(property_value(entity, name), equals, min_value, max_value))
+
+    results = []
+    for entity in candidates:
+        if len(results) >= limit:
+            break
+        if entity is not None and (not entity_type or entity.entity_type == entity_type):
+            results.append(entity)
+    return results
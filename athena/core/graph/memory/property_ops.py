@@ -0,0 +1,103 @@
+"""
+Property Index Operations for Memory Graph
+
+Provides functions for managing property indexes and for finding entities
+by property value in the memory graph.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from ...entity import Entity
+from .property_index import find_entities
+
+logger = logging.getLogger("athena.graph.memory.property_ops")
+
+async def create_property_index(adapter, name: str, kind: str = "hash") -> bool:
+    """
+    Create an index over one property and populate it from the graph.
+
+    Args:
+        adapter: The memory adapter instance
+        name: Property name
+        kind: "hash" for equality lookups or "sorted" for range lookups
+
+    Returns:
+        True if the index was created, False if it already existed with that kind
+    """
+    existing = adapter.property_indexes.indexes.get(name)
+    if existing is not None and existing.kind == kind:
+        return False
+
+    adapter.property_indexes.create(name, kind)
+    adapter.property_indexes.add_to(name, (entity for _, entity in adapter.graph.nodes(data='entity') if entity))
+    adapter.property_indexes.save_definitions(adapter.property_index_file)
+    logger.info(f"Created {kind} index on property {name}")
+    return True
+
+async def drop_property_index(adapter, name: str) -> bool:
+    """
+    Drop the index over a property.
+
+    Args:
+        adapter: The memory adapter instance
+        name: Property name
+
+    Returns:
+        True if an index was dropped
+    """
+    if not adapter.property_indexes.drop(name):
+        return False
+    adapter.property_indexes.save_definitions(adapter.property_index_file)
+    logger.info(f"Dropped index on property {name}")
+    return True
+
+async def list_property_indexes(adapter) -> List[Dict[str, Any]]:
+    """
+    List the property indexes.
+
+    Args:
+        adapter: The memory adapter instance
+
+    Returns:
+        List of {"name", "kind", "entries"} dictionaries
+    """
+    return adapter.property_indexes.describe()
+
+async def find_entities_by_property(adapter, name: str, value: Any = None, min_value: Any = None,
+                                    max_value: Any = None, entity_type: Optional[str] = None,
+                                    limit: int = 100) -> List[Entity]:
+    """
+    Find entities whose property equals a value or lies in an inclusive range.
+
+    Uses the index on the property when it can answer the condition and
+    scans the entities (of the requested type, if any) otherwise.
+
+    Args:
+        adapter: The memory adapter instance
+        name: Property name
+        value: Required value (omit for a range query)
+        min_value: Inclusive lower bound
+        max_value: Inclusive upper bound
+        entity_type: Optional entity type filter
+        limit: Maximum number of results
+
+    Returns:
+        List of matching entities
+    """
+    nodes = adapter.graph.nodes
+
+    def lookup(entity_id: str) -> Optional[Entity]:
+        data = nodes.get(entity_id)
+        return data.get('entity') if data is not None else None
+
+    def scan():
+        if entity_type:
+            entities = (lookup(entity_id) for entity_id in adapter.type_index.get(entity_type))
+            return (entity for entity in entities if entity)
+        return (entity for _, entity in adapter.graph.nodes(data='entity') if entity)
+
+    results = find_entities(adapter.property_indexes, name, lookup, scan, value,
+                            min_value, max_value, entity_type, limit)
+    logger.debug(f"Property lookup on {name} found {len(results)} entities")
+    return results
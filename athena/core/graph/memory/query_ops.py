@@ -9,10 +9,13 @@ from typing import Dict, Any, List, Optional, Tuple
 
 from ...entity import Entity
 from ...relationship import Relationship
+from .search_index import tokenize, entity_text_fields
+from .type_index import OUTGOING, INCOMING
 
 logger = logging.getLogger("athena.graph.memory.query_ops")
 
-async def search_entities(adapter, query: str, entity_type: Optional[str] = None, limit: int = 10) -> List[Entity]:
+async def search_entities(adapter, query: str, entity_type: Optional[str] = None, limit: int = 10,
+                          match_mode: Optional[str] = None) -> List[Entity]:
     """
     Search for entities matching a query.
     
@@ -21,15 +24,68 @@ async def search_entities(adapter, query: str, entity_type: Optional[str] = None
         query: Search query
         entity_type: Optional entity type filter
         limit: Maximum number of results
+        match_mode: "substring" matches the query anywhere in the name, an alias
+            or a string property; "token" looks the query's words up in the
+            inverted token index and ranks entities by matched words.
+            Defaults to the adapter's search_mode.
         
     Returns:
         List of matching entities
     """
-    query = query.lower()
-    results = []
+    query = (query or "").lower()
+    match_mode = match_mode or adapter.search_mode
     
-    for node_id in adapter.graph.nodes():
-        entity = adapter.graph.nodes[node_id].get('entity')
+    if match_mode == "token":
+        results = _search_tokens(adapter, query, entity_type, limit)
+    elif match_mode == "substring":
+        results = _search_substring(adapter, query, entity_type, limit)
+    else:
+        raise ValueError(f"Unsupported match mode: {match_mode}")
+            
+    logger.debug(f"Search for '{query}' ({match_mode}) found {len(results)} entities")
+    return results
+
+def _search_tokens(adapter, query: str, entity_type: Optional[str], limit: int) -> List[Entity]:
+    """Answer a search from the inverted token index."""
+    query_tokens = tokenize(query)
+    if not query_tokens:
+        # An empty query matches everything, as in substring mode
+        return _search_substring(adapter, "", entity_type, limit)
+        
+    nodes = adapter.graph.nodes
+    typed_ids = adapter.type_index.get(entity_type) if entity_type else None
+    
+    def accept(entity_id: str) -> bool:
+        if typed_ids is not None and entity_id not in typed_ids:
+            return False
+        return nodes[entity_id].get('entity') is not None
+        
+    entity_ids = adapter.token_index.search(query_tokens, limit, accept)
+    return [nodes[entity_id]['entity'] for entity_id in entity_ids]
+
+def _search_substring(adapter, query: str, entity_type: Optional[str], limit: int) -> List[Entity]:
+    """Answer a search by looking for the query as a substring of each entity's text."""
+    nodes = adapter.graph.nodes
+    typed_ids = adapter.type_index.get(entity_type) if entity_type else None
+    
+    if len(query) >= 3:
+        # Narrow the candidates with the trigram index, then verify each one
+        candidate_ids = adapter.trigram_index.candidates(query)
+        if typed_ids is not None:
+            candidate_ids = (entity_id for entity_id in candidate_ids if entity_id in typed_ids)
+        candidates = (nodes[entity_id].get('entity') for entity_id in candidate_ids)
+    elif typed_ids is not None:
+        # Too short to form a trigram, check every entity of the requested type
+        candidates = (nodes[entity_id].get('entity') for entity_id in typed_ids)
+    else:
+        # Too short to form a trigram, fall back to checking every entity
+        candidates = (entity for _, entity in adapter.graph.nodes(data='entity'))
+        
+    results = []
+    for entity in candidates:
+        if len(results) >= limit:
+            break
+            
         if not entity:
             continue
             
@@ -37,24 +93,11 @@ async def search_entities(adapter, query: str, entity_type: Optional[str] = None
         if entity_type and entity.entity_type != entity_type:
             continue
             
-        # Check for matches in name or aliases
-        if (query in entity.name.lower() or 
-            any(query in alias.lower() for alias in entity.aliases)):
+        # Check for matches in name, aliases and string properties
+        if any(query in text.lower() for text in entity_text_fields(entity)):
             results.append(entity)
             
-        # Check for matches in properties
-        for key, prop in entity.properties.items():
-            value = prop.get('value')
-            if isinstance(value, str) and query in value.lower():
-                if entity not in results:
-                    results.append(entity)
-                break
-                
-        if len(results) >= limit:
-            break
-            
-    logger.debug(f"Search for '{query}' found {len(results)} entities")
-    return results[:limit]
+    return results
 
 async def get_entity_relationships(adapter, entity_id: str, 
                          relationship_type: Optional[str] = None,
@@ -71,37 +114,90 @@ async def get_entity_relationships(adapter, entity_id: str,
     Returns:
         List of (relationship, connected entity) tuples
     """
+    results = _entity_relationships(adapter, entity_id, relationship_type, direction, None)
+    logger.debug(f"Found {len(results)} relationships for entity {entity_id}")
+    return results
+
+async def get_relationships_for_entities(adapter, entity_ids: List[str],
+                                         relationship_type: Optional[str] = None,
+                                         direction: str = "both",
+                                         per_entity_limit: Optional[int] = None) -> Dict[str, List[Tuple[Relationship, Entity]]]:
+    """
+    Get the relationships of many entities in one pass.
+    
+    Args:
+        adapter: The memory adapter instance
+        entity_ids: Entity IDs
+        relationship_type: Optional relationship type filter
+        direction: Relationship direction ('outgoing', 'incoming', or 'both')
+        per_entity_limit: Maximum number of relationships per entity, or None for all
+        
+    Returns:
+        Mapping from each requested entity ID to its (relationship, connected entity) tuples
+    """
+    results = {
+        entity_id: _entity_relationships(adapter, entity_id, relationship_type, direction, per_entity_limit)
+        for entity_id in entity_ids
+    }
+    logger.debug(f"Found {sum(len(pairs) for pairs in results.values())} relationships for {len(results)} entities")
+    return results
+
+def _entity_relationships(adapter, entity_id: str, relationship_type: Optional[str], direction: str,
+                          limit: Optional[int]) -> List[Tuple[Relationship, Entity]]:
+    """Collect an entity's relationships, stopping after limit."""
+    if limit is not None and limit < 1:
+        return []
+    if relationship_type:
+        return _typed_relationships(adapter, entity_id, relationship_type, direction, limit)
+    if entity_id not in adapter.graph:
+        return []
+        
+    graph = adapter.graph
     results = []
     
-    # Get outgoing relationships
+    # Outgoing relationships come first, then incoming ones; other_end
+    # picks the far endpoint out of each (source, target, key, data) edge
+    sides = []
     if direction in ["outgoing", "both"]:
-        for _, target_id, rel_id in adapter.graph.out_edges(entity_id, keys=True):
-            relationship = adapter.graph[entity_id][target_id][rel_id].get('relationship')
-            target_entity = adapter.graph.nodes[target_id].get('entity')
-            
-            if not relationship or not target_entity:
-                continue
-                
-            if relationship_type and relationship.relationship_type != relationship_type:
-                continue
-                
-            results.append((relationship, target_entity))
-            
-    # Get incoming relationships
+        sides.append((graph.out_edges(entity_id, keys=True, data='relationship'), 1))
     if direction in ["incoming", "both"]:
-        for source_id, _, rel_id in adapter.graph.in_edges(entity_id, keys=True):
-            relationship = adapter.graph[source_id][entity_id][rel_id].get('relationship')
-            source_entity = adapter.graph.nodes[source_id].get('entity')
-            
-            if not relationship or not source_entity:
+        sides.append((graph.in_edges(entity_id, keys=True, data='relationship'), 0))
+        
+    for edges, other_end in sides:
+        for edge in edges:
+            relationship = edge[3]
+            other_entity = graph.nodes[edge[other_end]].get('entity')
+            if not relationship or not other_entity:
                 continue
+            results.append((relationship, other_entity))
+            if len(results) == limit:
+                return results
                 
-            if relationship_type and relationship.relationship_type != relationship_type:
+    return results
+
+def _typed_relationships(adapter, entity_id: str, relationship_type: str,
+                         direction: str, limit: Optional[int] = None) -> List[Tuple[Relationship, Entity]]:
+    """Read one relationship type of an entity from the adjacency index."""
+    graph = adapter.graph
+    results = []
+    sides = []
+    if direction in ["outgoing", "both"]:
+        sides.append((OUTGOING, 1))
+    if direction in ["incoming", "both"]:
+        sides.append((INCOMING, 0))
+        
+    for key, other_end in sides:
+        for rel_id in adapter.adjacency_index.get(entity_id, key, relationship_type):
+            endpoints = adapter.relationship_index.get(rel_id)
+            if endpoints is None:
                 continue
-                
-            results.append((relationship, source_entity))
-    
-    logger.debug(f"Found {len(results)} relationships for entity {entity_id}")
+            source_id, target_id = endpoints
+            relationship = graph.get_edge_data(source_id, target_id, rel_id, {}).get('relationship')
+            other_entity = graph.nodes[endpoints[other_end]].get('entity')
+            if relationship and other_entity:
+                results.append((relationship, other_entity))
+                if len(results) == limit:
+                    return results
     return results
 
 async def execute_query(query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
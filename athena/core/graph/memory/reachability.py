@@ -0,0 +1,323 @@
+"""
+Reachability Index for Memory Graph
+
+Answers "can a reach b, and in how many hops" without searching the graph.
+
+Two structures are kept over dense integer slots, one per node that takes
+part in a relationship:
+
+    components: a union-find over relationships taken as undirected. Nodes
+        in different components can never reach each other.
+    landmarks:  for a few high-degree nodes L, the hop distance from L to
+        every node and from every node to L. By the triangle inequality
+        d(L, b) - d(L, a) <= d(a, b) <= d(a, L) + d(L, b), and the same
+        holds for distances to L, so each landmark gives a lower and an
+        upper bound on d(a, b) in O(1).
+
+Inserting a relationship is cheap to absorb: the components are unioned
+and any landmark distance it shortens is propagated breadth-first. Removing
+one can lengthen distances or split components, which cannot be undone
+incrementally, so a removal only marks the index stale. A stale index
+answers nothing; the next caller that asks schedules a rebuild, which runs
+over a pinned snapshot and yields to the event loop like any long read.
+Relationships added while it runs are applied once it finishes; if one is
+removed meanwhile the result is thrown away and the index stays stale.
+A fresh index is also rebuilt once the graph has doubled since its last
+build, so landmarks chosen while the graph was small get replaced.
+"""
+
+import math
+import heapq
+import asyncio
+import logging
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from .mvcc import YIELD_EVERY, pinned_snapshot
+
+logger = logging.getLogger("athena.graph.memory.reachability")
+
+UNREACHABLE = -1
+
+class ReachabilityIndex:
+    """Connected components and landmark distances of the memory graph."""
+
+    def __init__(self, landmark_count: int = 8):
+        """
+        Initialize an empty, stale index.
+
+        Args:
+            landmark_count: Number of landmarks to keep distances for
+        """
+        self.landmark_count = landmark_count
+        self.fresh = False
+        self.builds = 0
+        self.built_edges = 0
+        self.added_edges = 0
+        self.slots: Dict[str, int] = {}
+        self.parent = array('i')
+        self.landmarks: List[str] = []
+        self.forward: List[array] = []
+        self.backward: List[array] = []
+        self._rebuild: Optional[asyncio.Task] = None
+        self._pending: Optional[List[Tuple[str, str]]] = None
+        self._removed = False
+
+    def add_edge(self, graph, source_id: str, target_id: str) -> None:
+        """
+        Absorb a relationship that was just added to the live graph.
+
+        Args:
+            graph: Live NetworkX graph, already holding the relationship
+            source_id: Source node of the relationship
+            target_id: Target node of the relationship
+        """
+        if self._pending is not None:
+            # A rebuild has pinned its snapshot and will not see this edge
+            self._pending.append((source_id, target_id))
+        if not self.fresh:
+            return
+        self.added_edges += 1
+        source = self._slot(source_id)
+        target = self._slot(target_id)
+        self._union(source, target)
+        for forward, backward in zip(self.forward, self.backward):
+            self._relax(graph.successors, forward, source_id, target_id)
+            self._relax(graph.predecessors, backward, target_id, source_id)
+
+    def invalidate(self) -> None:
+        """Mark the index stale after a relationship was removed or moved."""
+        if self._rebuild is not None:
+            self._removed = True
+        if self.fresh:
+            logger.debug("Reachability index is stale")
+        self.fresh = False
+
+    def bounds(self, source_id: str, target_id: str) -> Optional[Tuple[float, float]]:
+        """
+        Bound the hop distance of the shortest directed path between two nodes.
+
+        Both nodes must exist in the graph.
+
+        Args:
+            source_id: Start node
+            target_id: End node
+
+        Returns:
+            (lower, upper) pair, with math.inf for unreachable or unknown,
+            or None while the index is stale
+        """
+        if not self.fresh:
+            return None
+        if source_id == target_id:
+            return 0.0, 0.0
+        source = self.slots.get(source_id)
+        target = self.slots.get(target_id)
+        if source is None or target is None or self._find(source) != self._find(target):
+            return math.inf, math.inf
+
+        lower, upper = 1, math.inf
+        for forward, backward in zip(self.forward, self.backward):
+            from_source, from_target = forward[source], forward[target]
+            if from_source != UNREACHABLE:
+                if from_target == UNREACHABLE:
+                    # The landmark reaches the source but not the target
+                    return math.inf, math.inf
+                lower = max(lower, from_target - from_source)
+            to_source, to_target = backward[source], backward[target]
+            if to_target != UNREACHABLE:
+                if to_source == UNREACHABLE:
+                    # The target reaches the landmark but the source does not
+                    return math.inf, math.inf
+                lower = max(lower, to_source - to_target)
+            if to_source != UNREACHABLE and from_target != UNREACHABLE:
+                upper = min(upper, to_source + from_target)
+        return float(lower), float(upper)
+
+    def schedule(self, adapter) -> None:
+        """
+        Start a rebuild in the background if the index is stale or outgrown.
+
+        Args:
+            adapter: The memory adapter instance
+        """
+        outgrown = self.fresh and self.added_edges > self.built_edges
+        if (outgrown or not self.fresh) and self._rebuild is None and self.landmark_count > 0:
+            self._removed = False
+            self._rebuild = asyncio.create_task(self._build(adapter))
+
+    async def refresh(self, adapter) -> bool:
+        """
+        Rebuild the index if it is stale or outgrown and wait for the rebuild.
+
+        Args:
+            adapter: The memory adapter instance
+
+        Returns:
+            True if the index is fresh afterwards
+        """
+        self.schedule(adapter)
+        while self._rebuild is not None:
+            await asyncio.shield(self._rebuild)
+            # A rebuild that saw a removal was discarded; start another
+            self.schedule(adapter)
+        return self.fresh
+
+    def cancel(self) -> None:
+        """Cancel a running rebuild."""
+        if self._rebuild is not None:
+            self._rebuild.cancel()
+            self._rebuild = None
+            self._pending = None
+
+    def describe(self) -> Dict[str, Any]:
+        """Describe the index for status reports."""
+        return {
+            "fresh": self.fresh,
+            "rebuilding": self._rebuild is not None,
+            "builds": self.builds,
+            "relationships_since_build": self.added_edges,
+            "nodes": len(self.slots),
+            "landmarks": len(self.landmarks)
+        }
+
+    async def _build(self, adapter) -> None:
+        try:
+            with pinned_snapshot(adapter) as snapshot:
+                self._pending = []
+
+                # Read the snapshot once into integer edge lists
+                node_ids = snapshot.node_ids()
+                slots = {node_id: slot for slot, node_id in enumerate(node_ids)}
+                parent = array('i', range(len(node_ids)))
+                sources, targets = array('i'), array('i')
+                steps = 0
+                for slot, node_id in enumerate(node_ids):
+                    edges = snapshot.out_edges(node_id)
+                    for target_id, _, _ in edges:
+                        target = slots[target_id]
+                        sources.append(slot)
+                        targets.append(target)
+                        _union(parent, slot, target)
+                    steps += len(edges) + 1
+                    if steps >= YIELD_EVERY:
+                        steps = 0
+                        await asyncio.sleep(0)
+
+            successors = _adjacency(len(node_ids), sources, targets)
+            predecessors = _adjacency(len(node_ids), targets, sources)
+            await asyncio.sleep(0)
+            degrees = [successors[0][slot + 1] - successors[0][slot] + predecessors[0][slot + 1] - predecessors[0][slot]
+                       for slot in range(len(node_ids))]
+            hubs = [slot for slot in heapq.nlargest(self.landmark_count, range(len(node_ids)), key=degrees.__getitem__)
+                    if degrees[slot]]
+            landmarks = [node_ids[slot] for slot in hubs]
+            forward, backward = [], []
+            for hub in hubs:
+                forward.append(await _distances(successors, hub))
+                backward.append(await _distances(predecessors, hub))
+            edge_count = len(sources)
+
+            if self._removed:
+                logger.debug("Discarded reachability rebuild: relationships were removed while it ran")
+                return
+            self.slots, self.parent = slots, parent
+            self.landmarks, self.forward, self.backward = landmarks, forward, backward
+            self.fresh = True
+            self.builds += 1
+            self.built_edges, self.added_edges = edge_count, 0
+            pending, self._pending = self._pending, None
+            self._rebuild = None
+            for source_id, target_id in pending:
+                self.add_edge(adapter.graph, source_id, target_id)
+            logger.debug(f"Rebuilt reachability index: {len(slots)} nodes, {len(landmarks)} landmarks, "
+                         f"{len(pending)} relationships added during the rebuild")
+        finally:
+            if self._rebuild is asyncio.current_task():
+                self._rebuild = None
+                self._pending = None
+
+    def _slot(self, node_id: str) -> int:
+        slot = self.slots.get(node_id)
+        if slot is None:
+            slot = self.slots[node_id] = len(self.parent)
+            self.parent.append(slot)
+            for distances in self.forward + self.backward:
+                distances.append(UNREACHABLE)
+        return slot
+
+    def _find(self, slot: int) -> int:
+        return _find(self.parent, slot)
+
+    def _union(self, a: int, b: int) -> None:
+        _union(self.parent, a, b)
+
+    def _relax(self, neighbors, distances: array, near_id: str, far_id: str) -> None:
+        """Propagate a distance shortened by a new edge from near_id to far_id."""
+        near = distances[self.slots[near_id]]
+        if near == UNREACHABLE:
+            return
+        far = self.slots[far_id]
+        if distances[far] != UNREACHABLE and distances[far] <= near + 1:
+            return
+        distances[far] = near + 1
+        frontier = [far_id]
+        while frontier:
+            reached = []
+            for node_id in frontier:
+                step = distances[self.slots[node_id]] + 1
+                for other_id in neighbors(node_id):
+                    other = self._slot(other_id)
+                    if distances[other] == UNREACHABLE or distances[other] > step:
+                        distances[other] = step
+                        reached.append(other_id)
+            frontier = reached
+
+def _find(parent: array, slot: int) -> int:
+    while parent[slot] != slot:
+        parent[slot] = parent[parent[slot]]
+        slot = parent[slot]
+    return slot
+
+def _union(parent: array, a: int, b: int) -> None:
+    a, b = _find(parent, a), _find(parent, b)
+    if a != b:
+        parent[max(a, b)] = min(a, b)
+
+def _adjacency(size: int, keys: array, values: array) -> Tuple[array, array]:
+    """Group values by key into (offsets, values) arrays, one offset per key plus one."""
+    offsets = array('i', [0]) * (size + 1)
+    for key in keys:
+        offsets[key + 1] += 1
+    for slot in range(size):
+        offsets[slot + 1] += offsets[slot]
+    grouped = array('i', [0]) * len(values)
+    fill = offsets[:-1]
+    for key, value in zip(keys, values):
+        grouped[fill[key]] = value
+        fill[key] += 1
+    return offsets, grouped
+
+async def _distances(adjacency: Tuple[array, array], origin: int) -> array:
+    """Breadth-first hop distances from origin, UNREACHABLE where not reached."""
+    offsets, neighbors = adjacency
+    distances = array('i', [UNREACHABLE]) * (len(offsets) - 1)
+    distances[origin] = 0
+    frontier = [origin]
+    depth = 0
+    steps = 0
+    while frontier:
+        depth += 1
+        reached = []
+        for node in frontier:
+            start, end = offsets[node], offsets[node + 1]
+            for other in neighbors[start:end]:
+                if distances[other] == UNREACHABLE:
+                    distances[other] = depth
+                    reached.append(other)
+            steps += end - start + 1
+            if steps >= YIELD_EVERY:
+                steps = 0
+                await asyncio.sleep(0)
+        frontier = reached
+    return distances
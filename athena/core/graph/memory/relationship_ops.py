@@ -5,9 +5,13 @@ Provides functions for relationship CRUD operations in the memory graph.
 """
 
 import logging
-from typing import Optional
+from itertools import chain
+from typing import Dict, List, Optional
 
 from ...relationship import Relationship
+from .index_ops import index_relationship, unindex_relationship, lookup_relationship
+from .mvcc import before_write
+from .wal import log_mutation, log_mutations
 
 logger = logging.getLogger("athena.graph.memory.relationship_ops")
 
@@ -22,15 +26,68 @@ async def create_relationship(adapter, relationship: Relationship) -> str:
     Returns:
         Relationship ID
     """
+    # Re-creating an existing ID with different endpoints moves the edge
+    existing = lookup_relationship(adapter, relationship.relationship_id)
+    before_write(adapter, (relationship.source_id, relationship.target_id) + (existing or ()))
+    if existing and existing != (relationship.source_id, relationship.target_id):
+        adapter.graph.remove_edge(existing[0], existing[1], relationship.relationship_id)
+        
     adapter.graph.add_edge(
         relationship.source_id,
         relationship.target_id,
         key=relationship.relationship_id,
         relationship=relationship
     )
+    index_relationship(adapter, relationship)
+    await log_mutation(adapter, "create_relationship", relationship.to_dict())
     logger.debug(f"Created relationship: {relationship.relationship_type} ({relationship.relationship_id})")
     return relationship.relationship_id
 
+async def create_relationships(adapter, relationships: List[Relationship]) -> Dict[int, str]:
+    """
+    Create many relationships at once.
+    
+    Edges are inserted with a single add_edges_from call and the whole
+    batch is written to the write-ahead log with one commit.
+    
+    Args:
+        adapter: The memory adapter instance
+        relationships: Relationships to create
+        
+    Returns:
+        Mapping from batch index to error message for relationships that could not be created
+    """
+    errors: Dict[int, str] = {}
+    latest: Dict[str, Relationship] = {}
+    for index, relationship in enumerate(relationships):
+        if not relationship.source_id or not relationship.target_id:
+            errors[index] = "Relationship needs a source_id and a target_id"
+            continue
+        # A later occurrence of the same ID in the batch wins
+        latest.pop(relationship.relationship_id, None)
+        latest[relationship.relationship_id] = relationship
+        
+    valid = list(latest.values())
+    before_write(adapter, chain.from_iterable(
+        (rel.source_id, rel.target_id) + (adapter.relationship_index.get(rel.relationship_id) or ())
+        for rel in valid
+    ))
+    for relationship in valid:
+        # Re-creating an existing ID with different endpoints moves the edge
+        existing = lookup_relationship(adapter, relationship.relationship_id)
+        if existing and existing != (relationship.source_id, relationship.target_id):
+            adapter.graph.remove_edge(existing[0], existing[1], relationship.relationship_id)
+
+    adapter.graph.add_edges_from(
+        (rel.source_id, rel.target_id, rel.relationship_id, {"relationship": rel})
+        for rel in valid
+    )
+    for relationship in valid:
+        index_relationship(adapter, relationship)
+    await log_mutations(adapter, "create_relationship", [rel.to_dict() for rel in valid])
+    logger.debug(f"Created {len(valid)} relationships in batch")
+    return errors
+
 async def get_relationship(adapter, relationship_id: str) -> Optional[Relationship]:
     """
     Get a relationship by ID.
@@ -42,14 +99,15 @@ async def get_relationship(adapter, relationship_id: str) -> Optional[Relationsh
     Returns:
         Relationship or None if not found
     """
-    for source_id, target_id, rel_id in adapter.graph.edges(keys=True):
-        if rel_id == relationship_id:
-            relationship = adapter.graph[source_id][target_id][rel_id].get('relationship')
-            if relationship:
-                logger.debug(f"Retrieved relationship: {relationship.relationship_type} ({relationship_id})")
-            else:
-                logger.warning(f"Relationship exists but has no relationship data: {relationship_id}")
-            return relationship
+    endpoints = lookup_relationship(adapter, relationship_id)
+    if endpoints:
+        source_id, target_id = endpoints
+        relationship = adapter.graph[source_id][target_id][relationship_id].get('relationship')
+        if relationship:
+            logger.debug(f"Retrieved relationship: {relationship.relationship_type} ({relationship_id})")
+        else:
+            logger.warning(f"Relationship exists but has no relationship data: {relationship_id}")
+        return relationship
     logger.debug(f"Relationship not found: {relationship_id}")
     return None
 
@@ -64,11 +122,15 @@ async def update_relationship(adapter, relationship: Relationship) -> bool:
     Returns:
         True if successful
     """
-    for source_id, target_id, rel_id in adapter.graph.edges(keys=True):
-        if rel_id == relationship.relationship_id:
-            adapter.graph[source_id][target_id][rel_id]['relationship'] = relationship
-            logger.debug(f"Updated relationship: {relationship.relationship_type} ({relationship.relationship_id})")
-            return True
+    endpoints = lookup_relationship(adapter, relationship.relationship_id)
+    if endpoints:
+        source_id, target_id = endpoints
+        before_write(adapter, endpoints)
+        adapter.graph[source_id][target_id][relationship.relationship_id]['relationship'] = relationship
+        index_relationship(adapter, relationship, endpoints)
+        await log_mutation(adapter, "update_relationship", relationship.to_dict())
+        logger.debug(f"Updated relationship: {relationship.relationship_type} ({relationship.relationship_id})")
+        return True
     logger.warning(f"Cannot update relationship: {relationship.relationship_id} - not found")
     return False
 
@@ -83,10 +145,14 @@ async def delete_relationship(adapter, relationship_id: str) -> bool:
     Returns:
         True if successful
     """
-    for source_id, target_id, rel_id in list(adapter.graph.edges(keys=True)):
-        if rel_id == relationship_id:
-            adapter.graph.remove_edge(source_id, target_id, rel_id)
-            logger.debug(f"Deleted relationship: {relationship_id}")
-            return True
+    endpoints = lookup_relationship(adapter, relationship_id)
+    if endpoints:
+        source_id, target_id = endpoints
+        before_write(adapter, endpoints)
+        adapter.graph.remove_edge(source_id, target_id, relationship_id)
+        unindex_relationship(adapter, relationship_id)
+        await log_mutation(adapter, "delete_relationship", {"relationship_id": relationship_id})
+        logger.debug(f"Deleted relationship: {relationship_id}")
+        return True
     logger.warning(f"Cannot delete relationship: {relationship_id} - not found")
     return False
\ No newline at end of file
@@ -0,0 +1,232 @@
+"""
+Search Indexes for Memory Graph
+
+Provides in-memory text indexes used to answer entity searches without
+scanning every node in the graph.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Set, FrozenSet
+
+from ...entity import Entity
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lower-case word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in order of appearance
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Get the set of three-character substrings of lower-cased text.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Set of trigrams (empty for text shorter than three characters)
+    """
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def entity_text_fields(entity: Entity) -> Iterator[str]:
+    """
+    Yield the searchable text of an entity: name, aliases and string properties.
+
+    Args:
+        entity: Entity to inspect
+
+    Returns:
+        Iterator over the raw text fields
+    """
+    if entity.name:
+        yield entity.name
+    yield from entity.aliases
+    for prop in entity.read_properties().values():
+        value = prop.get('value') if isinstance(prop, dict) else prop
+        if isinstance(value, str):
+            yield value
+
+class TokenIndex:
+    """
+    Inverted index from word tokens to entity IDs.
+
+    Covers entity names, aliases and string property values. Each entity's
+    token set is remembered so it can be removed or replaced incrementally.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Set[str]] = {}
+        self.entity_tokens: Dict[str, FrozenSet[str]] = {}
+
+    def add(self, entity: Entity) -> None:
+        """Index an entity, replacing any previous version of it."""
+        self.remove(entity.entity_id)
+
+        tokens = frozenset(
+            token
+            for text in entity_text_fields(entity)
+            for token in tokenize(text)
+        )
+        if not tokens:
+            return
+
+        self.entity_tokens[entity.entity_id] = tokens
+        for token in tokens:
+            self.postings.setdefault(token, set()).add(entity.entity_id)
+
+    def remove(self, entity_id: str) -> None:
+        """Remove an entity from the index."""
+        tokens = self.entity_tokens.pop(entity_id, None)
+        if not tokens:
+            return
+
+        for token in tokens:
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            posting.discard(entity_id)
+            if not posting:
+                del self.postings[token]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.postings.clear()
+        self.entity_tokens.clear()
+
+    def search(self, query_tokens: Iterable[str], limit: int, accept=None) -> List[str]:
+        """
+        Find the entities matching the most query tokens.
+
+        Entities matching every token are returned first; the scan stops as
+        soon as ``limit`` of them have been found. Otherwise partial matches
+        are ranked by the number of distinct tokens they contain.
+
+        Args:
+            query_tokens: Tokens to look up
+            limit: Maximum number of entity IDs to return
+            accept: Optional predicate applied to each candidate entity ID
+
+        Returns:
+            Entity IDs ordered by descending number of matched tokens
+        """
+        postings = sorted(
+            (self.postings.get(token, set()) for token in set(query_tokens)),
+            key=len
+        )
+        if not postings or limit <= 0:
+            return []
+
+        # Entities containing every token, stopping early once we have enough
+        full_matches = []
+        if postings[0]:
+            rest = postings[1:]
+            for entity_id in postings[0]:
+                if all(entity_id in posting for posting in rest):
+                    if accept is None or accept(entity_id):
+                        full_matches.append(entity_id)
+                        if len(full_matches) >= limit:
+                            return full_matches
+
+        if len(postings) == 1:
+            return full_matches
+
+        # Fill the remaining slots with the best partial matches
+        found = set(full_matches)
+        counts = Counter()
+        for posting in postings:
+            counts.update(posting)
+
+        partial = []
+        for entity_id, count in counts.most_common():
+            if len(full_matches) + len(partial) >= limit:
+                break
+            if entity_id in found:
+                continue
+            if accept is None or accept(entity_id):
+                partial.append(entity_id)
+
+        return full_matches + partial
+
+class TrigramIndex:
+    """
+    Posting-list index from trigrams to entity IDs.
+
+    Supports substring (CONTAINS) search: any string containing the query
+    also contains all of the query's trigrams, so intersecting their posting
+    lists yields a small candidate set that is then verified directly.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Set[str]] = {}
+        self.entity_trigrams: Dict[str, FrozenSet[str]] = {}
+
+    def add(self, entity: Entity) -> None:
+        """Index an entity, replacing any previous version of it."""
+        self.remove(entity.entity_id)
+
+        grams = frozenset(
+            gram
+            for text in entity_text_fields(entity)
+            for gram in trigrams(text)
+        )
+        if not grams:
+            return
+
+        self.entity_trigrams[entity.entity_id] = grams
+        for gram in grams:
+            self.postings.setdefault(gram, set()).add(entity.entity_id)
+
+    def remove(self, entity_id: str) -> None:
+        """Remove an entity from the index."""
+        grams = self.entity_trigrams.pop(entity_id, None)
+        if not grams:
+            return
+
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(entity_id)
+            if not posting:
+                del self.postings[gram]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.postings.clear()
+        self.entity_trigrams.clear()
+
+    def candidates(self, query: str) -> Iterator[str]:
+        """
+        Yield entity IDs that contain every trigram of the query.
+
+        Candidates are not guaranteed to contain the query itself and must
+        be verified by the caller. The query must be at least three
+        characters long.
+
+        Args:
+            query: Lower-cased substring to look for
+
+        Returns:
+            Iterator over candidate entity IDs
+        """
+        postings = sorted(
+            (self.postings.get(gram, set()) for gram in trigrams(query)),
+            key=len
+        )
+        if not postings or not postings[0]:
+            return
+
+        rest = postings[1:]
+        for entity_id in postings[0]:
+            if all(entity_id in posting for posting in rest):
+                yield entity_id
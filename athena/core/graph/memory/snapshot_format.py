@@ -0,0 +1,285 @@
+"""
+Binary Snapshot Format for Memory Graph
+
+Provides a compact, versioned on-disk format for memory graph snapshots.
+
+Layout:
+    header:  MAGIC (8 bytes) | version (uint16) | flags (uint16)
+    blocks:  kind (1 byte, b'P', b'E' or b'R') | payload length (uint32) | payload
+
+Each payload is a marshal-encoded list of record tuples, zlib-compressed
+when the FLAG_ZLIB header flag is set. Type and source strings are interned
+so marshal stores each distinct value once per block, and relationship
+endpoints refer to entities by their ordinal position in the snapshot
+instead of repeating the UUID string. Timestamps are stored in the compact
+form entities and relationships hold them in, so no formatting or parsing
+happens on save or load.
+
+With the FLAG_PAYLOADS header flag (version 2), entity properties are kept
+in a separate payload file named by a leading b'P' block, and each entity
+record holds the (offset, length) of its properties there instead of the
+properties themselves.
+"""
+
+import sys
+import zlib
+import struct
+import marshal
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from ...entity import Entity
+from ...relationship import Relationship
+from .payload_store import PayloadStore, PayloadRef, PayloadWriter
+
+MAGIC = b"ATHSNAP\x00"
+VERSION = 2
+FLAG_ZLIB = 0x1
+FLAG_PAYLOADS = 0x2
+
+HEADER = struct.Struct(">8sHH")
+BLOCK_HEADER = struct.Struct(">cI")
+
+PAYLOAD_BLOCK = b"P"
+ENTITY_BLOCK = b"E"
+RELATIONSHIP_BLOCK = b"R"
+
+DEFAULT_BLOCK_SIZE = 4096
+
+def is_binary_snapshot(path: str) -> bool:
+    """
+    Check whether a file starts with the binary snapshot header.
+
+    Args:
+        path: File to inspect
+
+    Returns:
+        True if the file is a binary snapshot
+    """
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def entity_to_record(entity: Entity, payloads: Optional[PayloadWriter] = None) -> Tuple:
+    """Convert an entity to a compact record tuple, writing its properties to payloads if given."""
+    return (
+        entity.entity_id,
+        sys.intern(entity.entity_type),
+        entity.name,
+        payloads.add(entity) if payloads is not None else entity.read_properties(),
+        entity.confidence,
+        sys.intern(entity.source),
+        entity._created_at,
+        entity._updated_at,
+        entity._aliases
+    )
+
+def entity_from_record(record: Tuple, payloads: Optional[PayloadStore] = None) -> Entity:
+    """Rebuild an entity from a record tuple, leaving properties in payloads undecoded."""
+    (entity_id, entity_type, name, properties, confidence,
+     source, created_at, updated_at, aliases) = record
+    entity = Entity(
+        entity_id=entity_id,
+        entity_type=entity_type,
+        name=name,
+        confidence=confidence,
+        source=source
+    )
+    if isinstance(properties, tuple):
+        if payloads is None:
+            raise ValueError(f"Entity {entity_id} refers to a payload file that was not opened")
+        entity._properties = None
+        entity._payload = PayloadRef(payloads, *properties)
+    else:
+        entity._properties = properties
+    entity.created_at = created_at
+    entity.updated_at = updated_at
+    entity.aliases = aliases
+    return entity
+
+def relationship_to_record(relationship: Relationship, ordinals: Dict[str, int]) -> Tuple:
+    """Convert a relationship to a compact record tuple."""
+    return (
+        relationship.relationship_id,
+        sys.intern(relationship.relationship_type),
+        ordinals.get(relationship.source_id, relationship.source_id),
+        ordinals.get(relationship.target_id, relationship.target_id),
+        relationship.properties,
+        relationship.confidence,
+        sys.intern(relationship.source),
+        relationship._created_at,
+        relationship._updated_at,
+        relationship.is_directional
+    )
+
+def relationship_from_record(record: Tuple, entity_ids: List[str]) -> Relationship:
+    """Rebuild a relationship from a record tuple."""
+    (relationship_id, relationship_type, source_ref, target_ref, properties,
+     confidence, source, created_at, updated_at, is_directional) = record
+    relationship = Relationship(
+        relationship_id=relationship_id,
+        relationship_type=relationship_type,
+        source_id=entity_ids[source_ref] if isinstance(source_ref, int) else source_ref,
+        target_id=entity_ids[target_ref] if isinstance(target_ref, int) else target_ref,
+        properties=properties,
+        confidence=confidence,
+        source=source
+    )
+    relationship.created_at = created_at
+    relationship.updated_at = updated_at
+    relationship.is_directional = is_directional
+    return relationship
+
+class SnapshotWriter:
+    """
+    Streams entities and relationships into a binary snapshot file.
+
+    All entities must be written before any relationship so that
+    relationship endpoints can be encoded as entity ordinals.
+    """
+
+    def __init__(self, f: BinaryIO, compress: bool = True, block_size: int = DEFAULT_BLOCK_SIZE,
+                 payloads: Optional[PayloadWriter] = None):
+        """
+        Initialize the writer and emit the file header.
+
+        Args:
+            f: Binary file object opened for writing
+            compress: Whether to zlib-compress each block
+            block_size: Number of records per block
+            payloads: Writer of the payload file that receives entity
+                properties; properties are inlined if None
+        """
+        self.f = f
+        self.compress = compress
+        self.block_size = block_size
+        self.payloads = payloads
+        self.ordinals: Dict[str, int] = {}
+        self._buffer: List[Tuple] = []
+        self._kind: Optional[bytes] = None
+        flags = FLAG_ZLIB if compress else 0
+        if payloads is None:
+            # Snapshots without payloads stay readable by version 1 readers
+            f.write(HEADER.pack(MAGIC, 1, flags))
+        else:
+            f.write(HEADER.pack(MAGIC, VERSION, flags | FLAG_PAYLOADS))
+            self._kind = PAYLOAD_BLOCK
+            self._buffer.append(payloads.name)
+            self._flush_block()
+
+    def write_entity(self, entity: Entity) -> None:
+        """Append an entity record."""
+        self._switch(ENTITY_BLOCK)
+        self.ordinals[entity.entity_id] = len(self.ordinals)
+        self._buffer.append(entity_to_record(entity, self.payloads))
+        if len(self._buffer) >= self.block_size:
+            self._flush_block()
+
+    def write_relationship(self, relationship: Relationship) -> None:
+        """Append a relationship record."""
+        self._switch(RELATIONSHIP_BLOCK)
+        self._buffer.append(relationship_to_record(relationship, self.ordinals))
+        if len(self._buffer) >= self.block_size:
+            self._flush_block()
+
+    def close(self) -> None:
+        """Write any buffered records."""
+        self._flush_block()
+
+    def _switch(self, kind: bytes) -> None:
+        if self._kind != kind:
+            self._flush_block()
+            self._kind = kind
+
+    def _flush_block(self) -> None:
+        if not self._buffer:
+            return
+        payload = marshal.dumps(self._buffer)
+        if self.compress:
+            payload = zlib.compress(payload, 1)
+        self.f.write(BLOCK_HEADER.pack(self._kind, len(payload)))
+        self.f.write(payload)
+        self._buffer = []
+
+def read_header(f: BinaryIO) -> int:
+    """
+    Read and validate the snapshot header.
+
+    Args:
+        f: Binary file object positioned at the start of the file
+
+    Returns:
+        Header flags
+    """
+    magic, version, flags = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("Not a binary graph snapshot")
+    if version > VERSION:
+        raise ValueError(f"Unsupported snapshot version {version} (max {VERSION})")
+    return flags
+
+def iter_raw_blocks(f: BinaryIO) -> Iterator[Tuple[bytes, bytes]]:
+    """
+    Yield the undecoded blocks of a snapshot after its header.
+
+    Args:
+        f: Binary file object positioned after the header
+
+    Returns:
+        Iterator over (kind, payload) pairs
+    """
+    while True:
+        header = f.read(BLOCK_HEADER.size)
+        if not header:
+            return
+        if len(header) < BLOCK_HEADER.size:
+            raise ValueError("Truncated snapshot block header")
+        kind, length = BLOCK_HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length:
+            raise ValueError("Truncated snapshot block")
+        yield kind, payload
+
+def decode_block(payload: bytes, flags: int) -> List[Tuple]:
+    """
+    Decode a block payload into its record tuples.
+
+    Args:
+        payload: Raw block payload
+        flags: Header flags of the snapshot
+
+    Returns:
+        List of record tuples
+    """
+    if flags & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    return marshal.loads(payload)
+
+def decode_blocks(blocks: List[Tuple[bytes, bytes]], flags: int) -> List[Tuple[bytes, List[Tuple]]]:
+    """
+    Decode a chunk of raw blocks.
+
+    Used as the unit of work when snapshots are decoded in a process pool:
+    the chunk is shipped to a worker as raw bytes and the compact record
+    tuples come back in bulk.
+
+    Args:
+        blocks: (kind, payload) pairs as yielded by iter_raw_blocks
+        flags: Header flags of the snapshot
+
+    Returns:
+        List of (kind, records) pairs in the order given
+    """
+    return [(kind, decode_block(payload, flags)) for kind, payload in blocks]
+
+def iter_blocks(f: BinaryIO) -> Iterator[Tuple[bytes, List[Tuple]]]:
+    """
+    Yield the decoded blocks of a snapshot file, one block in memory at a time.
+
+    Args:
+        f: Binary file object positioned at the start of the file
+
+    Returns:
+        Iterator over (kind, records) pairs
+    """
+    flags = read_header(f)
+    for kind, payload in iter_raw_blocks(f):
+        yield kind, decode_block(payload, flags)
@@ -0,0 +1,101 @@
+"""
+Subgraph Operations for Memory Graph
+
+Provides extraction of the neighborhood of a set of entities in one pass
+over a pinned snapshot.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+from ...entity import Entity
+from ...relationship import Relationship
+from .mvcc import YIELD_EVERY, pinned_snapshot
+
+logger = logging.getLogger("athena.graph.memory.subgraph_ops")
+
+async def get_subgraph(adapter, center_ids: Iterable[str], depth: int = 1,
+                       relationship_types: Optional[List[str]] = None, min_confidence: float = 0.0,
+                       max_nodes: Optional[int] = 1000) -> Dict[str, Any]:
+    """
+    Get the entities within depth hops of some centers and the relationships between them.
+
+    Relationships are followed in both directions, breadth-first, so when
+    max_nodes cuts the search short the entities nearest the centers are
+    kept. Only relationships that pass the type and confidence filters are
+    followed or returned.
+
+    Args:
+        adapter: The memory adapter instance
+        center_ids: IDs of the entities to start from; unknown IDs are skipped
+        depth: Maximum number of relationships between a center and an entity
+        relationship_types: Relationship types to follow, or None for all
+        min_confidence: Minimum confidence of a relationship
+        max_nodes: Maximum number of entities to return, or None for no limit
+
+    Returns:
+        Dictionary with "entities" in breadth-first order, "relationships"
+        between them, each listed once, and "truncated", True if max_nodes
+        left out entities within depth
+    """
+    types = set(relationship_types) if relationship_types else None
+
+    def follows(relationship: Optional[Relationship]) -> bool:
+        return (relationship is not None and relationship.confidence >= min_confidence
+                and (types is None or relationship.relationship_type in types))
+
+    with pinned_snapshot(adapter) as snapshot:
+        entities: Dict[str, Entity] = {}
+        truncated = False
+        queue = deque()
+        for center_id in center_ids:
+            entity = snapshot.entity(center_id)
+            if entity is None or center_id in entities:
+                continue
+            if max_nodes is not None and len(entities) >= max_nodes:
+                truncated = True
+                break
+            entities[center_id] = entity
+            queue.append((center_id, 0))
+
+        steps = 0
+        while queue and not truncated:
+            node_id, hops = queue.popleft()
+            if hops >= depth:
+                break
+            edges = snapshot.out_edges(node_id) + snapshot.in_edges(node_id)
+            for other_id, _, relationship in edges:
+                if other_id in entities or not follows(relationship):
+                    continue
+                entity = snapshot.entity(other_id)
+                if entity is None:
+                    continue
+                if max_nodes is not None and len(entities) >= max_nodes:
+                    truncated = True
+                    break
+                entities[other_id] = entity
+                queue.append((other_id, hops + 1))
+            steps += len(edges) + 1
+            if steps >= YIELD_EVERY:
+                steps = 0
+                await asyncio.sleep(0)
+
+        relationships: Dict[str, Relationship] = {}
+        for node_id in entities:
+            edges = snapshot.out_edges(node_id)
+            for other_id, relationship_id, relationship in edges:
+                if other_id in entities and follows(relationship):
+                    relationships[relationship_id] = relationship
+            steps += len(edges) + 1
+            if steps >= YIELD_EVERY:
+                steps = 0
+                await asyncio.sleep(0)
+
+    logger.debug(f"Extracted subgraph of {len(entities)} entities and {len(relationships)} relationships")
+    return {
+        "entities": list(entities.values()),
+        "relationships": list(relationships.values()),
+        "truncated": truncated
+    }
@@ -0,0 +1,103 @@
+"""
+Type Indexes for Memory Graph
+
+Provides secondary indexes that answer type-filtered lookups in time
+proportional to the result rather than to the graph or to a node's degree.
+"""
+
+from typing import Dict, Set, Tuple
+
+# Direction keys used by AdjacencyIndex
+OUTGOING = "out"
+INCOMING = "in"
+
+_EMPTY: Set[str] = frozenset()
+
+class TypeIndex:
+    """
+    Index from entity type to the IDs of the entities of that type.
+
+    The type each entity was indexed under is remembered so that an entity
+    changing type is moved rather than duplicated.
+    """
+
+    def __init__(self):
+        self.by_type: Dict[str, Set[str]] = {}
+        self.entity_types: Dict[str, str] = {}
+
+    def add(self, entity_id: str, entity_type: str) -> None:
+        """Index an entity under its type, replacing any previous entry."""
+        previous = self.entity_types.get(entity_id)
+        if previous == entity_type:
+            return
+        if previous is not None:
+            self.remove(entity_id)
+        self.entity_types[entity_id] = entity_type
+        self.by_type.setdefault(entity_type, set()).add(entity_id)
+
+    def remove(self, entity_id: str) -> None:
+        """Remove an entity from the index."""
+        entity_type = self.entity_types.pop(entity_id, None)
+        if entity_type is None:
+            return
+        ids = self.by_type.get(entity_type)
+        if ids is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del self.by_type[entity_type]
+
+    def get(self, entity_type: str) -> Set[str]:
+        """Get the IDs of the entities of a type (do not modify the result)."""
+        return self.by_type.get(entity_type, _EMPTY)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.by_type.clear()
+        self.entity_types.clear()
+
+class AdjacencyIndex:
+    """
+    Per-node index from (direction, relationship type) to relationship IDs.
+
+    Lets a typed neighbor lookup on a hub node read only the edges of the
+    requested type instead of scanning every incident edge.
+    """
+
+    def __init__(self):
+        self.nodes: Dict[str, Dict[Tuple[str, str], Set[str]]] = {}
+
+    def add(self, relationship_id: str, source_id: str, target_id: str, relationship_type: str) -> None:
+        """Index an edge at both of its endpoints."""
+        self.nodes.setdefault(source_id, {}).setdefault((OUTGOING, relationship_type), set()).add(relationship_id)
+        self.nodes.setdefault(target_id, {}).setdefault((INCOMING, relationship_type), set()).add(relationship_id)
+
+    def remove(self, relationship_id: str, source_id: str, target_id: str) -> None:
+        """Remove an edge from both of its endpoints, whatever type it was indexed under."""
+        self._discard(source_id, OUTGOING, relationship_id)
+        self._discard(target_id, INCOMING, relationship_id)
+
+    def _discard(self, node_id: str, direction: str, relationship_id: str) -> None:
+        # A node has few distinct (direction, type) keys, so finding the
+        # one holding the edge is cheap and avoids storing each edge's type
+        keys = self.nodes.get(node_id)
+        if not keys:
+            return
+        for key, ids in keys.items():
+            if key[0] == direction and relationship_id in ids:
+                ids.discard(relationship_id)
+                if not ids:
+                    del keys[key]
+                    if not keys:
+                        del self.nodes[node_id]
+                return
+
+    def get(self, node_id: str, direction: str, relationship_type: str) -> Set[str]:
+        """Get the IDs of a node's edges of one direction and type (do not modify the result)."""
+        keys = self.nodes.get(node_id)
+        if not keys:
+            return _EMPTY
+        return keys.get((direction, relationship_type), _EMPTY)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.nodes.clear()
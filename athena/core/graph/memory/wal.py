@@ -0,0 +1,257 @@
+"""
+Write-Ahead Log for Memory Graph
+
+Provides an append-only mutation log so changes to the in-memory graph
+survive a crash without rewriting the full snapshot on every change.
+"""
+
+import os
+import json
+import asyncio
+import logging
+from typing import Any, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("athena.graph.memory.wal")
+
+class WriteAheadLog:
+    """
+    Append-only log of graph mutations with group-commit fsync batching.
+
+    Each record is a single JSON line. Writers append to the file buffer and
+    then wait for a shared commit; all records appended before the commit
+    runs are flushed and fsynced together, so concurrent writers pay for one
+    fsync per group rather than one each.
+    """
+
+    def __init__(self, path: str, commit_delay: float = 0.0, fsync: bool = True):
+        """
+        Initialize the log.
+
+        Args:
+            path: Path of the log file
+            commit_delay: Seconds to wait for more records before committing
+            fsync: Whether commits fsync the file (otherwise they only flush)
+        """
+        self.path = path
+        self.commit_delay = commit_delay
+        self.fsync = fsync
+        self.replaying = False
+        self.records_since_checkpoint = 0
+        self._file = None
+        self._sequence = 0
+        self._pending: List[asyncio.Future] = []
+        self._commit_task: Optional[asyncio.Task] = None
+        
+        # Held while a commit flushes and fsyncs, so rotate() never closes the file under it
+        self._io_lock = asyncio.Lock()
+
+    def open(self) -> None:
+        """Open the log for appending, creating it if needed."""
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+
+    def close(self) -> None:
+        """Flush and close the log."""
+        if self._file is not None:
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+    async def append(self, op: str, data: Any) -> None:
+        """
+        Append a mutation record and wait until it is durable.
+
+        Args:
+            op: Name of the mutating operation
+            data: JSON-serializable operation payload
+        """
+        await self.append_many(op, [data])
+
+    async def append_many(self, op: str, items: List[Any]) -> None:
+        """
+        Append one record per item and wait until all of them are durable.
+
+        The records share a single commit, so a batch costs one fsync.
+
+        Args:
+            op: Name of the mutating operation
+            items: JSON-serializable operation payloads
+
+        Raises:
+            ValueError: If the log is closed, e.g. after the adapter disconnected
+        """
+        if self._file is None:
+            raise ValueError(f"Write-ahead log {self.path} is closed")
+            
+        lines = []
+        for data in items:
+            self._sequence += 1
+            lines.append(json.dumps({"seq": self._sequence, "op": op, "data": data}, separators=(',', ':')))
+        self._file.write("\n".join(lines) + "\n")
+        self.records_since_checkpoint += len(lines)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(future)
+        if self._commit_task is None or self._commit_task.done():
+            self._commit_task = asyncio.create_task(self._commit())
+        await future
+
+    async def _commit(self) -> None:
+        """Flush and fsync every record appended so far, then release their writers."""
+        if self.commit_delay:
+            await asyncio.sleep(self.commit_delay)
+        else:
+            # Let writers scheduled in the same loop iteration join this group
+            await asyncio.sleep(0)
+
+        group, self._pending = self._pending, []
+        try:
+            async with self._io_lock:
+                if self._file is not None:
+                    self._file.flush()
+                    if self.fsync:
+                        await asyncio.get_running_loop().run_in_executor(
+                            None, os.fsync, self._file.fileno()
+                        )
+        except Exception as e:
+            logger.error(f"Error committing write-ahead log: {e}")
+            for future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future in group:
+            if not future.done():
+                future.set_result(None)
+
+        # Records appended during the fsync need a commit of their own
+        if self._pending:
+            self._commit_task = asyncio.create_task(self._commit())
+
+    async def quiesce(self) -> None:
+        """Wait until no commit is in flight."""
+        while self._commit_task is not None and not self._commit_task.done():
+            await self._commit_task
+
+    async def rotate(self) -> None:
+        """
+        Start a new log segment for a checkpoint.
+
+        The current segment is renamed aside and stays replayable until
+        discard_rotated() is called once the checkpoint snapshot is durable.
+        Records appended from now on go to the fresh segment. If an earlier
+        checkpoint never completed, its segment is kept and this one is
+        numbered after it.
+        
+        Only an fsync already in flight is waited for; records appended before
+        the switch are made durable by closing the old segment. Waiting for the
+        log to go idle instead would never finish under a steady write load.
+        The old segment is flushed, fsynced and closed in an executor, holding
+        back commits but not the event loop.
+        """
+        async with self._io_lock:
+            segment = self._file
+            self._file = None
+            if os.path.exists(self.path):
+                os.replace(self.path, f"{self.path}.{len(self.rotated_paths()) + 1}")
+            if segment is not None:
+                self.open()
+            self.records_since_checkpoint = 0
+            
+            if segment is not None:
+                await asyncio.get_running_loop().run_in_executor(None, self._close_segment, segment)
+                
+    def _close_segment(self, segment) -> None:
+        """Flush, fsync and close a segment no longer appended to."""
+        segment.flush()
+        if self.fsync:
+            os.fsync(segment.fileno())
+        segment.close()
+        
+    def discard_rotated(self) -> None:
+        """Delete the segments made obsolete by a completed checkpoint."""
+        # Newest first, so a crash part way leaves the oldest segments in sequence
+        for path in reversed(self.rotated_paths()):
+            os.remove(path)
+
+    def rotated_paths(self) -> List[str]:
+        """Paths of the segments being checkpointed, oldest first."""
+        paths = []
+        while os.path.exists(f"{self.path}.{len(paths) + 1}"):
+            paths.append(f"{self.path}.{len(paths) + 1}")
+        return paths
+
+    def replay(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Read the records in the log, oldest segment first.
+
+        A torn record, left by a crash in the middle of a write, is skipped.
+
+        Returns:
+            Iterator over (op, data) pairs in commit order
+        """
+        for path in self.rotated_paths() + [self.path]:
+            if not os.path.exists(path):
+                continue
+
+            with open(path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping torn write-ahead log record at {path}:{line_number}")
+                        continue
+                    self._sequence = max(self._sequence, record.get("seq", 0))
+                    yield record["op"], record["data"]
+
+async def log_mutation(adapter, op: str, data: Any) -> None:
+    """
+    Record a mutation of the memory graph in the adapter's write-ahead log.
+
+    Does nothing when the log is disabled or being replayed. Starts a
+    checkpoint in the background once enough records have accumulated.
+
+    Args:
+        adapter: The memory adapter instance
+        op: Name of the mutating operation
+        data: JSON-serializable operation payload
+    """
+    wal = adapter.wal
+    if wal is None or wal.replaying:
+        return
+
+    await wal.append(op, data)
+    _maybe_checkpoint(adapter)
+
+async def log_mutations(adapter, op: str, items: List[Any]) -> None:
+    """
+    Record a batch of mutations of the same kind with a single commit.
+
+    Args:
+        adapter: The memory adapter instance
+        op: Name of the mutating operation
+        items: JSON-serializable operation payloads
+    """
+    wal = adapter.wal
+    if wal is None or wal.replaying or not items:
+        return
+
+    await wal.append_many(op, items)
+    _maybe_checkpoint(adapter)
+
+def _maybe_checkpoint(adapter) -> None:
+    """
+    Start a checkpoint once enough records have accumulated since the last one.
+
+    The checkpoint runs as its own task, so the writer that crossed the
+    interval returns as soon as its record is durable instead of waiting
+    for the snapshot to be written.
+    """
+    wal = adapter.wal
+    if adapter.checkpoint_interval and wal.records_since_checkpoint >= adapter.checkpoint_interval:
+        adapter.schedule_checkpoint()
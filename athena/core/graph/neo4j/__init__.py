@@ -1,15 +1,23 @@
 """
 Neo4j Graph Adapter for Athena Knowledge Graph
 
-This package provides integration with Neo4j graph database 
+This package provides integration with Neo4j graph database
 for the Athena knowledge graph through Hermes database services.
+
+The adapter is imported on first access, so the operations and pooling
+modules can be used without the Neo4j driver installed.
 """
 
-from .adapter import Neo4jAdapter
 from .config import Neo4jConfig
 
+def __getattr__(name):
+    if name == 'Neo4jAdapter':
+        from .adapter import Neo4jAdapter
+        return Neo4jAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Export main classes
 __all__ = [
     'Neo4jAdapter',
     'Neo4jConfig'
-]
\ No newline at end of file
+]
@@ -8,7 +8,7 @@ import os
 import json
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Set, Tuple, Union
+from typing import Dict, Any, AsyncIterator, List, Optional, Set, Tuple, Union
 from pathlib import Path
 
 from py2neo import Graph
@@ -24,10 +24,17 @@ except ImportError:
 from ...entity import Entity
 from ...relationship import Relationship
 from .config import Neo4jConfig
-from .operations import create_entity, get_entity, update_entity, delete_entity
+from .pool import ConcurrencyLimiter, DriverClient, LimitedClient, PooledDriver
+from .operations import get_entity, update_entity, delete_entity
 from .operations import create_relationship, get_relationship, update_relationship, delete_relationship
-from .operations import search_entities, get_entity_relationships, execute_query, find_paths
+from .operations import search_entities, get_entity_relationships, execute_query, find_paths, get_subgraph
+from .operations import get_relationships_for_entities, initialize_schema
 from .operations import count_entities, count_relationships
+from .operations import create_entities, create_relationships
+from .operations import create_property_index, drop_property_index, list_property_indexes, find_entities_by_property
+from .operations import run_read_batch, prepared_statements, stream_query
+from .operations.property_ops import node_properties
+from .operations.statements import ENTITY_LABEL
 
 logger = logging.getLogger("athena.graph.neo4j.adapter")
 
@@ -59,6 +66,10 @@ class Neo4jAdapter:
         self.is_connected = False
         self.client = None
         self.graph_db = None
+        self.fulltext_search = False
+        
+        # Bounds concurrent operations in both Hermes and direct mode
+        self.limiter = ConcurrencyLimiter(self.config.max_concurrency)
         
         # Create Hermes database client if Hermes is available and enabled
         if HERMES_AVAILABLE and self.config.use_hermes:
@@ -86,15 +97,22 @@ class Neo4jAdapter:
                     logger.error("Failed to get graph database from Hermes")
                     return False
             else:
-                # Direct connection to Neo4j
+                # Direct connection to Neo4j with a configured connection pool
                 conn_config = self.config.get_connection_config()
-                self.client = AsyncGraphDatabase.driver(
+                driver = AsyncGraphDatabase.driver(
                     conn_config["uri"],
-                    auth=(conn_config["username"], conn_config["password"])
+                    auth=(conn_config["username"], conn_config["password"]),
+                    max_connection_pool_size=conn_config["max_connection_pool_size"],
+                    connection_acquisition_timeout=conn_config["connection_acquisition_timeout"],
+                    max_connection_lifetime=conn_config["max_connection_lifetime"]
                 )
+                self.client = PooledDriver(driver, conn_config["fetch_size"])
                 
                 # Create a wrapper that mimics the Hermes interface
-                self.graph_db = self._create_graph_db_wrapper()
+                self.graph_db = DriverClient(self.client)
+                
+            # Admit a bounded number of operations at a time
+            self.graph_db = LimitedClient(self.graph_db, self.limiter)
             
             # Initialize schema
             await self.initialize_schema()
@@ -108,28 +126,6 @@ class Neo4jAdapter:
             self.is_connected = False
             return False
     
-    def _create_graph_db_wrapper(self):
-        """Create a wrapper for direct Neo4j connection that mimics the Hermes interface."""
-        client = self.client
-        
-        class GraphDBWrapper:
-            async def add_node(self, id, labels, properties):
-                return await create_entity(client, id, labels, properties)
-                
-            async def get_node(self, id):
-                return await get_entity(client, id)
-                
-            async def delete_node(self, id):
-                return await delete_entity(client, id)
-                
-            async def add_relationship(self, source_id, target_id, type, properties):
-                return await create_relationship(client, source_id, target_id, type, properties)
-                
-            async def query(self, query, params=None):
-                return await execute_query(client, query, params or {})
-        
-        return GraphDBWrapper()
-        
     async def disconnect(self) -> bool:
         """
         Disconnect from the Neo4j graph database.
@@ -157,30 +153,25 @@ class Neo4jAdapter:
         
     async def initialize_schema(self) -> bool:
         """
-        Initialize the graph schema with constraints.
+        Initialize the graph schema with constraints and indexes.
+        
+        Entity and relationship types are stored as the entity_type and
+        relationship_type properties, indexed here, rather than as labels
+        and relationship types.
         
         Returns:
-            True if successful
+            True if every constraint and index was created
         """
-        try:
-            # Create constraint for entity IDs
-            await self.graph_db.query("""
-            CREATE CONSTRAINT IF NOT EXISTS FOR (n:Entity)
-            WHERE n.entity_id IS UNIQUE
-            """)
-            
-            # Create constraint for relationship IDs
-            await self.graph_db.query("""
-            CREATE CONSTRAINT IF NOT EXISTS FOR ()-[r]-()
-            WHERE r.relationship_id IS UNIQUE
-            """)
-            
+        created = await initialize_schema(self.graph_db)
+        self.fulltext_search = created["fulltext_index"]
+        
+        if all(created.values()):
             logger.info("Initialized Neo4j schema")
             return True
-            
-        except Exception as e:
-            logger.error(f"Error initializing Neo4j schema: {e}")
-            return False
+        
+        missing = [name for name, ok in created.items() if not ok]
+        logger.warning(f"Initialized Neo4j schema without: {', '.join(missing)}")
+        return False
     
     # Methods delegate to operations module but provide the adapter interface
     async def create_entity(self, entity: Entity) -> str:
@@ -189,9 +180,9 @@ class Neo4jAdapter:
             logger.error("Not connected to database")
             raise ConnectionError("Not connected to database")
             
-        # Convert entity to Neo4j properties and add
-        properties = entity.to_dict()
-        labels = ["Entity", entity.entity_type]
+        # Convert entity to Neo4j properties, including the flat indexable values
+        properties = node_properties(entity)
+        labels = [ENTITY_LABEL]
             
         await self.graph_db.add_node(
             id=entity.entity_id,
@@ -202,6 +193,13 @@ class Neo4jAdapter:
         logger.debug(f"Created entity: {entity.name} ({entity.entity_id})")
         return entity.entity_id
         
+    async def create_entities(self, entities: List[Entity]) -> Dict[int, str]:
+        """Create many entities with batched UNWIND queries."""
+        if not self.is_connected:
+            logger.error("Not connected to database")
+            raise ConnectionError("Not connected to database")
+        return await create_entities(self.graph_db, entities)
+        
     async def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Get an entity by ID."""
         return await get_entity(self.graph_db, entity_id, Entity)
@@ -224,6 +222,10 @@ class Neo4jAdapter:
             relationship.to_dict()
         )
         
+    async def create_relationships(self, relationships: List[Relationship]) -> Dict[int, str]:
+        """Create many relationships with batched UNWIND queries."""
+        return await create_relationships(self.graph_db, relationships)
+        
     async def get_relationship(self, relationship_id: str) -> Optional[Relationship]:
         """Get a relationship by ID."""
         return await get_relationship(self.graph_db, relationship_id, Relationship)
@@ -238,19 +240,101 @@ class Neo4jAdapter:
         
     async def search_entities(self, query: str, entity_type: Optional[str] = None, limit: int = 10) -> List[Entity]:
         """Search for entities matching a query."""
-        return await search_entities(self.graph_db, query, entity_type, limit, Entity)
+        return await search_entities(self.graph_db, query, entity_type, limit, Entity, self.fulltext_search)
         
     async def get_entity_relationships(self, entity_id: str, relationship_type: Optional[str] = None, direction: str = "both") -> List[Tuple[Relationship, Entity]]:
         """Get relationships for an entity."""
         return await get_entity_relationships(self.graph_db, entity_id, relationship_type, direction, Relationship, Entity)
         
+    async def get_relationships_for_entities(self, entity_ids: List[str], relationship_type: Optional[str] = None,
+                                             direction: str = "both",
+                                             per_entity_limit: Optional[int] = None) -> Dict[str, List[Tuple[Relationship, Entity]]]:
+        """Get the relationships of many entities in one round trip."""
+        return await get_relationships_for_entities(self.graph_db, entity_ids, relationship_type, direction,
+                                                    per_entity_limit, Relationship, Entity)
+        
     async def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Execute a raw Cypher query."""
         return await execute_query(self.graph_db, query, params or {})
         
-    async def find_paths(self, source_id: str, target_id: str, max_depth: int = 3) -> List[List[Union[Entity, Relationship]]]:
-        """Find paths between two entities."""
-        return await find_paths(self.graph_db, source_id, target_id, max_depth, Entity, Relationship)
+    async def stream_query(self, query: str, params: Dict[str, Any] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a raw Cypher query, yielding records as the driver fetches them.
+        
+        The stream holds a concurrency slot until it is exhausted or closed.
+        """
+        async with self.limiter.slot():
+            async for record in stream_query(self.client or self.graph_db.client, query, params or {}):
+                yield record
+        
+    async def find_paths(self, source_id: str, target_id: str, max_depth: int = 3, max_paths: Optional[int] = 10,
+                         weighted: bool = False,
+                         relationship_types: Optional[List[str]] = None) -> List[List[Union[Entity, Relationship]]]:
+        """Find simple paths of up to max_depth relationships between two entities, shortest or most confident first."""
+        return await find_paths(self.graph_db, source_id, target_id, max_depth, Entity, Relationship, max_paths, weighted,
+                                relationship_types)
+        
+    async def get_subgraph(self, center_ids: List[str], depth: int = 1, relationship_types: Optional[List[str]] = None,
+                           min_confidence: float = 0.0, max_nodes: Optional[int] = 1000) -> Dict[str, Any]:
+        """Get the entities within depth hops of some centers and the relationships among them."""
+        return await get_subgraph(self.graph_db, center_ids, depth, relationship_types, min_confidence, max_nodes,
+                                  Entity, Relationship)
+        
+    async def create_property_index(self, name: str, kind: str = "hash") -> bool:
+        """Create a native index on an entity property."""
+        return await create_property_index(self.graph_db, name, kind)
+        
+    async def drop_property_index(self, name: str) -> bool:
+        """Drop the native index on an entity property."""
+        return await drop_property_index(self.graph_db, name)
+        
+    async def list_property_indexes(self) -> List[Dict[str, Any]]:
+        """List the property indexes."""
+        return await list_property_indexes(self.graph_db)
+        
+    async def find_entities_by_property(self, name: str, value: Any = None, min_value: Any = None,
+                                        max_value: Any = None, entity_type: Optional[str] = None,
+                                        limit: int = 100) -> List[Entity]:
+        """Find entities whose property equals a value or lies in an inclusive range."""
+        return await find_entities_by_property(self.graph_db, name, value, min_value, max_value,
+                                               entity_type, limit, Entity)
+        
+    async def execute_read_batch(self, statements: List[Tuple[str, Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Execute several independent read queries in one session and transaction.
+        
+        The batch holds a single concurrency slot, and with the direct driver
+        a single pooled connection, however many queries it runs.
+        
+        Args:
+            statements: (query, params) pairs
+            
+        Returns:
+            Result records of each query, in order
+        """
+        async with self.limiter.slot():
+            return await run_read_batch(self.client or self.graph_db.client, statements)
+            
+    async def get_status(self) -> Dict[str, Any]:
+        """
+        Get adapter status, including connection pool metrics.
+        
+        Returns:
+            Status information dictionary
+        """
+        return {
+            "adapter": "neo4j",
+            "connected": self.is_connected,
+            "mode": "hermes" if self.db_client else "direct",
+            "fulltext_search": self.fulltext_search,
+            "pool": dict(
+                self.limiter.describe(),
+                max_connection_pool_size=self.config.max_connection_pool_size,
+                connection_acquisition_timeout=self.config.connection_acquisition_timeout,
+                fetch_size=self.config.fetch_size
+            ),
+            "prepared_statements": sum(prepared_statements().values())
+        }
         
     async def count_entities(self) -> int:
         """Count the number of entities in the graph."""
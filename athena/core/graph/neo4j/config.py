@@ -25,6 +25,15 @@ class Neo4jConfig:
     use_hermes: bool = True
     hermes_url: Optional[str] = None
     
+    # Connection pool settings (direct driver connections)
+    max_connection_pool_size: int = 100
+    connection_acquisition_timeout: float = 60.0
+    max_connection_lifetime: float = 3600.0
+    fetch_size: int = 1000
+    
+    # Maximum number of concurrent operations admitted by the adapter
+    max_concurrency: int = 50
+    
     @classmethod
     def from_env(cls) -> 'Neo4jConfig':
         """Create configuration from environment variables."""
@@ -35,7 +44,12 @@ class Neo4jConfig:
             component_id=os.getenv("ATHENA_COMPONENT_ID", "athena.knowledge"),
             namespace=os.getenv("ATHENA_NAMESPACE", "athena_knowledge"),
             use_hermes=os.getenv("ATHENA_USE_HERMES", "true").lower() == "true",
-            hermes_url=os.getenv("HERMES_URL", None)
+            hermes_url=os.getenv("HERMES_URL", None),
+            max_connection_pool_size=int(os.getenv("ATHENA_NEO4J_MAX_POOL_SIZE", "100")),
+            connection_acquisition_timeout=float(os.getenv("ATHENA_NEO4J_ACQUISITION_TIMEOUT", "60")),
+            max_connection_lifetime=float(os.getenv("ATHENA_NEO4J_MAX_CONNECTION_LIFETIME", "3600")),
+            fetch_size=int(os.getenv("ATHENA_NEO4J_FETCH_SIZE", "1000")),
+            max_concurrency=int(os.getenv("ATHENA_NEO4J_MAX_CONCURRENCY", "50"))
         )
     
     @classmethod
@@ -48,7 +62,12 @@ class Neo4jConfig:
             component_id=config_dict.get("component_id", "athena.knowledge"),
             namespace=config_dict.get("namespace", "athena_knowledge"),
             use_hermes=config_dict.get("use_hermes", True),
-            hermes_url=config_dict.get("hermes_url", None)
+            hermes_url=config_dict.get("hermes_url", None),
+            max_connection_pool_size=config_dict.get("max_connection_pool_size", 100),
+            connection_acquisition_timeout=config_dict.get("connection_acquisition_timeout", 60.0),
+            max_connection_lifetime=config_dict.get("max_connection_lifetime", 3600.0),
+            fetch_size=config_dict.get("fetch_size", 1000),
+            max_concurrency=config_dict.get("max_concurrency", 50)
         )
         
     def to_dict(self) -> Dict[str, Any]:
@@ -60,7 +79,12 @@ class Neo4jConfig:
             "component_id": self.component_id,
             "namespace": self.namespace,
             "use_hermes": self.use_hermes,
-            "hermes_url": self.hermes_url
+            "hermes_url": self.hermes_url,
+            "max_connection_pool_size": self.max_connection_pool_size,
+            "connection_acquisition_timeout": self.connection_acquisition_timeout,
+            "max_connection_lifetime": self.max_connection_lifetime,
+            "fetch_size": self.fetch_size,
+            "max_concurrency": self.max_concurrency
         }
         
     def get_connection_config(self) -> Dict[str, Any]:
@@ -68,7 +92,11 @@ class Neo4jConfig:
         return {
             "uri": self.uri,
             "username": self.username,
-            "password": self.password
+            "password": self.password,
+            "max_connection_pool_size": self.max_connection_pool_size,
+            "connection_acquisition_timeout": self.connection_acquisition_timeout,
+            "max_connection_lifetime": self.max_connection_lifetime,
+            "fetch_size": self.fetch_size
         }
         
     def get_hermes_config(self) -> Dict[str, Any]:
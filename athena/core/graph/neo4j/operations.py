@@ -21,8 +21,13 @@ from .operations import (
     # Query operations
     search_entities,
     get_entity_relationships,
+    get_relationships_for_entities,
     execute_query,
     
+    # Batch operations
+    create_entities,
+    create_relationships,
+    
     # Path operations
     find_paths,
     
@@ -47,8 +52,13 @@ __all__ = [
     # Query operations
     'search_entities',
     'get_entity_relationships',
+    'get_relationships_for_entities',
     'execute_query',
     
+    # Batch operations
+    'create_entities',
+    'create_relationships',
+    
     # Path operations
     'find_paths',
     
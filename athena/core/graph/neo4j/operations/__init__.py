@@ -21,11 +21,35 @@ from .relationship_ops import (
 from .query_ops import (
     search_entities,
     get_entity_relationships,
-    execute_query
+    get_relationships_for_entities,
+    execute_query,
+    stream_query,
+    create_fulltext_index,
+    fulltext_index_exists
+)
+
+from .batch_ops import (
+    create_entities,
+    create_relationships
+)
+
+from .property_ops import (
+    create_property_index,
+    drop_property_index,
+    list_property_indexes,
+    find_entities_by_property
 )
 
 from .path_ops import find_paths
 
+from .subgraph_ops import get_subgraph
+
+from .schema_ops import initialize_schema
+
+from .statements import prepared_statements
+
+from .client import run_read_batch
+
 from .count_ops import (
     count_entities,
     count_relationships
@@ -48,11 +72,37 @@ __all__ = [
     # Query operations
     'search_entities',
     'get_entity_relationships',
+    'get_relationships_for_entities',
     'execute_query',
+    'stream_query',
+    'create_fulltext_index',
+    'fulltext_index_exists',
+    
+    # Batch operations
+    'create_entities',
+    'create_relationships',
+    
+    # Property index operations
+    'create_property_index',
+    'drop_property_index',
+    'list_property_indexes',
+    'find_entities_by_property',
     
     # Path operations
     'find_paths',
     
+    # Subgraph operations
+    'get_subgraph',
+    
+    # Schema operations
+    'initialize_schema',
+    
+    # Statement registry
+    'prepared_statements',
+    
+    # Query execution
+    'run_read_batch',
+    
     # Count operations
     'count_entities',
     'count_relationships'
@@ -0,0 +1,111 @@
+"""
+Neo4j Batch Operations
+
+Bulk entity and relationship creation for Neo4j in Athena using UNWIND.
+"""
+
+import logging
+from typing import Dict, Any, List, Tuple
+
+from .client import run_query
+from .property_ops import node_properties
+from .statements import register, statement
+
+logger = logging.getLogger("athena.graph.neo4j.operations.batch")
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Types are properties, so entities and relationships of any type share a query
+CREATE_ENTITIES = register("batch.create_entities", """
+UNWIND $rows AS row
+MERGE (n:Entity {entity_id: row.entity_id})
+SET n = row.properties
+RETURN row.entity_id AS entity_id
+""")
+
+CREATE_RELATIONSHIPS = register("batch.create_relationships", """
+UNWIND $rows AS row
+MATCH (source:Entity {entity_id: row.source_id})
+MATCH (target:Entity {entity_id: row.target_id})
+MERGE (source)-[r:RELATES_TO {relationship_id: row.relationship_id}]->(target)
+SET r = row.properties
+RETURN row.relationship_id AS relationship_id
+""")
+
+def _chunks(items: List[Tuple[int, Dict[str, Any]]], batch_size: int):
+    """Split (index, row) pairs into chunks of at most batch_size rows."""
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+async def create_entities(client, entities: List[Any], batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[int, str]:
+    """
+    Create many entities with one UNWIND query per chunk.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+        entities: Entities to create
+        batch_size: Maximum rows per query
+
+    Returns:
+        Mapping from batch index to error message for entities that could not be created
+    """
+    errors: Dict[int, str] = {}
+    items = [
+        (index, {"entity_id": entity.entity_id, "properties": node_properties(entity)})
+        for index, entity in enumerate(entities)
+    ]
+
+    for rows in _chunks(items, batch_size):
+        try:
+            await run_query(client, statement(CREATE_ENTITIES), {"rows": [row for _, row in rows]})
+        except Exception as e:
+            logger.error(f"Error creating entity batch: {e}")
+            for index, _ in rows:
+                errors[index] = str(e)
+
+    logger.debug(f"Created {len(entities) - len(errors)} entities in batch")
+    return errors
+
+async def create_relationships(client, relationships: List[Any], batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[int, str]:
+    """
+    Create many relationships with one UNWIND query per chunk.
+
+    Relationships whose source or target entity does not exist are reported
+    as errors.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+        relationships: Relationships to create
+        batch_size: Maximum rows per query
+
+    Returns:
+        Mapping from batch index to error message for relationships that could not be created
+    """
+    errors: Dict[int, str] = {}
+    items = [
+        (index, {
+            "relationship_id": rel.relationship_id,
+            "source_id": rel.source_id,
+            "target_id": rel.target_id,
+            "properties": rel.to_dict()
+        })
+        for index, rel in enumerate(relationships)
+    ]
+
+    for rows in _chunks(items, batch_size):
+        try:
+            result = await run_query(client, statement(CREATE_RELATIONSHIPS), {"rows": [row for _, row in rows]})
+        except Exception as e:
+            logger.error(f"Error creating relationship batch: {e}")
+            for index, _ in rows:
+                errors[index] = str(e)
+            continue
+
+        # Rows whose MATCH failed produce no result record
+        created = {record.get("relationship_id") for record in result or []}
+        for index, row in rows:
+            if row["relationship_id"] not in created:
+                errors[index] = "Source or target entity not found"
+
+    logger.debug(f"Created {len(relationships) - len(errors)} relationships in batch")
+    return errors
@@ -0,0 +1,95 @@
+"""
+Neo4j Query Execution
+
+Runs Cypher through either the Hermes graph client or a direct Neo4j driver.
+"""
+
+from typing import Dict, Any, List, Tuple
+
+async def run_query(client, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Execute a query through the Hermes client or a direct Neo4j driver.
+
+    Errors are raised to the caller, so operations can tell a failed
+    statement from one that matched nothing.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+        query: Cypher query
+        params: Query parameters
+
+    Returns:
+        Result records as dictionaries, with nodes and relationships as property dictionaries
+    """
+    if hasattr(client, "query"):
+        return await client.query(query, params)
+
+    async with client.session() as session:
+        result = await session.run(query, **params)
+        return [plain_record(record) async for record in result]
+
+def plain_record(record) -> Dict[str, Any]:
+    """
+    Convert a Neo4j driver record into plain dictionaries.
+
+    Args:
+        record: Driver record
+
+    Returns:
+        The record with every value converted by plain_value
+    """
+    return {key: plain_value(value) for key, value in record.items()}
+
+def plain_value(value) -> Any:
+    """
+    Convert a value returned by the Neo4j driver into plain Python values.
+
+    Args:
+        value: Driver value
+
+    Returns:
+        Nodes and relationships as property dictionaries, paths as lists
+        alternating between the two, and lists and maps with their items
+        converted in turn
+    """
+    if hasattr(value, "nodes") and hasattr(value, "relationships"):  # Path
+        items = [dict(value.nodes[0].items())]
+        for relationship, node in zip(value.relationships, value.nodes[1:]):
+            items.append(dict(relationship.items()))
+            items.append(dict(node.items()))
+        return items
+    if isinstance(value, dict):
+        return {key: plain_value(item) for key, item in value.items()}
+    if hasattr(value, "items"):  # Node or Relationship
+        return dict(value.items())
+    if isinstance(value, list):
+        return [plain_value(item) for item in value]
+    return value
+
+async def run_read_batch(client, statements: List[Tuple[str, Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+    """
+    Execute several independent read queries together.
+
+    A direct Neo4j driver runs them in one read transaction on one session,
+    so they share a pooled connection and see the same data. The Hermes
+    client has no transactions and runs them one after another.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+        statements: (query, params) pairs
+
+    Returns:
+        Result records of each query, in order
+    """
+    if hasattr(client, "query"):
+        return [await client.query(query, params) for query, params in statements]
+
+    async def read(tx) -> List[List[Dict[str, Any]]]:
+        results = []
+        for query, params in statements:
+            result = await tx.run(query, **params)
+            results.append([plain_record(record) async for record in result])
+        return results
+
+    async with client.session() as session:
+        return await session.execute_read(read)
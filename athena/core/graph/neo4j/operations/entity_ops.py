@@ -5,25 +5,28 @@ Basic entity CRUD operations for Neo4j in Athena.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Type, TypeVar
+from typing import Dict, Any, Optional, Type, TypeVar
+
+from .property_ops import node_properties
+from .statements import register, statement
 
 # Type variable for generic entity type
 E = TypeVar('E')
 
 logger = logging.getLogger("athena.graph.neo4j.operations.entity")
 
-async def create_entity(client, entity_id: str, labels: List[str], properties: Dict[str, Any]) -> bool:
+# Merge the entity - avoids duplicates but creates if not exists. The
+# entity type is the entity_type property, not a label.
+CREATE_ENTITY = register("entity.create", """
+MERGE (n:Entity {entity_id: $entity_id})
+SET n = $properties
+RETURN n
+""")
+
+async def create_entity(client, entity_id: str, properties: Dict[str, Any]) -> bool:
     """Create a new entity in Neo4j."""
     try:
-        # Format labels for Cypher
-        labels_str = ":".join(labels)
-        
-        # Merge the entity - avoids duplicates but creates if not exists
-        query = f"""
-        MERGE (n:{labels_str} {{entity_id: $entity_id}})
-        SET n = $properties
-        RETURN n
-        """
+        query = statement(CREATE_ENTITY)
         
         # Execute query directly if using Hermes client
         if hasattr(client, "query"):
@@ -87,8 +90,8 @@ async def get_entity(client, entity_id: str, entity_class: Type[E]) -> Optional[
 async def update_entity(client, entity) -> bool:
     """Update an existing entity."""
     try:
-        # Convert entity to properties
-        properties = entity.to_dict()
+        # Convert entity to properties, including the flat indexable values
+        properties = node_properties(entity)
         
         # Create query to update entity
         query = """
@@ -5,7 +5,10 @@ Path finding operations for Neo4j in Athena.
 """
 
 import logging
-from typing import List, Union, Type, TypeVar
+from typing import Any, Dict, List, Optional, Union, Type, TypeVar
+
+from .client import run_query
+from .statements import register, statement
 
 # Type variables for generic entity and relationship types
 E = TypeVar('E')
@@ -13,76 +16,102 @@ R = TypeVar('R')
 
 logger = logging.getLogger("athena.graph.neo4j.operations.path")
 
-async def find_paths(client, source_id: str, target_id: str, max_depth: int = 3, entity_class: Type[E] = None, relationship_class: Type[R] = None) -> List[List[Union[E, R]]]:
-    """Find paths between two entities."""
-    try:
-        # Build Cypher query for path finding
-        query = """
-        MATCH path = (source:Entity {entity_id: $source_id})-[*1..$max_depth]->
-                    (target:Entity {entity_id: $target_id})
-        RETURN path
-        LIMIT 10
-        """
-        
-        params = {
-            "source_id": source_id,
-            "target_id": target_id,
-            "max_depth": max_depth
-        }
+# Simple paths of exactly one length, over the relationship types in
+# $relationship_types or all of them when it is null; Cypher does not accept
+# parameters as variable-length bounds, so the (validated integer) length is
+# formatted in, as is the limit, which is left out for no limit
+PATH_QUERY = register("path.simple", """
+MATCH path = (source:Entity {{entity_id: $source_id}})-[*{length}]->(target:Entity {{entity_id: $target_id}})
+WHERE all(node IN nodes(path) WHERE single(other IN nodes(path) WHERE other = node))
+  AND ($relationship_types IS NULL OR all(rel IN relationships(path) WHERE rel.relationship_type IN $relationship_types))
+RETURN path
+{limit}
+""")
+
+# Simple paths of up to max_depth relationships, cheapest first with
+# -log(confidence) as the cost of a relationship, so the most confident come first
+WEIGHTED_PATH_QUERY = register("path.weighted", """
+MATCH path = (source:Entity {{entity_id: $source_id}})-[*1..{max_depth}]->(target:Entity {{entity_id: $target_id}})
+WHERE all(node IN nodes(path) WHERE single(other IN nodes(path) WHERE other = node))
+  AND all(rel IN relationships(path) WHERE coalesce(rel.confidence, 1.0) > 0)
+  AND ($relationship_types IS NULL OR all(rel IN relationships(path) WHERE rel.relationship_type IN $relationship_types))
+WITH path, reduce(cost = 0.0, rel IN relationships(path) | cost - log(coalesce(rel.confidence, 1.0))) AS cost
+RETURN path
+ORDER BY cost, length(path)
+{limit}
+""")
+
+async def _run_path_query(client, query: str, params: Dict[str, Any], entity_class: Type[E], relationship_class: Type[R]) -> List[List[Union[E, R]]]:
+    """Run a path query and convert each path into alternating Entity and Relationship objects."""
+    paths = []
+    for record in await run_query(client, query, params):
+        path_data = record.get("path", [])
         
-        if hasattr(client, "query"):
-            result = await client.query(query, params=params)
+        # Skip empty paths
+        if not path_data:
+            continue
             
-            # Process paths
-            paths = []
-            for record in result:
-                path_data = record.get("path", [])
-                
-                # Skip empty paths
-                if not path_data:
-                    continue
-                    
-                # Process path into alternating Entity and Relationship objects
-                processed_path = []
-                
-                # Add each node and relationship to the path
-                for i, item in enumerate(path_data):
-                    if i % 2 == 0:  # Entity
-                        processed_path.append(entity_class.from_dict(item))
-                    else:  # Relationship
-                        processed_path.append(relationship_class.from_dict(item))
-                        
-                paths.append(processed_path)
+        # Process path into alternating Entity and Relationship objects
+        processed_path = []
+        for i, item in enumerate(path_data):
+            if i % 2 == 0:  # Entity
+                processed_path.append(entity_class.from_dict(item))
+            else:  # Relationship
+                processed_path.append(relationship_class.from_dict(item))
                 
+        paths.append(processed_path)
+        
+    return paths
+
+async def find_paths(client, source_id: str, target_id: str, max_depth: int = 3, entity_class: Type[E] = None,
+                     relationship_class: Type[R] = None, max_paths: Optional[int] = 10,
+                     weighted: bool = False, relationship_types: Optional[List[str]] = None) -> List[List[Union[E, R]]]:
+    """
+    Find simple paths between two entities, shortest first.
+    
+    Each length from 1 to max_depth relationships is queried in turn with
+    the remaining limit, so the database stops expanding once max_paths
+    are found instead of enumerating every path up to max_depth.
+    
+    With weighted, a single query orders the paths by their summed
+    -log(confidence) costs, so the most confident paths come first; the
+    database keeps only the max_paths best while sorting.
+    
+    With relationship_types, only paths whose every relationship has one of
+    those types are followed, so the limit counts matching paths only.
+    """
+    try:
+        max_depth = int(max_depth)
+        paths: List[List[Union[E, R]]] = []
+        if source_id == target_id or max_depth < 1:
             return paths
-        else:
-            # Direct Neo4j client
-            async with client.session() as session:
-                result = await session.run(query, **params)
-                
-                paths = []
-                async for record in result:
-                    path = record["path"]
-                    
-                    # Process path
-                    processed_path = []
-                    
-                    # Extract nodes and relationships
-                    nodes = path.nodes
-                    relationships = path.relationships
-                    
-                    # Add source node
-                    processed_path.append(entity_class.from_dict(dict(nodes[0].items())))
-                    
-                    # Add alternating relationships and nodes
-                    for i in range(len(relationships)):
-                        processed_path.append(relationship_class.from_dict(dict(relationships[i].items())))
-                        processed_path.append(entity_class.from_dict(dict(nodes[i+1].items())))
-                        
-                    paths.append(processed_path)
-                    
-                return paths
+            
+        if weighted:
+            query = statement(WEIGHTED_PATH_QUERY, max_depth=max_depth, limit="" if max_paths is None else "LIMIT $limit")
+            params = {
+                "source_id": source_id,
+                "target_id": target_id,
+                "relationship_types": list(relationship_types) if relationship_types else None,
+                "limit": max_paths
+            }
+            return await _run_path_query(client, query, params, entity_class, relationship_class)
+            
+        for length in range(1, max_depth + 1):
+            remaining = max_paths - len(paths) if max_paths is not None else None
+            if remaining is not None and remaining < 1:
+                break
                 
+            query = statement(PATH_QUERY, length=length, limit="" if remaining is None else "LIMIT $limit")
+            params = {
+                "source_id": source_id,
+                "target_id": target_id,
+                "relationship_types": list(relationship_types) if relationship_types else None,
+                "limit": remaining
+            }
+            paths.extend(await _run_path_query(client, query, params, entity_class, relationship_class))
+            
+        return paths
+        
     except Exception as e:
         logger.error(f"Error finding paths: {e}")
-        return []
\ No newline at end of file
+        return []
@@ -0,0 +1,218 @@
+"""
+Neo4j Property Index Operations
+
+Property value indexes and lookups for Neo4j in Athena.
+
+Entity properties are stored as {"value", "confidence", "updated_at"} maps,
+which Neo4j cannot index, so each scalar property value is also written to
+a flat node property named prop_<name>. Property indexes are native Neo4j
+range indexes on those flat properties. The aliases and text property values
+are likewise joined into a flat search_text property for the full-text index.
+"""
+
+import re
+import logging
+from typing import Dict, Any, List, Optional, Type, TypeVar
+
+from .client import run_query
+
+# Type variable for generic entity type
+E = TypeVar('E')
+
+logger = logging.getLogger("athena.graph.neo4j.operations.property")
+
+PROPERTY_PREFIX = "prop_"
+SEARCH_TEXT_PROPERTY = "search_text"
+INDEX_PREFIX = "athena_prop_"
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+def _quote(name: str) -> str:
+    """Quote an identifier for use in Cypher."""
+    return "`" + name.replace("`", "``") + "`"
+
+def _index_name(name: str) -> str:
+    """Derive a valid Neo4j index name from a property name."""
+    return INDEX_PREFIX + re.sub(r"\W", "_", name)
+
+def flat_properties(entity) -> Dict[str, Any]:
+    """
+    Get the flat prop_<name> node properties of an entity.
+
+    Only values Neo4j can store and index are included: scalars and lists
+    of scalars of a single type.
+
+    Args:
+        entity: Entity to flatten
+
+    Returns:
+        Mapping from flat property name to value
+    """
+    flat = {}
+    for name, prop in entity.properties.items():
+        value = prop.get("value") if isinstance(prop, dict) else prop
+        if isinstance(value, _SCALAR_TYPES):
+            flat[PROPERTY_PREFIX + name] = value
+        elif isinstance(value, (list, tuple)) and value and len({type(item) for item in value}) == 1 \
+                and isinstance(value[0], _SCALAR_TYPES):
+            flat[PROPERTY_PREFIX + name] = list(value)
+    return flat
+
+def search_text(entity) -> str:
+    """
+    Get the text of an entity that full-text search matches besides its name.
+
+    Args:
+        entity: Entity to describe
+
+    Returns:
+        Its aliases and string property values, one per line
+    """
+    texts = sorted(entity.aliases)
+    for prop in entity.properties.values():
+        value = prop.get("value") if isinstance(prop, dict) else prop
+        if isinstance(value, str):
+            texts.append(value)
+        elif isinstance(value, (list, tuple)):
+            texts.extend(item for item in value if isinstance(item, str))
+    return "\n".join(texts)
+
+def node_properties(entity) -> Dict[str, Any]:
+    """
+    Get the full set of node properties written for an entity.
+
+    Args:
+        entity: Entity to store
+
+    Returns:
+        The entity's dictionary form plus its flat property values and search text
+    """
+    properties = entity.to_dict()
+    properties.update(flat_properties(entity))
+    properties[SEARCH_TEXT_PROPERTY] = search_text(entity)
+    return properties
+
+async def create_property_index(client, name: str, kind: str = "hash") -> bool:
+    """
+    Create a range index on the flat value of an entity property.
+
+    Neo4j range indexes answer both equality and range predicates, so both
+    index kinds map to the same native index.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+        name: Property name
+        kind: "hash" or "sorted"
+
+    Returns:
+        True once the index exists
+
+    Raises:
+        Exception: If the database cannot create the index
+    """
+    query = f"""
+    CREATE INDEX {_quote(_index_name(name))} IF NOT EXISTS
+    FOR (n:Entity) ON (n.{_quote(PROPERTY_PREFIX + name)})
+    """
+    await run_query(client, query, {})
+    logger.info(f"Created index {_index_name(name)} on property {name} (requested kind: {kind})")
+    return True
+
+async def drop_property_index(client, name: str) -> bool:
+    """
+    Drop the index on an entity property.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+        name: Property name
+
+    Returns:
+        True once no index exists
+
+    Raises:
+        Exception: If the database cannot drop the index
+    """
+    await run_query(client, f"DROP INDEX {_quote(_index_name(name))} IF EXISTS", {})
+    logger.info(f"Dropped index on property {name}")
+    return True
+
+async def list_property_indexes(client) -> List[Dict[str, Any]]:
+    """
+    List the property indexes created by Athena.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+
+    Returns:
+        List of {"name", "kind", "state"} dictionaries
+
+    Raises:
+        Exception: If the database cannot list its indexes
+    """
+    query = """
+    SHOW INDEXES YIELD name, type, state, properties
+    WHERE name STARTS WITH $prefix
+    RETURN name, type, state, properties
+    """
+    records = await run_query(client, query, {"prefix": INDEX_PREFIX})
+
+    indexes = []
+    for record in records:
+        properties = record.get("properties") or []
+        name = properties[0][len(PROPERTY_PREFIX):] if properties else record.get("name")
+        indexes.append({"name": name, "kind": str(record.get("type", "")).lower(), "state": record.get("state")})
+    return indexes
+
+async def find_entities_by_property(client, name: str, value: Any = None, min_value: Any = None,
+                                    max_value: Any = None, entity_type: Optional[str] = None,
+                                    limit: int = 100, entity_class: Type[E] = None) -> List[E]:
+    """
+    Find entities whose property equals a value or lies in an inclusive range.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+        name: Property name
+        value: Required value (omit for a range query)
+        min_value: Inclusive lower bound
+        max_value: Inclusive upper bound
+        entity_type: Optional entity type filter
+        limit: Maximum number of results
+        entity_class: Class used to build the returned entities
+
+    Returns:
+        List of matching entities, in ascending value order for range queries
+
+    Raises:
+        ValueError: If neither a value nor a range bound is given
+        Exception: If the query fails
+    """
+    if value is None and min_value is None and max_value is None:
+        raise ValueError("A value or at least one range bound is required")
+
+    field = f"n.{_quote(PROPERTY_PREFIX + name)}"
+    conditions = ["($entity_type IS NULL OR n.entity_type = $entity_type)"]
+    if value is not None:
+        conditions.append(f"{field} = $value")
+    else:
+        if min_value is not None:
+            conditions.append(f"{field} >= $min_value")
+        if max_value is not None:
+            conditions.append(f"{field} <= $max_value")
+
+    query = f"""
+    MATCH (n:Entity)
+    WHERE {" AND ".join(conditions)}
+    RETURN n
+    {"" if value is not None else f"ORDER BY {field}"}
+    LIMIT $limit
+    """
+    params = {"value": value, "min_value": min_value, "max_value": max_value, "entity_type": entity_type,
+              "limit": limit}
+
+    records = await run_query(client, query, params)
+
+    entities = []
+    for record in records:
+        node = record.get("n", {})
+        entities.append(entity_class.from_dict(dict(node.items()) if hasattr(node, "items") else node))
+    return entities
@@ -4,8 +4,13 @@ Neo4j Query Operations
 Query operations for Neo4j in Athena.
 """
 
+import re
 import logging
-from typing import Dict, Any, List, Optional, Tuple, Type, TypeVar
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple, Type, TypeVar
+
+from .client import run_query, plain_record
+from .property_ops import SEARCH_TEXT_PROPERTY
+from .statements import register, statement
 
 # Type variables for generic entity and relationship types
 E = TypeVar('E')
@@ -13,52 +18,155 @@ R = TypeVar('R')
 
 logger = logging.getLogger("athena.graph.neo4j.operations.query")
 
-async def search_entities(client, query: str, entity_type: Optional[str] = None, limit: int = 10, entity_class: Type[E] = None) -> List[E]:
-    """Search for entities matching a query."""
+FULLTEXT_INDEX = "athena_entity_text"
+
+# Characters with a meaning in Lucene query syntax
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+# Entities ranked by the full-text index, best match first
+FULLTEXT_SEARCH_QUERY = register("query.search_fulltext", """
+CALL db.index.fulltext.queryNodes($index, $search) YIELD node AS n, score
+WHERE $entity_type IS NULL OR n.entity_type = $entity_type
+RETURN n, score
+ORDER BY score DESC
+LIMIT $limit
+""")
+
+# Entities whose name or an alias contains the query, without the index
+CONTAINS_SEARCH_QUERY = register("query.search_contains", """
+MATCH (n:Entity)
+WHERE (toLower(n.name) CONTAINS $text OR any(alias IN n.aliases WHERE toLower(alias) CONTAINS $text))
+  AND ($entity_type IS NULL OR n.entity_type = $entity_type)
+RETURN n
+LIMIT $limit
+""")
+
+# The relationships of one entity, from its side
+OUTGOING_RELATIONSHIPS_QUERY = register("query.outgoing_relationships", """
+MATCH (source:Entity {entity_id: $entity_id})-[r]->(target:Entity)
+WHERE $rel_type IS NULL OR r.relationship_type = $rel_type
+RETURN r, target
+""")
+
+INCOMING_RELATIONSHIPS_QUERY = register("query.incoming_relationships", """
+MATCH (source:Entity)-[r]->(target:Entity {entity_id: $entity_id})
+WHERE $rel_type IS NULL OR r.relationship_type = $rel_type
+RETURN r, source
+""")
+
+# Relationship patterns for each direction, seen from the listed entity
+DIRECTION_PATTERNS = {
+    "outgoing": "-[r]->",
+    "incoming": "<-[r]-",
+    "both": "-[r]-"
+}
+
+# The relationships of many entities in one round trip, at most $limit each
+# unless the slice is left out
+RELATIONSHIPS_FOR_ENTITIES_QUERY = register("query.relationships_for_entities", """
+UNWIND $entity_ids AS entity_id
+MATCH (entity:Entity {{entity_id: entity_id}}){pattern}(other:Entity)
+WHERE $rel_type IS NULL OR r.relationship_type = $rel_type
+WITH entity_id, collect([r, other]){slice} AS pairs
+RETURN entity_id, pairs
+""")
+
+# The full-text index used by entity search, if it exists
+FULLTEXT_INDEX_QUERY = register("query.fulltext_index", """
+SHOW FULLTEXT INDEXES YIELD name, state
+WHERE name = $index
+RETURN name, state
+""")
+
+async def fulltext_index_exists(client) -> bool:
+    """
+    Check whether the full-text index exists.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+
+    Returns:
+        True if the index exists
+
+    Raises:
+        Exception: If the database cannot list its indexes
+    """
+    records = await run_query(client, statement(FULLTEXT_INDEX_QUERY), {"index": FULLTEXT_INDEX})
+    return bool(records)
+
+async def create_fulltext_index(client) -> bool:
+    """
+    Create the full-text index over entity names, aliases and text properties.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+
+    Returns:
+        True if the index exists afterwards
+    """
+    query = f"""
+    CREATE FULLTEXT INDEX {FULLTEXT_INDEX} IF NOT EXISTS
+    FOR (n:Entity) ON EACH [n.name, n.{SEARCH_TEXT_PROPERTY}]
+    """
     try:
-        # Build Cypher query for entity search
-        cypher_query = """
-        MATCH (n:Entity)
-        WHERE (n.name CONTAINS $query OR any(alias IN n.aliases WHERE alias CONTAINS $query))
-        """
-        
-        # Add entity type filter
-        if entity_type:
-            cypher_query += f" AND n:{entity_type}"
-            
-        # Add limit and return
-        cypher_query += " RETURN n LIMIT $limit"
-        
-        # Parameters
-        params = {"query": query.lower(), "limit": limit}
-        
-        # Execute query
-        if hasattr(client, "query"):
-            result = await client.query(cypher_query, params=params)
-            
-            # Convert results to entities
-            entities = []
-            for record in result:
-                entity_data = record.get("n", {})
-                entity = entity_class.from_dict(entity_data)
-                entities.append(entity)
-                
-            return entities
-        else:
-            # Direct Neo4j client
-            async with client.session() as session:
-                result = await session.run(cypher_query, **params)
-                
-                # Process results
-                entities = []
-                async for record in result:
-                    node = record["n"]
-                    entity_data = dict(node.items())
-                    entity = entity_class.from_dict(entity_data)
-                    entities.append(entity)
-                    
-                return entities
-                
+        await run_query(client, query, {})
+    except Exception as e:
+        logger.error(f"Error creating full-text index {FULLTEXT_INDEX}: {e}")
+
+    try:
+        exists = await fulltext_index_exists(client)
+    except Exception as e:
+        logger.error(f"Error checking full-text index {FULLTEXT_INDEX}: {e}")
+        return False
+
+    if exists:
+        logger.info(f"Created full-text index {FULLTEXT_INDEX}")
+    else:
+        logger.warning(f"Full-text index {FULLTEXT_INDEX} is unavailable, searching by substring")
+    return exists
+
+def fulltext_query(query: str) -> str:
+    """
+    Translate a search string into a Lucene query.
+
+    Every word must match, either exactly or as a prefix; exact matches
+    score higher.
+
+    Args:
+        query: Search string
+
+    Returns:
+        Lucene query, empty if the search string has no words
+    """
+    terms = [_LUCENE_SPECIAL.sub(r"\\\1", word) for word in query.split()]
+    return " ".join(f"+({term} {term}*)" for term in terms)
+
+async def search_entities(client, query: str, entity_type: Optional[str] = None, limit: int = 10, entity_class: Type[E] = None,
+                          fulltext: bool = True) -> List[E]:
+    """
+    Search for entities matching a query.
+
+    With fulltext set the full-text index ranks the matches, best first.
+    Without it, or if the index turns out to be missing, entities whose
+    name or an alias contains the query are returned in no particular order.
+    """
+    search = fulltext_query(query) if fulltext else ""
+    try:
+        if search:
+            params = {"index": FULLTEXT_INDEX, "search": search, "entity_type": entity_type, "limit": limit}
+            try:
+                records = await run_query(client, statement(FULLTEXT_SEARCH_QUERY), params)
+            except Exception as e:
+                if await fulltext_index_exists(client):
+                    raise
+                logger.warning(f"Full-text index {FULLTEXT_INDEX} is missing, searching by substring: {e}")
+            else:
+                return [entity_class.from_dict(record["n"]) for record in records]
+
+        params = {"text": query.lower(), "entity_type": entity_type, "limit": limit}
+        records = await run_query(client, statement(CONTAINS_SEARCH_QUERY), params)
+        return [entity_class.from_dict(record["n"]) for record in records]
+
     except Exception as e:
         logger.error(f"Error searching entities: {e}")
         return []
@@ -68,26 +176,14 @@ async def get_entity_relationships(client, entity_id: str, relationship_type: Op
     try:
         results = []
         
+        params = {"entity_id": entity_id, "rel_type": relationship_type}
+        
         # Handle outgoing relationships
         if direction in ["outgoing", "both"]:
-            # Build query for outgoing relationships
-            query = """
-            MATCH (source:Entity {entity_id: $entity_id})-[r]->(target:Entity)
-            """
-            
-            # Add relationship type filter
-            if relationship_type:
-                query += f" WHERE type(r) = $rel_type"
-                
-            query += " RETURN r, target"
+            query = statement(OUTGOING_RELATIONSHIPS_QUERY)
             
             # Execute query
             if hasattr(client, "query"):
-                params = {
-                    "entity_id": entity_id,
-                    "rel_type": relationship_type
-                } if relationship_type else {"entity_id": entity_id}
-                
                 result = await client.query(query, params=params)
                 
                 # Process results
@@ -102,10 +198,6 @@ async def get_entity_relationships(client, entity_id: str, relationship_type: Op
             else:
                 # Direct Neo4j client
                 async with client.session() as session:
-                    params = {"entity_id": entity_id}
-                    if relationship_type:
-                        params["rel_type"] = relationship_type
-                        
                     result = await session.run(query, **params)
                     
                     # Process results
@@ -121,22 +213,10 @@ async def get_entity_relationships(client, entity_id: str, relationship_type: Op
         # Handle incoming relationships
         if direction in ["incoming", "both"]:
             # Similar logic for incoming relationships
-            query = """
-            MATCH (source:Entity)-[r]->(target:Entity {entity_id: $entity_id})
-            """
-            
-            if relationship_type:
-                query += f" WHERE type(r) = $rel_type"
-                
-            query += " RETURN r, source"
+            query = statement(INCOMING_RELATIONSHIPS_QUERY)
             
             # Execute query - similar to above with source/target swapped
             if hasattr(client, "query"):
-                params = {
-                    "entity_id": entity_id,
-                    "rel_type": relationship_type
-                } if relationship_type else {"entity_id": entity_id}
-                
                 result = await client.query(query, params=params)
                 
                 for record in result:
@@ -150,10 +230,6 @@ async def get_entity_relationships(client, entity_id: str, relationship_type: Op
             else:
                 # Direct Neo4j client
                 async with client.session() as session:
-                    params = {"entity_id": entity_id}
-                    if relationship_type:
-                        params["rel_type"] = relationship_type
-                        
                     result = await session.run(query, **params)
                     
                     async for record in result:
@@ -171,36 +247,67 @@ async def get_entity_relationships(client, entity_id: str, relationship_type: Op
         logger.error(f"Error getting entity relationships: {e}")
         return []
 
+async def get_relationships_for_entities(client, entity_ids: List[str], relationship_type: Optional[str] = None,
+                                         direction: str = "both", per_entity_limit: Optional[int] = None,
+                                         relationship_class: Type[R] = None,
+                                         entity_class: Type[E] = None) -> Dict[str, List[Tuple[R, E]]]:
+    """Get the relationships of many entities with a single UNWIND query."""
+    results: Dict[str, List[Tuple[R, E]]] = {entity_id: [] for entity_id in entity_ids}
+    try:
+        if not results or (per_entity_limit is not None and per_entity_limit < 1):
+            return results
+            
+        query = statement(RELATIONSHIPS_FOR_ENTITIES_QUERY, pattern=DIRECTION_PATTERNS[direction],
+                          slice="" if per_entity_limit is None else "[..$limit]")
+        params = {
+            "entity_ids": list(results),
+            "rel_type": relationship_type,
+            "limit": per_entity_limit
+        }
+        
+        for record in await run_query(client, query, params):
+            results[record["entity_id"]] = [
+                (relationship_class.from_dict(rel_data), entity_class.from_dict(other_data))
+                for rel_data, other_data in record["pairs"]
+            ]
+            
+        return results
+        
+    except Exception as e:
+        logger.error(f"Error getting relationships for entities: {e}")
+        return {entity_id: [] for entity_id in entity_ids}
+
 async def execute_query(client, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-    """Execute a raw Cypher query."""
+    """Execute a raw Cypher query, logging errors and returning no records on failure."""
     try:
-        if hasattr(client, "query"):
-            return await client.query(query, params=params)
-        else:
-            # Direct Neo4j client
-            async with client.session() as session:
-                result = await session.run(query, **(params or {}))
-                
-                # Convert result to list of dictionaries
-                records = []
-                async for record in result:
-                    # Convert record to dict
-                    record_dict = {}
-                    
-                    for key, value in record.items():
-                        # Handle Neo4j types
-                        if hasattr(value, "items"):  # Node or Relationship
-                            record_dict[key] = dict(value.items())
-                        elif isinstance(value, list) and value and all(hasattr(item, "items") for item in value):
-                            # List of nodes or relationships
-                            record_dict[key] = [dict(item.items()) for item in value]
-                        else:
-                            record_dict[key] = value
-                    
-                    records.append(record_dict)
-                    
-                return records
-                
+        return await run_query(client, query, params or {})
     except Exception as e:
         logger.error(f"Error executing query: {e}")
-        return []
\ No newline at end of file
+        return []
+
+async def stream_query(client, query: str, params: Dict[str, Any] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Execute a raw Cypher query, yielding records as they arrive.
+
+    With a direct Neo4j driver, records are pulled from the server in
+    batches of the session fetch size, so only one batch is held in memory
+    at a time and closing the generator early stops the query. The Hermes
+    client returns complete results, which are yielded from memory.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+        query: Cypher query
+        params: Query parameters
+
+    Yields:
+        Result records as dictionaries
+    """
+    if hasattr(client, "query"):
+        for record in await client.query(query, params=params):
+            yield record
+        return
+
+    async with client.session() as session:
+        result = await session.run(query, **(params or {}))
+        async for record in result:
+            yield plain_record(record)
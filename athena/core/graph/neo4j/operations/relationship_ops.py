@@ -7,40 +7,46 @@ Basic relationship CRUD operations for Neo4j in Athena.
 import logging
 from typing import Dict, Any, Optional, Type, TypeVar
 
+from .statements import RELATIONSHIP_TYPE, register, statement
+
 # Type variable for generic relationship type
 R = TypeVar('R')
 
 logger = logging.getLogger("athena.graph.neo4j.operations.relationship")
 
+# Every relationship has the RELATES_TO type; the Athena relationship type
+# is its relationship_type property
+CREATE_RELATIONSHIP = register("relationship.create", """
+MATCH (source:Entity {entity_id: $source_id})
+MATCH (target:Entity {entity_id: $target_id})
+MERGE (source)-[r:RELATES_TO {relationship_id: $relationship_id}]->(target)
+SET r = $properties
+RETURN r
+""")
+
 async def create_relationship(client, source_id: str, target_id: str, rel_type: str, properties: Dict[str, Any]) -> str:
-    """Create a new relationship."""
+    """Create a new relationship of type rel_type."""
     try:
         relationship_id = properties.get("relationship_id")
+        properties = dict(properties, relationship_type=rel_type)
         
         # Create relationship using Hermes client or direct client
         if hasattr(client, "add_relationship"):
             await client.add_relationship(
                 source_id=source_id,
                 target_id=target_id,
-                type=rel_type,
+                type=RELATIONSHIP_TYPE,
                 properties=properties
             )
             return relationship_id
         else:
             # Direct Neo4j client
-            query = f"""
-            MATCH (source:Entity {{entity_id: $source_id}})
-            MATCH (target:Entity {{entity_id: $target_id}})
-            MERGE (source)-[r:{rel_type}]->(target)
-            SET r = $properties
-            RETURN r
-            """
-            
             async with client.session() as session:
                 result = await session.run(
-                    query,
+                    statement(CREATE_RELATIONSHIP),
                     source_id=source_id,
                     target_id=target_id,
+                    relationship_id=relationship_id,
                     properties=properties
                 )
                 await result.consume()
@@ -0,0 +1,59 @@
+"""
+Neo4j Schema Operations
+
+Constraints and indexes of the Athena graph schema.
+"""
+
+import logging
+from typing import Dict
+
+from .client import run_query
+from .query_ops import create_fulltext_index
+from .statements import ENTITY_TYPE_INDEX, RELATIONSHIP_TYPE_INDEX
+
+logger = logging.getLogger("athena.graph.neo4j.operations.schema")
+
+# Schema statements by name, run in order
+SCHEMA_STATEMENTS = {
+    "entity_id_constraint": """
+    CREATE CONSTRAINT IF NOT EXISTS FOR (n:Entity)
+    REQUIRE n.entity_id IS UNIQUE
+    """,
+    # Relationship property constraints need Neo4j 5.7 or later
+    "relationship_id_constraint": """
+    CREATE CONSTRAINT IF NOT EXISTS FOR ()-[r:RELATES_TO]-()
+    REQUIRE r.relationship_id IS UNIQUE
+    """,
+    "entity_type_index": f"""
+    CREATE INDEX {ENTITY_TYPE_INDEX} IF NOT EXISTS FOR (n:Entity) ON (n.entity_type)
+    """,
+    "relationship_type_index": f"""
+    CREATE INDEX {RELATIONSHIP_TYPE_INDEX} IF NOT EXISTS FOR ()-[r:RELATES_TO]-() ON (r.relationship_type)
+    """,
+}
+
+async def initialize_schema(client) -> Dict[str, bool]:
+    """
+    Create the constraints and indexes of the graph schema.
+
+    Each statement runs on its own, so one the server does not support
+    only logs a warning and the rest of the schema is still created.
+
+    Args:
+        client: Hermes graph client or Neo4j driver
+
+    Returns:
+        Whether each schema element was created, by name, including the
+        full-text index as "fulltext_index"
+    """
+    created = {}
+    for name, query in SCHEMA_STATEMENTS.items():
+        try:
+            await run_query(client, query, {})
+            created[name] = True
+        except Exception as e:
+            logger.warning(f"Could not create {name.replace('_', ' ')}: {e}")
+            created[name] = False
+
+    created["fulltext_index"] = await create_fulltext_index(client)
+    return created
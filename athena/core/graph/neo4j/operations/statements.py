@@ -0,0 +1,89 @@
+"""
+Neo4j Statement Registry
+
+Cypher statements for Neo4j in Athena, registered once by name.
+
+Statement text never depends on entity or relationship types. Every entity
+carries the single Entity label and every relationship the single
+RELATES_TO type; the Athena types live in the indexed entity_type and
+relationship_type properties and are matched through parameters. The server
+therefore sees a fixed set of query strings and caches one plan for each,
+however many types the graph holds, and no type name is ever spliced into
+a query.
+
+Some templates have variants that Cypher cannot parameterize, such as
+variable-length bounds or a direction pattern. Those fields are filled in
+from integers and fixed choices only, never from user data, and each
+variant is built once and kept with the others.
+"""
+
+import logging
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger("athena.graph.neo4j.operations.statements")
+
+ENTITY_LABEL = "Entity"
+RELATIONSHIP_TYPE = "RELATES_TO"
+ENTITY_TYPE_INDEX = "athena_entity_type"
+RELATIONSHIP_TYPE_INDEX = "athena_relationship_type"
+
+_templates: Dict[str, str] = {}
+_prepared: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], str] = {}
+
+def register(name: str, template: str) -> str:
+    """
+    Register a statement template under a name.
+
+    Args:
+        name: Unique statement name
+        template: Cypher text, with str.format fields for variants
+
+    Returns:
+        The name, for use with statement()
+
+    Raises:
+        ValueError: If a different template is already registered under the name
+    """
+    if _templates.get(name, template) != template:
+        raise ValueError(f"Statement {name} is already registered")
+    _templates[name] = template
+    return name
+
+def statement(name: str, **fields: Any) -> str:
+    """
+    Get the text of a registered statement.
+
+    Args:
+        name: Statement name
+        **fields: Variant fields of the template; a template without fields
+            is returned as registered
+
+    Returns:
+        Cypher text
+
+    Raises:
+        KeyError: If no statement is registered under the name
+        TypeError: If a field is not an integer, boolean or string
+    """
+    for field, value in fields.items():
+        if not isinstance(value, (int, str)):
+            raise TypeError(f"Field {field} of statement {name} must be an integer, boolean or string")
+    key = (name, tuple(sorted(fields.items())))
+    text = _prepared.get(key)
+    if text is None:
+        template = _templates[name]
+        text = _prepared[key] = template.format(**fields) if fields else template
+        logger.debug(f"Prepared statement {name} ({len(_prepared)} prepared)")
+    return text
+
+def prepared_statements() -> Dict[str, int]:
+    """
+    Count the prepared variants of each registered statement.
+
+    Returns:
+        Mapping from statement name to the number of distinct query strings built for it
+    """
+    counts = {name: 0 for name in _templates}
+    for name, _ in _prepared:
+        counts[name] += 1
+    return counts
@@ -0,0 +1,86 @@
+"""
+Neo4j Subgraph Operations
+
+Neighborhood extraction for Neo4j in Athena.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+from .statements import register, statement
+
+# Type variables for generic entity and relationship types
+E = TypeVar('E')
+R = TypeVar('R')
+
+logger = logging.getLogger("athena.graph.neo4j.operations.subgraph")
+
+# The entities within depth hops of the centers, nearest first, and the
+# relationships among them, in one round trip. Cypher does not accept
+# parameters as variable-length bounds, so the (validated integer) depth
+# is formatted in, as is the max_nodes cut, which is left out for no limit.
+SUBGRAPH_QUERY = register("subgraph.neighborhood", """
+MATCH (center:Entity) WHERE center.entity_id IN $center_ids
+WITH collect(center) AS centers
+UNWIND centers AS center
+OPTIONAL MATCH path = (center)-[rels*0..{depth}]-(other:Entity)
+WHERE NOT other IN centers
+  AND all(rel IN rels WHERE coalesce(rel.confidence, 1.0) >= $min_confidence
+                        AND ($relationship_types IS NULL OR rel.relationship_type IN $relationship_types))
+WITH centers, other, min(length(path)) AS hops
+ORDER BY hops
+WITH centers, collect(other) AS others
+WITH centers + others AS nodes
+WITH {cut} AS truncated
+UNWIND nodes AS node
+OPTIONAL MATCH (node)-[rel]->(neighbor:Entity)
+WHERE neighbor IN nodes
+  AND coalesce(rel.confidence, 1.0) >= $min_confidence
+  AND ($relationship_types IS NULL OR rel.relationship_type IN $relationship_types)
+RETURN nodes, collect(rel) AS relationships, truncated
+""")
+
+async def get_subgraph(client, center_ids: List[str], depth: int = 1, relationship_types: Optional[List[str]] = None,
+                       min_confidence: float = 0.0, max_nodes: Optional[int] = 1000, entity_class: Type[E] = None,
+                       relationship_class: Type[R] = None) -> Dict[str, Any]:
+    """
+    Get the entities within depth hops of some centers and the relationships between them.
+
+    A single variable-length match collects every entity within depth
+    hops, keeps the max_nodes nearest and returns the relationships among
+    them, each once.
+    """
+    subgraph: Dict[str, Any] = {"entities": [], "relationships": [], "truncated": False}
+    try:
+        cut = "nodes, false" if max_nodes is None else "nodes[..$max_nodes] AS nodes, size(nodes) > $max_nodes"
+        query = statement(SUBGRAPH_QUERY, depth=max(0, int(depth)), cut=cut)
+        params = {
+            "center_ids": list(dict.fromkeys(center_ids)),
+            "relationship_types": list(relationship_types) if relationship_types else None,
+            "min_confidence": min_confidence,
+            "max_nodes": max_nodes
+        }
+
+        if hasattr(client, "query"):
+            result = await client.query(query, params=params)
+
+            for record in result:
+                subgraph["entities"] = [entity_class.from_dict(node) for node in record.get("nodes", [])]
+                subgraph["relationships"] = [relationship_class.from_dict(rel) for rel in record.get("relationships", [])]
+                subgraph["truncated"] = bool(record.get("truncated", False))
+        else:
+            # Direct Neo4j client
+            async with client.session() as session:
+                result = await session.run(query, **params)
+
+                async for record in result:
+                    subgraph["entities"] = [entity_class.from_dict(dict(node.items())) for node in record["nodes"]]
+                    subgraph["relationships"] = [relationship_class.from_dict(dict(rel.items()))
+                                                 for rel in record["relationships"]]
+                    subgraph["truncated"] = bool(record["truncated"])
+
+        return subgraph
+
+    except Exception as e:
+        logger.error(f"Error extracting subgraph: {e}")
+        return subgraph
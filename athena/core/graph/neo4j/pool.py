@@ -0,0 +1,160 @@
+"""
+Neo4j Connection Pooling
+
+Wraps the direct Neo4j driver, bounds the concurrent database work of a
+Neo4j adapter and measures how long callers wait for a turn.
+
+The driver keeps its own pool of Bolt connections, sized by Neo4jConfig.
+Above it the adapter admits at most max_concurrency operations at once, so
+a burst of requests queues in the adapter instead of exhausting the pool
+and timing out on connection acquisition. Each admitted operation holds one
+slot for its whole duration, whether it runs one statement or a batch.
+"""
+
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+from .operations import create_entity, delete_entity, create_relationship
+from .operations.client import run_query
+
+logger = logging.getLogger("athena.graph.neo4j.pool")
+
+class ConcurrencyLimiter:
+    """Admits a bounded number of concurrent operations and records wait times."""
+
+    def __init__(self, max_concurrency: int):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrency: Maximum number of operations running at once
+        """
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_use = 0
+        self.waiting = 0
+        self.acquired = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one slot for the duration of the block."""
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        waited = time.perf_counter() - started
+        self.acquired += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+        self.in_use += 1
+        try:
+            yield
+        finally:
+            self.in_use -= 1
+            self._semaphore.release()
+
+    def describe(self) -> Dict[str, Any]:
+        """Describe the limiter for status reports."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_use": self.in_use,
+            "idle": self.max_concurrency - self.in_use,
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "wait_time_total": round(self.wait_total, 6),
+            "wait_time_mean": round(self.wait_total / self.acquired, 6) if self.acquired else 0.0,
+            "wait_time_max": round(self.wait_max, 6)
+        }
+
+class LimitedClient:
+    """
+    Graph client whose coroutine methods each run in a limiter slot.
+
+    Attributes that are not coroutine methods are passed through, so
+    hasattr checks on the client behave as on the wrapped one.
+    """
+
+    def __init__(self, client, limiter: ConcurrencyLimiter):
+        """
+        Wrap a graph client.
+
+        Args:
+            client: Hermes graph client or the direct driver wrapper
+            limiter: Limiter shared by the adapter
+        """
+        self.client = client
+        self.limiter = limiter
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.client, name)
+        if not asyncio.iscoroutinefunction(attribute):
+            return attribute
+
+        async def limited(*args, **kwargs):
+            async with self.limiter.slot():
+                return await attribute(*args, **kwargs)
+
+        return limited
+
+class PooledDriver:
+    """Neo4j driver whose sessions default to the configured fetch size."""
+
+    def __init__(self, driver, fetch_size: int):
+        """
+        Wrap a Neo4j driver.
+
+        Args:
+            driver: Neo4j async driver
+            fetch_size: Records fetched per round trip while streaming results
+        """
+        self.driver = driver
+        self.fetch_size = fetch_size
+
+    def session(self, **config):
+        """Open a session, with the default fetch size unless config sets one."""
+        config.setdefault("fetch_size", self.fetch_size)
+        return self.driver.session(**config)
+
+    async def close(self) -> None:
+        """Close the driver and its connection pool."""
+        await self.driver.close()
+
+class DriverClient:
+    """
+    Client for a direct Neo4j driver that mimics the Hermes graph client.
+
+    Like the Hermes client, query raises on failure, so operations can
+    report failed statements instead of mistaking them for empty results.
+    """
+
+    def __init__(self, driver):
+        """
+        Wrap a driver.
+
+        Args:
+            driver: Neo4j async driver, usually a PooledDriver
+        """
+        self.driver = driver
+
+    async def add_node(self, id, labels, properties):
+        return await create_entity(self.driver, id, properties)
+
+    async def get_node(self, id):
+        records = await run_query(self.driver, "MATCH (n:Entity {entity_id: $entity_id}) RETURN n", {"entity_id": id})
+        return {"id": id, "properties": records[0]["n"]} if records else None
+
+    async def delete_node(self, id):
+        return await delete_entity(self.driver, id)
+
+    async def add_relationship(self, source_id, target_id, type, properties):
+        return await create_relationship(self.driver, source_id, target_id, type, properties)
+
+    async def query(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        return await run_query(self.driver, query, params or {})
@@ -0,0 +1,11 @@
+"""
+Sharded Graph Module for Athena
+
+Provides a multi-process implementation of the graph database interface.
+Entities are hash-partitioned across worker processes that each run a
+MemoryAdapter; a coordinator routes operations and merges their results.
+"""
+
+from .adapter import ShardedAdapter
+
+__all__ = ['ShardedAdapter']
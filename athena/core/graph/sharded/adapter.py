@@ -0,0 +1,560 @@
+"""
+Sharded Graph Adapter for Athena
+
+Provides a multi-process implementation of the graph database interface.
+Entities are partitioned by a hash of their ID across worker processes,
+each running its own MemoryAdapter, so the graph is no longer limited to
+one core and one interpreter lock.
+
+A relationship is stored on the shard of its source and, when that is a
+different shard, replicated to the shard of its target, so every shard
+holds all edges incident to its own entities. The coordinator routes
+entity operations to the owning shard, scatters searches and gathers the
+merged top results, and runs path searches as breadth-first expansions
+that ask the shards for one frontier at a time.
+"""
+
+import os
+import json
+import heapq
+import asyncio
+import logging
+from itertools import chain, zip_longest
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+
+from ...entity import Entity
+from ...relationship import Relationship
+from ..memory.path_search import iter_simple_paths, iter_weighted_paths, confidence_cost
+from ..memory.property_index import property_value, sort_key
+from .client import ShardClient
+from .worker import shard_of
+
+logger = logging.getLogger("athena.graph.sharded.adapter")
+
+class ShardedAdapter:
+    """
+    Hash-sharded multi-process graph adapter for Athena.
+
+    Each shard keeps its data in its own subdirectory of data_path using
+    the memory adapter's formats. The number of shards is recorded there
+    on first use and cannot change afterwards, since it decides where
+    every entity lives.
+    """
+
+    def __init__(self, data_path: str, **kwargs):
+        """
+        Initialize the sharded adapter.
+
+        Args:
+            data_path: Path to store persistence files
+            **kwargs: Additional configuration options
+                shard_count: Number of shard processes for a new data
+                    directory (default: number of CPUs)
+                Any other option is passed to each shard's MemoryAdapter,
+                except background_load and load_workers: shards load in
+                parallel already, and shard processes cannot start workers.
+        """
+        self.data_path = data_path
+        self.shard_file = os.path.join(data_path, "shards.json")
+        self.shard_count = kwargs.get("shard_count") or os.cpu_count() or 1
+        self.shard_options = {
+            key: value for key, value in kwargs.items()
+            if key not in ("shard_count", "background_load", "load_workers")
+        }
+        self.search_mode = kwargs.get("search_mode", "substring")
+        self.shards: List[ShardClient] = []
+        self.is_connected = False
+
+    def _shard(self, entity_id: str) -> ShardClient:
+        """Get the client of the shard that owns an entity."""
+        return self.shards[shard_of(entity_id, self.shard_count)]
+
+    def _endpoint_shards(self, relationship: Relationship) -> List[ShardClient]:
+        """Get the shards that store a relationship."""
+        source = self._shard(relationship.source_id)
+        target = self._shard(relationship.target_id)
+        return [source] if source is target else [source, target]
+
+    async def _broadcast(self, operation: str, *args) -> List[Any]:
+        """Run an operation on every shard."""
+        return await asyncio.gather(*(shard.call(operation, *args) for shard in self.shards))
+
+    async def connect(self) -> bool:
+        """
+        Start the shard processes and load their data.
+
+        Returns:
+            True if every shard connected
+        """
+        logger.info("Connecting to sharded graph database")
+        os.makedirs(self.data_path, exist_ok=True)
+
+        if os.path.exists(self.shard_file):
+            with open(self.shard_file, 'r') as f:
+                stored = json.load(f)["shard_count"]
+            if stored != self.shard_count:
+                logger.warning(f"Data directory is partitioned into {stored} shards; "
+                               f"ignoring shard_count={self.shard_count}")
+                self.shard_count = stored
+        else:
+            with open(self.shard_file, 'w') as f:
+                json.dump({"shard_count": self.shard_count}, f)
+
+        self.shards = [
+            ShardClient(index, os.path.join(self.data_path, f"shard-{index:03d}"),
+                        self.shard_count, self.shard_options)
+            for index in range(self.shard_count)
+        ]
+        for shard in self.shards:
+            shard.start()
+
+        connected = all(await self._broadcast("connect"))
+        self.is_connected = connected
+        logger.info(f"Connected to sharded graph database ({self.shard_count} shards)")
+        return connected
+
+    async def disconnect(self) -> bool:
+        """
+        Checkpoint every shard and stop the shard processes.
+
+        Returns:
+            True if successful
+        """
+        logger.info("Disconnecting from sharded graph database")
+        results = await asyncio.gather(*(shard.call("disconnect") for shard in self.shards),
+                                       return_exceptions=True)
+        await asyncio.gather(*(shard.close() for shard in self.shards))
+        self.is_connected = False
+        return all(result is True for result in results)
+
+    async def checkpoint(self) -> bool:
+        """
+        Checkpoint every shard.
+
+        Returns:
+            True if every shard wrote its snapshot
+        """
+        return all(await self._broadcast("checkpoint"))
+
+    async def initialize_schema(self) -> bool:
+        """
+        Initialize the graph schema.
+
+        Returns:
+            True if successful
+        """
+        # No schema initialization needed for in-memory shards
+        return True
+
+    # Entity operations
+    async def create_entity(self, entity: Entity) -> str:
+        return await self._shard(entity.entity_id).call("create_entity", entity.to_dict())
+
+    async def create_entities(self, entities: List[Entity]) -> Dict[int, str]:
+        """
+        Create many entities, one batch per shard.
+
+        Args:
+            entities: Entities to create
+
+        Returns:
+            Mapping from batch index to error message for entities that could not be created
+        """
+        batches: Dict[int, List[int]] = {}
+        for index, entity in enumerate(entities):
+            batches.setdefault(shard_of(entity.entity_id, self.shard_count), []).append(index)
+
+        results = await asyncio.gather(*(
+            self.shards[shard].call("create_entities", [entities[index].to_dict() for index in indices])
+            for shard, indices in batches.items()
+        ))
+        errors: Dict[int, str] = {}
+        for indices, shard_errors in zip(batches.values(), results):
+            for position, message in shard_errors.items():
+                errors[indices[position]] = message
+        return errors
+
+    async def get_entity(self, entity_id: str) -> Optional[Entity]:
+        data = (await self._shard(entity_id).call("get_entities", [entity_id]))[0]
+        return Entity.from_dict(data) if data else None
+
+    async def _get_entities(self, entity_ids: Iterable[str]) -> Dict[str, Optional[Entity]]:
+        """Fetch entities from their shards, one call per shard."""
+        batches: Dict[int, List[str]] = {}
+        for entity_id in dict.fromkeys(entity_ids):
+            batches.setdefault(shard_of(entity_id, self.shard_count), []).append(entity_id)
+        results = await asyncio.gather(*(
+            self.shards[shard].call("get_entities", ids) for shard, ids in batches.items()
+        ))
+        return {
+            entity_id: Entity.from_dict(data) if data else None
+            for ids, found in zip(batches.values(), results)
+            for entity_id, data in zip(ids, found)
+        }
+
+    async def update_entity(self, entity: Entity) -> bool:
+        return await self._shard(entity.entity_id).call("update_entity", entity.to_dict())
+
+    async def delete_entity(self, entity_id: str) -> bool:
+        """
+        Delete an entity and its relationships, including their replicas.
+
+        Args:
+            entity_id: Entity ID to delete
+
+        Returns:
+            True if successful
+        """
+        owner = self._shard(entity_id)
+        incident = await owner.call("delete_entity", entity_id)
+        if incident is None:
+            return False
+
+        replicas: Dict[int, List[str]] = {}
+        for relationship_id, other_id in incident:
+            shard = shard_of(other_id, self.shard_count)
+            if self.shards[shard] is not owner:
+                replicas.setdefault(shard, []).append(relationship_id)
+        await asyncio.gather(*(
+            self.shards[shard].call("discard_relationships", ids) for shard, ids in replicas.items()
+        ))
+        return True
+
+    # Relationship operations
+    async def create_relationship(self, relationship: Relationship) -> str:
+        """
+        Create a relationship on the shards of its endpoints.
+
+        The other shards drop any copy of the same ID, so re-creating a
+        relationship with new endpoints moves it as it does in one graph.
+
+        Args:
+            relationship: Relationship to create
+
+        Returns:
+            Relationship ID
+        """
+        targets = self._endpoint_shards(relationship)
+        data = relationship.to_dict()
+        await asyncio.gather(*(
+            shard.call("create_relationship", data) if shard in targets
+            else shard.call("discard_relationships", [relationship.relationship_id])
+            for shard in self.shards
+        ))
+        return relationship.relationship_id
+
+    async def create_relationships(self, relationships: List[Relationship]) -> Dict[int, str]:
+        """
+        Create many relationships, one batch per shard.
+
+        Args:
+            relationships: Relationships to create
+
+        Returns:
+            Mapping from batch index to error message for relationships that could not be created
+        """
+        errors: Dict[int, str] = {}
+        latest: Dict[str, int] = {}
+        for index, relationship in enumerate(relationships):
+            if not relationship.source_id or not relationship.target_id:
+                errors[index] = "Relationship needs a source_id and a target_id"
+                continue
+            # A later occurrence of the same ID in the batch wins
+            latest.pop(relationship.relationship_id, None)
+            latest[relationship.relationship_id] = index
+
+        batches: Dict[int, List[int]] = {shard: [] for shard in range(self.shard_count)}
+        for index in latest.values():
+            relationship = relationships[index]
+            source = shard_of(relationship.source_id, self.shard_count)
+            target = shard_of(relationship.target_id, self.shard_count)
+            batches[source].append(index)
+            if target != source:
+                batches[target].append(index)
+
+        async def apply(shard: ShardClient, indices: List[int]) -> Dict[int, str]:
+            # Copies of these IDs with endpoints elsewhere are stale once the batch lands
+            included = set(indices)
+            stale = [rel_id for rel_id, index in latest.items() if index not in included]
+            if stale:
+                await shard.call("discard_relationships", stale)
+            if not indices:
+                return {}
+            return await shard.call("create_relationships", [relationships[index].to_dict() for index in indices])
+
+        results = await asyncio.gather(*(
+            apply(self.shards[shard], indices) for shard, indices in batches.items()
+        ))
+        for indices, shard_errors in zip(batches.values(), results):
+            for position, message in shard_errors.items():
+                errors[indices[position]] = message
+        return errors
+
+    async def get_relationship(self, relationship_id: str) -> Optional[Relationship]:
+        # Only the ID is known, so ask every shard
+        for data in await self._broadcast("get_relationship", relationship_id):
+            if data:
+                return Relationship.from_dict(data)
+        return None
+
+    async def update_relationship(self, relationship: Relationship) -> bool:
+        # Updates every copy, wherever its endpoints live
+        return any(await self._broadcast("update_relationship", relationship.to_dict()))
+
+    async def delete_relationship(self, relationship_id: str) -> bool:
+        return any(await self._broadcast("delete_relationship", relationship_id))
+
+    # Query operations
+    async def search_entities(self, query: str, entity_type: Optional[str] = None, limit: int = 10,
+                              match_mode: Optional[str] = None) -> List[Entity]:
+        """
+        Search every shard and merge the best results.
+
+        Each shard returns its own top results with their scores. Results
+        are taken round-robin across shards and then ranked by score, so
+        equally good matches are drawn from all shards.
+
+        Args:
+            query: Search query
+            entity_type: Optional entity type filter
+            limit: Maximum number of results
+            match_mode: "substring" or "token" (defaults to the adapter's search_mode)
+
+        Returns:
+            List of matching entities
+        """
+        match_mode = match_mode or self.search_mode
+        if match_mode not in ("token", "substring"):
+            raise ValueError(f"Unsupported match mode: {match_mode}")
+
+        results = await self._broadcast("search", query, entity_type, limit, match_mode)
+        interleaved = (item for row in zip_longest(*results) for item in row if item is not None)
+        best = heapq.nlargest(limit, interleaved, key=lambda item: item[0])
+        return [Entity.from_dict(data) for _, data in best]
+
+    async def get_entity_relationships(self, entity_id: str, relationship_type: Optional[str] = None,
+                                       direction: str = "both") -> List[Tuple[Relationship, Entity]]:
+        """
+        Get relationships for an entity.
+
+        Args:
+            entity_id: Entity ID
+            relationship_type: Optional relationship type filter
+            direction: Relationship direction ('outgoing', 'incoming', or 'both')
+
+        Returns:
+            List of (relationship, connected entity) tuples
+        """
+        edges = await self._shard(entity_id).call("relationships", entity_id, relationship_type, direction)
+        remote = await self._get_entities(other_id for _, other_id, other in edges if other is None)
+
+        results = []
+        for data, other_id, other in edges:
+            entity = Entity.from_dict(other) if other else remote.get(other_id)
+            if entity:
+                results.append((Relationship.from_dict(data), entity))
+        return results
+
+    async def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        logger.warning(f"Raw query execution not supported in sharded adapter. Query: {query}")
+        return []
+
+    # Path operations
+    async def find_paths(self, source_id: str, target_id: str, max_depth: int = 3, max_paths: Optional[int] = 10,
+                         weighted: bool = False,
+                         relationship_types: Optional[List[str]] = None) -> List[List[Union[Entity, Relationship]]]:
+        """
+        Find simple directed paths between two entities across shards.
+
+        The relevant part of the graph is fetched by breadth-first
+        expansion from both ends, one level per round trip, always growing
+        the smaller frontier. Every edge of a path of at most L edges joins
+        a node within a of the source to a node within b of the target
+        whenever the two searches together expand L levels, so after
+        max_depth levels the paths are searched locally over the fetched
+        edges. Fetching stops early if a frontier runs out.
+
+        Args:
+            source_id: Source entity ID
+            target_id: Target entity ID
+            max_depth: Maximum number of relationships in a path
+            max_paths: Maximum number of paths to return, or None for all
+            weighted: Return the most confident paths first, by the product
+                of their relationships' confidences, instead of the shortest
+            relationship_types: Relationship types a path may use, or None for all
+
+        Returns:
+            List of paths, where each path is a list of alternating Entity and Relationship objects
+        """
+        if source_id == target_id or max_depth < 1 or (max_paths is not None and max_paths < 1):
+            return []
+        ends = await self._get_entities([source_id, target_id])
+        if not ends[source_id] or not ends[target_id]:
+            logger.debug(f"Cannot find path: source {source_id} or target {target_id} not found")
+            return []
+
+        edges: Dict[str, Tuple[str, str, float]] = {}
+        sides = {
+            "outgoing": ({source_id}, [source_id]),
+            "incoming": ({target_id}, [target_id])
+        }
+        for _ in range(max_depth):
+            forward, backward = sides["outgoing"][1], sides["incoming"][1]
+            if not forward or not backward:
+                # One end has nothing left to reach, so every path is fetched already
+                break
+            direction = "outgoing" if len(forward) <= len(backward) else "incoming"
+            seen, frontier = sides[direction]
+            adjacency = await self._neighbors(frontier, direction, relationship_types)
+
+            next_frontier = []
+            for node_id, node_edges in adjacency.items():
+                for relationship_id, other_id, confidence in node_edges:
+                    if direction == "outgoing":
+                        edges[relationship_id] = (node_id, other_id, confidence)
+                    else:
+                        edges[relationship_id] = (other_id, node_id, confidence)
+                    if other_id not in seen:
+                        seen.add(other_id)
+                        next_frontier.append(other_id)
+            sides[direction] = (seen, next_frontier)
+
+        successors: Dict[str, List[Tuple[str, str]]] = {}
+        predecessors: Dict[str, List[Tuple[str, str]]] = {}
+        for relationship_id, (source, target, _) in edges.items():
+            successors.setdefault(source, []).append((relationship_id, target))
+            predecessors.setdefault(target, []).append((relationship_id, source))
+
+        found: List[Tuple[List[str], List[str]]] = []
+        neighbors = (lambda node_id: successors.get(node_id, ()), lambda node_id: predecessors.get(node_id, ()))
+        if weighted:
+            search = iter_weighted_paths(*neighbors, source_id, target_id, max_depth,
+                                         lambda relationship_id: confidence_cost(edges[relationship_id][2]))
+        else:
+            search = iter_simple_paths(*neighbors, source_id, target_id, max_depth)
+        try:
+            async for path_nodes, path_relationships in search:
+                found.append((path_nodes, path_relationships))
+                if len(found) == max_paths:
+                    break
+        finally:
+            await search.aclose()
+        if not found:
+            return []
+
+        entities = await self._get_entities(chain.from_iterable(path_nodes for path_nodes, _ in found))
+        relationships = await self._get_relationships(
+            {relationship_id: edges[relationship_id][0] for _, ids in found for relationship_id in ids}
+        )
+        paths = []
+        for path_nodes, path_relationships in found:
+            path = [entities[path_nodes[0]]]
+            for relationship_id, node_id in zip(path_relationships, path_nodes[1:]):
+                path.append(relationships[relationship_id])
+                path.append(entities[node_id])
+            paths.append(path)
+        logger.debug(f"Found {len(paths)} paths between {source_id} and {target_id}")
+        return paths
+
+    async def _neighbors(self, node_ids: List[str], direction: str,
+                         relationship_types: Optional[List[str]] = None) -> Dict[str, List[Tuple[str, str, float]]]:
+        """Expand nodes on their owning shards, one call per shard."""
+        batches: Dict[int, List[str]] = {}
+        for node_id in node_ids:
+            batches.setdefault(shard_of(node_id, self.shard_count), []).append(node_id)
+        results = await asyncio.gather(*(
+            self.shards[shard].call("neighbors", ids, direction, relationship_types) for shard, ids in batches.items()
+        ))
+        adjacency = {}
+        for result in results:
+            adjacency.update(result)
+        return adjacency
+
+    async def _get_relationships(self, sources: Dict[str, str]) -> Dict[str, Optional[Relationship]]:
+        """Fetch relationships, given their source IDs, from the shards of their sources."""
+        batches: Dict[int, List[str]] = {}
+        for relationship_id, source_id in sources.items():
+            batches.setdefault(shard_of(source_id, self.shard_count), []).append(relationship_id)
+        results = await asyncio.gather(*(
+            self.shards[shard].call("get_relationships", ids) for shard, ids in batches.items()
+        ))
+        return {
+            relationship_id: Relationship.from_dict(data) if data else None
+            for ids, found in zip(batches.values(), results)
+            for relationship_id, data in zip(ids, found)
+        }
+
+    # Property index operations
+    async def create_property_index(self, name: str, kind: str = "hash") -> bool:
+        return any(await self._broadcast("create_property_index", name, kind))
+
+    async def drop_property_index(self, name: str) -> bool:
+        return any(await self._broadcast("drop_property_index", name))
+
+    async def list_property_indexes(self) -> List[Dict[str, Any]]:
+        """
+        List the property indexes, with entries summed over the shards.
+
+        Returns:
+            List of {"name", "kind", "entries"} dictionaries
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+        for indexes in await self._broadcast("list_property_indexes"):
+            for index in indexes:
+                if index["name"] in merged:
+                    merged[index["name"]]["entries"] += index["entries"]
+                else:
+                    merged[index["name"]] = dict(index)
+        return list(merged.values())
+
+    async def find_entities_by_property(self, name: str, value: Any = None, min_value: Any = None,
+                                        max_value: Any = None, entity_type: Optional[str] = None,
+                                        limit: int = 100) -> List[Entity]:
+        """
+        Find entities whose property equals a value or lies in an inclusive range.
+
+        Args:
+            name: Property name
+            value: Required value (omit for a range query)
+            min_value: Inclusive lower bound
+            max_value: Inclusive upper bound
+            entity_type: Optional entity type filter
+            limit: Maximum number of results
+
+        Returns:
+            List of matching entities, in ascending value order for range queries
+        """
+        if value is None and min_value is None and max_value is None:
+            raise ValueError("A value or at least one range bound is required")
+
+        results = await self._broadcast("find_entities_by_property", name, value, min_value,
+                                        max_value, entity_type, limit)
+        entities = [Entity.from_dict(data) for data in chain.from_iterable(results)]
+        if value is None:
+            # Values inside a range are all ordered, so the key is never None
+            entities.sort(key=lambda entity: sort_key(property_value(entity, name)))
+        return entities[:limit]
+
+    # Count operations
+    async def count_entities(self) -> int:
+        return sum(entities for entities, _ in await self._broadcast("counts"))
+
+    async def count_relationships(self) -> int:
+        return sum(relationships for _, relationships in await self._broadcast("counts"))
+
+    async def get_status(self) -> Dict[str, Any]:
+        """
+        Get adapter status, including the status of every shard.
+
+        Returns:
+            Status information dictionary
+        """
+        shards = await self._broadcast("get_status") if self.is_connected else []
+        return {
+            "adapter": "sharded",
+            "connected": self.is_connected,
+            "shard_count": self.shard_count,
+            "entities": sum(status["entities"] for status in shards),
+            "relationships": sum(status["relationships"] for status in shards),
+            "shards": shards
+        }
@@ -0,0 +1,181 @@
+"""
+Shard Client for Athena
+
+Starts a shard process and forwards calls to it from the coordinator's
+event loop. RemoteCalls, the pipelined call protocol itself, works over
+any multiprocessing connection.
+"""
+
+import asyncio
+import logging
+import threading
+import multiprocessing
+from typing import Any, Dict, Optional
+
+from .worker import run_shard
+
+logger = logging.getLogger("athena.graph.sharded.client")
+
+class RemoteUnavailableError(RuntimeError):
+    """Raised when the process at the other end of a connection has exited or closed it."""
+
+class RemoteCalls:
+    """
+    Pipelined calls over a multiprocessing connection.
+
+    Each call is sent immediately and its reply is matched to it by call
+    ID, so many calls can be in flight at once. A reader thread receives
+    replies and hands them to the event loop. The other end is served by
+    serve_requests().
+    """
+
+    def __init__(self, conn, name: str):
+        """
+        Initialize the calls and start reading replies.
+
+        Must be created on the event loop that makes the calls.
+
+        Args:
+            conn: Connection to the serving process
+            name: Name used in error messages
+        """
+        self.name = name
+        self.closed = False
+        self._conn = conn
+        self._loop = asyncio.get_running_loop()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_call = 0
+        threading.Thread(target=self._receive, name=f"{name}-replies", daemon=True).start()
+
+    async def call(self, operation: str, *args) -> Any:
+        """
+        Run an operation on the other end.
+
+        Args:
+            operation: Name of the operation
+            *args: Operation arguments; must be picklable
+
+        Returns:
+            The operation's result
+
+        Raises:
+            RemoteUnavailableError: If the connection is closed
+        """
+        if self.closed:
+            raise RemoteUnavailableError(f"{self.name} is not running")
+        self._next_call += 1
+        call_id = self._next_call
+        future = self._loop.create_future()
+        self._pending[call_id] = future
+        try:
+            self._conn.send((call_id, operation, args))
+        except (BrokenPipeError, EOFError, OSError) as e:
+            del self._pending[call_id]
+            self.closed = True
+            raise RemoteUnavailableError(f"{self.name} is not running: {e}")
+        return await future
+
+    def _receive(self) -> None:
+        """Read replies until the connection closes."""
+        try:
+            while True:
+                try:
+                    call_id, ok, result = self._conn.recv()
+                except (EOFError, OSError):
+                    self._loop.call_soon_threadsafe(self._fail_pending)
+                    return
+                self._loop.call_soon_threadsafe(self._resolve, call_id, ok, result)
+        except RuntimeError:
+            # The event loop was closed while the other end was still running
+            return
+
+    def _resolve(self, call_id: int, ok: bool, result: Any) -> None:
+        future = self._pending.pop(call_id, None)
+        if future is None or future.done():
+            return
+        if ok:
+            future.set_result(result)
+        else:
+            future.set_exception(result)
+
+    def _fail_pending(self) -> None:
+        self.closed = True
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(RemoteUnavailableError(f"{self.name} exited"))
+
+    def close(self) -> None:
+        """Close the connection; calls still in flight fail."""
+        self.closed = True
+        self._conn.close()
+
+class ShardClient:
+    """Connection to one shard process."""
+
+    def __init__(self, shard_index: int, data_path: str, shard_count: int, options: Dict[str, Any]):
+        """
+        Initialize the client; the process is started by start().
+
+        Args:
+            shard_index: Index of the shard
+            data_path: Directory holding the shard's persistence files
+            shard_count: Total number of shards
+            options: Keyword arguments for the shard's MemoryAdapter
+        """
+        self.shard_index = shard_index
+        self.data_path = data_path
+        self.shard_count = shard_count
+        self.options = options
+        self.process: Optional[multiprocessing.Process] = None
+        self._calls: Optional[RemoteCalls] = None
+
+    def start(self) -> None:
+        """Start the shard process and the reply reader."""
+        # Spawned rather than forked: the coordinator may already run threads
+        context = multiprocessing.get_context("spawn")
+        conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=run_shard,
+            args=(child_conn, self.data_path, self.shard_index, self.shard_count, self.options),
+            name=f"athena-shard-{self.shard_index}",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self._calls = RemoteCalls(conn, f"Shard {self.shard_index}")
+
+    async def call(self, operation: str, *args) -> Any:
+        """
+        Run an operation on the shard.
+
+        Args:
+            operation: Name of a ShardService operation
+            *args: Operation arguments; must be picklable
+
+        Returns:
+            The operation's result
+
+        Raises:
+            RemoteUnavailableError: If the shard is not running
+        """
+        if self._calls is None:
+            raise RemoteUnavailableError(f"Shard {self.shard_index} is not running")
+        return await self._calls.call(operation, *args)
+
+    async def close(self, timeout: float = 30.0) -> None:
+        """
+        Wait for the shard process to exit and release the connection.
+
+        Args:
+            timeout: Seconds to wait before terminating the process
+        """
+        if self.process is None:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.process.join, timeout)
+        if self.process.is_alive():
+            logger.warning(f"Shard {self.shard_index} did not exit, terminating it")
+            self.process.terminate()
+            await loop.run_in_executor(None, self.process.join, 5.0)
+        self._calls.close()
@@ -0,0 +1,364 @@
+"""
+Shard Worker for Athena
+
+Runs one shard of a ShardedAdapter: a MemoryAdapter in its own process,
+serving requests from the coordinator over a multiprocessing connection.
+
+Each request is a (call_id, operation, args) tuple and is answered with a
+(call_id, ok, result) tuple, where result is the exception when ok is
+False. Entities and relationships cross the connection in their dictionary
+form. Requests are served concurrently, so the shard's write-ahead log can
+group-commit writes from many coordinator calls.
+"""
+
+import zlib
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...entity import Entity
+from ...relationship import Relationship
+from ..memory import MemoryAdapter
+from ..memory.search_index import tokenize, entity_text_fields
+
+logger = logging.getLogger("athena.graph.sharded.worker")
+
+def shard_of(entity_id: str, shard_count: int) -> int:
+    """
+    Get the shard that owns an entity.
+
+    Uses CRC32 rather than hash(), which is salted per process.
+
+    Args:
+        entity_id: Entity ID
+        shard_count: Number of shards
+
+    Returns:
+        Shard index
+    """
+    return zlib.crc32(entity_id.encode("utf-8")) % shard_count
+
+def _match_count(entity: Entity, query_tokens: set) -> int:
+    """Count the distinct query tokens that occur in an entity's text."""
+    if not query_tokens:
+        return 0
+    tokens = set()
+    for text in entity_text_fields(entity):
+        tokens.update(tokenize(text))
+    return len(query_tokens & tokens)
+
+class ShardService:
+    """
+    The operations a shard serves to the coordinator.
+
+    Each public coroutine is one operation. Besides the adapter interface
+    there are a few shard-level reads the coordinator needs to stitch
+    shards together: raw adjacency that includes edges to entities owned
+    by other shards, and batched lookups.
+
+    Every relationship is stored on the shard of its source and on the
+    shard of its target, so a shard holds all edges incident to the
+    entities it owns. Endpoints owned by other shards appear in its graph
+    as nodes without an entity.
+    """
+
+    def __init__(self, adapter: MemoryAdapter, shard_index: int, shard_count: int):
+        self.adapter = adapter
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+
+    def _owns(self, node_id: str) -> bool:
+        return shard_of(node_id, self.shard_count) == self.shard_index
+
+    def _entity(self, node_id: str) -> Optional[Entity]:
+        data = self.adapter.graph.nodes.get(node_id)
+        return data.get('entity') if data is not None else None
+
+    # Lifecycle
+    async def connect(self) -> bool:
+        return await self.adapter.connect()
+
+    async def disconnect(self) -> bool:
+        return await self.adapter.disconnect()
+
+    async def checkpoint(self) -> bool:
+        return await self.adapter.checkpoint()
+
+    async def get_status(self) -> Dict[str, Any]:
+        status = await self.adapter.get_status()
+        status["shard"] = self.shard_index
+        status["entities"], status["relationships"] = await self.counts()
+        return status
+
+    # Entity operations
+    async def create_entity(self, data: Dict[str, Any]) -> str:
+        return await self.adapter.create_entity(Entity.from_dict(data))
+
+    async def create_entities(self, batch: List[Dict[str, Any]]) -> Dict[int, str]:
+        return await self.adapter.create_entities([Entity.from_dict(data) for data in batch])
+
+    async def get_entities(self, entity_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        entities = (self._entity(entity_id) for entity_id in entity_ids)
+        return [entity.to_dict() if entity else None for entity in entities]
+
+    async def update_entity(self, data: Dict[str, Any]) -> bool:
+        return await self.adapter.update_entity(Entity.from_dict(data))
+
+    async def delete_entity(self, entity_id: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Delete an entity and its local edges.
+
+        Returns:
+            (relationship_id, other endpoint) of every edge that was incident
+            to the entity, or None if the entity was not found
+        """
+        graph = self.adapter.graph
+        if entity_id not in graph:
+            return None
+        # Collected before the adapter's first await, so no edge can slip in between
+        incident = [(key, target) for _, target, key in graph.out_edges(entity_id, keys=True)]
+        incident.extend((key, source) for source, _, key in graph.in_edges(entity_id, keys=True))
+        if not await self.adapter.delete_entity(entity_id):
+            return None
+        return incident
+
+    # Relationship operations
+    async def create_relationship(self, data: Dict[str, Any]) -> str:
+        return await self.adapter.create_relationship(Relationship.from_dict(data))
+
+    async def create_relationships(self, batch: List[Dict[str, Any]]) -> Dict[int, str]:
+        return await self.adapter.create_relationships([Relationship.from_dict(data) for data in batch])
+
+    async def get_relationship(self, relationship_id: str) -> Optional[Dict[str, Any]]:
+        relationship = await self.adapter.get_relationship(relationship_id)
+        return relationship.to_dict() if relationship else None
+
+    async def get_relationships(self, relationship_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        results = []
+        for relationship_id in relationship_ids:
+            endpoints = self.adapter.relationship_index.get(relationship_id)
+            data = self.adapter.graph.get_edge_data(*endpoints, relationship_id) if endpoints else None
+            relationship = data.get('relationship') if data else None
+            results.append(relationship.to_dict() if relationship else None)
+        return results
+
+    async def update_relationship(self, data: Dict[str, Any]) -> bool:
+        relationship = Relationship.from_dict(data)
+        if relationship.relationship_id not in self.adapter.relationship_index:
+            return False
+        return await self.adapter.update_relationship(relationship)
+
+    async def delete_relationship(self, relationship_id: str) -> bool:
+        if relationship_id not in self.adapter.relationship_index:
+            return False
+        return await self.adapter.delete_relationship(relationship_id)
+
+    async def discard_relationships(self, relationship_ids: List[str]) -> int:
+        """Delete whichever of the relationships this shard holds."""
+        held = [rel_id for rel_id in relationship_ids if rel_id in self.adapter.relationship_index]
+        for relationship_id in held:
+            await self.adapter.delete_relationship(relationship_id)
+        return len(held)
+
+    # Query operations
+    async def search(self, query: str, entity_type: Optional[str], limit: int,
+                     match_mode: Optional[str]) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Search this shard's entities.
+
+        Returns:
+            (score, entity) pairs in the adapter's result order. The score is
+            the number of matched query tokens in token mode and 0 otherwise.
+        """
+        entities = await self.adapter.search_entities(query, entity_type, limit, match_mode)
+        if (match_mode or self.adapter.search_mode) == "token":
+            query_tokens = set(tokenize((query or "").lower()))
+        else:
+            query_tokens = set()
+        return [(_match_count(entity, query_tokens), entity.to_dict()) for entity in entities]
+
+    async def relationships(self, entity_id: str, relationship_type: Optional[str],
+                            direction: str) -> List[Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]]:
+        """
+        Get the relationships of an owned entity.
+
+        Returns:
+            (relationship, other endpoint ID, other entity) tuples; the other
+            entity is None when another shard owns it
+        """
+        graph = self.adapter.graph
+        if entity_id not in graph:
+            return []
+        edges = []
+        if direction in ["outgoing", "both"]:
+            edges.extend((target, rel) for _, target, rel in graph.out_edges(entity_id, data='relationship'))
+        if direction in ["incoming", "both"]:
+            edges.extend((source, rel) for source, _, rel in graph.in_edges(entity_id, data='relationship'))
+
+        results = []
+        for other_id, relationship in edges:
+            if not relationship:
+                continue
+            if relationship_type and relationship.relationship_type != relationship_type:
+                continue
+            other = self._entity(other_id)
+            results.append((relationship.to_dict(), other_id, other.to_dict() if other else None))
+        return results
+
+    async def neighbors(self, node_ids: List[str], direction: str,
+                        relationship_types: Optional[List[str]] = None) -> Dict[str, List[Tuple[str, str, float]]]:
+        """
+        Get the adjacency of some nodes, without relationship payloads.
+
+        Args:
+            node_ids: Nodes to expand
+            direction: "outgoing" or "incoming"
+            relationship_types: Relationship types to follow, or None for all
+
+        Returns:
+            node ID -> list of (relationship_id, other endpoint ID, confidence) in edge order
+        """
+        graph = self.adapter.graph
+        types = set(relationship_types) if relationship_types else None
+        result = {}
+        for node_id in node_ids:
+            if node_id not in graph:
+                continue
+            if direction == "outgoing":
+                edges = ((key, target, relationship) for _, target, key, relationship
+                         in graph.out_edges(node_id, keys=True, data='relationship'))
+            else:
+                edges = ((key, source, relationship) for source, _, key, relationship
+                         in graph.in_edges(node_id, keys=True, data='relationship'))
+            result[node_id] = [(key, other, relationship.confidence) for key, other, relationship in edges
+                               if types is None or relationship.relationship_type in types]
+        return result
+
+    # Property index operations
+    async def create_property_index(self, name: str, kind: str) -> bool:
+        return await self.adapter.create_property_index(name, kind)
+
+    async def drop_property_index(self, name: str) -> bool:
+        return await self.adapter.drop_property_index(name)
+
+    async def list_property_indexes(self) -> List[Dict[str, Any]]:
+        return await self.adapter.list_property_indexes()
+
+    async def find_entities_by_property(self, name: str, value: Any, min_value: Any, max_value: Any,
+                                        entity_type: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        entities = await self.adapter.find_entities_by_property(name, value, min_value, max_value,
+                                                                entity_type, limit)
+        return [entity.to_dict() for entity in entities]
+
+    # Count operations
+    async def counts(self) -> Tuple[int, int]:
+        """
+        Count the entities and relationships this shard owns.
+
+        A relationship is owned by the shard of its source, so relationships
+        replicated for their target are not counted twice.
+        """
+        graph = self.adapter.graph
+        entities = sum(1 for _, entity in graph.nodes(data='entity') if entity is not None)
+        relationships = sum(degree for node_id, degree in graph.out_degree() if self._owns(node_id))
+        return entities, relationships
+
+async def serve_requests(conn, service, name: str, final_operation: Optional[str] = None) -> None:
+    """
+    Serve (call_id, operation, args) requests on a connection.
+
+    Requests run concurrently as tasks. Serving ends when the connection
+    closes, or once final_operation has been answered; that operation only
+    runs after all earlier requests have finished.
+
+    Args:
+        conn: Connection to serve
+        service: Object whose public coroutines are the operations
+        name: Name used in log messages and errors
+        final_operation: Operation that ends serving, if any
+    """
+    loop = asyncio.get_running_loop()
+    requests: asyncio.Queue = asyncio.Queue()
+
+    def receive() -> None:
+        # Blocking reads happen off the event loop; None marks a closed connection
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                message = None
+            try:
+                loop.call_soon_threadsafe(requests.put_nowait, message)
+            except RuntimeError:
+                # The event loop has already finished
+                return
+            if message is None:
+                return
+
+    threading.Thread(target=receive, name=f"{name}-recv", daemon=True).start()
+
+    def reply(call_id: int, ok: bool, result: Any) -> None:
+        try:
+            conn.send((call_id, ok, result))
+        except (BrokenPipeError, EOFError, OSError):
+            pass
+        except Exception as e:
+            # The result or exception could not be pickled
+            conn.send((call_id, False, RuntimeError(f"{name} could not send its reply: {e}")))
+
+    async def handle(call_id: int, operation: str, args: tuple) -> None:
+        handler = getattr(service, operation, None) if not operation.startswith("_") else None
+        if handler is None:
+            reply(call_id, False, ValueError(f"Unknown operation: {operation}"))
+            return
+        try:
+            reply(call_id, True, await handler(*args))
+        except Exception as e:
+            logger.error(f"{name} failed {operation}: {e}")
+            reply(call_id, False, e)
+
+    tasks = set()
+    while True:
+        message = await requests.get()
+        if message is None:
+            break
+
+        call_id, operation, args = message
+        if operation == final_operation:
+            # Let in-flight requests finish first
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            await handle(call_id, operation, args)
+            return
+
+        task = loop.create_task(handle(call_id, operation, args))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+async def _serve(conn, data_path: str, shard_index: int, shard_count: int, options: Dict[str, Any]) -> None:
+    """Serve coordinator requests until it disconnects the shard or goes away."""
+    service = ShardService(MemoryAdapter(data_path, **options), shard_index, shard_count)
+    await serve_requests(conn, service, f"Shard {shard_index}", final_operation="disconnect")
+    if service.adapter.is_connected:
+        # The coordinator went away without disconnecting; save what we have
+        await service.adapter.disconnect()
+
+def run_shard(conn, data_path: str, shard_index: int, shard_count: int, options: Dict[str, Any]) -> None:
+    """
+    Entry point of a shard process.
+
+    Args:
+        conn: Connection to the coordinator
+        data_path: Directory holding this shard's persistence files
+        shard_index: Index of this shard
+        shard_count: Total number of shards
+        options: Keyword arguments for the shard's MemoryAdapter
+    """
+    try:
+        asyncio.run(_serve(conn, data_path, shard_index, shard_count, options))
+    finally:
+        conn.close()
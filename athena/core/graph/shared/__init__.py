@@ -0,0 +1,11 @@
+"""
+Shared Graph Module for Athena
+
+Provides a graph adapter for multi-process deployments: one writer process
+publishes immutable, memory-mapped snapshots of the graph that reader
+processes share, and readers forward their writes to the writer.
+"""
+
+from .adapter import SharedGraphAdapter
+
+__all__ = ['SharedGraphAdapter']
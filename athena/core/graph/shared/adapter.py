@@ -0,0 +1,737 @@
+"""
+Shared Graph Adapter for Athena
+
+Provides a graph adapter for deployments that run several API worker
+processes on one data directory. Instead of each worker loading its own
+copy of the graph, one process, the writer, owns it and publishes
+immutable snapshots ("generations") of it as memory-mappable files.
+Every other process is a reader: it maps the current generation
+read-only, serves reads from it without copying it, and forwards writes
+to the writer over a local socket.
+
+The writer is whichever process takes the writer lock first. It keeps
+the graph in a MemoryAdapter, with its usual write-ahead log and
+checkpoints, and publishes a new generation whenever the graph has
+changed, at most once per publish_interval. Readers switch to a new
+generation on their next read after it appears, so they see writes,
+including their own, within about publish_interval; the writer itself
+always reads its live graph.
+
+If the writer exits, the next reader that needs to forward a write takes
+the lock and becomes the writer, loading the graph from the persistence
+files the previous writer left behind. A write whose connection fails is
+retried on the new writer, so a write in flight at the moment the writer
+died can be applied twice.
+"""
+
+import os
+import time
+import fcntl
+import socket
+import asyncio
+import logging
+import secrets
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from ...entity import Entity
+from ...relationship import Relationship
+from ..memory import MemoryAdapter
+from ..memory.path_search import iter_simple_paths, iter_weighted_paths, confidence_cost
+from ..memory.search_index import tokenize
+from ..memory.property_index import PropertyIndexes, find_entities, property_value, sort_key
+from ..sharded.client import RemoteCalls, RemoteUnavailableError
+from ..sharded.worker import ShardService, serve_requests
+from .generation import (
+    Generation,
+    write_generation,
+    generation_name,
+    generation_number,
+    publish_current,
+    read_current,
+    list_generations
+)
+
+logger = logging.getLogger("athena.graph.shared.adapter")
+
+# Errors that mean the writer cannot be reached, rather than that an operation failed
+_UNREACHABLE = (RemoteUnavailableError, OSError, EOFError, AuthenticationError)
+
+def _hang_up(conn) -> None:
+    """Shut a socket connection down, waking any thread blocked reading it."""
+    try:
+        sock = socket.socket(fileno=os.dup(conn.fileno()))
+    except OSError:
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    finally:
+        sock.close()
+
+class WriterService(ShardService):
+    """
+    The operations the writer serves to readers.
+
+    The writer's graph is a single shard holding everything, so the shard
+    operations apply unchanged; only the lifecycle stays with the writer.
+    """
+
+    def __init__(self, adapter: MemoryAdapter):
+        super().__init__(adapter, 0, 1)
+
+    async def connect(self) -> bool:
+        raise PermissionError("Readers cannot connect the writer's graph")
+
+    async def disconnect(self) -> bool:
+        raise PermissionError("Readers cannot disconnect the writer's graph")
+
+class SharedGraphAdapter:
+    """
+    Single-writer, many-reader graph adapter for multi-process deployments.
+
+    Every process on the same data directory uses this adapter with the
+    same options; the processes decide among themselves which one writes.
+    """
+
+    def __init__(self, data_path: str, **kwargs):
+        """
+        Initialize the shared adapter.
+
+        Args:
+            data_path: Path to store persistence files
+            **kwargs: Additional configuration options
+                role: "auto" (default) to become the writer if no other
+                    process is, "writer" to fail instead of reading, or
+                    "reader" to never write
+                publish_interval: Minimum seconds between generations (default 1.0)
+                refresh_interval: Seconds between a reader's checks for a
+                    new generation (default 0.2)
+                keep_generations: Generation files kept for readers still
+                    using older ones (default 3)
+                attach_timeout: Seconds to wait for a writer (default 60)
+                Any other option is passed to the writer's MemoryAdapter,
+                except background_load: the writer publishes the loaded graph
+                before serving.
+        """
+        self.data_path = data_path
+        self.shared_path = os.path.join(data_path, "shared")
+        self.lock_file = os.path.join(self.shared_path, "writer.lock")
+        self.socket_file = os.path.join(self.shared_path, "writer.sock")
+        self.key_file = os.path.join(self.shared_path, "writer.key")
+        self.role = kwargs.get("role", "auto")
+        self.publish_interval = kwargs.get("publish_interval", 1.0)
+        self.refresh_interval = kwargs.get("refresh_interval", 0.2)
+        self.keep_generations = max(1, kwargs.get("keep_generations", 3))
+        self.attach_timeout = kwargs.get("attach_timeout", 60.0)
+        self.search_mode = kwargs.get("search_mode", "substring")
+        self.options = {
+            key: value for key, value in kwargs.items()
+            if key not in ("role", "publish_interval", "refresh_interval", "keep_generations",
+                           "attach_timeout", "background_load")
+        }
+        self.is_connected = False
+
+        # Writer state
+        self.local: Optional[MemoryAdapter] = None
+        self._service: Optional[WriterService] = None
+        self._lock = None
+        self._listener: Optional[Listener] = None
+        self._reader_conns = set()
+        self._publisher: Optional[asyncio.Task] = None
+        self._published_version = -1
+        self._published_generation = 0
+        self._closing = False
+
+        # Reader state
+        self.generation: Optional[Generation] = None
+        self._checked_at = 0.0
+        self._calls: Optional[RemoteCalls] = None
+        self._calls_lock = asyncio.Lock()
+
+    @property
+    def is_writer(self) -> bool:
+        return self.local is not None
+
+    async def connect(self) -> bool:
+        """
+        Become the writer or attach to the current generation as a reader.
+
+        Returns:
+            True if connected
+        """
+        logger.info("Connecting to shared graph database")
+        os.makedirs(self.shared_path, exist_ok=True)
+
+        if self.role != "reader" and self._take_lock():
+            connected = await self._become_writer()
+        elif self.role == "writer":
+            logger.error("Another process is already the graph writer")
+            connected = False
+        else:
+            connected = await self._attach()
+
+        self.is_connected = connected
+        if connected:
+            logger.info(f"Connected to shared graph database as {'writer' if self.is_writer else 'reader'}")
+        return connected
+
+    async def disconnect(self) -> bool:
+        """
+        Disconnect; the writer publishes a final generation and checkpoints.
+
+        Returns:
+            True if successful
+        """
+        logger.info("Disconnecting from shared graph database")
+        self.is_connected = False
+        if not self.is_writer:
+            if self._calls is not None:
+                _hang_up(self._calls._conn)
+                self._calls.close()
+                self._calls = None
+            self.generation = None
+            return True
+
+        self._publisher.cancel()
+        try:
+            await self._publisher
+        except asyncio.CancelledError:
+            pass
+        if self.local.snapshots.version != self._published_version:
+            await self._publish()
+
+        self._stop_listener()
+        result = await self.local.disconnect()
+        self.local = None
+        self._service = None
+        self._lock.close()
+        self._lock = None
+        return result
+
+    async def checkpoint(self) -> bool:
+        """
+        Checkpoint the writer's graph.
+
+        Returns:
+            True if the snapshot was written
+        """
+        if self.is_writer:
+            return await self.local.checkpoint()
+        return await self._forward("checkpoint")
+
+    async def initialize_schema(self) -> bool:
+        """
+        Initialize the graph schema.
+
+        Returns:
+            True if successful
+        """
+        # No schema initialization needed for the in-memory writer
+        return True
+
+    # Writer role
+    def _take_lock(self) -> bool:
+        """Try to take the writer lock without waiting."""
+        lock = open(self.lock_file, 'a+')
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock.close()
+            return False
+        self._lock = lock
+        return True
+
+    async def _become_writer(self) -> bool:
+        """Load the graph, publish it and start serving readers."""
+        local = MemoryAdapter(self.data_path, **self.options)
+        if not await local.connect():
+            self._lock.close()
+            self._lock = None
+            return False
+
+        self.local = local
+        self._service = WriterService(local)
+        self.generation = None
+        if self._calls is not None:
+            self._calls.close()
+            self._calls = None
+
+        existing = list_generations(self.shared_path)
+        self._published_generation = generation_number(existing[-1]) if existing else 0
+        await self._publish()
+        self._start_listener()
+        self._closing = False
+        self._publisher = asyncio.create_task(self._publish_loop())
+        return True
+
+    async def _publish(self) -> None:
+        """Write a new generation, make it current and remove the oldest ones."""
+        number = self._published_generation + 1
+        name = generation_name(number)
+        meta = await write_generation(self.local, os.path.join(self.shared_path, name), number)
+        publish_current(self.shared_path, name)
+        self._published_generation = number
+        self._published_version = meta["graph_version"]
+
+        for old in list_generations(self.shared_path)[:-self.keep_generations]:
+            try:
+                os.unlink(os.path.join(self.shared_path, old))
+            except FileNotFoundError:
+                pass
+
+    async def _publish_loop(self) -> None:
+        """Publish whenever the graph has changed, at most once per publish_interval."""
+        while True:
+            await asyncio.sleep(self.publish_interval)
+            if self.local.snapshots.version == self._published_version:
+                continue
+            try:
+                await self._publish()
+            except Exception as e:
+                logger.error(f"Failed to publish graph generation: {e}")
+
+    def _start_listener(self) -> None:
+        """Listen for reader connections on a Unix socket in the shared directory."""
+        # Readers authenticate with a key that only users of the data directory can read
+        key = secrets.token_bytes(32)
+        tmp_key_file = self.key_file + ".tmp"
+        fd = os.open(tmp_key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+        os.replace(tmp_key_file, self.key_file)
+
+        # A socket left by a writer that crashed; the lock says it is gone
+        if os.path.exists(self.socket_file):
+            os.unlink(self.socket_file)
+        self._listener = Listener(self.socket_file, family="AF_UNIX", authkey=key)
+
+        loop = asyncio.get_running_loop()
+        threading.Thread(target=self._accept, args=(loop, key), name="graph-writer-accept",
+                         daemon=True).start()
+
+    def _accept(self, loop: asyncio.AbstractEventLoop, key: bytes) -> None:
+        """Accept reader connections and serve each on the event loop."""
+        while True:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError) as e:
+                if self._closing:
+                    return
+                logger.warning(f"Rejected graph reader connection: {e}")
+                continue
+            if self._closing:
+                conn.close()
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._serve_reader(conn), loop)
+            except RuntimeError:
+                # The event loop has already finished
+                conn.close()
+                return
+
+    async def _serve_reader(self, conn) -> None:
+        self._reader_conns.add(conn)
+        try:
+            await serve_requests(conn, self._service, "Graph writer")
+        finally:
+            self._reader_conns.discard(conn)
+            conn.close()
+
+    def _stop_listener(self) -> None:
+        """Stop accepting readers and hang up on the connected ones."""
+        self._closing = True
+        address = self._listener.address
+        try:
+            # accept() is not interrupted by closing the socket; connect once to wake it
+            with open(self.key_file, 'rb') as f:
+                Client(address, family="AF_UNIX", authkey=f.read()).close()
+        except (OSError, EOFError, AuthenticationError):
+            pass
+        self._listener.close()
+        self._listener = None
+        for conn in list(self._reader_conns):
+            _hang_up(conn)
+
+    # Reader role
+    async def _attach(self) -> bool:
+        """Wait for a published generation, taking over as writer if there is none."""
+        deadline = time.monotonic() + self.attach_timeout
+        while not self._refresh(force=True):
+            if self.role != "reader" and self._take_lock():
+                return await self._become_writer()
+            if time.monotonic() >= deadline:
+                logger.error(f"No graph generation was published within {self.attach_timeout}s")
+                return False
+            await asyncio.sleep(0.1)
+        return True
+
+    def _refresh(self, force: bool = False) -> bool:
+        """
+        Switch to the current generation if it has changed.
+
+        Returns:
+            True if a generation is mapped
+        """
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.refresh_interval:
+            return True
+        self._checked_at = now
+
+        name = read_current(self.shared_path)
+        if name is None or (self.generation is not None and os.path.basename(self.generation.path) == name):
+            return self.generation is not None
+        try:
+            generation = Generation(os.path.join(self.shared_path, name))
+        except FileNotFoundError:
+            # Already superseded and removed; the next check finds its successor
+            return self.generation is not None
+        # The previous mapping is released once no read still uses it
+        self.generation = generation
+        logger.debug(f"Attached to graph generation {generation.number}")
+        return True
+
+    def _reader(self) -> Generation:
+        self._refresh()
+        return self.generation
+
+    async def _writer_calls(self) -> RemoteCalls:
+        async with self._calls_lock:
+            if self._calls is None or self._calls.closed:
+                loop = asyncio.get_running_loop()
+                conn = await loop.run_in_executor(None, self._connect_writer)
+                self._calls = RemoteCalls(conn, "Graph writer")
+            return self._calls
+
+    def _connect_writer(self):
+        with open(self.key_file, 'rb') as f:
+            key = f.read()
+        return Client(self.socket_file, family="AF_UNIX", authkey=key)
+
+    async def _forward(self, operation: str, *args) -> Any:
+        """
+        Run a writer operation, from a reader by forwarding it.
+
+        If the writer cannot be reached, this process takes over as writer
+        when it can, and otherwise waits for another process to.
+
+        Args:
+            operation: Name of a WriterService operation
+            *args: Operation arguments
+
+        Returns:
+            The operation's result
+        """
+        deadline = time.monotonic() + self.attach_timeout
+        while True:
+            if self.is_writer:
+                return await getattr(self._service, operation)(*args)
+            try:
+                calls = await self._writer_calls()
+                return await calls.call(operation, *args)
+            except _UNREACHABLE as e:
+                self._calls = None
+                if time.monotonic() >= deadline:
+                    raise RemoteUnavailableError(f"Graph writer is unavailable: {e}")
+                if self.role != "reader" and self._take_lock():
+                    logger.warning("Graph writer went away, taking over")
+                    if not await self._become_writer():
+                        raise RemoteUnavailableError("Could not take over as graph writer")
+                else:
+                    await asyncio.sleep(0.1)
+
+    # Entity operations
+    async def create_entity(self, entity: Entity) -> str:
+        if self.is_writer:
+            return await self.local.create_entity(entity)
+        return await self._forward("create_entity", entity.to_dict())
+
+    async def create_entities(self, entities: List[Entity]) -> Dict[int, str]:
+        if self.is_writer:
+            return await self.local.create_entities(entities)
+        return await self._forward("create_entities", [entity.to_dict() for entity in entities])
+
+    async def get_entity(self, entity_id: str) -> Optional[Entity]:
+        if self.is_writer:
+            return await self.local.get_entity(entity_id)
+        return self._reader().entity(entity_id)
+
+    async def update_entity(self, entity: Entity) -> bool:
+        if self.is_writer:
+            return await self.local.update_entity(entity)
+        return await self._forward("update_entity", entity.to_dict())
+
+    async def delete_entity(self, entity_id: str) -> bool:
+        if self.is_writer:
+            return await self.local.delete_entity(entity_id)
+        return await self._forward("delete_entity", entity_id) is not None
+
+    # Relationship operations
+    async def create_relationship(self, relationship: Relationship) -> str:
+        if self.is_writer:
+            return await self.local.create_relationship(relationship)
+        return await self._forward("create_relationship", relationship.to_dict())
+
+    async def create_relationships(self, relationships: List[Relationship]) -> Dict[int, str]:
+        if self.is_writer:
+            return await self.local.create_relationships(relationships)
+        return await self._forward("create_relationships", [rel.to_dict() for rel in relationships])
+
+    async def get_relationship(self, relationship_id: str) -> Optional[Relationship]:
+        if self.is_writer:
+            return await self.local.get_relationship(relationship_id)
+        return self._reader().relationship(relationship_id)
+
+    async def update_relationship(self, relationship: Relationship) -> bool:
+        if self.is_writer:
+            return await self.local.update_relationship(relationship)
+        return await self._forward("update_relationship", relationship.to_dict())
+
+    async def delete_relationship(self, relationship_id: str) -> bool:
+        if self.is_writer:
+            return await self.local.delete_relationship(relationship_id)
+        return await self._forward("delete_relationship", relationship_id)
+
+    # Query operations
+    async def search_entities(self, query: str, entity_type: Optional[str] = None, limit: int = 10,
+                              match_mode: Optional[str] = None) -> List[Entity]:
+        """
+        Search for entities matching a query.
+
+        Readers scan the text sections of the mapped generation in place.
+
+        Args:
+            query: Search query
+            entity_type: Optional entity type filter
+            limit: Maximum number of results
+            match_mode: "substring" or "token" (defaults to the adapter's search_mode)
+
+        Returns:
+            List of matching entities
+        """
+        if self.is_writer:
+            return await self.local.search_entities(query, entity_type, limit, match_mode)
+
+        generation = self._reader()
+        query = (query or "").lower()
+        match_mode = match_mode or self.search_mode
+        if match_mode == "token":
+            query_tokens = tokenize(query)
+            if query_tokens:
+                indices = generation.find_tokens(query_tokens, entity_type, limit)
+            else:
+                # An empty query matches everything, as in substring mode
+                indices = generation.find_substring("", entity_type, limit)
+        elif match_mode == "substring":
+            indices = generation.find_substring(query, entity_type, limit)
+        else:
+            raise ValueError(f"Unsupported match mode: {match_mode}")
+        return [generation.entity_at(index) for index in indices]
+
+    async def get_entity_relationships(self, entity_id: str, relationship_type: Optional[str] = None,
+                                       direction: str = "both") -> List[Tuple[Relationship, Entity]]:
+        """
+        Get relationships for an entity.
+
+        Args:
+            entity_id: Entity ID
+            relationship_type: Optional relationship type filter
+            direction: Relationship direction ('outgoing', 'incoming', or 'both')
+
+        Returns:
+            List of (relationship, connected entity) tuples
+        """
+        if self.is_writer:
+            return await self.local.get_entity_relationships(entity_id, relationship_type, direction)
+
+        generation = self._reader()
+        node = generation.node_index(entity_id)
+        if node is None:
+            return []
+        type_code = generation.relationship_type_code(relationship_type) if relationship_type else None
+        if relationship_type and type_code is None:
+            return []
+
+        edges = []
+        if direction in ["outgoing", "both"]:
+            out_edges = generation.out_edges(node)
+            edges.extend(zip(out_edges.tolist(), generation.edge_target[out_edges].tolist()))
+        if direction in ["incoming", "both"]:
+            in_edges = generation.in_edges_of(node)
+            edges.extend(zip(in_edges.tolist(), generation.edge_source[in_edges].tolist()))
+
+        results = []
+        for edge, other in edges:
+            if type_code is not None and generation.edge_type[edge] != type_code:
+                continue
+            other_entity = generation.entity_at(other)
+            if other_entity:
+                results.append((generation.relationship_at(edge), other_entity))
+        return results
+
+    async def execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        logger.warning(f"Raw query execution not supported in shared adapter. Query: {query}")
+        return []
+
+    # Path operations
+    async def find_paths(self, source_id: str, target_id: str, max_depth: int = 3, max_paths: Optional[int] = 10,
+                         weighted: bool = False,
+                         relationship_types: Optional[List[str]] = None) -> List[List[Union[Entity, Relationship]]]:
+        """
+        Find simple directed paths between two entities, shortest first.
+
+        Readers search the adjacency and confidence arrays of the mapped
+        generation.
+
+        Args:
+            source_id: Source entity ID
+            target_id: Target entity ID
+            max_depth: Maximum number of relationships in a path
+            max_paths: Maximum number of paths to return, or None for all
+            weighted: Return the most confident paths first, by the product
+                of their relationships' confidences, instead of the shortest
+            relationship_types: Relationship types a path may use, or None for all
+
+        Returns:
+            List of paths, where each path is a list of alternating Entity and Relationship objects
+        """
+        if self.is_writer:
+            return await self.local.find_paths(source_id, target_id, max_depth, max_paths, weighted,
+                                               relationship_types)
+
+        generation = self._reader()
+        source = generation.node_index(source_id)
+        target = generation.node_index(target_id)
+        if source is None or target is None:
+            logger.debug(f"Cannot find path: source {source_id} or target {target_id} not found")
+            return []
+        if max_paths is not None and max_paths < 1:
+            return []
+        type_codes = None
+        if relationship_types:
+            type_codes = {generation.relationship_type_code(name) for name in relationship_types} - {None}
+            if not type_codes:
+                return []
+
+        def successors(node: int):
+            out_edges = generation.out_edges(node)
+            return [(edge, other) for edge, other in zip(out_edges.tolist(), generation.edge_target[out_edges].tolist())
+                    if type_codes is None or generation.edge_type[edge] in type_codes]
+
+        def predecessors(node: int):
+            in_edges = generation.in_edges_of(node)
+            return [(edge, other) for edge, other in zip(in_edges.tolist(), generation.edge_source[in_edges].tolist())
+                    if type_codes is None or generation.edge_type[edge] in type_codes]
+
+        if weighted:
+            confidences = generation.edge_confidence
+            found = iter_weighted_paths(successors, predecessors, source, target, max_depth,
+                                        lambda edge: confidence_cost(float(confidences[edge])))
+        else:
+            found = iter_simple_paths(successors, predecessors, source, target, max_depth)
+        paths = []
+        try:
+            async for path_nodes, path_relationships in found:
+                path = [generation.entity_at(path_nodes[0])]
+                for edge_index, node in zip(path_relationships, path_nodes[1:]):
+                    path.append(generation.relationship_at(edge_index))
+                    path.append(generation.entity_at(node))
+                paths.append(path)
+                if len(paths) == max_paths:
+                    break
+        finally:
+            await found.aclose()
+        logger.debug(f"Found {len(paths)} paths between {source_id} and {target_id}")
+        return paths
+
+    # Property index operations
+    async def create_property_index(self, name: str, kind: str = "hash") -> bool:
+        if self.is_writer:
+            return await self.local.create_property_index(name, kind)
+        return await self._forward("create_property_index", name, kind)
+
+    async def drop_property_index(self, name: str) -> bool:
+        if self.is_writer:
+            return await self.local.drop_property_index(name)
+        return await self._forward("drop_property_index", name)
+
+    async def list_property_indexes(self) -> List[Dict[str, Any]]:
+        if self.is_writer:
+            return await self.local.list_property_indexes()
+        return list(self._reader().meta["property_indexes"])
+
+    async def find_entities_by_property(self, name: str, value: Any = None, min_value: Any = None,
+                                        max_value: Any = None, entity_type: Optional[str] = None,
+                                        limit: int = 100) -> List[Entity]:
+        """
+        Find entities whose property equals a value or lies in an inclusive range.
+
+        Readers scan the entities of the mapped generation.
+
+        Args:
+            name: Property name
+            value: Required value (omit for a range query)
+            min_value: Inclusive lower bound
+            max_value: Inclusive upper bound
+            entity_type: Optional entity type filter
+            limit: Maximum number of results
+
+        Returns:
+            List of matching entities, in ascending value order for range queries
+        """
+        if self.is_writer:
+            return await self.local.find_entities_by_property(name, value, min_value, max_value,
+                                                              entity_type, limit)
+
+        generation = self._reader()
+        if value is not None:
+            return find_entities(PropertyIndexes(), name, generation.entity,
+                                 lambda: generation.iter_entities(entity_type), value,
+                                 min_value, max_value, entity_type, limit)
+
+        # Take the lowest values, as a sorted index on the writer would
+        entities = find_entities(PropertyIndexes(), name, generation.entity,
+                                 lambda: generation.iter_entities(entity_type), None,
+                                 min_value, max_value, entity_type, generation.node_count)
+        entities.sort(key=lambda entity: (sort_key(property_value(entity, name)), entity.entity_id))
+        return entities[:limit]
+
+    # Count operations
+    async def count_entities(self) -> int:
+        if self.is_writer:
+            return await self.local.count_entities()
+        return self._reader().meta["nodes"]
+
+    async def count_relationships(self) -> int:
+        if self.is_writer:
+            return await self.local.count_relationships()
+        return self._reader().meta["relationships"]
+
+    async def get_status(self) -> Dict[str, Any]:
+        """
+        Get adapter status, including the role of this process.
+
+        Returns:
+            Status information dictionary
+        """
+        status = {
+            "adapter": "shared",
+            "connected": self.is_connected,
+            "role": "writer" if self.is_writer else "reader",
+            "publish_interval": self.publish_interval
+        }
+        if self.is_writer:
+            status["generation"] = self._published_generation
+            status["published_version"] = self._published_version
+            status["readers"] = len(self._reader_conns)
+            status["writer"] = await self.local.get_status()
+        elif self.generation is not None:
+            generation = self._reader()
+            status["generation"] = generation.number
+            status["graph_version"] = generation.graph_version
+            status["entities"] = generation.meta["entities"]
+            status["relationships"] = generation.meta["relationships"]
+        return status
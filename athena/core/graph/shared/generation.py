@@ -0,0 +1,514 @@
+"""
+Shared Graph Generations for Athena
+
+Provides the immutable, memory-mappable file format a writer publishes the
+graph in and reader processes attach to.
+
+Layout:
+    header:  MAGIC (8 bytes) | version (uint32) | metadata length (uint32)
+    meta:    JSON object: counts, type names, property index definitions
+             and the offset, dtype and length of every section
+    data:    8-byte aligned sections, each either a NumPy array or a blob
+
+Nodes and edges are addressed by dense integer indices. Edges are stored
+grouped by source node, so the outgoing adjacency of node i is the edge
+range out_offsets[i]:out_offsets[i + 1]; in_edges lists the edges grouped
+by target in the same way. IDs are looked up through a sorted array of
+64-bit ID hashes. Entities and relationships are stored as marshal-encoded
+snapshot records and only decoded when read.
+
+For search, each entity's lower-cased text fields are kept in a text
+blob, and two posting tables, from trigrams and from tokens to the nodes
+containing them, mirror the memory adapter's search indexes. Substring
+candidates are confirmed against the entity's text in place with
+mmap.find().
+
+A reader maps the file read-only, so every process attached to the same
+generation shares one copy of it in the page cache.
+"""
+
+import os
+import json
+import mmap
+import zlib
+import struct
+import marshal
+import asyncio
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ...entity import Entity
+from ...relationship import Relationship
+from ..memory.mvcc import pinned_snapshot, YIELD_EVERY
+from ..memory.search_index import tokenize, trigrams, entity_text_fields
+from ..memory.snapshot_format import (
+    entity_to_record,
+    entity_from_record,
+    relationship_to_record,
+    relationship_from_record
+)
+
+logger = logging.getLogger("athena.graph.shared.generation")
+
+MAGIC = b"ATHGEN\x00\x00"
+VERSION = 2
+
+HEADER = struct.Struct(">8sII")
+
+CURRENT_FILE = "CURRENT"
+GENERATION_PREFIX = "gen-"
+GENERATION_SUFFIX = ".graph"
+
+# Separates the text fields of one entity so a match cannot span two of them
+FIELD_SEPARATOR = "\x00"
+
+def id_hash(value: str) -> int:
+    """Get the 64-bit lookup hash of an ID."""
+    data = value.encode("utf-8")
+    return (zlib.crc32(data) << 32) | zlib.adler32(data)
+
+def generation_name(number: int) -> str:
+    """Get the file name of a generation."""
+    return f"{GENERATION_PREFIX}{number:08d}{GENERATION_SUFFIX}"
+
+def generation_number(name: str) -> int:
+    """Get the number of a generation from its file name."""
+    return int(name[len(GENERATION_PREFIX):-len(GENERATION_SUFFIX)])
+
+def _blob(items: List[bytes]) -> Tuple[bytes, np.ndarray]:
+    """Concatenate byte strings and compute their offsets."""
+    offsets = np.zeros(len(items) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in items], out=offsets[1:])
+    return b"".join(items), offsets
+
+def _hash_table(ids: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Build the sorted hash array and permutation used to look IDs up."""
+    hashes = np.fromiter((id_hash(value) for value in ids), dtype=np.uint64, count=len(ids))
+    order = np.argsort(hashes, kind="stable").astype(np.int32)
+    return hashes[order], order
+
+def _posting_table(name: str, postings: Dict[str, List[int]]) -> Dict[str, Any]:
+    """
+    Build the sections of a posting table: keys looked up by hash, each with
+    an ascending list of node indices.
+    """
+    keys = list(postings)
+    hashes, order = _hash_table(keys)
+    ordered = [keys[index] for index in order.tolist()]
+    key_blob, key_offsets = _blob([key.encode("utf-8") for key in ordered])
+    lists = [postings[key] for key in ordered]
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum([len(nodes) for nodes in lists], out=offsets[1:])
+    nodes = np.fromiter((node for entries in lists for node in entries), dtype=np.int32, count=int(offsets[-1]))
+    return {
+        f"{name}_hashes": hashes,
+        f"{name}_key_offsets": key_offsets,
+        f"{name}_key_blob": key_blob,
+        f"{name}_offsets": offsets,
+        f"{name}_nodes": nodes
+    }
+
+async def write_generation(adapter, path: str, number: int) -> Dict[str, Any]:
+    """
+    Write the graph of a memory adapter as a generation file.
+
+    The graph is read from a pinned snapshot, so writes continue while the
+    file is built, and none of them are partially included.
+
+    Args:
+        adapter: MemoryAdapter to publish
+        path: Destination file; written to a temporary name and renamed into place
+        number: Generation number
+
+    Returns:
+        The generation's metadata
+    """
+    with pinned_snapshot(adapter) as snapshot:
+        graph_version = snapshot.version
+        node_ids = snapshot.node_ids()
+        node_index = {node_id: index for index, node_id in enumerate(node_ids)}
+
+        entity_types: Dict[str, int] = {}
+        entity_payloads: List[bytes] = []
+        node_type = np.full(len(node_ids), -1, dtype=np.int32)
+        texts: List[bytes] = []
+        trigram_postings: Dict[str, List[int]] = {}
+        token_postings: Dict[str, List[int]] = {}
+        entity_count = 0
+        for index, node_id in enumerate(node_ids):
+            entity = snapshot.entity(node_id)
+            if entity is None:
+                # Endpoint of a relationship whose entity does not exist
+                entity_payloads.append(b"")
+                texts.append(b"")
+            else:
+                entity_count += 1
+                entity_payloads.append(marshal.dumps(entity_to_record(entity)))
+                node_type[index] = entity_types.setdefault(entity.entity_type, len(entity_types))
+                fields = [text.lower() for text in entity_text_fields(entity)]
+                texts.append((FIELD_SEPARATOR.join(fields) + FIELD_SEPARATOR).encode("utf-8"))
+                for token in {token for field in fields for token in tokenize(field)}:
+                    token_postings.setdefault(token, []).append(index)
+                for trigram in set().union(*(trigrams(field) for field in fields)):
+                    trigram_postings.setdefault(trigram, []).append(index)
+            if (index + 1) % YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+
+        relationship_types: Dict[str, int] = {}
+        edge_ids: List[str] = []
+        edge_source: List[int] = []
+        edge_target: List[int] = []
+        edge_type: List[int] = []
+        edge_confidence: List[float] = []
+        edge_payloads: List[bytes] = []
+        out_counts = np.zeros(len(node_ids), dtype=np.int64)
+        since_yield = 0
+        for index, node_id in enumerate(node_ids):
+            out_edges = snapshot.out_edges(node_id)
+            for target, relationship_id, relationship in out_edges:
+                if relationship is None:
+                    continue
+                edge_ids.append(relationship_id)
+                edge_source.append(index)
+                edge_target.append(node_index[target])
+                edge_type.append(relationship_types.setdefault(relationship.relationship_type,
+                                                               len(relationship_types)))
+                edge_confidence.append(relationship.confidence)
+                edge_payloads.append(marshal.dumps(relationship_to_record(relationship, node_index)))
+                out_counts[index] += 1
+            since_yield += len(out_edges) + 1
+            if since_yield >= YIELD_EVERY:
+                since_yield = 0
+                await asyncio.sleep(0)
+
+        property_indexes = adapter.property_indexes.describe()
+
+    targets = np.array(edge_target, dtype=np.int32)
+    out_offsets = np.zeros(len(node_ids) + 1, dtype=np.int64)
+    np.cumsum(out_counts, out=out_offsets[1:])
+    in_edges = np.argsort(targets, kind="stable").astype(np.int32)
+    in_offsets = np.zeros(len(node_ids) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(targets, minlength=len(node_ids)), out=in_offsets[1:])
+    node_hashes, node_order = _hash_table(node_ids)
+    edge_hashes, edge_order = _hash_table(edge_ids)
+
+    node_id_blob, node_id_offsets = _blob([node_id.encode("utf-8") for node_id in node_ids])
+    edge_id_blob, edge_id_offsets = _blob([edge_id.encode("utf-8") for edge_id in edge_ids])
+    entity_blob, entity_offsets = _blob(entity_payloads)
+    edge_blob, edge_offsets = _blob(edge_payloads)
+    text_blob, text_offsets = _blob(texts)
+
+    sections = {
+        "node_id_offsets": node_id_offsets,
+        "node_id_blob": node_id_blob,
+        "node_hashes": node_hashes,
+        "node_order": node_order,
+        "node_type": node_type,
+        "entity_offsets": entity_offsets,
+        "entity_blob": entity_blob,
+        "text_offsets": text_offsets,
+        "text_blob": text_blob,
+        **_posting_table("trigram", trigram_postings),
+        **_posting_table("token", token_postings),
+        "edge_id_offsets": edge_id_offsets,
+        "edge_id_blob": edge_id_blob,
+        "edge_hashes": edge_hashes,
+        "edge_order": edge_order,
+        "edge_source": np.array(edge_source, dtype=np.int32),
+        "edge_target": targets,
+        "edge_type": np.array(edge_type, dtype=np.int32),
+        "edge_confidence": np.array(edge_confidence, dtype=np.float64),
+        "edge_offsets": edge_offsets,
+        "edge_blob": edge_blob,
+        "out_offsets": out_offsets,
+        "in_offsets": in_offsets,
+        "in_edges": in_edges
+    }
+    meta = {
+        "generation": number,
+        "graph_version": graph_version,
+        "nodes": len(node_ids),
+        "entities": entity_count,
+        "relationships": len(edge_ids),
+        "entity_types": list(entity_types),
+        "relationship_types": list(relationship_types),
+        "property_indexes": property_indexes
+    }
+
+    await asyncio.get_running_loop().run_in_executor(None, _write_file, path, meta, sections)
+    logger.info(f"Published generation {number} ({entity_count} entities, {len(edge_ids)} relationships)")
+    return meta
+
+def _write_file(path: str, meta: Dict[str, Any], sections: Dict[str, Any]) -> None:
+    """Lay out the sections after the header and write the file atomically."""
+    # The section table is part of the metadata, so its size fixes where the data starts
+    layout = {name: [0, "bytes" if isinstance(data, bytes) else data.dtype.str, len(data)]
+              for name, data in sections.items()}
+    while True:
+        meta["sections"] = layout
+        encoded = json.dumps(meta).encode("utf-8")
+        offset = _align(HEADER.size + len(encoded))
+        changed = False
+        for name, data in sections.items():
+            if layout[name][0] != offset:
+                layout[name][0] = offset
+                changed = True
+            size = len(data) if isinstance(data, bytes) else data.nbytes
+            offset = _align(offset + size)
+        if not changed:
+            break
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(encoded)))
+        f.write(encoded)
+        for name, data in sections.items():
+            f.write(b"\x00" * (layout[name][0] - f.tell()))
+            f.write(data if isinstance(data, bytes) else data.tobytes())
+    os.replace(tmp_path, path)
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+def publish_current(directory: str, name: str) -> None:
+    """Point the CURRENT file of a directory at a generation."""
+    tmp_path = os.path.join(directory, CURRENT_FILE + ".tmp")
+    with open(tmp_path, 'w') as f:
+        f.write(name + "\n")
+    os.replace(tmp_path, os.path.join(directory, CURRENT_FILE))
+
+def read_current(directory: str) -> Optional[str]:
+    """Get the name of the current generation, or None if none was published."""
+    try:
+        with open(os.path.join(directory, CURRENT_FILE), 'r') as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+def list_generations(directory: str) -> List[str]:
+    """List the generation files of a directory, oldest first."""
+    return sorted(name for name in os.listdir(directory)
+                  if name.startswith(GENERATION_PREFIX) and name.endswith(GENERATION_SUFFIX))
+
+class _NodeIds(Sequence):
+    """The node IDs of a generation as a lazily decoded sequence."""
+
+    def __init__(self, generation: "Generation"):
+        self.generation = generation
+
+    def __getitem__(self, index):
+        return self.generation.node_id(index)
+
+    def __len__(self):
+        return self.generation.node_count
+
+class Generation:
+    """
+    A published generation, mapped read-only.
+
+    Decoded entities and relationships are new objects on every read, so
+    callers may modify them freely.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a generation file.
+
+        Args:
+            path: Generation file
+
+        Raises:
+            ValueError: If the file is not a generation of this version
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, meta_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} graph generation: {path}")
+        self.meta = json.loads(self._map[HEADER.size:HEADER.size + meta_length])
+        self.number = self.meta["generation"]
+        self.graph_version = self.meta["graph_version"]
+        self.node_count = self.meta["nodes"]
+        self.entity_types = self.meta["entity_types"]
+        self.relationship_types = self.meta["relationship_types"]
+
+        # NumPy arrays are views into the mapping; blobs are (start, end) ranges
+        self._blobs: Dict[str, Tuple[int, int]] = {}
+        for name, (offset, dtype, length) in self.meta["sections"].items():
+            if dtype == "bytes":
+                self._blobs[name] = (offset, offset + length)
+            else:
+                setattr(self, name, np.frombuffer(self._map, dtype=np.dtype(dtype), count=length, offset=offset))
+        self._node_ids = _NodeIds(self)
+
+    def _slice(self, blob: str, offsets: np.ndarray, index: int) -> bytes:
+        start = self._blobs[blob][0]
+        return self._map[start + int(offsets[index]):start + int(offsets[index + 1])]
+
+    def _find(self, hashes: np.ndarray, order: Optional[np.ndarray], key_of, value: str) -> Optional[int]:
+        """Look a key up in a hash table, confirming the key to rule out collisions."""
+        digest = np.uint64(id_hash(value))
+        position = int(np.searchsorted(hashes, digest))
+        while position < len(hashes) and hashes[position] == digest:
+            index = int(order[position]) if order is not None else position
+            if key_of(index) == value:
+                return index
+            position += 1
+        return None
+
+    def postings(self, table: str, key: str) -> np.ndarray:
+        """Get the ascending node indices listed under a key of the "trigram" or "token" table."""
+        key_offsets = getattr(self, f"{table}_key_offsets")
+        key_of = lambda index: self._slice(f"{table}_key_blob", key_offsets, index).decode("utf-8")
+        index = self._find(getattr(self, f"{table}_hashes"), None, key_of, key)
+        if index is None:
+            return np.empty(0, dtype=np.int32)
+        offsets = getattr(self, f"{table}_offsets")
+        return getattr(self, f"{table}_nodes")[offsets[index]:offsets[index + 1]]
+
+    # Nodes and entities
+    def node_id(self, index: int) -> str:
+        return self._slice("node_id_blob", self.node_id_offsets, index).decode("utf-8")
+
+    def node_index(self, node_id: str) -> Optional[int]:
+        """Get the index of a node, or None if the generation does not have it."""
+        return self._find(self.node_hashes, self.node_order, self.node_id, node_id)
+
+    def entity_at(self, index: int) -> Optional[Entity]:
+        """Decode the entity of a node, or None for a node without one."""
+        payload = self._slice("entity_blob", self.entity_offsets, index)
+        return entity_from_record(marshal.loads(payload)) if payload else None
+
+    def entity(self, entity_id: str) -> Optional[Entity]:
+        index = self.node_index(entity_id)
+        return self.entity_at(index) if index is not None else None
+
+    def entity_indices(self, entity_type: Optional[str] = None) -> np.ndarray:
+        """Get the indices of the nodes that hold an entity, optionally of one type."""
+        if entity_type is None:
+            return np.flatnonzero(self.node_type >= 0)
+        if entity_type not in self.entity_types:
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero(self.node_type == self.entity_types.index(entity_type))
+
+    def iter_entities(self, entity_type: Optional[str] = None) -> Iterator[Entity]:
+        for index in self.entity_indices(entity_type).tolist():
+            yield self.entity_at(index)
+
+    # Edges and relationships
+    def edge_id(self, edge: int) -> str:
+        return self._slice("edge_id_blob", self.edge_id_offsets, edge).decode("utf-8")
+
+    def edge_index(self, relationship_id: str) -> Optional[int]:
+        return self._find(self.edge_hashes, self.edge_order, self.edge_id, relationship_id)
+
+    def relationship_at(self, edge: int) -> Relationship:
+        payload = self._slice("edge_blob", self.edge_offsets, edge)
+        return relationship_from_record(marshal.loads(payload), self._node_ids)
+
+    def relationship(self, relationship_id: str) -> Optional[Relationship]:
+        edge = self.edge_index(relationship_id)
+        return self.relationship_at(edge) if edge is not None else None
+
+    def out_edges(self, node: int) -> np.ndarray:
+        """Get the edges leaving a node, in insertion order."""
+        return np.arange(self.out_offsets[node], self.out_offsets[node + 1], dtype=np.int64)
+
+    def in_edges_of(self, node: int) -> np.ndarray:
+        """Get the edges entering a node."""
+        return self.in_edges[self.in_offsets[node]:self.in_offsets[node + 1]]
+
+    def relationship_type_code(self, relationship_type: str) -> Optional[int]:
+        if relationship_type not in self.relationship_types:
+            return None
+        return self.relationship_types.index(relationship_type)
+
+    # Search
+    def find_substring(self, query: str, entity_type: Optional[str], limit: int) -> List[int]:
+        """
+        Find entities whose name, aliases or string properties contain a string.
+
+        Args:
+            query: Lower-cased query
+            entity_type: Optional entity type filter
+            limit: Maximum number of results
+
+        Returns:
+            Node indices in generation order
+        """
+        if not query:
+            return self.entity_indices(entity_type)[:limit].tolist()
+        type_code = self._type_code(entity_type)
+        if type_code is None:
+            return []
+
+        pattern = query.encode("utf-8")
+        start, end = self._blobs["text_blob"]
+        results = []
+        if len(query) < 3:
+            # Too short to form a trigram, scan the text of every entity
+            position = self._map.find(pattern, start, end)
+            while position >= 0 and len(results) < limit:
+                index = int(np.searchsorted(self.text_offsets, position - start, side="right")) - 1
+                if type_code < 0 or self.node_type[index] == type_code:
+                    results.append(index)
+                # Continue after this entity's text
+                position = self._map.find(pattern, start + int(self.text_offsets[index + 1]), end)
+            return results
+
+        # Narrow the candidates with the trigram postings, rarest first, then verify each one
+        postings = sorted((self.postings("trigram", trigram) for trigram in trigrams(query)), key=len)
+        candidates = postings[0]
+        for other in postings[1:]:
+            if len(candidates) <= 64:
+                # Verifying a few candidates is cheaper than intersecting long lists
+                break
+            candidates = np.intersect1d(candidates, other, assume_unique=True)
+        if type_code >= 0:
+            candidates = candidates[self.node_type[candidates] == type_code]
+
+        offsets = self.text_offsets
+        for index in candidates.tolist():
+            if self._map.find(pattern, start + int(offsets[index]), start + int(offsets[index + 1])) >= 0:
+                results.append(index)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def find_tokens(self, query_tokens: List[str], entity_type: Optional[str], limit: int) -> List[int]:
+        """
+        Find the entities matching the most query tokens.
+
+        Entities matching every token come first, then partial matches by
+        descending number of matched tokens.
+
+        Args:
+            query_tokens: Tokens to look up
+            entity_type: Optional entity type filter
+            limit: Maximum number of results
+
+        Returns:
+            Node indices
+        """
+        type_code = self._type_code(entity_type)
+        if type_code is None:
+            return []
+
+        matches = np.concatenate([self.postings("token", token) for token in set(query_tokens)])
+        if type_code >= 0:
+            matches = matches[self.node_type[matches] == type_code]
+        indices, counts = np.unique(matches, return_counts=True)
+        # Stable, so equally good matches stay in generation order
+        best = np.argsort(-counts, kind="stable")[:limit]
+        return indices[best].tolist()
+
+    def _type_code(self, entity_type: Optional[str]) -> Optional[int]:
+        """Get the code of an entity type filter: -1 for none, None if no entity has the type."""
+        if not entity_type:
+            return -1
+        if entity_type not in self.entity_types:
+            return None
+        return self.entity_types.index(entity_type)
@@ -5,6 +5,7 @@ This module provides tool definitions for the Athena MCP service,
 using the FastMCP decorator-based approach.
 """
 
+import math
 import logging
 import asyncio
 from typing import Dict, List, Any, Optional, Union
@@ -250,6 +251,8 @@ async def find_entity_paths(
     target_id: str,
     max_depth: int = 3,
     relationship_types: Optional[List[str]] = None,
+    max_paths: int = 10,
+    weighted: bool = False,
     entity_manager: Optional[Any] = None
 ) -> Dict[str, Any]:
     """
@@ -258,12 +261,16 @@ async def find_entity_paths(
     Args:
         source_id: ID of the source entity
         target_id: ID of the target entity
-        max_depth: Maximum path depth
-        relationship_types: Optional list of relationship types to consider
+        max_depth: Maximum number of relationships in a path
+        relationship_types: Optional list of relationship types; only paths
+            using these types are searched for
+        max_paths: Maximum number of paths to find (the k of a top-k query)
+        weighted: Rank paths by the product of their relationships'
+            confidences instead of by length
         entity_manager: Entity manager to use (injected)
         
     Returns:
-        Paths between entities
+        Paths between entities, each with its confidence
     """
     if not entity_manager:
         return {
@@ -272,16 +279,20 @@ async def find_entity_paths(
         
     try:
         # Find paths
-        paths = await entity_manager.engine.find_paths(
+        paths = await entity_manager.engine.find_path(
             source_id, 
             target_id,
             max_depth=max_depth,
+            max_paths=max_paths,
+            weighted=weighted,
             relationship_types=relationship_types
         )
         
         # Format results
         formatted_paths = []
+        confidences = []
         for path in paths:
+            confidences.append(math.prod(rel.confidence for rel in path[1::2]))
             formatted_path = []
             
             for i, item in enumerate(path):
@@ -310,8 +321,10 @@ async def find_entity_paths(
             "target_id": target_id,
             "max_depth": max_depth,
             "relationship_types": relationship_types,
+            "weighted": weighted,
             "count": len(formatted_paths),
-            "paths": formatted_paths
+            "paths": formatted_paths,
+            "confidences": confidences
         }
     except Exception as e:
         logger.error(f"Error finding entity paths: {e}")
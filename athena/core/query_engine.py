@@ -183,12 +183,15 @@ class QueryEngine:
         context_items = []
         entity_relationships = {}
         
+        # Get direct relationships of all entities in one batch
+        relationships_by_entity = await self.engine.get_relationships_for_entities(
+            [entity.entity_id for entity in entities],
+            direction="both",
+            per_entity_limit=10  # Limit relationships per entity
+        )
+        
         for entity in entities:
-            # Get direct relationships
-            relationships = await self.engine.get_entity_relationships(
-                entity.entity_id,
-                direction="both"
-            )
+            relationships = relationships_by_entity.get(entity.entity_id, [])
             
             # Store relationship data
             entity_relationships[entity.entity_id] = [
@@ -204,7 +207,7 @@ class QueryEngine:
                         "entity_type": connected.entity_type
                     }
                 }
-                for rel, connected in relationships[:10]  # Limit relationships per entity
+                for rel, connected in relationships
             ]
             
             # Add entity data
@@ -301,11 +304,17 @@ class QueryEngine:
                 source = entry_entities[i]
                 target = entry_entities[j]
                 
+                # Skip pairs the reachability index already rules out
+                lower, _ = await self.engine.distance_bounds(source.entity_id, target.entity_id)
+                if lower > parameters.relationship_depth:
+                    continue
+                    
                 # Find paths between these entities
-                entity_paths = await self.engine.find_paths(
+                entity_paths = await self.engine.find_path(
                     source.entity_id,
                     target.entity_id,
-                    max_depth=parameters.relationship_depth
+                    max_depth=parameters.relationship_depth,
+                    max_paths=parameters.max_relationships
                 )
                 
                 if entity_paths:
@@ -313,15 +322,18 @@ class QueryEngine:
                     
         # If we found no paths, try extending from each entry entity individually
         if not paths:
+            # Get direct relationships of all entry entities in one batch
+            relationships_by_entity = await self.engine.get_relationships_for_entities(
+                [entity.entity_id for entity in entry_entities],
+                direction="both",
+                per_entity_limit=parameters.max_relationships // len(entry_entities)
+            )
+            
             for entity in entry_entities:
-                # Get direct relationships for this entity
-                relationships = await self.engine.get_entity_relationships(
-                    entity.entity_id,
-                    direction="both"
-                )
+                relationships = relationships_by_entity.get(entity.entity_id, [])
                 
                 # Convert to path format
-                for relationship, connected_entity in relationships[:parameters.max_relationships // len(entry_entities)]:
+                for relationship, connected_entity in relationships:
                     # Create a simple path with just one relationship
                     if relationship.source_id == entity.entity_id:
                         path = [entity, relationship, connected_entity]
@@ -4,9 +4,11 @@ Athena Relationship Module
 Provides relationship management capabilities for the knowledge graph.
 """
 
+import sys
 import uuid
 from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime
+
+from . import timestamps
 
 class Relationship:
     """
@@ -14,8 +16,24 @@ class Relationship:
     
     Relationships connect entities and provide structured knowledge about
     how entities relate to each other.
+    
+    Instances are slotted; type and source strings are interned and
+    timestamps are held as integer microseconds, formatted on access.
     """
     
+    __slots__ = (
+        "relationship_id",
+        "relationship_type",
+        "source_id",
+        "target_id",
+        "properties",
+        "confidence",
+        "source",
+        "is_directional",
+        "_created_at",
+        "_updated_at"
+    )
+    
     def __init__(self, 
                 relationship_id: Optional[str] = None,
                 relationship_type: str = "generic",
@@ -37,16 +55,34 @@ class Relationship:
             source: Source of the relationship information
         """
         self.relationship_id = relationship_id or str(uuid.uuid4())
-        self.relationship_type = relationship_type
+        self.relationship_type = sys.intern(relationship_type) if isinstance(relationship_type, str) else relationship_type
         self.source_id = source_id
         self.target_id = target_id
         self.properties = properties or {}
         self.confidence = max(0.0, min(1.0, confidence))  # Clamp between 0 and 1
-        self.source = source
-        self.created_at = datetime.utcnow().isoformat()
-        self.updated_at = self.created_at
+        self.source = sys.intern(source) if isinstance(source, str) else source
+        self._created_at = timestamps.now()
+        self._updated_at = self._created_at
         self.is_directional = True  # Most relationships are directional
         
+    @property
+    def created_at(self) -> str:
+        """Creation time as an ISO 8601 string."""
+        return timestamps.to_iso(self._created_at)
+        
+    @created_at.setter
+    def created_at(self, value) -> None:
+        self._created_at = timestamps.to_compact(value)
+        
+    @property
+    def updated_at(self) -> str:
+        """Last update time as an ISO 8601 string."""
+        return timestamps.to_iso(self._updated_at)
+        
+    @updated_at.setter
+    def updated_at(self, value) -> None:
+        self._updated_at = timestamps.to_compact(value)
+        
     def add_property(self, key: str, value: Any, confidence: float = 1.0) -> None:
         """
         Add or update a property for this relationship.
@@ -56,12 +92,13 @@ class Relationship:
             value: Property value
             confidence: Confidence in this property (0.0 to 1.0)
         """
+        now = timestamps.now()
         self.properties[key] = {
             "value": value,
             "confidence": max(0.0, min(1.0, confidence)),
-            "updated_at": datetime.utcnow().isoformat()
+            "updated_at": timestamps.to_iso(now)
         }
-        self.updated_at = datetime.utcnow().isoformat()
+        self._updated_at = now
         
     def get_property(self, key: str) -> Optional[Any]:
         """
@@ -139,8 +176,10 @@ class Relationship:
             source=data.get("source", "system")
         )
         
-        relationship.created_at = data.get("created_at", relationship.created_at)
-        relationship.updated_at = data.get("updated_at", relationship.updated_at)
+        if "created_at" in data:
+            relationship.created_at = data["created_at"]
+        if "updated_at" in data:
+            relationship.updated_at = data["updated_at"]
         relationship.is_directional = data.get("is_directional", True)
         
         return relationship
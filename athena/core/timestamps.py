@@ -0,0 +1,69 @@
+"""
+Athena Timestamp Module
+
+Provides the compact timestamp representation shared by entities and
+relationships. Timestamps are kept as integer microseconds since the Unix
+epoch (UTC) and only formatted as ISO 8601 strings when they are read.
+"""
+
+import time
+from datetime import datetime, timedelta
+from typing import Union
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Compact form: int microseconds, or the original string when it cannot be
+# represented losslessly as one (e.g. values carrying a UTC offset)
+Timestamp = Union[int, str]
+
+def now() -> int:
+    """
+    Get the current UTC time in compact form.
+
+    Returns:
+        Microseconds since the Unix epoch
+    """
+    return time.time_ns() // 1000
+
+def to_compact(value: Union[Timestamp, datetime]) -> Timestamp:
+    """
+    Convert an ISO 8601 string or naive UTC datetime to compact form.
+
+    Strings that would not format back to exactly the same text are kept
+    as they are, so round-tripping through to_dict() never alters data.
+
+    Args:
+        value: ISO string, naive UTC datetime or compact timestamp
+
+    Returns:
+        Compact timestamp
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, datetime):
+        return _micros(value)
+    try:
+        micros = _micros(datetime.fromisoformat(value))
+    except (TypeError, ValueError, OverflowError):
+        return value
+    return micros if to_iso(micros) == value else value
+
+def to_iso(value: Timestamp) -> str:
+    """
+    Format a compact timestamp as an ISO 8601 string.
+
+    Args:
+        value: Compact timestamp
+
+    Returns:
+        ISO string in the format produced by datetime.isoformat()
+    """
+    if isinstance(value, int):
+        return (_EPOCH + timedelta(microseconds=value)).isoformat()
+    return value
+
+def _micros(dt: datetime) -> int:
+    if dt.tzinfo is not None:
+        raise ValueError("Only naive UTC datetimes can be stored compactly")
+    delta = dt - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
@@ -400,6 +400,11 @@ class HermesKnowledgeAdapter:
                 if source.entity_id == target.entity_id:
                     continue
                     
+                # Skip pairs the reachability index already rules out
+                lower, _ = await self.engine.distance_bounds(source.entity_id, target.entity_id)
+                if lower > max_depth:
+                    continue
+                    
                 # Find paths
                 found_paths = await self.engine.find_path(source.entity_id, target.entity_id, max_depth)
                 
@@ -416,13 +421,14 @@ class HermesKnowledgeAdapter:
         
         return paths
     
-    async def get_entity_graph(self, entity_id: str, depth: int = 1) -> Dict[str, Any]:
+    async def get_entity_graph(self, entity_id: str, depth: int = 1, max_nodes: Optional[int] = 1000) -> Dict[str, Any]:
         """
         Get a subgraph centered on a specific entity.
         
         Args:
             entity_id: Center entity ID
             depth: Depth of relationships to include
+            max_nodes: Maximum number of entities to include, nearest first
             
         Returns:
             Entity graph with nodes and edges
@@ -430,45 +436,19 @@ class HermesKnowledgeAdapter:
         if not self.engine:
             await self.initialize()
             
-        # Get the center entity
-        center_entity = await self.engine.get_entity(entity_id)
-        if not center_entity:
+        # The adapter walks the neighborhood natively and lists each relationship once
+        subgraph = await self.engine.get_subgraph([entity_id], depth=depth, max_nodes=max_nodes)
+        if not subgraph["entities"] or subgraph["entities"][0].entity_id != entity_id:
             return {"error": f"Entity {entity_id} not found"}
             
-        # Initialize the graph
-        nodes = [center_entity.to_dict()]
-        edges = []
-        visited_ids = {entity_id}
-        
-        # Process current depth level
-        current_ids = {entity_id}
-        
-        # For each depth level
-        for _ in range(depth):
-            next_ids = set()
-            
-            # Process each ID at this level
-            for current_id in current_ids:
-                # Get relationships for this entity
-                relationships = await self.engine.get_entity_relationships(current_id)
-                
-                for rel, related_entity in relationships:
-                    # Add the relationship
-                    edges.append(rel.to_dict())
-                    
-                    # If we haven't seen this entity before, add it
-                    if related_entity.entity_id not in visited_ids:
-                        nodes.append(related_entity.to_dict())
-                        visited_ids.add(related_entity.entity_id)
-                        next_ids.add(related_entity.entity_id)
-            
-            # Set up the next level
-            current_ids = next_ids
+        nodes = [entity.to_dict() for entity in subgraph["entities"]]
+        edges = [relationship.to_dict() for relationship in subgraph["relationships"]]
         
         return {
             "nodes": nodes,
             "edges": edges,
-            "center": entity_id
+            "center": entity_id,
+            "truncated": subgraph["truncated"]
         }
     
     async def shutdown(self):
@@ -172,6 +172,13 @@ class HermesKnowledgeAdapter:
         # Get direct relationships
         direct_relationships = await self.engine.get_entity_relationships(entity_id)
         
+        # Get second-degree relationships of all related entities in one batch
+        secondary_by_entity = {}
+        if max_depth > 1:
+            secondary_by_entity = await self.engine.get_relationships_for_entities(
+                list(dict.fromkeys(related.entity_id for _, related in direct_relationships))
+            )
+        
         # Convert to serializable format
         related_entities = []
         relationships = []
@@ -182,7 +189,7 @@ class HermesKnowledgeAdapter:
             
             # Get second-degree relationships if depth > 1
             if max_depth > 1:
-                secondary_relationships = await self.engine.get_entity_relationships(related_entity.entity_id)
+                secondary_relationships = secondary_by_entity.get(related_entity.entity_id, [])
                 
                 for sec_rel, sec_entity in secondary_relationships:
                     # Don't include the original entity
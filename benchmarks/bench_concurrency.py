@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Concurrency Stress Benchmark
+
+Runs concurrent readers and writers against a MemoryAdapter: path searches,
+entity lookups and searches, checkpoints and exports read the graph while
+writers create, update and delete entities and relationships. Reports
+per-operation throughput and latency, and fails if any operation raised.
+
+Long reads run on pinned snapshots, so the interesting numbers are the
+write latencies while paths, checkpoints and exports are in progress.
+
+Usage:
+    python benchmarks/bench_concurrency.py --entities 20000 --relationships 60000 --duration 10
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+from collections import defaultdict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.memory import MemoryAdapter
+
+class Recorder:
+    """Collects per-operation latencies and errors."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    async def timed(self, name: str, operation) -> None:
+        start = time.perf_counter()
+        try:
+            await operation
+        except Exception as e:
+            self.errors[name] += 1
+            print(f"  {name} failed: {e!r}")
+        self.latencies[name].append(time.perf_counter() - start)
+
+    def report(self, elapsed: float) -> None:
+        print(f"{'operation':<22}{'count':>8}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'errors':>8}")
+        for name, samples in sorted(self.latencies.items()):
+            samples.sort()
+            p50 = samples[len(samples) // 2] * 1000
+            p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000
+            print(f"{name:<22}{len(samples):>8}{len(samples) / elapsed:>10,.0f}{p50:>10.2f}"
+                  f"{p99:>10.2f}{samples[-1] * 1000:>10.2f}{self.errors[name]:>8}")
+
+async def populate(adapter: MemoryAdapter, entities: int, relationships: int) -> None:
+    """Create a random graph with a few hub entities."""
+    await adapter.create_entities([
+        Entity(entity_id=f"e{i}", entity_type="benchmark", name=f"Entity {i}") for i in range(entities)
+    ])
+    hubs = max(1, entities // 1000)
+    rels = []
+    for i in range(relationships):
+        source = random.randrange(hubs) if random.random() < 0.2 else random.randrange(entities)
+        rels.append(Relationship(
+            relationship_id=f"r{i}",
+            relationship_type=random.choice(["knows", "cites", "part_of"]),
+            source_id=f"e{source}",
+            target_id=f"e{random.randrange(entities)}"
+        ))
+    await adapter.create_relationships(rels)
+
+async def run(args) -> None:
+    random.seed(args.seed)
+    with tempfile.TemporaryDirectory() as data_path:
+        adapter = MemoryAdapter(data_path, wal_fsync=not args.no_fsync, checkpoint_interval=0)
+        await adapter.connect()
+        start = time.perf_counter()
+        await populate(adapter, args.entities, args.relationships)
+        print(f"populated {args.entities} entities and {args.relationships} relationships "
+              f"in {time.perf_counter() - start:.2f}s")
+
+        recorder = Recorder()
+        deadline = time.perf_counter() + args.duration
+        next_id = [args.relationships]
+
+        def entity_id() -> str:
+            return f"e{random.randrange(args.entities)}"
+
+        async def path_reader():
+            while time.perf_counter() < deadline:
+                await recorder.timed("find_paths", adapter.find_paths(entity_id(), entity_id(), args.depth))
+
+        async def point_reader():
+            while time.perf_counter() < deadline:
+                await recorder.timed("get_entity", adapter.get_entity(entity_id()))
+                await recorder.timed("get_relationships", adapter.get_entity_relationships(entity_id()))
+                await recorder.timed("search_entities", adapter.search_entities(f"entity {random.randrange(1000)}"))
+                # Point reads complete without suspending; let the other tasks run
+                await asyncio.sleep(0)
+
+        async def writer():
+            while time.perf_counter() < deadline:
+                choice = random.random()
+                if choice < 0.4:
+                    next_id[0] += 1
+                    await recorder.timed("create_relationship", adapter.create_relationship(Relationship(
+                        relationship_id=f"r{next_id[0]}",
+                        relationship_type="knows",
+                        source_id=entity_id(),
+                        target_id=entity_id()
+                    )))
+                elif choice < 0.6:
+                    await recorder.timed("delete_relationship",
+                                         adapter.delete_relationship(f"r{random.randrange(next_id[0])}"))
+                elif choice < 0.8:
+                    await recorder.timed("update_entity", adapter.update_entity(
+                        Entity(entity_id=entity_id(), entity_type="benchmark", name="Updated")))
+                elif choice < 0.95:
+                    await recorder.timed("create_entity", adapter.create_entity(
+                        Entity(entity_id=entity_id(), entity_type="benchmark", name="Recreated")))
+                else:
+                    await recorder.timed("delete_entity", adapter.delete_entity(entity_id()))
+
+        async def maintenance():
+            while time.perf_counter() < deadline:
+                await recorder.timed("checkpoint", adapter.checkpoint())
+                await recorder.timed("export_json", adapter.export_json(
+                    os.path.join(data_path, "export_entities.json"),
+                    os.path.join(data_path, "export_relationships.json")
+                ))
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(path_reader() for _ in range(args.path_readers)),
+            *(point_reader() for _ in range(args.point_readers)),
+            *(writer() for _ in range(args.writers)),
+            maintenance()
+        )
+        elapsed = time.perf_counter() - start
+
+        print(f"readers={args.path_readers}+{args.point_readers} writers={args.writers} "
+              f"duration={elapsed:.1f}s graph_version={adapter.snapshots.version}")
+        recorder.report(elapsed)
+        await adapter.disconnect()
+
+        if sum(recorder.errors.values()):
+            sys.exit(1)
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress the memory adapter with concurrent reads and writes")
+    parser.add_argument("--entities", type=int, default=20000, help="Number of entities in the graph")
+    parser.add_argument("--relationships", type=int, default=60000, help="Number of relationships in the graph")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run the mixed workload")
+    parser.add_argument("--path-readers", type=int, default=4, help="Concurrent path searches")
+    parser.add_argument("--point-readers", type=int, default=4, help="Concurrent lookup and search readers")
+    parser.add_argument("--writers", type=int, default=16, help="Concurrent writers")
+    parser.add_argument("--depth", type=int, default=3, help="max_depth passed to find_paths")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    parser.add_argument("--no-fsync", action="store_true", help="Flush the log without fsync")
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
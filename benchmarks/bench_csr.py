@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+CSR Adapter Benchmark
+
+Compares the NetworkX-backed MemoryAdapter with the array-backed CSRAdapter
+on traced memory for the graph structure, neighbor lookups and path queries.
+
+Usage:
+    python benchmarks/bench_csr.py --entities 100000 --relationships 500000
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.memory import MemoryAdapter
+from athena.core.graph.csr import CSRAdapter
+
+async def build(adapter, entities, relationships) -> float:
+    """Insert the graph into an adapter and return the traced bytes it added."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for entity in entities:
+        await adapter.create_entity(entity)
+    for relationship in relationships:
+        await adapter.create_relationship(relationship)
+    if isinstance(adapter, CSRAdapter):
+        adapter.store.merge()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before
+
+async def run(args) -> None:
+    rng = random.Random(42)
+    entities = [Entity(entity_type="benchmark", name=f"Entity {i}") for i in range(args.entities)]
+    ids = [entity.entity_id for entity in entities]
+    relationships = [
+        Relationship(relationship_type=rng.choice(["knows", "part_of", "related_to"]),
+                     source_id=rng.choice(ids), target_id=rng.choice(ids))
+        for _ in range(args.relationships)
+    ]
+    probes = [rng.choice(ids) for _ in range(args.queries)]
+    pairs = [(rng.choice(ids), rng.choice(ids)) for _ in range(args.paths)]
+
+    for label, cls in (("memory", MemoryAdapter), ("csr", CSRAdapter)):
+        with tempfile.TemporaryDirectory() as data_path:
+            adapter = cls(data_path, wal_enabled=False)
+            await adapter.connect()
+            size = await build(adapter, entities, relationships)
+
+            start = time.perf_counter()
+            for entity_id in probes:
+                await adapter.get_entity_relationships(entity_id)
+            neighbors = time.perf_counter() - start
+
+            start = time.perf_counter()
+            found = 0
+            for source_id, target_id in pairs:
+                found += len(await adapter.find_paths(source_id, target_id, args.max_depth))
+            paths = time.perf_counter() - start
+
+            print(f"{label:<7} graph={size / 1e6:8.1f} MB  "
+                  f"neighbors={len(probes) / neighbors:10,.0f} q/s  "
+                  f"paths={paths / len(pairs) * 1000:8.2f} ms/q  ({found} paths)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the memory and CSR graph adapters")
+    parser.add_argument("--entities", type=int, default=100000, help="Number of entities")
+    parser.add_argument("--relationships", type=int, default=500000, help="Number of relationships")
+    parser.add_argument("--queries", type=int, default=10000, help="Neighbor lookups to time")
+    parser.add_argument("--paths", type=int, default=100, help="Path queries to time")
+    parser.add_argument("--max-depth", type=int, default=2, help="Maximum path length")
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Lazy Property Payload Benchmark
+
+Loads the same binary snapshot with and without lazy_properties in fresh
+processes and reports load time, anonymous resident memory (heap; pages
+of the mapped payload file are not counted, since the kernel can drop
+them at any time) and the latency of searches, path queries and
+get_entity calls.
+
+Usage:
+    python benchmarks/bench_lazy_properties.py --entities 100000 --payload-size 200
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import asyncio
+import argparse
+import tempfile
+import multiprocessing
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.memory import MemoryAdapter
+
+BATCH = 10000
+
+def anonymous_rss_mb() -> float:
+    """Get the anonymous resident memory of this process in MB (Linux only)."""
+    try:
+        with open("/proc/self/status", 'r') as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+async def build(data_path: str, args) -> None:
+    """Create a graph whose entities carry numeric payloads and save it lazily."""
+    rng = random.Random(42)
+    adapter = MemoryAdapter(data_path, lazy_properties=True, wal_enabled=False)
+    await adapter.connect()
+    for start in range(0, args.entities, BATCH):
+        batch = []
+        for i in range(start, min(start + BATCH, args.entities)):
+            entity = Entity(entity_id=f"e{i}", entity_type="benchmark", name=f"Entity {i}")
+            entity.add_property("embedding", [rng.random() for _ in range(args.payload_size)])
+            entity.add_property("rank", i % 1000)
+            batch.append(entity)
+        await adapter.create_entities(batch)
+    relationships = [
+        Relationship(relationship_id=f"r{i}", relationship_type="knows",
+                     source_id=f"e{rng.randrange(args.entities)}", target_id=f"e{rng.randrange(args.entities)}")
+        for i in range(args.entities * 3)
+    ]
+    for start in range(0, len(relationships), BATCH):
+        await adapter.create_relationships(relationships[start:start + BATCH])
+    await adapter.disconnect()
+
+def measure(data_path: str, lazy: bool, args, results) -> None:
+    async def main():
+        baseline = anonymous_rss_mb()
+        started = time.perf_counter()
+        adapter = MemoryAdapter(data_path, lazy_properties=lazy, wal_enabled=False)
+        await adapter.connect()
+        load_seconds = time.perf_counter() - started
+        resident = anonymous_rss_mb() - baseline
+
+        rng = random.Random(7)
+        timings = {}
+        for name, operation in (
+            ("search", lambda: adapter.search_entities(f"entity {rng.randrange(args.entities)}", limit=10)),
+            ("paths", lambda: adapter.find_paths(f"e{rng.randrange(args.entities)}",
+                                                 f"e{rng.randrange(args.entities)}", 2)),
+            ("get_entity", lambda: adapter.get_entity(f"e{rng.randrange(args.entities)}"))
+        ):
+            started = time.perf_counter()
+            for _ in range(args.queries):
+                await operation()
+            timings[name] = (time.perf_counter() - started) / args.queries * 1000
+
+        results.put((load_seconds, resident, anonymous_rss_mb() - baseline, timings))
+    asyncio.run(main())
+
+def run_in_process(data_path: str, lazy: bool, args):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=measure, args=(data_path, lazy, args, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare eager and lazy entity property payloads")
+    parser.add_argument("--entities", type=int, default=100000, help="Number of entities")
+    parser.add_argument("--payload-size", type=int, default=200, help="Floats in each entity's payload")
+    parser.add_argument("--queries", type=int, default=1000, help="Queries timed per operation")
+    args = parser.parse_args()
+
+    data_path = tempfile.mkdtemp()
+    try:
+        asyncio.run(build(data_path, args))
+        print(f"{'mode':<8}{'load s':>9}{'heap MB':>10}{'after MB':>10}"
+              f"{'search ms':>11}{'paths ms':>10}{'get ms':>9}")
+        for label, lazy in (("eager", False), ("lazy", True)):
+            load_seconds, resident, after, timings = run_in_process(data_path, lazy, args)
+            print(f"{label:<8}{load_seconds:>9.2f}{resident:>10.0f}{after:>10.0f}"
+                  f"{timings['search']:>11.3f}{timings['paths']:>10.3f}{timings['get_entity']:>9.4f}")
+    finally:
+        shutil.rmtree(data_path, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Path Search Benchmark
+
+Builds a graph in which a few hub entities take part in a large share of
+the relationships, then times find_paths between random hub pairs and
+random entity pairs: capped at max_paths, capped at max_paths with
+confidence-weighted ranking, and collecting every simple path up to
+max_depth.
+
+Usage:
+    python benchmarks/bench_paths.py --entities 5000 --degree 5 --max-depth 3
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.memory import MemoryAdapter
+
+BATCH = 10000
+
+async def build(adapter, args) -> None:
+    """Create entities and relationships, a fraction of which touch a hub."""
+    rng = random.Random(42)
+    hubs = [f"e{i}" for i in range(args.hubs)]
+
+    def endpoint() -> str:
+        return rng.choice(hubs) if rng.random() < args.hub_share else f"e{rng.randrange(args.entities)}"
+
+    entities = [Entity(entity_id=f"e{i}", entity_type="benchmark", name=f"Entity {i}") for i in range(args.entities)]
+    for start in range(0, len(entities), BATCH):
+        await adapter.create_entities(entities[start:start + BATCH])
+    relationships = [
+        Relationship(relationship_id=f"r{i}", relationship_type="link", source_id=endpoint(), target_id=endpoint(),
+                     confidence=rng.uniform(0.5, 1.0))
+        for i in range(args.entities * args.degree)
+    ]
+    for start in range(0, len(relationships), BATCH):
+        await adapter.create_relationships(relationships[start:start + BATCH])
+
+async def measure(adapter, pairs, max_depth: int, max_paths, weighted: bool) -> tuple:
+    """Time find_paths over pairs, returning (mean ms, worst ms, mean paths)."""
+    timings = []
+    found = 0
+    for source_id, target_id in pairs:
+        started = time.perf_counter()
+        found += len(await adapter.find_paths(source_id, target_id, max_depth, max_paths, weighted))
+        timings.append(time.perf_counter() - started)
+    return sum(timings) / len(timings) * 1000, max(timings) * 1000, found / len(pairs)
+
+async def run(args) -> None:
+    adapter = MemoryAdapter(tempfile.mkdtemp(), wal_enabled=False)
+    await adapter.connect()
+    await build(adapter, args)
+
+    rng = random.Random(7)
+    workloads = {
+        "hub pairs": [(f"e{a}", f"e{b}") for a, b in
+                      (rng.sample(range(args.hubs), 2) for _ in range(args.queries))],
+        "random pairs": [(f"e{rng.randrange(args.entities)}", f"e{rng.randrange(args.entities)}")
+                         for _ in range(args.queries)]
+    }
+
+    print(f"{args.entities} entities, {args.entities * args.degree} relationships, "
+          f"{args.hubs} hubs, max_depth {args.max_depth}")
+    print(f"{'workload':<14}{'max_paths':>10}{'weighted':>10}{'mean ms':>10}{'worst ms':>10}{'paths':>10}")
+    for label, pairs in workloads.items():
+        for max_paths, weighted in ((args.max_paths, False), (args.max_paths, True), (None, False)):
+            mean, worst, paths = await measure(adapter, pairs, args.max_depth, max_paths, weighted)
+            print(f"{label:<14}{str(max_paths):>10}{str(weighted):>10}{mean:>10.2f}{worst:>10.2f}{paths:>10.1f}")
+    await adapter.disconnect()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bounded path search")
+    parser.add_argument("--entities", type=int, default=5000, help="Number of entities")
+    parser.add_argument("--degree", type=int, default=5, help="Relationships per entity")
+    parser.add_argument("--hubs", type=int, default=20, help="Number of hub entities")
+    parser.add_argument("--hub-share", type=float, default=0.3, help="Chance that an endpoint is a hub")
+    parser.add_argument("--max-depth", type=int, default=3, help="max_depth passed to find_paths")
+    parser.add_argument("--max-paths", type=int, default=10, help="max_paths for the capped runs")
+    parser.add_argument("--queries", type=int, default=20, help="Queries per workload")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Reachability Index Benchmark
+
+Builds a sparse graph with a few hub entities, times the reachability
+index rebuild, then compares answering "is b reachable from a within k
+hops" with are_connected and distance_bounds against asking find_paths
+for a single path. Also reports how often the index bounds alone decide
+the question.
+
+Usage:
+    python benchmarks/bench_reachability.py --entities 100000 --degree 1.5 --max-hops 3
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.memory import MemoryAdapter
+
+BATCH = 10000
+
+async def build(adapter, args) -> None:
+    """Create entities and relationships, a fraction of which touch a hub."""
+    rng = random.Random(42)
+    hubs = [f"e{i}" for i in range(args.hubs)]
+
+    def endpoint() -> str:
+        return rng.choice(hubs) if rng.random() < args.hub_share else f"e{rng.randrange(args.entities)}"
+
+    entities = [Entity(entity_id=f"e{i}", entity_type="benchmark", name=f"Entity {i}") for i in range(args.entities)]
+    for start in range(0, len(entities), BATCH):
+        await adapter.create_entities(entities[start:start + BATCH])
+    relationships = [
+        Relationship(relationship_id=f"r{i}", relationship_type="link", source_id=endpoint(), target_id=endpoint())
+        for i in range(int(args.entities * args.degree))
+    ]
+    for start in range(0, len(relationships), BATCH):
+        await adapter.create_relationships(relationships[start:start + BATCH])
+
+async def measure(pairs, operation) -> tuple:
+    """Time operation over pairs, returning (mean us, worst us, results)."""
+    timings = []
+    results = []
+    for source_id, target_id in pairs:
+        started = time.perf_counter()
+        results.append(await operation(source_id, target_id))
+        timings.append(time.perf_counter() - started)
+    return sum(timings) / len(timings) * 1e6, max(timings) * 1e6, results
+
+async def run(args) -> None:
+    adapter = MemoryAdapter(tempfile.mkdtemp(), wal_enabled=False, reachability_landmarks=args.landmarks)
+    await adapter.connect()
+    await build(adapter, args)
+
+    started = time.perf_counter()
+    await adapter.reachability.refresh(adapter)
+    print(f"{args.entities} entities, {int(args.entities * args.degree)} relationships, "
+          f"{args.landmarks} landmarks, rebuilt in {time.perf_counter() - started:.2f} s")
+
+    rng = random.Random(7)
+    pairs = [(f"e{rng.randrange(args.entities)}", f"e{rng.randrange(args.entities)}") for _ in range(args.queries)]
+    operations = {
+        "find_paths": lambda a, b: adapter.find_paths(a, b, args.max_hops, 1),
+        "are_connected": lambda a, b: adapter.are_connected(a, b, args.max_hops),
+        "distance_bounds": lambda a, b: adapter.distance_bounds(a, b)
+    }
+
+    print(f"{'operation':<18}{'mean us':>10}{'worst us':>12}{'reachable':>14}")
+    for name, operation in operations.items():
+        mean, worst, results = await measure(pairs, operation)
+        if name == "distance_bounds":
+            decided = sum(1 for lower, upper in results if lower > args.max_hops or upper <= args.max_hops)
+            summary = f"{decided / len(results):.0%} decided"
+        else:
+            summary = f"{sum(1 for found in results if found) / len(results):.0%}"
+        print(f"{name:<18}{mean:>10.1f}{worst:>12.1f}{summary:>14}")
+    await adapter.disconnect()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the reachability index")
+    parser.add_argument("--entities", type=int, default=100000, help="Number of entities")
+    parser.add_argument("--degree", type=float, default=1.5, help="Relationships per entity")
+    parser.add_argument("--hubs", type=int, default=20, help="Number of hub entities")
+    parser.add_argument("--hub-share", type=float, default=0.1, help="Chance that an endpoint is a hub")
+    parser.add_argument("--landmarks", type=int, default=8, help="Landmarks kept by the index")
+    parser.add_argument("--max-hops", type=int, default=3, help="Hop limit of the connectivity check")
+    parser.add_argument("--queries", type=int, default=1000, help="Random pairs to check")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
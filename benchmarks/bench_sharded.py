@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Sharded Adapter Benchmark
+
+Compares a single-process MemoryAdapter with a ShardedAdapter on bulk
+ingestion and on a concurrent mix of substring searches, relationship
+lookups, path searches and writes.
+
+Usage:
+    python benchmarks/bench_sharded.py --entities 50000 --relationships 150000 --shards 4
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.memory import MemoryAdapter
+from athena.core.graph.sharded import ShardedAdapter
+
+BATCH = 10000
+
+async def ingest(adapter, entities, relationships) -> float:
+    """Bulk-load the graph and return the elapsed seconds."""
+    start = time.perf_counter()
+    for i in range(0, len(entities), BATCH):
+        await adapter.create_entities(entities[i:i + BATCH])
+    for i in range(0, len(relationships), BATCH):
+        await adapter.create_relationships(relationships[i:i + BATCH])
+    return time.perf_counter() - start
+
+async def workload(adapter, ids, args) -> dict:
+    """Run concurrent clients for a fixed time and count completed operations."""
+    counts = {"search": 0, "relationships": 0, "paths": 0, "writes": 0}
+    deadline = time.perf_counter() + args.duration
+    next_id = [0]
+
+    async def client(seed: int):
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            choice = rng.random()
+            if choice < 0.25:
+                await adapter.search_entities(f"entity {rng.randrange(10000)}", limit=10)
+                counts["search"] += 1
+            elif choice < 0.6:
+                await adapter.get_entity_relationships(rng.choice(ids))
+                counts["relationships"] += 1
+            elif choice < 0.7:
+                await adapter.find_paths(rng.choice(ids), rng.choice(ids), 2)
+                counts["paths"] += 1
+            else:
+                next_id[0] += 1
+                await adapter.create_relationship(Relationship(
+                    relationship_id=f"w{next_id[0]}", relationship_type="knows",
+                    source_id=rng.choice(ids), target_id=rng.choice(ids)))
+                counts["writes"] += 1
+
+    await asyncio.gather(*(client(seed) for seed in range(args.clients)))
+    return counts
+
+async def run(args) -> None:
+    rng = random.Random(42)
+    entities = [Entity(entity_id=f"e{i}", entity_type="benchmark", name=f"Entity {i}")
+                for i in range(args.entities)]
+    ids = [entity.entity_id for entity in entities]
+    relationships = [
+        Relationship(relationship_id=f"r{i}", relationship_type=rng.choice(["knows", "part_of", "related_to"]),
+                     source_id=rng.choice(ids), target_id=rng.choice(ids))
+        for i in range(args.relationships)
+    ]
+
+    print(f"{'adapter':<12}{'ingest s':>10}{'search/s':>10}{'rels/s':>10}{'paths/s':>10}{'writes/s':>10}{'total/s':>10}")
+    for label, factory in (
+        ("memory", lambda path: MemoryAdapter(path, wal_fsync=False)),
+        (f"sharded x{args.shards}", lambda path: ShardedAdapter(path, shard_count=args.shards, wal_fsync=False))
+    ):
+        with tempfile.TemporaryDirectory() as data_path:
+            adapter = factory(data_path)
+            await adapter.connect()
+            elapsed = await ingest(adapter, entities, relationships)
+            counts = await workload(adapter, ids, args)
+            await adapter.disconnect()
+
+        rates = {name: count / args.duration for name, count in counts.items()}
+        print(f"{label:<12}{elapsed:>10.2f}{rates['search']:>10,.0f}{rates['relationships']:>10,.0f}"
+              f"{rates['paths']:>10,.0f}{rates['writes']:>10,.0f}{sum(rates.values()):>10,.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the memory and sharded graph adapters")
+    parser.add_argument("--entities", type=int, default=50000, help="Number of entities")
+    parser.add_argument("--relationships", type=int, default=150000, help="Number of relationships")
+    parser.add_argument("--shards", type=int, default=os.cpu_count() or 1, help="Number of shard processes")
+    parser.add_argument("--clients", type=int, default=64, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run the mixed workload")
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Shared Adapter Benchmark
+
+Compares worker processes that each load their own MemoryAdapter with
+reader processes of a SharedGraphAdapter attached to one writer: time to
+become ready, proportional memory use (PSS, which splits shared pages
+between the processes mapping them) and read throughput per worker.
+
+Usage:
+    python benchmarks/bench_shared.py --entities 100000 --relationships 300000 --workers 4
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import asyncio
+import argparse
+import tempfile
+import multiprocessing
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.memory import MemoryAdapter
+from athena.core.graph.shared import SharedGraphAdapter
+
+BATCH = 10000
+
+def pss_mb() -> float:
+    """Get this process's proportional set size in MB (Linux only)."""
+    try:
+        with open("/proc/self/smaps_rollup", 'r') as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+async def reads(adapter, entity_count: int, duration: float) -> int:
+    """Run a read-only mix of searches, relationship lookups and paths; return the count."""
+    rng = random.Random(os.getpid())
+    deadline = time.perf_counter() + duration
+    count = 0
+    while time.perf_counter() < deadline:
+        choice = rng.random()
+        if choice < 0.3:
+            await adapter.search_entities(f"entity {rng.randrange(10000)}", limit=10)
+        elif choice < 0.8:
+            await adapter.get_entity_relationships(f"e{rng.randrange(entity_count)}")
+        else:
+            await adapter.find_paths(f"e{rng.randrange(entity_count)}", f"e{rng.randrange(entity_count)}", 2)
+        count += 1
+    return count
+
+def worker(kind: str, data_path: str, entity_count: int, duration: float, start, results) -> None:
+    async def main():
+        start.wait()
+        began = time.perf_counter()
+        if kind == "memory":
+            adapter = MemoryAdapter(data_path, wal_enabled=False)
+        else:
+            adapter = SharedGraphAdapter(data_path, role="reader")
+        await adapter.connect()
+        ready = time.perf_counter() - began
+        count = await reads(adapter, entity_count, duration)
+        results.put((ready, pss_mb(), count / duration))
+        if kind == "shared":
+            await adapter.disconnect()
+    asyncio.run(main())
+
+async def build(data_path: str, args) -> MemoryAdapter:
+    """Create the graph in data_path and return the loaded adapter."""
+    rng = random.Random(42)
+    adapter = MemoryAdapter(data_path, wal_fsync=False)
+    await adapter.connect()
+    entities = [Entity(entity_id=f"e{i}", entity_type="benchmark", name=f"Entity {i}")
+                for i in range(args.entities)]
+    for i in range(0, len(entities), BATCH):
+        await adapter.create_entities(entities[i:i + BATCH])
+    relationships = [
+        Relationship(relationship_id=f"r{i}", relationship_type="knows",
+                     source_id=f"e{rng.randrange(args.entities)}", target_id=f"e{rng.randrange(args.entities)}")
+        for i in range(args.relationships)
+    ]
+    for i in range(0, len(relationships), BATCH):
+        await adapter.create_relationships(relationships[i:i + BATCH])
+    return adapter
+
+def run_workers(kind: str, data_path: str, args) -> list:
+    context = multiprocessing.get_context("spawn")
+    start = context.Event()
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(kind, data_path, args.entities, args.duration, start, results))
+        for _ in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    start.set()
+    rows = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return rows
+
+async def run(args) -> None:
+    data_path = tempfile.mkdtemp()
+    try:
+        adapter = await build(data_path, args)
+        await adapter.disconnect()
+
+        print(f"{'workers':<10}{'ready s':>10}{'PSS MB':>10}{'reads/s':>12}")
+        rows = run_workers("memory", data_path, args)
+        print(f"{'memory':<10}{max(r[0] for r in rows):>10.2f}{sum(r[1] for r in rows):>10.0f}"
+              f"{sum(r[2] for r in rows):>12,.0f}")
+
+        writer = SharedGraphAdapter(data_path, role="writer", wal_fsync=False)
+        await writer.connect()
+        loop = asyncio.get_running_loop()
+        rows = await loop.run_in_executor(None, run_workers, "shared", data_path, args)
+        await writer.disconnect()
+        print(f"{'shared':<10}{max(r[0] for r in rows):>10.2f}{sum(r[1] for r in rows):>10.0f}"
+              f"{sum(r[2] for r in rows):>12,.0f}")
+    finally:
+        shutil.rmtree(data_path, ignore_errors=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-worker memory adapters with a shared graph")
+    parser.add_argument("--entities", type=int, default=100000, help="Number of entities")
+    parser.add_argument("--relationships", type=int, default=300000, help="Number of relationships")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds each worker runs reads")
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Snapshot Format Benchmark
+
+Compares the JSON and binary memory graph snapshot formats by file size,
+save time, cold-load time and peak traced memory during the load.
+Binary snapshots can optionally be decoded by a pool of worker processes.
+
+Usage:
+    python benchmarks/bench_snapshot.py --entities 100000 --relationships 300000 --load-workers 8
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.memory import MemoryAdapter
+
+ENTITY_TYPES = ["person", "organization", "concept", "location", "event"]
+RELATIONSHIP_TYPES = ["works_for", "located_in", "related_to", "part_of", "knows"]
+
+async def build_graph(data_path: str, entities: int, relationships: int) -> MemoryAdapter:
+    """Create an adapter holding a random graph of the requested size."""
+    adapter = MemoryAdapter(data_path, wal_enabled=False)
+    await adapter.connect()
+
+    rng = random.Random(42)
+    entity_ids = []
+    for i in range(entities):
+        entity = Entity(
+            entity_type=rng.choice(ENTITY_TYPES),
+            name=f"Entity {i}",
+            source="benchmark"
+        )
+        entity.add_property("description", f"Synthetic entity number {i}")
+        entity.add_property("rank", rng.randint(0, 1000))
+        await adapter.create_entity(entity)
+        entity_ids.append(entity.entity_id)
+
+    for _ in range(relationships):
+        await adapter.create_relationship(Relationship(
+            relationship_type=rng.choice(RELATIONSHIP_TYPES),
+            source_id=rng.choice(entity_ids),
+            target_id=rng.choice(entity_ids),
+            confidence=rng.random(),
+            source="benchmark"
+        ))
+    return adapter
+
+def snapshot_size(adapter: MemoryAdapter, snapshot_format: str) -> int:
+    if snapshot_format == "json":
+        return os.path.getsize(adapter.entity_file) + os.path.getsize(adapter.relationship_file)
+    return os.path.getsize(adapter.snapshot_file)
+
+async def measure(source: MemoryAdapter, snapshot_format: str, compression: bool,
+                  load_workers: int = 0) -> None:
+    with tempfile.TemporaryDirectory() as data_path:
+        options = {"snapshot_format": snapshot_format, "snapshot_compression": compression,
+                   "wal_enabled": False}
+        writer = MemoryAdapter(data_path, **options)
+        writer.graph = source.graph
+
+        start = time.perf_counter()
+        await writer.checkpoint()
+        save_time = time.perf_counter() - start
+        size = snapshot_size(writer, snapshot_format)
+
+        reader = MemoryAdapter(data_path, load_workers=load_workers, **options)
+        tracemalloc.start()
+        start = time.perf_counter()
+        await reader.connect()
+        load_time = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        label = snapshot_format if snapshot_format == "json" else f"binary{'+zlib' if compression else ''}"
+        if load_workers:
+            label += f"/{load_workers}p"
+        print(f"{label:<15} size={size / 1e6:8.1f} MB  save={save_time:6.2f}s  "
+              f"load={load_time:6.2f}s  peak={peak / 1e6:8.1f} MB  "
+              f"entities={await reader.count_entities()}")
+
+async def run(args) -> None:
+    with tempfile.TemporaryDirectory() as data_path:
+        print(f"Building graph with {args.entities} entities and {args.relationships} relationships...")
+        source = await build_graph(data_path, args.entities, args.relationships)
+        await measure(source, "json", False)
+        await measure(source, "binary", False)
+        await measure(source, "binary", True)
+        if args.load_workers:
+            await measure(source, "binary", True, args.load_workers)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare JSON and binary graph snapshots")
+    parser.add_argument("--entities", type=int, default=100000, help="Number of entities")
+    parser.add_argument("--relationships", type=int, default=300000, help="Number of relationships")
+    parser.add_argument("--load-workers", type=int, default=0,
+                        help="Also load the compressed snapshot with this many decoder processes")
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Recorded Neo4j driver for tests.
+
+Stands in for the async Neo4j driver: every statement run through it is
+recorded, and a responder function decides the records it returns or the
+error it raises.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Responder = Callable[[str, Dict[str, Any]], List[Dict[str, Any]]]
+
+class RecordedNode:
+    """Node or relationship value exposing its properties only through items()."""
+
+    def __init__(self, properties: Dict[str, Any]):
+        self._properties = dict(properties)
+
+    def items(self):
+        return self._properties.items()
+
+class RecordedPath:
+    """Path value with the nodes and relationships of a driver path."""
+
+    def __init__(self, nodes: List[Dict[str, Any]], relationships: List[Dict[str, Any]]):
+        self.nodes = nodes
+        self.relationships = relationships
+
+class RecordedResult:
+    """Result cursor over a fixed list of records."""
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        self.records = list(records)
+
+    def __aiter__(self):
+        self._iterator = iter(self.records)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def single(self):
+        return self.records[0] if self.records else None
+
+    async def consume(self):
+        return None
+
+class RecordedSession:
+    """Session that runs statements through the driver's responder."""
+
+    def __init__(self, driver: 'RecordedDriver', config: Dict[str, Any]):
+        self.driver = driver
+        self.config = config
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def run(self, query: str, **params) -> RecordedResult:
+        self.driver.statements.append((query, params))
+        return RecordedResult(self.driver.responder(query, params))
+
+    async def execute_read(self, work):
+        return await work(self)
+
+class RecordedDriver:
+    """Async driver double recording (query, params) pairs."""
+
+    def __init__(self, responder: Optional[Responder] = None):
+        self.responder = responder or (lambda query, params: [])
+        self.statements: List[Tuple[str, Dict[str, Any]]] = []
+        self.sessions: List[Dict[str, Any]] = []
+
+    def session(self, **config) -> RecordedSession:
+        self.sessions.append(config)
+        return RecordedSession(self, config)
+
+    async def close(self) -> None:
+        pass
+
+    def queries(self, fragment: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Recorded statements whose text contains a fragment."""
+        return [(query, params) for query, params in self.statements if fragment in query]
+
+def failing(message: str) -> Responder:
+    """Responder raising an error for every statement."""
+    def respond(query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        raise RuntimeError(message)
+    return respond
@@ -0,0 +1,170 @@
+"""
+Tests that the search, type, adjacency and property indexes agree with a full scan.
+
+A random history of creates, updates and deletes is applied, and every
+indexed lookup is compared with the answer of scanning all entities, both
+live and after the graph is reloaded.
+"""
+
+import random
+import asyncio
+
+import pytest
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.memory.adapter import MemoryAdapter
+from athena.core.graph.csr.adapter import CSRAdapter
+from athena.core.graph.memory.search_index import tokenize, entity_text_fields
+from athena.core.graph.memory.property_index import property_value, value_matches
+from athena.core.graph.memory.type_index import OUTGOING, INCOMING
+
+WORDS = ["alpha", "beta", "gamma", "delta", "omega", "sigma", "kappa", "theta"]
+TYPES = ["person", "place", "concept"]
+RELATIONSHIP_TYPES = ["knows", "near", "cites"]
+VALUES = [0, 1, 2, 2.5, 7, -3, True, False, "a", "b", "delta", "z", None]
+QUERIES = ["alp", "ta", "a", "mega", "lta ka", "sigma", "theta gam", "xyz", "pa"]
+
+ADAPTERS = {"memory": MemoryAdapter, "csr": CSRAdapter}
+
+def all_entities(adapter):
+    if isinstance(adapter, MemoryAdapter):
+        return [entity for _, entity in adapter.graph.nodes(data="entity") if entity]
+    return list(adapter.store.iter_entities())
+
+def random_entity(rng: random.Random, entity_id: str) -> Entity:
+    entity = Entity(entity_id=entity_id, entity_type=rng.choice(TYPES),
+                    name=" ".join(rng.sample(WORDS, rng.randint(1, 2))))
+    for _ in range(rng.randint(0, 2)):
+        entity.add_alias(rng.choice(WORDS) + rng.choice(["", "x", " prime"]))
+    for name in ("rank", "label"):
+        value = rng.choice(VALUES)
+        if value is not None:
+            entity.add_property(name, value)
+    if rng.random() < 0.3:
+        entity.add_property("note", " ".join(rng.sample(WORDS, 3)))
+    return entity
+
+async def random_history(adapter, seed: int) -> None:
+    rng = random.Random(seed)
+    ids = []
+    for step in range(120):
+        action = rng.random()
+        if action < 0.45 or len(ids) < 4:
+            entity_id = f"e{step}"
+            await adapter.create_entity(random_entity(rng, entity_id))
+            ids.append(entity_id)
+        elif action < 0.7:
+            replacement = random_entity(rng, rng.choice(ids))
+            await adapter.update_entity(replacement)
+        elif action < 0.8:
+            entity_id = ids.pop(rng.randrange(len(ids)))
+            await adapter.delete_entity(entity_id)
+        else:
+            source, target = rng.sample(ids, 2)
+            await adapter.create_relationship(Relationship(
+                relationship_id=f"r{step}", relationship_type=rng.choice(RELATIONSHIP_TYPES),
+                source_id=source, target_id=target
+            ))
+
+async def check_search(adapter) -> None:
+    entities = all_entities(adapter)
+    for query in QUERIES:
+        for entity_type in (None, "person"):
+            candidates = [e for e in entities if entity_type is None or e.entity_type == entity_type]
+
+            found = await adapter.search_entities(query, entity_type, limit=10000, match_mode="substring")
+            expected = {e.entity_id for e in candidates
+                        if any(query in text.lower() for text in entity_text_fields(e))}
+            assert {e.entity_id for e in found} == expected, (query, entity_type)
+
+            found = await adapter.search_entities(query, entity_type, limit=10000, match_mode="token")
+            query_tokens = set(tokenize(query))
+            token_sets = {e.entity_id: {token for text in entity_text_fields(e) for token in tokenize(text)}
+                          for e in candidates}
+            full = {entity_id for entity_id, tokens in token_sets.items() if query_tokens <= tokens}
+            partial = {entity_id for entity_id, tokens in token_sets.items() if query_tokens & tokens} - full
+            found_ids = [e.entity_id for e in found]
+            assert set(found_ids[:len(full)]) == full, (query, entity_type)
+            expected_partial = partial if len(query_tokens) > 1 else set()
+            assert set(found_ids[len(full):]) == expected_partial, (query, entity_type)
+
+async def check_properties(adapter) -> None:
+    entities = all_entities(adapter)
+    conditions = [{"value": v} for v in VALUES if v is not None] + [
+        {"min_value": 0, "max_value": 2}, {"min_value": 1}, {"max_value": 0},
+        {"min_value": "b"}, {"min_value": "a", "max_value": "d"}, {"min_value": False, "max_value": True}
+    ]
+    for name in ("rank", "label"):
+        for condition in conditions:
+            equals = condition.get("value")
+            expected = {e.entity_id for e in entities
+                        if value_matches(property_value(e, name), equals,
+                                         condition.get("min_value"), condition.get("max_value"))}
+            found = await adapter.find_entities_by_property(name, limit=10000, **condition)
+            assert {e.entity_id for e in found} == expected, (name, condition)
+
+def check_memory_indexes(adapter: MemoryAdapter) -> None:
+    graph = adapter.graph
+    entities = all_entities(adapter)
+    for entity_type in TYPES:
+        assert adapter.type_index.get(entity_type) == {e.entity_id for e in entities if e.entity_type == entity_type}
+
+    edges = list(graph.edges(keys=True, data="relationship"))
+    assert adapter.relationship_index == {key: (source, target) for source, target, key, _ in edges}
+    for entity in entities:
+        for relationship_type in RELATIONSHIP_TYPES:
+            outgoing = {key for source, _, key, r in edges
+                        if source == entity.entity_id and r.relationship_type == relationship_type}
+            incoming = {key for _, target, key, r in edges
+                        if target == entity.entity_id and r.relationship_type == relationship_type}
+            assert adapter.adjacency_index.get(entity.entity_id, OUTGOING, relationship_type) == outgoing
+            assert adapter.adjacency_index.get(entity.entity_id, INCOMING, relationship_type) == incoming
+
+@pytest.mark.parametrize("adapter_name", sorted(ADAPTERS))
+@pytest.mark.parametrize("seed", [1, 2])
+def test_indexes_agree_with_a_scan(tmp_path, adapter_name, seed):
+    async def run():
+        adapter_class = ADAPTERS[adapter_name]
+        adapter = adapter_class(str(tmp_path))
+        await adapter.connect()
+        await adapter.create_property_index("rank", "sorted")
+        await adapter.create_property_index("label", "hash")
+        await random_history(adapter, seed)
+
+        # Live, after replaying the log, and after loading the snapshot
+        await check_search(adapter)
+        await check_properties(adapter)
+        if isinstance(adapter, MemoryAdapter):
+            check_memory_indexes(adapter)
+        adapter.wal.close()
+        for _ in range(2):
+            adapter = adapter_class(str(tmp_path))
+            await adapter.connect()
+            await check_search(adapter)
+            await check_properties(adapter)
+            if isinstance(adapter, MemoryAdapter):
+                check_memory_indexes(adapter)
+            await adapter.disconnect()
+
+    asyncio.run(run())
+
+def test_property_indexes_wait_for_a_background_load(tmp_path):
+    async def run():
+        adapter = MemoryAdapter(str(tmp_path))
+        await adapter.connect()
+        await adapter.create_property_index("rank", "sorted")
+        for i in range(5):
+            entity = Entity(entity_id=f"e{i}", entity_type="person", name=f"Person {i}")
+            entity.add_property("rank", i)
+            await adapter.create_entity(entity)
+        await adapter.disconnect()
+
+        adapter = MemoryAdapter(str(tmp_path), background_load=True)
+        await adapter.connect()
+        assert await adapter.list_property_indexes() == [{"name": "rank", "kind": "sorted", "entries": 5}]
+        assert await adapter.drop_property_index("rank")
+        assert await adapter.list_property_indexes() == []
+        await adapter.disconnect()
+
+    asyncio.run(run())
@@ -0,0 +1,60 @@
+"""
+Tests for recovering the memory graph from its snapshot and write-ahead log.
+"""
+
+import os
+import asyncio
+
+from athena.core.entity import Entity
+from athena.core.graph.memory.adapter import MemoryAdapter
+
+async def open_adapter(path: str, **kwargs) -> MemoryAdapter:
+    adapter = MemoryAdapter(str(path), **kwargs)
+    await adapter.connect()
+    return adapter
+
+def crash(adapter: MemoryAdapter) -> None:
+    """Stop an adapter without a checkpoint, as a crash would."""
+    adapter.reachability.cancel()
+    adapter.wal.close()
+
+def entity_ids(adapter: MemoryAdapter):
+    return sorted(node for node, _ in adapter.graph.nodes(data="entity"))
+
+def test_unreadable_snapshot_is_kept_with_the_log(tmp_path):
+    async def run():
+        adapter = await open_adapter(tmp_path)
+        await adapter.create_entity(Entity(entity_id="e1", entity_type="person", name="Ada"))
+        await adapter.disconnect()
+
+        adapter = await open_adapter(tmp_path)
+        await adapter.create_entity(Entity(entity_id="e2", entity_type="person", name="Grace"))
+        crash(adapter)
+
+        # Tear the snapshot in the middle of its blocks
+        snapshot = tmp_path / "graph.snapshot"
+        snapshot.write_bytes(snapshot.read_bytes()[:-8])
+        torn = snapshot.read_bytes()
+
+        adapter = await open_adapter(tmp_path)
+        assert adapter.load_progress["state"] == "failed"
+        assert "e2" in entity_ids(adapter)
+        await adapter.create_entity(Entity(entity_id="e3", entity_type="person", name="Edsger"))
+        assert not await adapter.checkpoint()
+        await adapter.disconnect()
+
+        # The torn snapshot was moved aside, and no checkpoint compacted the log
+        quarantined = [name for name in os.listdir(tmp_path) if name.startswith("corrupt-")]
+        assert len(quarantined) == 1
+        assert (tmp_path / quarantined[0] / "graph.snapshot").read_bytes() == torn
+        assert not snapshot.exists()
+        log = (tmp_path / "graph.wal").read_text()
+        assert '"e2"' in log and '"e3"' in log
+
+        # The next start recovers every write made since the last good snapshot
+        adapter = await open_adapter(tmp_path)
+        assert adapter.load_progress["state"] == "loaded"
+        assert entity_ids(adapter) == ["e2", "e3"]
+        await adapter.disconnect()
+
+    asyncio.run(run())
@@ -0,0 +1,142 @@
+"""
+Tests for the memory graph's write-ahead log and crash replay.
+"""
+
+import asyncio
+
+import pytest
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.memory.adapter import MemoryAdapter
+
+async def open_adapter(path: str, **kwargs) -> MemoryAdapter:
+    adapter = MemoryAdapter(str(path), **kwargs)
+    await adapter.connect()
+    return adapter
+
+def crash(adapter: MemoryAdapter) -> None:
+    """Stop an adapter without a checkpoint, as a crash would."""
+    adapter.reachability.cancel()
+    adapter.wal.close()
+
+def graph_state(adapter: MemoryAdapter):
+    entities = {node: (entity.entity_type, entity.name, entity.read_properties())
+                for node, entity in adapter.graph.nodes(data="entity")}
+    relationships = {key: (source, target, relationship.relationship_type)
+                     for source, target, key, relationship in adapter.graph.edges(keys=True, data="relationship")}
+    return entities, relationships
+
+async def write_history(adapter: MemoryAdapter) -> None:
+    for i in range(4):
+        await adapter.create_entity(Entity(entity_id=f"e{i}", entity_type="person", name=f"Person {i}"))
+    await adapter.create_relationship(Relationship(relationship_id="r1", relationship_type="knows",
+                                                   source_id="e0", target_id="e1"))
+    await adapter.create_relationship(Relationship(relationship_id="r2", relationship_type="knows",
+                                                   source_id="e1", target_id="e2"))
+    entity = await adapter.get_entity("e2")
+    entity.add_property("born", 1906)
+    await adapter.update_entity(entity)
+    await adapter.delete_relationship("r1")
+    await adapter.delete_entity("e3")
+
+def test_crash_replays_every_mutation(tmp_path):
+    async def run():
+        adapter = await open_adapter(tmp_path)
+        await write_history(adapter)
+        expected = graph_state(adapter)
+        crash(adapter)
+
+        recovered = await open_adapter(tmp_path)
+        assert graph_state(recovered) == expected
+        assert recovered.relationship_index == {"r2": ("e1", "e2")}
+        assert [e.entity_id for e in await recovered.search_entities("person 2")] == ["e2"]
+        await recovered.disconnect()
+
+        # Replay was checkpointed, so the log starts empty
+        assert (tmp_path / "graph.wal").read_text() == ""
+        reopened = await open_adapter(tmp_path)
+        assert graph_state(reopened) == expected
+        await reopened.disconnect()
+
+    asyncio.run(run())
+
+def test_torn_record_is_skipped(tmp_path):
+    async def run():
+        adapter = await open_adapter(tmp_path)
+        await adapter.create_entity(Entity(entity_id="e1", entity_type="person", name="Ada"))
+        crash(adapter)
+        with open(tmp_path / "graph.wal", "a") as f:
+            f.write('{"seq":2,"op":"create_entity","data":{"entity_id":"e2"')
+
+        recovered = await open_adapter(tmp_path)
+        assert list(recovered.graph.nodes) == ["e1"]
+        await recovered.disconnect()
+
+    asyncio.run(run())
+
+def test_crash_during_checkpoint_keeps_the_rotated_segment(tmp_path):
+    async def run():
+        adapter = await open_adapter(tmp_path)
+        await adapter.create_entity(Entity(entity_id="e1", entity_type="person", name="Ada"))
+        # Rotate as a checkpoint would, then crash before the snapshot is written
+        await adapter.wal.rotate()
+        await adapter.create_entity(Entity(entity_id="e2", entity_type="person", name="Grace"))
+        crash(adapter)
+        assert (tmp_path / "graph.wal.1").exists()
+
+        recovered = await open_adapter(tmp_path)
+        assert sorted(recovered.graph.nodes) == ["e1", "e2"]
+        assert not (tmp_path / "graph.wal.1").exists()
+        await recovered.disconnect()
+
+    asyncio.run(run())
+
+def test_incomplete_checkpoints_keep_every_segment(tmp_path):
+    async def run():
+        adapter = await open_adapter(tmp_path)
+        for i in range(3):
+            await adapter.create_entity(Entity(entity_id=f"e{i}", entity_type="person", name=f"Person {i}"))
+            # Rotate as a checkpoint would, and never write the snapshot
+            await adapter.wal.rotate()
+        await adapter.create_entity(Entity(entity_id="e3", entity_type="person", name="Person 3"))
+        crash(adapter)
+        assert adapter.wal.rotated_paths() == [str(tmp_path / f"graph.wal.{n}") for n in (1, 2, 3)]
+
+        recovered = await open_adapter(tmp_path)
+        assert sorted(recovered.graph.nodes) == ["e0", "e1", "e2", "e3"]
+        assert recovered.wal.rotated_paths() == []
+        await recovered.disconnect()
+
+    asyncio.run(run())
+
+def test_checkpoint_runs_in_the_background(tmp_path):
+    async def run():
+        adapter = await open_adapter(tmp_path, checkpoint_interval=3)
+        for i in range(3):
+            await adapter.create_entity(Entity(entity_id=f"e{i}", entity_type="person", name=f"Person {i}"))
+
+        # The writer that crossed the interval returned before the checkpoint ran
+        task = adapter._checkpoint_task
+        assert task is not None and not task.done()
+        await task
+        assert adapter.wal.records_since_checkpoint == 0
+        assert (tmp_path / "graph.snapshot").exists()
+
+        await adapter.create_entity(Entity(entity_id="e3", entity_type="person", name="Person 3"))
+        crash(adapter)
+        recovered = await open_adapter(tmp_path)
+        assert sorted(recovered.graph.nodes) == ["e0", "e1", "e2", "e3"]
+        await recovered.disconnect()
+
+    asyncio.run(run())
+
+def test_mutation_after_disconnect_reports_the_closed_log(tmp_path):
+    async def run():
+        adapter = await open_adapter(tmp_path)
+        await adapter.disconnect()
+
+        with pytest.raises(ValueError, match="is closed"):
+            await adapter.create_entity(Entity(entity_id="e1", entity_type="person", name="Ada"))
+
+    asyncio.run(run())
@@ -0,0 +1,62 @@
+"""
+Tests for the Entity and Relationship models.
+"""
+
+import sys
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+
+def test_entity_round_trip():
+    entity = Entity(entity_id="e1", entity_type="person", name="Ada Lovelace", source="wiki")
+    entity.add_alias("Countess of Lovelace")
+    entity.add_property("born", 1815)
+    entity.created_at = "2020-01-02T03:04:05"
+
+    copy = Entity.from_dict(entity.to_dict())
+
+    assert copy.to_dict() == entity.to_dict()
+    assert copy.aliases == frozenset({"ada lovelace", "countess of lovelace"})
+    assert copy.entity_type is sys.intern("person")
+    assert copy.source is sys.intern("wiki")
+
+def test_entity_from_dict_with_null_fields():
+    data = {"entity_id": "e1", "entity_type": None, "name": None, "properties": None, "source": None,
+            "created_at": None, "updated_at": None, "aliases": None}
+
+    entity = Entity.from_dict(data)
+
+    assert entity.entity_type is None
+    assert entity.source is None
+    assert entity.aliases == frozenset()
+    assert Entity.from_dict(entity.to_dict()).to_dict() == entity.to_dict()
+
+def test_entity_from_dict_accepts_frozenset_aliases():
+    entity = Entity(entity_id="e1", entity_type="person", name="Ada")
+    entity.add_alias("Lovelace")
+    data = entity.to_dict()
+    data["aliases"] = entity.aliases
+
+    copy = Entity.from_dict(data)
+
+    assert copy.aliases == entity.aliases
+
+def test_relationship_round_trip():
+    relationship = Relationship(relationship_id="r1", relationship_type="knows", source_id="e1", target_id="e2",
+                                properties={"since": 1833}, source="wiki")
+    relationship.is_directional = False
+
+    copy = Relationship.from_dict(relationship.to_dict())
+
+    assert copy.to_dict() == relationship.to_dict()
+    assert copy.relationship_type is sys.intern("knows")
+
+def test_relationship_from_dict_with_null_fields():
+    data = {"relationship_id": "r1", "relationship_type": None, "source_id": "e1", "target_id": "e2",
+            "properties": None, "source": None, "created_at": None, "updated_at": None}
+
+    relationship = Relationship.from_dict(data)
+
+    assert relationship.relationship_type is None
+    assert relationship.source is None
+    assert Relationship.from_dict(relationship.to_dict()).to_dict() == relationship.to_dict()
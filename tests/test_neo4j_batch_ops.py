@@ -0,0 +1,64 @@
+"""
+Tests for the Neo4j batch operations against a recorded driver.
+"""
+
+import asyncio
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.neo4j.pool import DriverClient, PooledDriver
+from athena.core.graph.neo4j.operations import create_entities, create_relationships
+
+from .recorded_driver import RecordedDriver, failing
+
+def make_client(driver: RecordedDriver) -> DriverClient:
+    return DriverClient(PooledDriver(driver, fetch_size=100))
+
+def make_entities(count: int):
+    return [Entity(entity_id=f"e{i}", entity_type=f"type{i % 3}", name=f"Entity {i}") for i in range(count)]
+
+def make_relationships(count: int):
+    return [
+        Relationship(relationship_id=f"r{i}", relationship_type=f"rel{i % 3}", source_id="e0", target_id=f"e{i}")
+        for i in range(count)
+    ]
+
+def test_failed_entity_batches_report_every_row():
+    driver = RecordedDriver(failing("database unavailable"))
+
+    errors = asyncio.run(create_entities(make_client(driver), make_entities(5), batch_size=2))
+
+    assert sorted(errors) == [0, 1, 2, 3, 4]
+    assert all("database unavailable" in message for message in errors.values())
+    assert len(driver.statements) == 3
+
+def test_failed_relationship_batches_report_the_error():
+    driver = RecordedDriver(failing("database unavailable"))
+
+    errors = asyncio.run(create_relationships(make_client(driver), make_relationships(5), batch_size=2))
+
+    assert sorted(errors) == [0, 1, 2, 3, 4]
+    assert all("database unavailable" in message for message in errors.values())
+
+def test_relationships_without_endpoints_are_reported():
+    def respond(query, params):
+        # Only rows whose source and target matched come back
+        return [{"relationship_id": row["relationship_id"]} for row in params["rows"]
+                if row["target_id"] != "e3"]
+    driver = RecordedDriver(respond)
+
+    errors = asyncio.run(create_relationships(make_client(driver), make_relationships(5)))
+
+    assert errors == {3: "Source or target entity not found"}
+
+def test_batches_share_one_statement_across_types():
+    driver = RecordedDriver()
+
+    errors = asyncio.run(create_entities(make_client(driver), make_entities(6), batch_size=10))
+
+    assert errors == {}
+    assert len(driver.statements) == 1
+    query, params = driver.statements[0]
+    assert "type0" not in query
+    assert [row["properties"]["entity_type"] for row in params["rows"]] == [f"type{i % 3}" for i in range(6)]
+    assert driver.sessions == [{"fetch_size": 100}]
@@ -0,0 +1,52 @@
+"""
+Tests for Neo4j path search against a recorded driver.
+"""
+
+import asyncio
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.neo4j.pool import DriverClient, PooledDriver
+from athena.core.graph.neo4j.operations import find_paths
+
+from .recorded_driver import RecordedDriver, RecordedPath
+
+def path_record(*ids):
+    """Record holding a driver path through the given entity IDs."""
+    nodes = [Entity(entity_id=entity_id, entity_type="node", name=entity_id).to_dict() for entity_id in ids]
+    relationships = [
+        Relationship(relationship_id=f"{source}-{target}", relationship_type="knows",
+                     source_id=source, target_id=target).to_dict()
+        for source, target in zip(ids, ids[1:])
+    ]
+    return {"path": RecordedPath(nodes, relationships)}
+
+def respond(query, params):
+    if "[*1]" in query:
+        return [path_record("a", "b")]
+    if "[*2]" in query:
+        return [path_record("a", "c", "b")]
+    return []
+
+def test_driver_paths_become_alternating_objects():
+    driver = RecordedDriver(respond)
+    client = DriverClient(PooledDriver(driver, fetch_size=100))
+
+    paths = asyncio.run(find_paths(client, "a", "b", 3, Entity, Relationship, max_paths=2))
+
+    assert [[item.entity_id if isinstance(item, Entity) else item.relationship_id for item in path]
+            for path in paths] == [["a", "a-b", "b"], ["a", "a-c", "c", "c-b", "b"]]
+    # The search stops once max_paths are found
+    assert len(driver.statements) == 2
+
+def test_relationship_types_are_a_parameter():
+    driver = RecordedDriver()
+    client = DriverClient(PooledDriver(driver, fetch_size=100))
+
+    asyncio.run(find_paths(client, "a", "b", 2, Entity, Relationship, relationship_types=["knows"]))
+    asyncio.run(find_paths(client, "a", "b", 2, Entity, Relationship))
+
+    filtered, unfiltered = driver.statements[:2], driver.statements[2:]
+    assert [query for query, _ in filtered] == [query for query, _ in unfiltered]
+    assert all(params["relationship_types"] == ["knows"] for _, params in filtered)
+    assert all(params["relationship_types"] is None for _, params in unfiltered)
@@ -0,0 +1,69 @@
+"""
+Tests for the Neo4j property index operations against a recorded driver.
+"""
+
+import asyncio
+
+import pytest
+
+from athena.core.entity import Entity
+from athena.core.graph.neo4j.pool import DriverClient, PooledDriver
+from athena.core.graph.neo4j.operations import (
+    create_property_index,
+    drop_property_index,
+    list_property_indexes,
+    find_entities_by_property
+)
+
+from .recorded_driver import RecordedDriver, failing
+
+def make_client(driver: RecordedDriver) -> DriverClient:
+    return DriverClient(PooledDriver(driver, fetch_size=100))
+
+def test_create_and_drop_report_success():
+    driver = RecordedDriver()
+    client = make_client(driver)
+
+    assert asyncio.run(create_property_index(client, "year", "sorted"))
+    assert asyncio.run(drop_property_index(client, "year"))
+    assert driver.queries("CREATE INDEX `athena_prop_year` IF NOT EXISTS")
+    assert driver.queries("DROP INDEX `athena_prop_year` IF EXISTS")
+
+def test_create_and_drop_raise_on_failure():
+    client = make_client(RecordedDriver(failing("permission denied")))
+
+    with pytest.raises(RuntimeError, match="permission denied"):
+        asyncio.run(create_property_index(client, "year"))
+    with pytest.raises(RuntimeError, match="permission denied"):
+        asyncio.run(drop_property_index(client, "year"))
+
+def test_list_describes_athena_indexes():
+    driver = RecordedDriver(lambda query, params: [
+        {"name": "athena_prop_year", "type": "RANGE", "state": "ONLINE", "properties": ["prop_year"]}
+    ])
+
+    indexes = asyncio.run(list_property_indexes(make_client(driver)))
+
+    assert indexes == [{"name": "year", "kind": "range", "state": "ONLINE"}]
+    assert driver.statements[0][1] == {"prefix": "athena_prop_"}
+
+def test_list_and_find_raise_on_failure():
+    client = make_client(RecordedDriver(failing("database unavailable")))
+
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        asyncio.run(list_property_indexes(client))
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        asyncio.run(find_entities_by_property(client, "year", value=1990, entity_class=Entity))
+
+def test_find_builds_entities_from_records():
+    entity = Entity(entity_id="e1", entity_type="film", name="Film")
+    entity.add_property("year", 1990)
+    driver = RecordedDriver(lambda query, params: [{"n": entity.to_dict()}])
+
+    found = asyncio.run(find_entities_by_property(make_client(driver), "year", min_value=1980, max_value=2000,
+                                                  entity_class=Entity))
+
+    assert [e.entity_id for e in found] == ["e1"]
+    query, params = driver.statements[0]
+    assert "ORDER BY n.`prop_year`" in query
+    assert (params["min_value"], params["max_value"]) == (1980, 2000)
@@ -0,0 +1,36 @@
+"""
+Tests for the Neo4j relationship lookups against a recorded driver.
+"""
+
+import asyncio
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.neo4j.pool import DriverClient, PooledDriver
+from athena.core.graph.neo4j.operations import get_relationships_for_entities
+
+from .recorded_driver import RecordedDriver, RecordedNode
+
+def make_client(driver: RecordedDriver) -> DriverClient:
+    return DriverClient(PooledDriver(driver, fetch_size=100))
+
+def pair(relationship_id: str, source_id: str, target_id: str):
+    relationship = Relationship(relationship_id=relationship_id, relationship_type="knows",
+                                source_id=source_id, target_id=target_id)
+    other = Entity(entity_id=target_id, entity_type="person", name=target_id.upper())
+    return [RecordedNode(relationship.to_dict()), RecordedNode(other.to_dict())]
+
+def test_relationships_for_entities_converts_driver_pairs():
+    driver = RecordedDriver(lambda query, params: [
+        {"entity_id": "e1", "pairs": [pair("r1", "e1", "e2"), pair("r2", "e1", "e3")]},
+    ])
+
+    results = asyncio.run(get_relationships_for_entities(make_client(driver), ["e1", "e4"], relationship_type="knows",
+                                                         per_entity_limit=5, relationship_class=Relationship,
+                                                         entity_class=Entity))
+
+    assert [(r.relationship_id, e.entity_id) for r, e in results["e1"]] == [("r1", "e2"), ("r2", "e3")]
+    assert results["e4"] == []
+    query, params = driver.statements[0]
+    assert "[..$limit]" in query
+    assert params == {"entity_ids": ["e1", "e4"], "rel_type": "knows", "limit": 5}
@@ -0,0 +1,41 @@
+"""
+Tests for the Neo4j schema operations against a recorded driver.
+"""
+
+import asyncio
+
+from athena.core.graph.neo4j.pool import DriverClient, PooledDriver
+from athena.core.graph.neo4j.operations import initialize_schema
+
+from .recorded_driver import RecordedDriver
+
+def make_client(driver: RecordedDriver) -> DriverClient:
+    return DriverClient(PooledDriver(driver, fetch_size=100))
+
+def responder(unsupported: str = None):
+    """Responder for a server rejecting statements containing a fragment."""
+    def respond(query, params):
+        if unsupported and unsupported in query:
+            raise RuntimeError("Invalid input 'REQUIRE': relationship property constraints are not supported")
+        if "SHOW FULLTEXT INDEXES" in query:
+            return [{"name": params["index"], "state": "ONLINE"}]
+        return []
+    return respond
+
+def test_initialize_schema_creates_every_element():
+    driver = RecordedDriver(responder())
+
+    created = asyncio.run(initialize_schema(make_client(driver)))
+
+    assert all(created.values())
+    assert driver.queries("CREATE FULLTEXT INDEX")
+
+def test_unsupported_constraint_does_not_skip_the_rest():
+    driver = RecordedDriver(responder(unsupported="()-[r:RELATES_TO]-()\n    REQUIRE"))
+
+    created = asyncio.run(initialize_schema(make_client(driver)))
+
+    assert created["relationship_id_constraint"] is False
+    assert created["entity_id_constraint"] and created["entity_type_index"] and created["relationship_type_index"]
+    assert driver.queries("CREATE FULLTEXT INDEX")
+    assert created["fulltext_index"] is True
@@ -0,0 +1,79 @@
+"""
+Tests for Neo4j entity search and the full-text index against a recorded driver.
+"""
+
+import asyncio
+
+from athena.core.entity import Entity
+from athena.core.graph.neo4j.pool import DriverClient, PooledDriver
+from athena.core.graph.neo4j.operations import create_fulltext_index, search_entities
+
+from .recorded_driver import RecordedDriver
+
+def make_client(driver: RecordedDriver) -> DriverClient:
+    return DriverClient(PooledDriver(driver, fetch_size=100))
+
+def node(entity_id: str, name: str):
+    return Entity(entity_id=entity_id, entity_type="person", name=name).to_dict()
+
+def responder(index_exists: bool = True, fulltext_error: str = None):
+    """Responder for a database with or without the full-text index."""
+    def respond(query, params):
+        if "SHOW FULLTEXT INDEXES" in query:
+            return [{"name": params["index"], "state": "ONLINE"}] if index_exists else []
+        if "db.index.fulltext.queryNodes" in query:
+            if fulltext_error:
+                raise RuntimeError(fulltext_error)
+            return [{"n": node("e2", "Ada Lovelace"), "score": 2.5}, {"n": node("e1", "Ada"), "score": 1.0}]
+        if "CONTAINS" in query:
+            return [{"n": node("e1", "Ada")}]
+        return []
+    return respond
+
+def search(driver: RecordedDriver, fulltext: bool = True):
+    return asyncio.run(search_entities(make_client(driver), "ada", limit=5, entity_class=Entity, fulltext=fulltext))
+
+def test_create_fulltext_index_checks_the_index_exists():
+    driver = RecordedDriver(responder(index_exists=True))
+
+    assert asyncio.run(create_fulltext_index(make_client(driver)))
+    assert driver.queries("CREATE FULLTEXT INDEX athena_entity_text IF NOT EXISTS")
+    assert driver.queries("SHOW FULLTEXT INDEXES")
+
+def test_create_fulltext_index_reports_a_missing_index():
+    driver = RecordedDriver(responder(index_exists=False))
+
+    assert not asyncio.run(create_fulltext_index(make_client(driver)))
+
+def test_fulltext_search_keeps_score_order():
+    driver = RecordedDriver(responder())
+
+    results = search(driver)
+
+    assert [entity.entity_id for entity in results] == ["e2", "e1"]
+    query, params = driver.queries("db.index.fulltext.queryNodes")[0]
+    assert params["search"] == "+(ada ada*)"
+    assert not driver.queries("CONTAINS")
+
+def test_search_without_fulltext_uses_substring_match():
+    driver = RecordedDriver(responder())
+
+    results = search(driver, fulltext=False)
+
+    assert [entity.entity_id for entity in results] == ["e1"]
+    assert driver.queries("CONTAINS")[0][1]["text"] == "ada"
+    assert not driver.queries("db.index.fulltext.queryNodes")
+
+def test_search_falls_back_when_the_index_is_missing():
+    driver = RecordedDriver(responder(index_exists=False, fulltext_error="There is no such fulltext schema index"))
+
+    results = search(driver)
+
+    assert [entity.entity_id for entity in results] == ["e1"]
+    assert driver.queries("SHOW FULLTEXT INDEXES")
+
+def test_search_does_not_fall_back_on_other_errors():
+    driver = RecordedDriver(responder(index_exists=True, fulltext_error="Failed to parse query"))
+
+    assert search(driver) == []
+    assert not driver.queries("CONTAINS")
@@ -0,0 +1,120 @@
+"""
+Tests for path search, checked against NetworkX on random graphs.
+"""
+
+import math
+import random
+import asyncio
+
+import networkx as nx
+import pytest
+
+from athena.core.entity import Entity
+from athena.core.relationship import Relationship
+from athena.core.graph.memory.adapter import MemoryAdapter
+from athena.core.graph.csr.adapter import CSRAdapter
+
+TYPES = ["knows", "works_with", "cites"]
+
+def random_graph(seed: int, nodes: int = 14, edges: int = 40) -> nx.MultiDiGraph:
+    """Random multigraph with parallel relationships and mixed types."""
+    rng = random.Random(seed)
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from(f"e{i}" for i in range(nodes))
+    for i in range(edges):
+        source, target = rng.sample(list(graph.nodes), 2)
+        graph.add_edge(source, target, key=f"r{i}", relationship_type=rng.choice(TYPES),
+                       confidence=round(rng.uniform(0.1, 1.0), 3))
+    return graph
+
+async def load(adapter, graph: nx.MultiDiGraph):
+    await adapter.connect()
+    for node in graph.nodes:
+        await adapter.create_entity(Entity(entity_id=node, entity_type="node", name=node))
+    for source, target, key, data in graph.edges(keys=True, data=True):
+        await adapter.create_relationship(Relationship(relationship_id=key, source_id=source, target_id=target,
+                                                       relationship_type=data["relationship_type"],
+                                                       confidence=data["confidence"]))
+    return adapter
+
+def expected_paths(graph: nx.MultiDiGraph, source: str, target: str, max_depth: int, relationship_types=None):
+    """Every simple path as a tuple of relationship IDs, from NetworkX."""
+    if relationship_types:
+        graph = graph.edge_subgraph([(u, v, k) for u, v, k, t in graph.edges(keys=True, data="relationship_type")
+                                     if t in relationship_types])
+        if source not in graph or target not in graph:
+            return set()
+    return {tuple(key for _, _, key in path)
+            for path in nx.all_simple_edge_paths(graph, source, target, cutoff=max_depth)}
+
+def path_ids(path):
+    return tuple(relationship.relationship_id for relationship in path[1::2])
+
+def confidence(graph: nx.MultiDiGraph, ids) -> float:
+    confidences = {key: c for _, _, key, c in graph.edges(keys=True, data="confidence")}
+    return math.prod(confidences[key] for key in ids)
+
+ADAPTERS = {"memory": MemoryAdapter, "csr": CSRAdapter}
+
+@pytest.fixture(params=sorted(ADAPTERS))
+def adapter_class(request):
+    return ADAPTERS[request.param]
+
+@pytest.mark.parametrize("relationship_types", [None, ["knows"], ["knows", "cites"]])
+def test_paths_match_networkx(tmp_path, adapter_class, relationship_types):
+    async def run():
+        graph = random_graph(seed=7)
+        adapter = await load(adapter_class(str(tmp_path), wal_enabled=False), graph)
+        pairs = [(f"e{i}", f"e{j}") for i in range(6) for j in range(6) if i != j]
+        for source, target in pairs:
+            expected = expected_paths(graph, source, target, 4, relationship_types)
+
+            found = await adapter.find_paths(source, target, 4, None, relationship_types=relationship_types)
+            assert {path_ids(path) for path in found} == expected
+            assert len(found) == len(expected)
+
+            # Shortest first, and the first k are k of the shortest
+            found = await adapter.find_paths(source, target, 4, 5, relationship_types=relationship_types)
+            lengths = [len(path_ids(path)) for path in found]
+            assert lengths == sorted(len(ids) for ids in expected)[:5]
+            assert all(path_ids(path) in expected for path in found)
+            for path in found:
+                assert [entity.entity_id for entity in path[::2]][0] == source
+                assert path[-1].entity_id == target
+
+    asyncio.run(run())
+
+@pytest.mark.parametrize("relationship_types", [None, ["works_with", "cites"]])
+def test_weighted_paths_are_the_most_confident(tmp_path, adapter_class, relationship_types):
+    async def run():
+        graph = random_graph(seed=11)
+        adapter = await load(adapter_class(str(tmp_path), wal_enabled=False), graph)
+        for source, target in [("e0", "e1"), ("e2", "e5"), ("e3", "e4"), ("e6", "e0")]:
+            expected = expected_paths(graph, source, target, 4, relationship_types)
+            best = sorted((confidence(graph, ids) for ids in expected), reverse=True)[:3]
+
+            found = await adapter.find_paths(source, target, 4, 3, weighted=True,
+                                             relationship_types=relationship_types)
+            assert all(path_ids(path) in expected for path in found)
+            assert [confidence(graph, path_ids(path)) for path in found] == pytest.approx(best)
+
+    asyncio.run(run())
+
+def test_connectivity_matches_networkx(tmp_path):
+    async def run():
+        graph = random_graph(seed=3, nodes=30, edges=35)
+        adapter = await load(MemoryAdapter(str(tmp_path), wal_enabled=False), graph)
+        await adapter.reachability.refresh(adapter)
+        for source in list(graph.nodes)[:10]:
+            lengths = nx.single_source_shortest_path_length(graph, source)
+            for target in graph.nodes:
+                distance = lengths.get(target)
+                assert await adapter.are_connected(source, target) == (distance is not None)
+                assert await adapter.are_connected(source, target, 2) == (distance is not None and distance <= 2)
+                lower, upper = await adapter.distance_bounds(source, target)
+                if distance is None:
+                    assert upper == math.inf
+                else:
+                    assert lower <= distance <= upper
+
+    asyncio.run(run())